@@ -0,0 +1,148 @@
+"""Benchmark finding the files each discovery plugin looks for.
+
+Compares the file index on a package against the previous implementation, where every
+discovery plugin looped over every file in the package and checked its name and file
+type. Both implementations must find the same files, in the same order.
+
+Usage: python benchmarks/discovery_benchmark.py [--files 100000] [--no-reference]
+
+The package is made up in memory, so the time to walk the file system and to classify
+files is not included.
+"""
+
+import argparse
+import random
+import time
+
+from statick_tool.file_index import FileRule
+from statick_tool.file_record import FileRecord
+from statick_tool.package import Package
+from statick_tool.plugins.discovery.c import C_RULE
+from statick_tool.plugins.discovery.cmake import CMAKE_RULE
+from statick_tool.plugins.discovery.css import CSS_RULE
+from statick_tool.plugins.discovery.dockerfile import DOCKERFILE_RULE
+from statick_tool.plugins.discovery.groovy import GROOVY_RULE
+from statick_tool.plugins.discovery.html import HTML_RULE
+from statick_tool.plugins.discovery.java import JAVA_CLASS_RULE, JAVA_SRC_RULE
+from statick_tool.plugins.discovery.javascript import JAVASCRIPT_RULE
+from statick_tool.plugins.discovery.markdown import MARKDOWN_RULE
+from statick_tool.plugins.discovery.pddl import PDDL_RULE
+from statick_tool.plugins.discovery.perl import PERL_RULE
+from statick_tool.plugins.discovery.python import PYTHON_RULE
+from statick_tool.plugins.discovery.rst import RST_RULE
+from statick_tool.plugins.discovery.shell import SHELL_RULE
+from statick_tool.plugins.discovery.tex import TEX_RULE
+from statick_tool.plugins.discovery.xml import XML_RULE
+from statick_tool.plugins.discovery.yaml import YAML_RULE
+
+RULES = [
+    C_RULE,
+    CMAKE_RULE,
+    CSS_RULE,
+    DOCKERFILE_RULE,
+    GROOVY_RULE,
+    HTML_RULE,
+    JAVA_CLASS_RULE,
+    JAVA_SRC_RULE,
+    JAVASCRIPT_RULE,
+    MARKDOWN_RULE,
+    PDDL_RULE,
+    PERL_RULE,
+    PYTHON_RULE,
+    RST_RULE,
+    SHELL_RULE,
+    TEX_RULE,
+    XML_RULE,
+    YAML_RULE,
+]
+
+# Names of files and the file types reported for them.
+FILES = [
+    ("main.cpp", "c++ source, ascii text"),
+    ("util.h", "c source, ascii text"),
+    ("run", "python script, ascii text executable"),
+    ("setup.py", "python script, ascii text"),
+    ("setup.cfg", "python script, ascii text"),
+    ("build.sh", "posix shell script, ascii text executable"),
+    ("configure", "posix shell script, ascii text executable"),
+    ("index.html", "html document, ascii text"),
+    ("style.css", "ascii text"),
+    ("style.min.css", "ascii text, with very long lines"),
+    ("app.js", "javascript source, ascii text"),
+    ("app.min.js", "ascii text, with very long lines"),
+    ("readme.md", "ascii text"),
+    ("index.rst", "ascii text"),
+    ("config.yaml", "ascii text"),
+    ("robot.launch", "xml 1.0 document, ascii text"),
+    ("paper.tex", "latex document, ascii text"),
+    ("paper.log", "latex 2e document, ascii text"),
+    ("Foo.java", "java source, ascii text"),
+    ("Foo.class", "compiled java class data"),
+    ("dockerfile", "ascii text"),
+    ("jenkinsfile", "ascii text"),
+    ("build.gradle", "ascii text"),
+    ("domain.pddl", "ascii text"),
+    ("tool.pl", "perl script text executable"),
+    ("cmakelists.txt", "ascii text"),
+    ("image.png", "png image data, 64 x 64, 8-bit/color rgba"),
+    ("data.bin", "data"),
+]
+
+
+def reference_find(package: Package, rule: FileRule) -> list[str]:
+    """Find files the way discovery plugins did before the file index was added."""
+    found = []
+    for file_dict in package.files.values():
+        name = file_dict["name"]
+        if (
+            name.endswith(rule.extensions)
+            or name in rule.names
+            or name.startswith(rule.prefixes)
+            or any(item in file_dict["file_cmd_out"] for item in rule.types)
+        ) and not (rule.exclude and name.endswith(rule.exclude)):
+            found.append(file_dict["path"])
+    return found
+
+
+def make_package(count: int) -> Package:
+    """Make a package with files spread over directories."""
+    package = Package("package", "/workspace/src/package")
+    rng = random.Random(0)
+    for index in range(count):
+        name, file_type = rng.choice(FILES)
+        path = f"{package.path}/module{index % 500}/dir{index % 7}/{index}_{name}"
+        if name in ("dockerfile", "jenkinsfile", "cmakelists.txt"):
+            path = f"{package.path}/module{index % 500}/dir{index}/{name}"
+        package.files[path] = FileRecord(
+            path, file_cmd_out=f"{path}: {file_type}\n".lower()
+        )
+    return package
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=100000)
+    parser.add_argument("--no-reference", action="store_true")
+    args = parser.parse_args()
+
+    package = make_package(args.files)
+    start = time.perf_counter()
+    file_index = package.get_file_index()
+    found = [file_index.find(rule) for rule in RULES]
+    index_time = time.perf_counter() - start
+
+    print(f"{args.files} files, {len(RULES)} rules, {sum(map(len, found))} found")
+    print(f"index:     {index_time:.3f} s")
+    if args.no_reference:
+        return
+
+    start = time.perf_counter()
+    expected = [reference_find(package, rule) for rule in RULES]
+    reference_time = time.perf_counter() - start
+    assert found == expected, "Index results differ from the reference"
+    print(f"reference: {reference_time:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Benchmark filtering issues with exceptions.
+
+Compares `Exceptions.filter_issues` against the previous implementation, which ran
+`fnmatch` for every issue, exception, and glob and removed issues with list scans. Both
+implementations must remove the same issues.
+
+Run it with `python benchmarks/exceptions_benchmark.py`. The `--issues` and `--globs`
+options set the size of the run, which defaults to 50000 issues and 300 globs.
+
+The previous implementation is quadratic in the number of issues. On larger runs, such
+as 200000 issues, the `--no-reference` option times the matcher alone.
+"""
+
+import argparse
+import fnmatch
+import os
+import random
+import re
+import tempfile
+import time
+from typing import Any
+
+import yaml
+
+from statick_tool.exceptions import Exceptions
+from statick_tool.issue import Issue
+from statick_tool.package import Package
+
+TOOLS = ["clang-tidy", "make", "cppcheck", "pylint"]
+
+
+def reference_filter(
+    package: Package, exceptions: dict[str, Any], issues: dict[str, list[Issue]]
+) -> dict[str, list[Issue]]:
+    """Filter issues the way exceptions were applied before the matcher was added."""
+    # pylint: disable=too-many-nested-blocks
+    for tool, tool_issues in list(issues.items()):
+        to_remove: list[Issue] = []
+        for issue in tool_issues:
+            rel_path = os.path.relpath(issue.filename, package.path)
+            for exception in exceptions["file"]:
+                if exception["tools"] == "all" or tool in exception["tools"]:
+                    for pattern in exception["globs"]:
+                        if fnmatch.fnmatch(issue.filename, pattern) or fnmatch.fnmatch(
+                            rel_path, pattern
+                        ):
+                            to_remove.append(issue)
+        issues[tool] = [issue for issue in tool_issues if issue not in to_remove]
+    for exception in exceptions["message_regex"]:
+        compiled_re = re.compile(exception["regex"])
+        for tool, tool_issues in list(issues.items()):
+            to_remove = []
+            if exception["tools"] == "all" or tool in exception["tools"]:
+                for issue in tool_issues:
+                    if compiled_re.match(issue.message):
+                        to_remove.append(issue)
+            issues[tool] = [issue for issue in tool_issues if issue not in to_remove]
+    return issues
+
+
+def make_exceptions(globs: int) -> dict[str, Any]:
+    """Make file exceptions with the given number of globs and a few regexes."""
+    file_exceptions = []
+    for index in range(globs):
+        tools: Any = "all" if index % 3 == 0 else [TOOLS[index % len(TOOLS)]]
+        file_exceptions.append({"tools": tools, "globs": [f"*/module{index}/*.cpp"]})
+    return {
+        "global": {
+            "exceptions": {
+                "file": file_exceptions,
+                "message_regex": [
+                    {"tools": ["clang-tidy"], "regex": ".*unused parameter.*"},
+                    {"tools": "all", "regex": "warning: deprecated .*"},
+                ],
+            }
+        }
+    }
+
+
+def make_issues(package: Package, count: int, globs: int) -> dict[str, list[Issue]]:
+    """Make issues spread over files in modules, some of which have exceptions."""
+    messages = ["unused parameter 'x'", "warning: deprecated call", "narrowing"]
+    issues: dict[str, list[Issue]] = {tool: [] for tool in TOOLS}
+    rng = random.Random(0)
+    for index in range(count):
+        tool = TOOLS[index % len(TOOLS)]
+        module = rng.randrange(globs * 2)
+        filename = os.path.join(
+            package.path, f"module{module}", f"file{rng.randrange(20)}.cpp"
+        )
+        issues[tool].append(
+            Issue(filename, index, tool, "type", 3, rng.choice(messages), None)
+        )
+    return issues
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--issues", type=int, default=50000)
+    parser.add_argument("--globs", type=int, default=300)
+    parser.add_argument("--no-reference", action="store_true")
+    args = parser.parse_args()
+
+    package = Package("package", "/workspace/src/package")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        exceptions_file = os.path.join(tmp_dir, "exceptions.yaml")
+        with open(exceptions_file, "w", encoding="utf8") as fid:
+            yaml.safe_dump(make_exceptions(args.globs), fid)
+        exceptions = Exceptions(exceptions_file)
+
+    issues = make_issues(package, args.issues, args.globs)
+    start = time.perf_counter()
+    # NOLINT filtering reads files, so only compare exception filtering.
+    filtered = exceptions.get_matcher(package).filter_issues(
+        {tool: list(tool_issues) for tool, tool_issues in issues.items()}
+    )
+    matcher_time = time.perf_counter() - start
+
+    remaining = sum(len(tool_issues) for tool_issues in filtered.values())
+    print(f"{args.issues} issues, {args.globs} globs, {remaining} issues remain")
+    print(f"matcher:   {matcher_time:.3f} s")
+    if args.no_reference:
+        return
+
+    start = time.perf_counter()
+    expected = reference_filter(
+        package,
+        exceptions.get_exceptions(package),
+        {tool: list(tool_issues) for tool, tool_issues in issues.items()},
+    )
+    reference_time = time.perf_counter() - start
+    assert filtered == expected, "Matcher results differ from the reference"
+    print(f"reference: {reference_time:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Base for caches that persist data between Statick runs.
+
+Each cache is an SQLite database in the cache directory. The cache directory is set with
+the `--cache-dir` argument or the `STATICK_CACHE_DIR` environment variable, and all
+caches are disabled with the `--no-cache` argument.
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import sqlite3
+from typing import Any, Optional, TypeVar
+
+CacheT = TypeVar("CacheT", bound="Cache")
+
+
+class Cache:
+    """Base for caches stored in an SQLite database in the cache directory."""
+
+    filename = "cache.sqlite"
+    schema: list[str] = []
+
+    def __init__(self, cache_dir: str) -> None:
+        """Open the cache database, creating it if needed."""
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, self.filename)
+        # Workspace scans write to the same cache from several processes.
+        self.connection = sqlite3.connect(self.path, timeout=60)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        with self.connection:
+            for statement in self.schema:
+                self.connection.execute(statement)
+
+    @classmethod
+    def open(cls: type[CacheT], args: argparse.Namespace) -> Optional[CacheT]:
+        """Open the cache for the given arguments.
+
+        Returns None if caching is not enabled or the cache can't be opened.
+        """
+        cache_dir = get_cache_dir(args)
+        if cache_dir is None:
+            return None
+        try:
+            return cls(cache_dir)
+        except (OSError, sqlite3.Error) as ex:
+            logging.warning("Unable to open cache in %s: %s", cache_dir, ex)
+            return None
+
+    def execute(self, statement: str, parameters: Any = ()) -> list[Any]:
+        """Run a statement and return all of the rows it produces."""
+        with self.connection:
+            return self.connection.execute(statement, parameters).fetchall()
+
+    def executemany(self, statement: str, parameters: Any) -> None:
+        """Run a statement once for each set of parameters."""
+        with self.connection:
+            self.connection.executemany(statement, parameters)
+
+    def close(self) -> None:
+        """Close the cache database."""
+        self.connection.close()
+
+
+def get_cache_dir(args: argparse.Namespace) -> Optional[str]:
+    """Get the cache directory to use, or None if caching is not enabled."""
+    cache_dir: Optional[str] = getattr(args, "cache_dir", None)
+    if not cache_dir or getattr(args, "no_cache", False):
+        return None
+    return os.path.abspath(cache_dir)
+
+
+def get_file_hash(path: str) -> Optional[str]:
+    """Get a hash of the contents of a file, or None if it can't be read."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as fid:
+            for block in iter(lambda: fid.read(1024 * 1024), b""):
+                digest.update(block)
+    except OSError:
+        return None
+    return digest.hexdigest()
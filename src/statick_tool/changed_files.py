@@ -0,0 +1,84 @@
+"""Find the files that have changed since a git reference.
+
+Changed files are the files that differ between the working tree and the merge base of
+the reference and HEAD, plus untracked files that are not ignored. This matches the
+files changed by a branch when the reference is the branch it will be merged into.
+"""
+
+import functools
+import logging
+import os
+import subprocess
+from typing import Optional
+
+
+@functools.lru_cache(maxsize=None)
+def get_repository_root(path: str) -> Optional[str]:
+    """Get the top level directory of the git repository containing a path."""
+    try:
+        output = subprocess.check_output(
+            ["git", "-C", path, "rev-parse", "--show-toplevel"],
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+        )
+    except (subprocess.CalledProcessError, OSError):
+        return None
+    return os.path.realpath(output.strip())
+
+
+@functools.lru_cache(maxsize=None)
+def get_repository_changes(root: str, ref: str) -> Optional[frozenset[str]]:
+    """Get the absolute paths of files changed since a reference in a repository.
+
+    The result is cached so each repository in a workspace is only checked once.
+    """
+    try:
+        base = subprocess.check_output(
+            ["git", "-C", root, "merge-base", ref, "HEAD"],
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+        ).strip()
+        changed = subprocess.check_output(
+            ["git", "-C", root, "diff", "--name-only", "-z", base, "--"],
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+        )
+        untracked = subprocess.check_output(
+            ["git", "-C", root, "ls-files", "--others", "--exclude-standard", "-z"],
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+        )
+    except subprocess.CalledProcessError as ex:
+        logging.warning("Unable to find files changed since %s in %s.", ref, root)
+        logging.warning("Exception output: %s", ex.output)
+        return None
+    except OSError as ex:
+        logging.warning("Couldn't run git to find changed files! (%s)", ex)
+        return None
+
+    paths = changed.split("\0") + untracked.split("\0")
+    return frozenset(os.path.join(root, path) for path in paths if path)
+
+
+def get_changed_files(path: str, ref: str) -> Optional[set[str]]:
+    """Get the files under a path that have changed since a reference.
+
+    Paths are returned under the given path, in the same form as package files. Returns
+    None if the changed files can't be found, such as when the path is not in a git
+    repository.
+    """
+    path = os.path.abspath(path)
+    root = get_repository_root(path)
+    if root is None:
+        logging.warning("%s is not in a git repository.", path)
+        return None
+    changes = get_repository_changes(root, ref)
+    if changes is None:
+        return None
+
+    real_path = os.path.join(os.path.realpath(path), "")
+    return {
+        os.path.join(path, os.path.relpath(change, real_path))
+        for change in changes
+        if change.startswith(real_path)
+    }
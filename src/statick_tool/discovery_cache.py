@@ -0,0 +1,136 @@
+"""Persist file types and discovery plugin results between runs.
+
+Files are identified by their path, size, modification time, and inode. A file whose
+metadata has not changed since the last run reuses the stored file type, and a discovery
+plugin whose package files have not changed reuses its stored results.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from typing import Any, Optional
+
+from statick_tool.cache import Cache
+from statick_tool.package import Package
+
+FileStat = tuple[int, int, int]
+
+
+class DiscoveryCache(Cache):
+    """Persist file types and discovery plugin results between runs."""
+
+    filename = "discovery.sqlite"
+    schema = [
+        "CREATE TABLE IF NOT EXISTS files ("
+        " path TEXT PRIMARY KEY, package TEXT NOT NULL, size INTEGER NOT NULL,"
+        " mtime_ns INTEGER NOT NULL, inode INTEGER NOT NULL, file_cmd_out TEXT)",
+        "CREATE INDEX IF NOT EXISTS files_package ON files (package)",
+        "CREATE TABLE IF NOT EXISTS results ("
+        " package TEXT NOT NULL, plugin TEXT NOT NULL, fingerprint TEXT NOT NULL,"
+        " results TEXT NOT NULL, PRIMARY KEY (package, plugin))",
+    ]
+
+    @staticmethod
+    def get_file_stat(path: str) -> Optional[FileStat]:
+        """Get the metadata used to tell if a file has changed."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+    def get_files(self, package: Package) -> dict[str, tuple[FileStat, Optional[str]]]:
+        """Get the stored metadata and file type of each file in a package."""
+        try:
+            rows = self.execute(
+                "SELECT path, size, mtime_ns, inode, file_cmd_out FROM files"
+                " WHERE package = ?",
+                (package.path,),
+            )
+        except sqlite3.Error as ex:
+            logging.warning("Unable to read discovery cache: %s", ex)
+            return {}
+        return {row[0]: ((row[1], row[2], row[3]), row[4]) for row in rows}
+
+    def update_files(self, package: Package, stats: dict[str, FileStat]) -> None:
+        """Store the metadata and file type of each file in a package.
+
+        Entries for files that no longer exist in the package are removed.
+        """
+        stored = self.get_files(package)
+        rows = []
+        for path, stat in stats.items():
+            record = package.files.get(path)
+            if record is None:
+                continue
+            # Don't force the file type to be found just to store it.
+            file_cmd_out = record.get_file_cmd_out(resolve=False)
+            if stored.get(path) != (stat, file_cmd_out):
+                rows.append((path, package.path, *stat, file_cmd_out))
+        stale = [(path,) for path in stored if path not in stats]
+        try:
+            self.executemany(
+                "INSERT OR REPLACE INTO files"
+                " (path, package, size, mtime_ns, inode, file_cmd_out)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self.executemany("DELETE FROM files WHERE path = ?", stale)
+        except sqlite3.Error as ex:
+            logging.warning("Unable to update discovery cache: %s", ex)
+
+    @staticmethod
+    def get_fingerprint(
+        package: Package, stats: dict[str, FileStat], *extra: Any
+    ) -> str:
+        """Get a fingerprint of the files and anything else the results depend on."""
+        digest = hashlib.sha256()
+        digest.update(package.path.encode("utf-8", "surrogateescape"))
+        for path in sorted(stats):
+            digest.update(f"\0{path}\0{stats[path]}".encode("utf-8", "surrogateescape"))
+        digest.update(json.dumps(extra, sort_keys=True, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get_results(
+        self, package: Package, plugin: str, fingerprint: str
+    ) -> Optional[dict[str, Any]]:
+        """Get the stored package entries set by a discovery plugin.
+
+        Returns None if there are no stored results for the fingerprint.
+        """
+        try:
+            rows = self.execute(
+                "SELECT results FROM results"
+                " WHERE package = ? AND plugin = ? AND fingerprint = ?",
+                (package.path, plugin, fingerprint),
+            )
+        except sqlite3.Error as ex:
+            logging.warning("Unable to read discovery cache: %s", ex)
+            return None
+        if not rows:
+            return None
+        results: dict[str, Any] = json.loads(rows[0][0])
+        return results
+
+    def set_results(
+        self, package: Package, plugin: str, fingerprint: str, results: dict[str, Any]
+    ) -> None:
+        """Store the package entries set by a discovery plugin.
+
+        Stored results for an older fingerprint are replaced.
+        """
+        try:
+            serialized = json.dumps(results)
+        except (TypeError, ValueError):
+            logging.debug("Results from %s can't be cached.", plugin)
+            return
+        try:
+            self.execute(
+                "INSERT OR REPLACE INTO results (package, plugin, fingerprint, results)"
+                " VALUES (?, ?, ?, ?)",
+                (package.path, plugin, fingerprint, serialized),
+            )
+        except sqlite3.Error as ex:
+            logging.warning("Unable to update discovery cache: %s", ex)
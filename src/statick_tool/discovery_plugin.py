@@ -3,12 +3,16 @@
 import logging
 import os
 import subprocess
-import sys
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Optional, Union
 
+from statick_tool import file_classifier
+from statick_tool.discovery_cache import DiscoveryCache
 from statick_tool.exceptions import Exceptions
+from statick_tool.file_record import FileRecord, FileTypeResolver
+from statick_tool.git_files import get_package_git_files
 from statick_tool.package import Package
 from statick_tool.plugin_context import PluginContext
+from statick_tool.walk import DirectoryFilter, filter_paths, walk
 
 
 class DiscoveryPlugin:
@@ -24,6 +28,24 @@ class DiscoveryPlugin:
         """Get a list of discovery plugins that must run before this one."""
         return []
 
+    @classmethod
+    def get_package_keys(cls) -> Optional[list[str]]:
+        """Get the package keys the plugin sets.
+
+        The plugin is only run when an enabled tool reads one of these keys. Returns
+        None if the keys are not known, so the plugin always runs.
+        """
+        return None
+
+    @classmethod
+    def is_cacheable(cls) -> bool:
+        """Return whether the results of the plugin only depend on the package files.
+
+        Results of cacheable plugins are reused from the discovery cache when none of
+        the files in the package have changed.
+        """
+        return False
+
     def gather_args(self, args: Any) -> None:
         """Gather arguments for plugin."""
 
@@ -36,24 +58,90 @@ class DiscoveryPlugin:
         which files the plugin detects.
         """
 
-    def find_files(self, package: Package) -> None:
-        """Walk the package path exactly once to discover files for analysis."""
-        if package._walked:  # pylint: disable=protected-access
+    def list_files(self, package: Package, dir_filter: DirectoryFilter) -> list[str]:
+        """Get the absolute paths of the files in a package.
+
+        When the package is in a git repository, the files are the files git tracks and
+        untracked files that are not ignored, and the git hashes of unmodified files are
+        kept with the package. Otherwise, or with `--no-git-files`, the package path is
+        walked. Packages found by walking a workspace already have their files, which
+        are only limited to the files git lists.
+        """
+        paths: Optional[Iterable[str]] = package.file_list
+        use_git = self.plugin_context is None or not getattr(
+            self.plugin_context.args, "no_git_files", False
+        )
+        if use_git:
+            git_files = get_package_git_files(package)
+            if git_files is not None:
+                if paths is None:
+                    paths = git_files
+                else:
+                    paths = [path for path in paths if path in git_files]
+        if paths is not None:
+            return filter_paths(os.path.abspath(package.path), paths, dir_filter)
+        return [
+            os.path.abspath(os.path.join(root, fname))
+            for root, _, files in walk(package.path, dir_filter)
+            for fname in files
+        ]
+
+    def find_files(
+        self,
+        package: Package,
+        cache: Optional[DiscoveryCache] = None,
+        exceptions: Optional[Exceptions] = None,
+    ) -> None:
+        """Find the files in the package exactly once to discover files for analysis.
+
+        The file type of each file (the "file_cmd_out" entry) is only determined the
+        first time a discovery plugin asks for it. If a cache is given, the file type
+        stored for a file is reused when the file has not changed. If exceptions are
+        given, whether each file is excepted for all tools is found once here, and the
+        exception matcher is kept with the package so tools can skip excepted files.
+        Discovery plugins leave excepted files out with the file index. Files in
+        directories that are ignored or excepted for all tools are not found.
+        """
+        if package.files_found:
+            if exceptions is not None and package.exception_matcher is None:
+                self.find_excepted_files(package, exceptions)
             return
 
-        for root, _, files in os.walk(package.path):
-            for fname in files:
-                full_path = os.path.join(root, fname)
-                abs_path = os.path.abspath(full_path)
-                file_output = self.get_file_cmd_output(full_path)
-                file_dict = {
-                    "name": fname.lower(),
-                    "path": abs_path,
-                    "file_cmd_out": file_output,
-                }
-                package.files[abs_path] = file_dict
+        resolver = FileTypeResolver()
+        stored = {}
+        if cache is not None:
+            stored = cache.get_files(package)
+        dir_filter = DirectoryFilter.from_exceptions(exceptions, package)
+        for abs_path in self.list_files(package, dir_filter):
+            if (
+                package.changed_files is not None
+                and abs_path not in package.changed_files
+            ):
+                continue
+            file_cmd_out = None
+            if cache is not None:
+                stat = cache.get_file_stat(abs_path)
+                if stat is not None:
+                    package.file_stats[abs_path] = stat
+                    if abs_path in stored and stored[abs_path][0] == stat:
+                        file_cmd_out = stored[abs_path][1]
+            package.files[abs_path] = FileRecord(abs_path, resolver, file_cmd_out)
+
+        package.files_found = True
+        if exceptions is not None:
+            self.find_excepted_files(package, exceptions)
 
-        package._walked = True  # pylint: disable=protected-access
+    @staticmethod
+    def find_excepted_files(package: Package, exceptions: Exceptions) -> None:
+        """Mark the files of the package that are excepted for all tools."""
+        matcher = exceptions.get_matcher(package)
+        package.exception_matcher = matcher
+        excepted = 0
+        for path, record in package.files.items():
+            record.excepted = matcher.is_file_excepted(path)
+            excepted += record.excepted
+        if excepted:
+            logging.info("  %d files are excepted for all tools.", excepted)
 
     def get_file_cmd_output(self, full_path: str) -> str:
         """Run the file command (if it exists) on the supplied path.
@@ -94,14 +182,4 @@ class DiscoveryPlugin:
     @staticmethod
     def file_command_exists() -> bool:
         """Return whether the 'file' command is available on $PATH."""
-        if sys.platform == "win32":
-            command_name = "file.exe"
-        else:
-            command_name = "file"
-
-        for path in os.environ["PATH"].split(os.pathsep):
-            exe_path = os.path.join(path, command_name)
-            if os.path.isfile(exe_path) and os.access(exe_path, os.X_OK):
-                return True
-
-        return False
+        return file_classifier.file_command_exists()
@@ -11,15 +11,322 @@ set in the tool plugin that generates the issues.
 
 import fnmatch
 import logging
+import mmap
 import os
 import re
-from typing import Any, Match, Optional, Pattern
+from typing import Any, Optional, Pattern, Sequence, TypeVar, cast
 
 import yaml
 
-from statick_tool.issue import Issue
+from statick_tool.issue import Issue, IssueTable
 from statick_tool.package import Package
 
+# Hack to avoid exceptions for everything on Travis CI: this glob is matched against
+# absolute paths with the Travis build directory removed.
+TRAVIS_GLOB = "*/build/*"
+TRAVIS_PREFIX = "/home/travis/build/"
+
+# Markers that suppress the issues on the line they are on.
+DEFAULT_NOLINT_MARKERS = ["NOLINT"]
+
+# Files at least this large are memory mapped instead of read when finding markers.
+MMAP_SIZE = 1024 * 1024
+
+LINE_BREAK = re.compile(rb"\r\n?|\n")
+
+# Issues of a tool, as a list or an issue table.
+IssuesT = TypeVar("IssuesT", bound=Sequence[Issue])
+
+
+def remove_issues(issues: IssuesT, to_remove: set[Issue]) -> IssuesT:
+    """Get the issues that are not in a set, keeping an issue table as a table."""
+    if isinstance(issues, IssueTable):
+        return cast(IssuesT, issues.filter(lambda issue: issue not in to_remove))
+    return cast(IssuesT, [issue for issue in issues if issue not in to_remove])
+
+
+def split_glob(glob: str) -> tuple[str, str]:
+    """Split a glob into its literal prefix and a regular expression for the rest."""
+    match = re.search(r"[*?[]", glob)
+    end = match.start() if match else len(glob)
+    return glob[:end], fnmatch.translate(glob[end:])
+
+
+def get_prefix_tree(globs: list[tuple[str, str]]) -> str:
+    """Get a regular expression that matches any of the split globs.
+
+    Globs are grouped by their literal prefixes, one character at a time, so a path is
+    compared with each distinct prefix once instead of once for every glob.
+    """
+    branches: dict[str, list[tuple[str, str]]] = {}
+    alternatives: list[str] = []
+    for prefix, rest in globs:
+        if prefix:
+            branches.setdefault(prefix[0], []).append((prefix[1:], rest))
+        else:
+            alternatives.append(rest)
+    alternatives = [
+        re.escape(char) + get_prefix_tree(branch)
+        for char, branch in sorted(branches.items())
+    ] + alternatives
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return f"(?:{'|'.join(alternatives)})"
+
+
+def compile_globs(globs: list[str]) -> Optional[Pattern[str]]:
+    """Combine glob patterns into one regular expression that matches like fnmatch.
+
+    Returns None if there are no globs.
+    """
+    if not globs:
+        return None
+    leading: list[tuple[str, str]] = []
+    other: list[tuple[str, str]] = []
+    for glob in sorted({os.path.normcase(glob) for glob in globs}):
+        if glob.startswith("*"):
+            # Match the leading `*` once for all globs that start with it.
+            leading.append(split_glob(glob.lstrip("*")))
+        else:
+            other.append(split_glob(glob))
+    alternatives = []
+    if leading:
+        alternatives.append("(?s:.*)" + get_prefix_tree(leading))
+    if other:
+        alternatives.append(get_prefix_tree(other))
+    return re.compile("|".join(f"(?:{alternative})" for alternative in alternatives))
+
+
+def applies_to(exception: dict[str, Any], tool: str) -> bool:
+    """Return whether an exception applies to the issues of a tool."""
+    return bool(exception["tools"] == "all" or tool in exception["tools"])
+
+
+class GlobMatcher:
+    """Match paths against a set of file exception globs."""
+
+    def __init__(self, globs: list[str]) -> None:
+        """Compile the globs."""
+        self.relative = compile_globs(globs)
+        self.absolute = compile_globs([glob for glob in globs if glob != TRAVIS_GLOB])
+        self.travis = compile_globs([TRAVIS_GLOB]) if TRAVIS_GLOB in globs else None
+
+    def match_absolute(self, path: str) -> bool:
+        """Return whether an absolute path matches any of the globs."""
+        path = os.path.normcase(path)
+        if self.absolute is not None and self.absolute.match(path):
+            return True
+        if self.travis is not None:
+            if path.startswith(TRAVIS_PREFIX):
+                path = path[len(TRAVIS_PREFIX) :]
+            return self.travis.match(path) is not None
+        return False
+
+    def match(self, path: str, rel_path: str) -> bool:
+        """Return whether an absolute path or its relative path match any glob."""
+        if self.match_absolute(path):
+            return True
+        return bool(
+            self.relative is not None
+            and self.relative.match(os.path.normcase(rel_path))
+        )
+
+
+class ExceptionMatcher:  # pylint: disable=too-many-instance-attributes
+    """Match issues against the exceptions for a package.
+
+    Globs are translated into one regular expression for each tool and each message
+    regex is compiled once, so the matcher can be reused for all issues in a package.
+    """
+
+    def __init__(
+        self,
+        package_path: str,
+        file_exceptions: list[Any],
+        regex_exceptions: list[Any],
+    ) -> None:
+        """Compile the exceptions."""
+        self.package_path = package_path
+        self.file_exceptions = file_exceptions
+        self.regex_exceptions: list[tuple[Any, Optional[Pattern[str]], Pattern[str]]]
+        self.regex_exceptions = []
+        for exception in regex_exceptions:
+            try:
+                compiled_re = re.compile(exception["regex"])
+            except re.error:
+                logging.warning(
+                    "Invalid regular expression in exception: %s", exception["regex"]
+                )
+                continue
+            globs = compile_globs(exception.get("globs") or [])
+            self.regex_exceptions.append((exception["tools"], globs, compiled_re))
+        self.file_globs: dict[str, Optional[GlobMatcher]] = {}
+        self.excepted_files: dict[str, bool] = {}
+        self.excepted_paths: dict[tuple[str, str], bool] = {}
+        all_tools_globs = [
+            glob
+            for exception in file_exceptions
+            if exception["tools"] == "all"
+            for glob in exception["globs"]
+        ]
+        self.all_tools_globs = GlobMatcher(all_tools_globs) if all_tools_globs else None
+        # A glob ending with "*" that matches a directory matches everything in it.
+        dir_globs = [glob for glob in all_tools_globs if glob.endswith("*")]
+        self.all_tools_dir_globs = GlobMatcher(dir_globs) if dir_globs else None
+        self.message_regexes: dict[
+            str, list[tuple[Optional[Pattern[str]], Pattern[str]]]
+        ] = {}
+        # Tools that have been warned about, so issues streamed in batches only warn once.
+        self.warned_tools: set[str] = set()
+
+    def get_file_globs(self, tool: str) -> Optional[GlobMatcher]:
+        """Get the matcher for file exception globs that apply to a tool."""
+        if tool not in self.file_globs:
+            globs = [
+                glob
+                for exception in self.file_exceptions
+                if applies_to(exception, tool)
+                for glob in exception["globs"]
+            ]
+            self.file_globs[tool] = GlobMatcher(globs) if globs else None
+        return self.file_globs[tool]
+
+    def get_message_regexes(
+        self, tool: str
+    ) -> list[tuple[Optional[Pattern[str]], Pattern[str]]]:
+        """Get the globs and message regexes of the regex exceptions for a tool."""
+        if tool not in self.message_regexes:
+            self.message_regexes[tool] = [
+                (globs, compiled_re)
+                for tools, globs, compiled_re in self.regex_exceptions
+                if applies_to({"tools": tools}, tool)
+            ]
+        return self.message_regexes[tool]
+
+    def is_file_excepted(self, path: str) -> bool:
+        """Return whether a file is excepted for all tools.
+
+        Results are remembered, so files found during discovery are only matched once.
+        """
+        excepted = self.excepted_files.get(path)
+        if excepted is None:
+            excepted = (
+                self.all_tools_globs is not None
+                and self.all_tools_globs.match_absolute(path)
+            )
+            self.excepted_files[path] = excepted
+        return excepted
+
+    def is_dir_excepted(self, path: str) -> bool:
+        """Return whether every file in a directory is excepted for all tools."""
+        return (
+            self.all_tools_dir_globs is not None
+            and self.all_tools_dir_globs.match_absolute(os.path.join(path, ""))
+        )
+
+    def is_path_excepted(self, tool: str, path: str) -> bool:
+        """Return whether the file exceptions for a tool match a path.
+
+        File exceptions are only applied to absolute paths. Results are remembered,
+        since most files have more than one issue.
+        """
+        key = (tool, path)
+        excepted = self.excepted_paths.get(key)
+        if excepted is None:
+            globs = self.get_file_globs(tool)
+            excepted = (
+                globs is not None
+                and os.path.isabs(path)
+                and globs.match(path, os.path.relpath(path, self.package_path))
+            )
+            self.excepted_paths[key] = excepted
+        return excepted
+
+    def is_excepted(self, tool: str, issue: Issue) -> bool:
+        """Return whether an issue from a tool is excepted."""
+        if self.is_path_excepted(tool, issue.filename):
+            return True
+        filename = os.path.normcase(issue.filename)
+        for file_re, message_re in self.get_message_regexes(tool):
+            if (file_re is None or file_re.match(filename)) and message_re.match(
+                issue.message
+            ):
+                return True
+        return False
+
+    def filter_issues(self, issues: dict[str, IssuesT]) -> dict[str, IssuesT]:
+        """Remove the issues that are excepted."""
+        for tool, tool_issues in list(issues.items()):
+            if (
+                self.file_exceptions
+                and tool not in self.warned_tools
+                and not all(os.path.isabs(issue.filename) for issue in tool_issues)
+            ):
+                Exceptions.print_exception_warning(tool)
+                self.warned_tools.add(tool)
+            if self.get_file_globs(tool) is None and not self.get_message_regexes(tool):
+                continue
+            to_remove = {
+                issue for issue in tool_issues if self.is_excepted(tool, issue)
+            }
+            if to_remove:
+                issues[tool] = remove_issues(tool_issues, to_remove)
+        return issues
+
+
+class NolintIndex:
+    """Find the lines of files that have a marker suppressing their issues.
+
+    Each file is read once, no matter how many issues or tools report it, and the lines
+    with markers are kept so checking an issue is a set lookup.
+    """
+
+    def __init__(self, markers: Optional[list[str]] = None) -> None:
+        """Compile the markers."""
+        if not markers:
+            markers = DEFAULT_NOLINT_MARKERS
+        self.pattern = re.compile(
+            b"|".join(re.escape(marker.encode("utf-8")) for marker in markers)
+        )
+        self.lines: dict[str, Optional[frozenset[int]]] = {}
+        self.warned_tools: set[str] = set()
+
+    def find_lines(self, data: Any) -> frozenset[int]:
+        """Get the numbers of the lines that contain a marker.
+
+        Lines end with any of the line breaks that Python recognizes when reading text.
+        """
+        lines = set()
+        line_number = 1
+        position = 0
+        for match in self.pattern.finditer(data):
+            line_number += len(LINE_BREAK.findall(data, position, match.start()))
+            position = match.start()
+            lines.add(line_number)
+        return frozenset(lines)
+
+    def read_lines(self, filename: str) -> Optional[frozenset[int]]:
+        """Read a file and get the numbers of the lines that contain a marker.
+
+        Returns None if the file can't be read.
+        """
+        try:
+            with open(filename, "rb") as fid:
+                if os.fstat(fid.fileno()).st_size < MMAP_SIZE:
+                    return self.find_lines(fid.read())
+                with mmap.mmap(fid.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return self.find_lines(data)
+        except (OSError, ValueError) as exc:
+            logging.warning("Could not read %s: %s", filename, exc)
+            return None
+
+    def is_suppressed(self, filename: str, line_number: int) -> bool:
+        """Return whether a line of a file has a marker on it."""
+        if filename not in self.lines:
+            self.lines[filename] = self.read_lines(filename)
+        lines = self.lines[filename]
+        return lines is not None and line_number in lines
+
 
 class Exceptions:
     """Interface for applying exceptions."""
@@ -33,6 +340,7 @@ class Exceptions:
                 self.exceptions: dict[Any, Any] = yaml.safe_load(fname)
             except (yaml.YAMLError, yaml.scanner.ScannerError) as ex:
                 raise ValueError(f"{filename} is not a valid YAML file: {ex}") from ex
+        self.matchers: dict[tuple[str, str], ExceptionMatcher] = {}
 
     def get_ignore_packages(self) -> list[str]:
         """Get list of packages to skip when scanning a workspace."""
@@ -44,6 +352,16 @@ class Exceptions:
             ignore = self.exceptions["ignore_packages"]
         return ignore
 
+    def get_ignore_directories(self) -> list[str]:
+        """Get names of directories to skip when finding files and packages."""
+        ignore: list[str] = []
+        if (
+            "ignore_directories" in self.exceptions
+            and self.exceptions["ignore_directories"] is not None
+        ):
+            ignore = self.exceptions["ignore_directories"]
+        return ignore
+
     def get_exceptions(self, package: Package) -> dict[Any, Any]:
         """Get specific exceptions for given package."""
         exceptions: dict[Any, Any] = {"file": [], "message_regex": []}
@@ -76,6 +394,20 @@ class Exceptions:
 
         return exceptions
 
+    def get_matcher(self, package: Package) -> ExceptionMatcher:
+        """Get a matcher for the exceptions of a package.
+
+        The matcher is built once for each package and shared by discovery, tool, and
+        issue filtering.
+        """
+        key = (package.name, package.path)
+        if key not in self.matchers:
+            exceptions = self.get_exceptions(package)
+            self.matchers[key] = ExceptionMatcher(
+                package.path, exceptions["file"], exceptions["message_regex"]
+            )
+        return self.matchers[key]
+
     def filter_file_exceptions_early(
         self, package: Package, file_list: list[str]
     ) -> list[str]:
@@ -83,153 +415,82 @@ class Exceptions:
 
         Only filters files which have tools=all, intended for use after the discovery
         plugins have been run (so that Statick doesn't run the tool plugins against
-        files which will be ignored anyway).
+        files which will be ignored anyway). Files found with exceptions by
+        `DiscoveryPlugin.find_files` were already matched, so they are only looked up.
         """
-        exceptions: dict[Any, Any] = self.get_exceptions(package)
-        to_remove = []
-        for filename in file_list:
-            removed = False
-            for exception in exceptions["file"]:
-                if exception["tools"] == "all":
-                    for pattern in exception["globs"]:
-                        # Hack to avoid exceptions for everything on Travis CI.
-                        fname = filename
-                        prefix = "/home/travis/build/"
-                        if pattern == "*/build/*" and fname.startswith(prefix):
-                            fname = fname[len(prefix) :]
-                        if fnmatch.fnmatch(fname, pattern):
-                            to_remove.append(filename)
-                            removed = True
-                            break
-                    if removed:
-                        break
-        file_list = [filename for filename in file_list if filename not in to_remove]
-        return file_list
+        matcher = self.get_matcher(package)
+        return [
+            filename for filename in file_list if not matcher.is_file_excepted(filename)
+        ]
 
     def filter_file_exceptions(
-        self, package: Package, exceptions: list[Any], issues: dict[str, list[Issue]]
-    ) -> dict[str, list[Issue]]:
+        self, package: Package, exceptions: list[Any], issues: dict[str, IssuesT]
+    ) -> dict[str, IssuesT]:
         """Filter issues based on file pattern exceptions list."""
-        for tool, tool_issues in list(  # pylint: disable=too-many-nested-blocks
-            issues.items()
-        ):
-            warning_printed = False
-            to_remove: list[Issue] = []
-            for issue in tool_issues:
-                if not os.path.isabs(issue.filename):
-                    if not warning_printed:
-                        self.print_exception_warning(tool)
-                        warning_printed = True
-                    continue
-                rel_path: str = os.path.relpath(issue.filename, package.path)
-                for exception in exceptions:
-                    if exception["tools"] == "all" or tool in exception["tools"]:
-                        for pattern in exception["globs"]:
-                            # Hack to avoid exceptions for everything on Travis CI.
-                            fname: str = issue.filename
-                            prefix: str = "/home/travis/build/"
-                            if pattern == "*/build/*" and fname.startswith(prefix):
-                                fname = fname[len(prefix) :]
-                            if fnmatch.fnmatch(fname, pattern) or fnmatch.fnmatch(
-                                rel_path, pattern
-                            ):
-                                to_remove.append(issue)
-            issues[tool] = [issue for issue in tool_issues if issue not in to_remove]
-
-        return issues
+        return ExceptionMatcher(package.path, exceptions, []).filter_issues(issues)
 
     @classmethod
     def filter_regex_exceptions(
-        cls, exceptions: list[Any], issues: dict[str, list[Issue]]
-    ) -> dict[str, list[Issue]]:
+        cls, exceptions: list[Any], issues: dict[str, IssuesT]
+    ) -> dict[str, IssuesT]:
         """Filter issues based on message regex exceptions list."""
-        for exception in exceptions:  # pylint: disable=too-many-nested-blocks
-            exception_re = exception["regex"]
-            exception_tools = exception["tools"]
-            exception_globs = []
-            if "globs" in exception:
-                exception_globs = exception["globs"]
-            try:
-                compiled_re: Pattern[str] = re.compile(exception_re)
-            except re.error:
-                logging.warning(
-                    "Invalid regular expression in exception: %s", exception_re
-                )
-                continue
-            for tool, tool_issues in list(issues.items()):
-                to_remove = []
-                if exception_tools == "all" or tool in exception_tools:
-                    for issue in tool_issues:
-                        if exception_globs:
-                            for pattern in exception_globs:
-                                if fnmatch.fnmatch(issue.filename, pattern):
-                                    match: Optional[Match[str]] = compiled_re.match(
-                                        issue.message
-                                    )
-                                    if match:
-                                        to_remove.append(issue)
-                        else:
-                            match_re: Optional[Match[str]] = compiled_re.match(
-                                issue.message
-                            )
-                            if match_re:
-                                to_remove.append(issue)
-                issues[tool] = [
-                    issue for issue in tool_issues if issue not in to_remove
-                ]
-        return issues
+        return ExceptionMatcher("", [], exceptions).filter_issues(issues)
+
+    def get_nolint_markers(self) -> list[str]:
+        """Get the markers that suppress the issues on their line."""
+        markers: list[str] = DEFAULT_NOLINT_MARKERS
+        if self.exceptions and self.exceptions.get("nolint_markers"):
+            markers = [str(marker) for marker in self.exceptions["nolint_markers"]]
+        return markers
 
-    def filter_nolint(self, issues: dict[str, list[Issue]]) -> dict[str, list[Issue]]:
+    def filter_nolint(
+        self, issues: dict[str, IssuesT], index: Optional[NolintIndex] = None
+    ) -> dict[str, IssuesT]:
         """Filter out lines that have an explicit NOLINT on them.
 
         Sometimes the tools themselves don't properly filter these out if there is a
-        complex macro or something.
+        complex macro or something. Any of the configured markers can be used in place
+        of NOLINT.
         """
+        if index is None:
+            index = NolintIndex(self.get_nolint_markers())
         for tool, tool_issues in list(issues.items()):
-            warning_printed: bool = False
-            to_remove: list[Issue] = []
+            to_remove: set[Issue] = set()
             for issue in tool_issues:
                 if not os.path.isabs(issue.filename):
-                    if not warning_printed:
+                    if tool not in index.warned_tools:
                         self.print_exception_warning(tool)
-                        warning_printed = True
+                        index.warned_tools.add(tool)
                     continue
-                try:
-                    with open(issue.filename, encoding="utf-8") as fid:
-                        try:
-                            lines = fid.readlines()
-                        except UnicodeDecodeError as exc:
-                            logging.warning(
-                                "Could not read %s: %s", issue.filename, exc
-                            )
-                            continue
-                except FileNotFoundError as exc:
-                    logging.warning("Could not read %s: %s", issue.filename, exc)
-                    continue
-                if len(lines) <= 0:
-                    continue
-                line_number = issue.line_number - 1
-                if line_number < len(lines) and "NOLINT" in lines[line_number]:
-                    to_remove.append(issue)
-            issues[tool] = [issue for issue in tool_issues if issue not in to_remove]
+                if index.is_suppressed(issue.filename, issue.line_number):
+                    to_remove.add(issue)
+            if to_remove:
+                issues[tool] = remove_issues(tool_issues, to_remove)
         return issues
 
     def filter_issues(
-        self, package: Package, issues: dict[str, list[Issue]]
-    ) -> dict[str, list[Issue]]:
+        self, package: Package, issues: dict[str, IssuesT]
+    ) -> dict[str, IssuesT]:
         """Filter issues based on exceptions list."""
-        exceptions = self.get_exceptions(package)
-
-        if exceptions["file"]:
-            issues = self.filter_file_exceptions(package, exceptions["file"], issues)
-
-        if exceptions["message_regex"]:
-            issues = self.filter_regex_exceptions(exceptions["message_regex"], issues)
-
+        issues = self.get_matcher(package).filter_issues(issues)
         issues = self.filter_nolint(issues)
 
         return issues
 
+    def filter_tool_issues(
+        self,
+        package: Package,
+        tool: str,
+        issues: IssuesT,
+        index: Optional[NolintIndex] = None,
+    ) -> IssuesT:
+        """Filter some of the issues from one tool, such as a batch of streamed issues.
+
+        Pass the same NOLINT index for each batch so files are only read once.
+        """
+        filtered = self.get_matcher(package).filter_issues({tool: issues})
+        return self.filter_nolint(filtered, index)[tool]
+
     @classmethod
     def print_exception_warning(cls, tool: str) -> None:
         """Print warning about exception not being applied for an issue.
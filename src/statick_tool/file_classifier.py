@@ -0,0 +1,226 @@
+"""Classify files in-process using magic bytes, shebang lines, and file extensions.
+
+The descriptions match the lowercase output of the `file` command closely enough for the
+checks done by discovery plugins, such as "python script" or "c source". Files that
+can't be classified in-process are passed to a single batched `file` command.
+"""
+
+import functools
+import logging
+import os
+import subprocess
+import sys
+from typing import Optional
+
+# Number of bytes read from the start of each file for classification.
+HEADER_SIZE = 2048
+
+MAGIC_BYTES: list[tuple[bytes, str]] = [
+    (b"\x7fELF", "elf"),
+    (b"\x89PNG\r\n\x1a\n", "png image data"),
+    (b"\xff\xd8\xff", "jpeg image data"),
+    (b"GIF87a", "gif image data"),
+    (b"GIF89a", "gif image data"),
+    (b"%PDF-", "pdf document"),
+    (b"\x1f\x8b", "gzip compressed data"),
+    (b"BZh", "bzip2 compressed data"),
+    (b"\xfd7zXZ\x00", "xz compressed data"),
+    (b"PK\x03\x04", "zip archive data"),
+    (b"\xca\xfe\xba\xbe", "compiled java class data"),
+    (b"SQLite format 3\x00", "sqlite 3.x database"),
+    (b"!<arch>\n", "current ar archive"),
+]
+
+SHEBANG_INTERPRETERS: dict[str, str] = {
+    "bash": "bourne-again shell script",
+    "csh": "c shell script",
+    "dash": "a dash script",
+    "ksh": "korn shell script",
+    "node": "node.js script",
+    "perl": "perl script",
+    "python": "python script",
+    "ruby": "ruby script",
+    "sh": "posix shell script",
+    "tcsh": "tenex c shell script",
+    "zsh": "paul falstad's zsh script",
+}
+
+TEXT_EXTENSIONS: dict[str, str] = {
+    ".bib": "bibtex text file",
+    ".c": "c source",
+    ".cc": "c++ source",
+    ".cfg": "text",
+    ".cmake": "text",
+    ".cpp": "c++ source",
+    ".css": "css source",
+    ".csv": "csv text",
+    ".cxx": "c++ source",
+    ".groovy": "groovy source",
+    ".h": "c source",
+    ".hh": "c++ source",
+    ".hpp": "c++ source",
+    ".htm": "html document",
+    ".html": "html document",
+    ".hxx": "c++ source",
+    ".ini": "text",
+    ".java": "java source",
+    ".js": "javascript source",
+    ".json": "json text data",
+    ".launch": "xml 1.0 document",
+    ".md": "text",
+    ".pddl": "text",
+    ".pl": "perl script",
+    ".py": "python script",
+    ".rst": "text",
+    ".tex": "latex document",
+    ".toml": "text",
+    ".txt": "text",
+    ".xml": "xml 1.0 document",
+    ".yaml": "text",
+    ".yml": "text",
+}
+
+
+def get_shebang_description(header: bytes) -> Optional[str]:
+    """Get the description of a script from its shebang line."""
+    if not header.startswith(b"#!"):
+        return None
+    line = header[2:].split(b"\n", 1)[0].decode("utf-8", "replace").split()
+    if not line:
+        return None
+    interpreter = os.path.basename(line[0])
+    if interpreter == "env":
+        args = [arg for arg in line[1:] if not arg.startswith("-")]
+        if not args:
+            return None
+        interpreter = os.path.basename(args[0])
+    for name, description in SHEBANG_INTERPRETERS.items():
+        if interpreter == name or (
+            name in ("python", "perl", "ruby") and interpreter.startswith(name)
+        ):
+            return description
+    return f"a {interpreter} script"
+
+
+def get_text_encoding(header: bytes) -> Optional[str]:
+    """Get the text encoding description, or None if the data is binary."""
+    if b"\x00" in header:
+        return None
+    try:
+        header.decode("ascii")
+        return "ascii text"
+    except UnicodeDecodeError:
+        pass
+    try:
+        # A multibyte character may be cut off at the end of the header.
+        header[: len(header) - 3 if len(header) == HEADER_SIZE else None].decode(
+            "utf-8"
+        )
+        return "unicode text, utf-8 text"
+    except UnicodeDecodeError:
+        return None
+
+
+def get_magic_description(header: bytes) -> Optional[str]:
+    """Get the description of a file from its magic bytes, or None if none match."""
+    for magic, description in MAGIC_BYTES:
+        if header.startswith(magic):
+            return description
+    return None
+
+
+def get_text_description(path: str, header: bytes, encoding: str) -> Optional[str]:
+    """Get the description of a text file from its shebang line or extension."""
+    script = get_shebang_description(header)
+    if script is not None:
+        if script == "perl script":
+            return "perl script text executable"
+        return f"{script}, {encoding} executable"
+
+    _, ext = os.path.splitext(path)
+    ext_description: Optional[str] = TEXT_EXTENSIONS.get(ext.lower())
+    if ext_description is None:
+        return None
+    if ext_description == "text":
+        return encoding
+    return f"{ext_description}, {encoding}"
+
+
+def classify_file(path: str) -> Optional[str]:
+    """Classify a file without running the `file` command.
+
+    Returns a lowercase description or None if the file type can't be decided.
+    """
+    try:
+        with open(path, "rb") as fid:
+            header = fid.read(HEADER_SIZE)
+    except OSError:
+        return None
+
+    if not header:
+        return "empty"
+
+    description = get_magic_description(header)
+    if description is not None:
+        return description
+
+    encoding = get_text_encoding(header)
+    if encoding is None:
+        return None
+    return get_text_description(path, header, encoding)
+
+
+def get_file_cmd_outputs(paths: list[str]) -> dict[str, str]:
+    """Run the `file` command once on a batch of files.
+
+    Returns the lowercase output for each file, in the same format as running the `file`
+    command on a single file. Files with a newline in their name are skipped.
+    """
+    paths = [path for path in paths if "\n" not in path]
+    if not paths or not file_command_exists():
+        return {}
+
+    try:
+        output: str = subprocess.check_output(
+            ["file", "--no-pad", "--print0", "--files-from", "-"],
+            input="\n".join(paths) + "\n",
+            universal_newlines=True,
+        )
+    except subprocess.CalledProcessError as ex:
+        logging.warning("Failed to run 'file' command. Returncode = %d", ex.returncode)
+        logging.warning("Exception output: %s", ex.output)
+        return {}
+    except OSError:
+        logging.warning("OSError on file command for %d files", len(paths))
+        return {}
+
+    outputs: dict[str, str] = {}
+    for record in output.split("\n"):
+        path, sep, description = record.partition("\0")
+        if sep:
+            outputs[path] = f"{path}{description}\n".lower()
+    return outputs
+
+
+def file_command_exists() -> bool:
+    """Return whether the 'file' command is available on $PATH."""
+    return find_file_command(os.environ.get("PATH", ""))
+
+
+@functools.lru_cache(maxsize=None)
+def find_file_command(search_path: str) -> bool:
+    """Return whether the 'file' command is on the given search path.
+
+    The result is cached for each search path so $PATH is only scanned once.
+    """
+    if sys.platform == "win32":
+        command_name = "file.exe"
+    else:
+        command_name = "file"
+
+    for path in search_path.split(os.pathsep):
+        exe_path = os.path.join(path, command_name)
+        if os.path.isfile(exe_path) and os.access(exe_path, os.X_OK):
+            return True
+
+    return False
@@ -0,0 +1,121 @@
+"""Find the files in a package that match a rule without checking every file.
+
+Discovery plugins used to loop over every file in a package and check its name and file
+type. The index groups files by the suffixes of their names, by their names, and by the
+file types reported for them, so each plugin only looks at the groups its rule asks for.
+File types are only looked up once a rule needs them.
+"""
+
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Iterable, Mapping, Optional
+
+from statick_tool.file_record import FileRecord
+
+
+def is_excepted(file_dict: Mapping[str, Any]) -> bool:
+    """Return whether a file was found to be excepted for all tools."""
+    return isinstance(file_dict, FileRecord) and file_dict.excepted
+
+
+class FileRule:  # pylint: disable=too-few-public-methods
+    """Describe the files a discovery plugin looks for.
+
+    A file matches if its lowercase name ends with one of the extensions, is one of the
+    names, or starts with one of the prefixes, or if its file type contains one of the
+    types. Files whose names end with one of the excluded extensions never match.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        extensions: Iterable[str] = (),
+        names: Iterable[str] = (),
+        prefixes: Iterable[str] = (),
+        types: Iterable[str] = (),
+        exclude: Iterable[str] = (),
+    ) -> None:
+        """Store the parts of the rule."""
+        self.extensions = tuple(extensions)
+        self.names = tuple(names)
+        self.prefixes = tuple(prefixes)
+        self.types = tuple(types)
+        self.exclude = tuple(exclude)
+
+
+class FileIndex:
+    """Index the files of a package by name, extension, and file type."""
+
+    def __init__(self, files: Mapping[str, Mapping[str, Any]]) -> None:
+        """Index the names of files, in the order they are in the package."""
+        self.paths: list[str] = []
+        self.file_dicts: list[Mapping[str, Any]] = []
+        self.suffixes: dict[str, list[int]] = defaultdict(list)
+        self.names: dict[str, list[int]] = defaultdict(list)
+        for position, file_dict in enumerate(files.values()):
+            self.paths.append(file_dict["path"])
+            self.file_dicts.append(file_dict)
+            name = file_dict["name"]
+            self.names[name].append(position)
+            start = name.find(".")
+            while start != -1:
+                self.suffixes[name[start:]].append(position)
+                start = name.find(".", start + 1)
+        self.sorted_names = sorted(self.names)
+        self.types: Optional[dict[str, list[int]]] = None
+
+    def __len__(self) -> int:
+        """Get the number of files in the index."""
+        return len(self.paths)
+
+    def get_types(self) -> dict[str, list[int]]:
+        """Group the files by the file type reported for them."""
+        if self.types is None:
+            self.types = defaultdict(list)
+            for position, file_dict in enumerate(self.file_dicts):
+                if isinstance(file_dict, FileRecord):
+                    output = file_dict.description or ""
+                else:
+                    output = file_dict["file_cmd_out"]
+                    prefix = file_dict["path"].lower()
+                    if output.startswith(prefix):
+                        output = output[len(prefix) :]
+                self.types[output].append(position)
+        return self.types
+
+    def find(self, rule: FileRule, include_excepted: bool = True) -> list[str]:
+        """Get the paths of the files that match a rule, in package order.
+
+        Files found to be excepted for all tools when the package files were found are
+        left out unless include_excepted is True.
+        """
+        positions: set[int] = set()
+        for extension in rule.extensions:
+            if extension.startswith("."):
+                positions.update(self.suffixes.get(extension, ()))
+            else:
+                for name in self.sorted_names:
+                    if name.endswith(extension):
+                        positions.update(self.names[name])
+        for name in rule.names:
+            positions.update(self.names.get(name, ()))
+        for prefix in rule.prefixes:
+            index = bisect_left(self.sorted_names, prefix)
+            while index < len(self.sorted_names) and self.sorted_names[
+                index
+            ].startswith(prefix):
+                positions.update(self.names[self.sorted_names[index]])
+                index += 1
+        if rule.types:
+            for file_type, typed in self.get_types().items():
+                if any(rule_type in file_type for rule_type in rule.types):
+                    positions.update(typed)
+        return [
+            self.paths[position]
+            for position in sorted(positions)
+            if not (
+                rule.exclude
+                and self.file_dicts[position]["name"].endswith(rule.exclude)
+            )
+            and (include_excepted or not is_excepted(self.file_dicts[position]))
+        ]
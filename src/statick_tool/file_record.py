@@ -0,0 +1,195 @@
+"""Compact records of the files found in a package.
+
+A package can have hundreds of thousands of files, so each file is stored as a small
+slotted record instead of a dictionary of strings. The file type is stored as a code for
+its description in a table shared by all files, instead of the full output of the `file`
+command, which repeats the path of the file.
+
+Records can still be used like the dictionaries discovery plugins used before, with
+`name`, `path`, and `file_cmd_out` keys. The `file_cmd_out` text is made when it is
+asked for.
+"""
+
+import os
+import threading
+from collections.abc import Mapping
+from typing import Any, Iterator, Optional
+
+from statick_tool import file_classifier
+
+
+class FileTypeTable:
+    """Give each distinct file type description a code."""
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self.descriptions: list[str] = []
+        self.codes: dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def get_code(self, description: str) -> int:
+        """Get the code of a description, adding it to the table if it is new."""
+        code = self.codes.get(description)
+        if code is None:
+            with self.lock:
+                code = self.codes.get(description)
+                if code is None:
+                    code = len(self.descriptions)
+                    self.descriptions.append(description)
+                    self.codes[description] = code
+        return code
+
+    def get_description(self, code: int) -> str:
+        """Get the description with a code."""
+        return self.descriptions[code]
+
+
+# Codes are only meaningful within a process, so records store descriptions when they
+# are pickled.
+FILE_TYPES = FileTypeTable()
+
+
+class FileTypeResolver:  # pylint: disable=too-few-public-methods
+    """Determine file types for a batch of files the first time one is needed."""
+
+    def __init__(self) -> None:
+        """Initialize the resolver."""
+        self.pending: list["FileRecord"] = []
+
+    def resolve(self) -> None:
+        """Set the file command output for every pending file.
+
+        Files are classified in-process when possible. All remaining files are passed to
+        a single run of the `file` command.
+        """
+        undecided: list["FileRecord"] = []
+        for record in self.pending:
+            description = file_classifier.classify_file(record.path)
+            if description is None:
+                undecided.append(record)
+            else:
+                record.set_file_cmd_out(f"{record.path}: {description}\n".lower())
+        self.pending = []
+
+        outputs = file_classifier.get_file_cmd_outputs(
+            [record.path for record in undecided]
+        )
+        for record in undecided:
+            record.set_file_cmd_out(outputs.get(record.path, ""))
+
+
+class FileRecord(Mapping[str, Any]):
+    """Information about a file whose file type is found on first use."""
+
+    __slots__ = ("path", "type_code", "path_in_type", "excepted", "resolver")
+
+    KEYS = ("name", "path", "file_cmd_out")
+
+    def __init__(
+        self,
+        path: str,
+        resolver: Optional[FileTypeResolver] = None,
+        file_cmd_out: Optional[str] = None,
+    ) -> None:
+        """Initialize file information.
+
+        If the file command output is not known, the file is added to the resolver.
+        """
+        self.path = path
+        self.type_code: Optional[int] = None
+        # Whether the file command output starts with the lowercase path of the file.
+        self.path_in_type = False
+        # Whether the file is excepted for all tools.
+        self.excepted = False
+        self.resolver = resolver
+        if file_cmd_out is not None:
+            self.set_file_cmd_out(file_cmd_out)
+        elif resolver is not None:
+            resolver.pending.append(self)
+
+    @property
+    def name(self) -> str:
+        """Get the lowercase name of the file."""
+        return os.path.basename(self.path).lower()
+
+    @property
+    def description(self) -> Optional[str]:
+        """Get the file type description, without the path of the file.
+
+        Returns None if the file type can't be found.
+        """
+        if self.type_code is None:
+            self.resolve()
+            if self.type_code is None:
+                return None
+        return FILE_TYPES.get_description(self.type_code)
+
+    def resolve(self) -> None:
+        """Find the file type if it is not known yet."""
+        if self.type_code is None and self.resolver is not None:
+            self.resolver.resolve()
+
+    def set_file_cmd_out(self, file_cmd_out: str) -> None:
+        """Set the file command output."""
+        prefix = self.path.lower()
+        self.path_in_type = file_cmd_out.startswith(prefix)
+        if self.path_in_type:
+            file_cmd_out = file_cmd_out[len(prefix) :]
+        self.type_code = FILE_TYPES.get_code(file_cmd_out)
+        self.resolver = None
+
+    def get_file_cmd_out(self, resolve: bool = True) -> Optional[str]:
+        """Get the file command output.
+
+        If resolve is False, None is returned instead of finding an unknown file type.
+        """
+        if resolve:
+            self.resolve()
+        if self.type_code is None:
+            return None
+        description = FILE_TYPES.get_description(self.type_code)
+        if self.path_in_type:
+            return self.path.lower() + description
+        return description
+
+    def __getitem__(self, key: str) -> Any:
+        """Get the name, path, or file command output of the file."""
+        if key == "name":
+            return self.name
+        if key == "path":
+            return self.path
+        if key == "file_cmd_out":
+            file_cmd_out = self.get_file_cmd_out()
+            if file_cmd_out is not None:
+                return file_cmd_out
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Check for a key without finding the file type."""
+        if key == "file_cmd_out":
+            return self.type_code is not None
+        return key in self.KEYS
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys that are known without finding the file type."""
+        return iter(self.KEYS if self.type_code is not None else self.KEYS[:2])
+
+    def __len__(self) -> int:
+        """Get the number of keys that are known."""
+        return len(self.KEYS) if self.type_code is not None else 2
+
+    def __repr__(self) -> str:
+        """Show the record like a dictionary."""
+        return f"FileRecord({dict(self.items())!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle the file type as text, since codes are only valid in this process."""
+        return (
+            self.__class__,
+            (self.path, None, self.get_file_cmd_out()),
+            self.excepted,
+        )
+
+    def __setstate__(self, excepted: bool) -> None:
+        """Restore whether the file is excepted after unpickling."""
+        self.excepted = excepted
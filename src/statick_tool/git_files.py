@@ -0,0 +1,91 @@
+"""Find the files in a package from the git index.
+
+When a package is in a git repository, its files are the files git tracks plus untracked
+files that are not ignored. Asking git for them is faster than walking the file system,
+and it skips ignored build trees without listing them.
+
+The index also has the hash of the contents of each tracked file. Files that are not
+modified in the working tree use that hash as their content hash, so caches don't need
+to read and hash them again.
+"""
+
+import logging
+import os
+import subprocess
+from typing import Optional
+
+from statick_tool.package import Package
+
+# Git file modes for symbolic links and submodules.
+SYMLINK_MODE = "120000"
+SUBMODULE_MODE = "160000"
+
+
+def run_git(path: str, *args: str) -> list[str]:
+    """Run a git command that lists files and get the paths it lists."""
+    output = subprocess.check_output(
+        ["git", "-C", path, *args, "-z"], stderr=subprocess.DEVNULL
+    )
+    return [os.fsdecode(entry) for entry in output.split(b"\0") if entry]
+
+
+def get_git_files(path: str) -> Optional[dict[str, Optional[str]]]:
+    """Get the files under a path that git tracks or doesn't ignore.
+
+    The keys are absolute paths of the files. The values are the git hashes of the file
+    contents, or None for untracked, modified, and conflicted files and symbolic links.
+    Returns None if the files can't be found from git, such as when the path is not in a
+    git repository or has a submodule or another repository in it.
+    """
+    path = os.path.abspath(path)
+    try:
+        staged = run_git(path, "ls-files", "--stage")
+        untracked = run_git(path, "ls-files", "--others", "--exclude-standard")
+        modified = set(run_git(path, "ls-files", "--modified"))
+        deleted = set(run_git(path, "ls-files", "--deleted"))
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+    files: dict[str, Optional[str]] = {}
+    for entry in staged:
+        info, name = entry.split("\t", 1)
+        mode, blob, stage = info.split(" ")
+        if mode == SUBMODULE_MODE:
+            logging.debug("Not using git to find files, %s is a submodule.", name)
+            return None
+        if name in deleted:
+            continue
+        full_path = os.path.normpath(os.path.join(path, name))
+        if mode == SYMLINK_MODE:
+            # Links to directories are not files, like when walking the file system.
+            if os.path.isdir(full_path):
+                continue
+            files[full_path] = None
+        elif stage != "0" or name in modified or full_path in files:
+            files[full_path] = None
+        else:
+            files[full_path] = blob
+    for name in untracked:
+        if name.endswith("/"):
+            logging.debug("Not using git to find files, %s is a repository.", name)
+            return None
+        files[os.path.normpath(os.path.join(path, name))] = None
+    if not files:
+        # The path could be ignored, so don't trust an empty list.
+        return None
+    return files
+
+
+def get_package_git_files(package: Package) -> Optional[dict[str, Optional[str]]]:
+    """Get the files of a package from git, only asking git the first time.
+
+    The git hashes of unmodified files are kept in the file hashes of the package.
+    """
+    if package.git_files is None:
+        package.git_files = get_git_files(package.path) or {}
+        package.file_hashes = {
+            path: file_hash
+            for path, file_hash in package.git_files.items()
+            if file_hash is not None
+        }
+    return package.git_files or None
@@ -1,6 +1,17 @@
 """Issue interface."""
 
-from typing import NamedTuple, Optional
+from array import array
+from collections.abc import Sequence
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Union,
+    overload,
+)
 
 Issue = NamedTuple(
     "Issue",
@@ -14,3 +25,145 @@ Issue = NamedTuple(
         ("cert_reference", Optional[str]),
     ],
 )
+
+# Fields stored as numbers instead of as positions in the list of strings.
+NUMBER_FIELDS = ("line_number", "severity")
+STRING_FIELDS = tuple(field for field in Issue._fields if field not in NUMBER_FIELDS)
+
+
+class IssueTable(Sequence[Issue]):
+    """Issues stored in columns, with each distinct string stored once.
+
+    Tools report many issues in the same files, with the same tool name and issue type,
+    so the table keeps a list of the distinct strings and stores the string fields of
+    each issue as positions in it. Line numbers and severities are stored in integer
+    arrays. Iterating over the table gives `Issue` tuples, so it can be used wherever a
+    list of issues is read.
+    """
+
+    def __init__(self, issues: Iterable[Issue] = ()) -> None:
+        """Make a table with the given issues."""
+        self.strings: list[Optional[str]] = []
+        self.codes: dict[Optional[str], int] = {}
+        self.columns: dict[str, Union["array[int]", list[Any]]] = {
+            field: array("q") for field in Issue._fields
+        }
+        self.extend(issues)
+
+    def get_code(self, value: Optional[str]) -> int:
+        """Get the position of a string in the list of strings, adding it if needed."""
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.strings)
+            self.strings.append(value)
+            self.codes[value] = code
+        return code
+
+    def append(self, issue: Issue) -> None:
+        """Add an issue to the end of the table."""
+        for field in STRING_FIELDS:
+            self.columns[field].append(self.get_code(getattr(issue, field)))
+        for field in NUMBER_FIELDS:
+            value = getattr(issue, field)
+            try:
+                self.columns[field].append(value)
+            except (TypeError, OverflowError):
+                # Keep values that are not integers as they are.
+                self.columns[field] = list(self.columns[field])
+                self.columns[field].append(value)
+
+    def extend(self, issues: Iterable[Issue]) -> None:
+        """Add issues to the end of the table.
+
+        Issues from another table are added column by column.
+        """
+        if not isinstance(issues, IssueTable):
+            for issue in issues:
+                self.append(issue)
+            return
+        codes = [self.get_code(value) for value in issues.strings]
+        for field in Issue._fields:
+            column = issues.columns[field]
+            if field not in NUMBER_FIELDS:
+                self.columns[field].extend(codes[code] for code in column)
+            elif isinstance(self.columns[field], array) and isinstance(column, array):
+                self.columns[field].extend(column)
+            else:
+                self.columns[field] = list(self.columns[field]) + list(column)
+
+    def filter(self, keep: Callable[[Issue], bool]) -> "IssueTable":
+        """Get a table with the issues for which a function returns True."""
+        return self.select([index for index, issue in enumerate(self) if keep(issue)])
+
+    def select(self, rows: Iterable[int]) -> "IssueTable":
+        """Get a table with the issues at the given positions."""
+        rows = list(rows)
+        table = IssueTable()
+        table.strings = list(self.strings)
+        table.codes = dict(self.codes)
+        for field, column in self.columns.items():
+            selected = [column[row] for row in rows]
+            table.columns[field] = (
+                array(column.typecode, selected)
+                if isinstance(column, array)
+                else selected
+            )
+        return table
+
+    def get_issue(self, row: int) -> Issue:
+        """Get the issue at a position."""
+        return Issue._make(
+            (
+                self.columns[field][row]
+                if field in NUMBER_FIELDS
+                else self.strings[self.columns[field][row]]
+            )
+            for field in Issue._fields
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> Issue:
+        """Get the issue at a position."""
+
+    @overload
+    def __getitem__(self, index: slice) -> "IssueTable":
+        """Get a table with a slice of the issues."""
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Issue, "IssueTable"]:
+        """Get the issue at a position, or a table with a slice of the issues."""
+        if isinstance(index, slice):
+            return self.select(range(len(self))[index])
+        return self.get_issue(range(len(self))[index])
+
+    def __iter__(self) -> Iterator[Issue]:
+        """Iterate over the issues in the table."""
+        strings = self.strings
+        for row in zip(*(self.columns[field] for field in Issue._fields)):
+            yield Issue(
+                strings[row[0]],
+                row[1],
+                strings[row[2]],
+                strings[row[3]],
+                row[4],
+                strings[row[5]],
+                strings[row[6]],
+            )
+
+    def __len__(self) -> int:
+        """Get the number of issues in the table."""
+        return len(self.columns["filename"])
+
+    def __iadd__(self, issues: Iterable[Issue]) -> "IssueTable":
+        """Add issues to the end of the table."""
+        self.extend(issues)
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the issues with the issues in another table or list."""
+        if isinstance(other, (IssueTable, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Show the issues in the table."""
+        return f"IssueTable({list(self)!r})"
@@ -0,0 +1,72 @@
+"""Pass issues from tool plugins to reporting plugins as they are found.
+
+In streaming mode, each batch of issues a tool plugin finds is filtered by the
+exceptions and added to every reporting plugin right away, instead of waiting for all
+tools to finish. Tool plugins run in threads, so batches are added one at a time.
+"""
+
+import threading
+import time
+from typing import Optional, Sequence
+
+from statick_tool.exceptions import Exceptions, NolintIndex
+from statick_tool.issue import Issue, IssueTable
+from statick_tool.package import Package
+from statick_tool.reporting_plugin import ReportingPlugin
+
+
+class IssueStream:  # pylint: disable=too-many-instance-attributes
+    """Filter batches of issues and add them to reporting plugins."""
+
+    def __init__(
+        self,
+        package: Package,
+        level: str,
+        reporting_plugins: list[ReportingPlugin],
+        exceptions: Optional[Exceptions] = None,
+    ) -> None:
+        """Initialize the stream."""
+        self.package = package
+        self.level = level
+        self.reporting_plugins = reporting_plugins
+        self.exceptions = exceptions
+        self.index: Optional[NolintIndex] = None
+        if exceptions is not None:
+            self.index = NolintIndex(exceptions.get_nolint_markers())
+        # Issues kept after filtering, for the package cache and the scan result.
+        self.issues: dict[str, IssueTable] = {}
+        # Seconds spent in each reporting plugin.
+        self.durations = [0.0 for _ in reporting_plugins]
+        self.lock = threading.Lock()
+
+    def begin(self) -> None:
+        """Start the reports."""
+        for position, plugin in enumerate(self.reporting_plugins):
+            start = time.time()
+            plugin.begin(self.package, self.level)
+            self.durations[position] += time.time() - start
+
+    def add_issues(
+        self, tool: str, issues: Sequence[Issue], filtered: bool = False
+    ) -> None:
+        """Filter issues found by a tool and add them to the reports.
+
+        Issues that were already filtered, such as stored results, are added unchanged.
+        """
+        if self.exceptions is not None and not filtered:
+            issues = self.exceptions.filter_tool_issues(
+                self.package, tool, issues, self.index
+            )
+        with self.lock:
+            self.issues.setdefault(tool, IssueTable()).extend(issues)
+            for position, plugin in enumerate(self.reporting_plugins):
+                start = time.time()
+                plugin.add_issues(tool, issues)
+                self.durations[position] += time.time() - start
+
+    def finish(self) -> None:
+        """Finish the reports."""
+        for position, plugin in enumerate(self.reporting_plugins):
+            start = time.time()
+            plugin.finish()
+            self.durations[position] += time.time() - start
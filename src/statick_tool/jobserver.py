@@ -0,0 +1,95 @@
+"""Share CPU tokens between package workers, tool plugins, and parallel tools.
+
+This works like the GNU make jobserver. Each running unit of work already holds one
+implicit token. Starting any more work at the same time requires taking another token
+from the pool, and the token is returned when that work is done. The pool starts with
+one token for each CPU core that may be used beyond the implicit ones, so total
+concurrency never exceeds `--max-procs`.
+
+On POSIX systems the tokens are bytes in a pipe, which forked workspace workers inherit,
+so all packages in a workspace share the same pool. Other systems use a semaphore that
+is only shared between threads.
+"""
+
+import contextlib
+import os
+import select
+import sys
+import threading
+from typing import Iterator, Optional
+
+
+class JobServer:
+    """Share CPU tokens between package workers, tool plugins, and parallel tools."""
+
+    def __init__(self, tokens: int) -> None:
+        """Create a pool with the given number of tokens."""
+        self.tokens = max(0, tokens)
+        self.read_fd: Optional[int] = None
+        self.write_fd: Optional[int] = None
+        self.semaphore: Optional[threading.Semaphore] = None
+        if sys.platform == "win32":
+            self.semaphore = threading.Semaphore(self.tokens)
+            return
+
+        self.read_fd, self.write_fd = os.pipe()
+        os.set_blocking(self.read_fd, False)
+        os.write(self.write_fd, b"+" * self.tokens)
+
+    def acquire(self, block: bool = True) -> bool:
+        """Take a token from the pool.
+
+        Returns False if no token is available and block is False.
+        """
+        if self.semaphore is not None:
+            return self.semaphore.acquire(blocking=block)
+
+        assert self.read_fd is not None
+        while True:
+            try:
+                if os.read(self.read_fd, 1):
+                    return True
+            except BlockingIOError:
+                pass
+            if not block:
+                return False
+            # Another process or thread may take the token first, so try again.
+            select.select([self.read_fd], [], [])
+
+    def acquire_extra(self, count: int) -> int:
+        """Take up to count tokens without waiting and return how many were taken."""
+        taken = 0
+        while taken < count and self.acquire(block=False):
+            taken += 1
+        return taken
+
+    def release(self, count: int = 1) -> None:
+        """Return tokens to the pool."""
+        if count <= 0:
+            return
+        if self.semaphore is not None:
+            self.semaphore.release(count)
+            return
+        assert self.write_fd is not None
+        os.write(self.write_fd, b"+" * count)
+
+    @contextlib.contextmanager
+    def jobs(self, max_jobs: int) -> Iterator[int]:
+        """Take extra tokens for work that can run up to max_jobs parallel jobs.
+
+        Yields the number of jobs to run, including the job for the token that is
+        already held.
+        """
+        extra = self.acquire_extra(max_jobs - 1)
+        try:
+            yield 1 + extra
+        finally:
+            self.release(extra)
+
+    def close(self) -> None:
+        """Close the pipe used for the token pool."""
+        for fd in (self.read_fd, self.write_fd):
+            if fd is not None:
+                os.close(fd)
+        self.read_fd = None
+        self.write_fd = None
@@ -1,7 +1,14 @@
 """Package interface."""
 
+import os
+from typing import Any, Optional
 
-class Package(dict):  # type: ignore
+from statick_tool.file_index import FileIndex
+from statick_tool.file_record import FileRecord
+from statick_tool.parse_cache import ParseCache
+
+
+class Package(dict):  # type: ignore  # pylint: disable=too-many-instance-attributes
     """Default implementation of package interface."""
 
     def __init__(  # pylint:disable=super-init-not-called
@@ -10,5 +17,54 @@ class Package(dict):  # type: ignore
         """Initialize package interface."""
         self.name = name
         self.path = path
-        self.files: dict[str, dict[str, str]] = {}
-        self._walked = False
+        self.files: dict[str, FileRecord] = {}
+        # Size, modification time, and inode of each file, used by caches.
+        self.file_stats: dict[str, tuple[int, int, int]] = {}
+        # Git hashes of the contents of files that are unchanged from the git index.
+        self.file_hashes: dict[str, str] = {}
+        # Files git lists, empty if git can't list them, or None before git is asked.
+        self.git_files: Optional[dict[str, Optional[str]]] = None
+        # Files that have changed, or None to scan all files.
+        self.changed_files: Optional[set[str]] = None
+        # Files found by walking a workspace, or None to find them in the package.
+        self.file_list: Optional[list[str]] = None
+        # Paths of packages in this package that are scanned on their own.
+        self.nested_packages: list[str] = []
+        # Whether the files of the package have been found by discovery.
+        self.files_found = False
+        # Matcher for the exceptions of the package, set when files are found.
+        self.exception_matcher: Any = None
+        # Python files parsed once for the tools that check them inside Statick.
+        self.parse_cache: Optional[ParseCache] = None
+        self._file_index: Optional[FileIndex] = None
+
+    def get_file_index(self) -> FileIndex:
+        """Get the index of the files in the package.
+
+        The index is made again if files have been found since it was made.
+        """
+        if self._file_index is None or len(self._file_index) != len(self.files):
+            self._file_index = FileIndex(self.files)
+        return self._file_index
+
+    def filter_changed(self, files: list[str]) -> list[str]:
+        """Get the files in a list that have changed.
+
+        All of the files are returned if only changed files are not being scanned.
+        """
+        if self.changed_files is None:
+            return files
+        return [path for path in files if os.path.abspath(path) in self.changed_files]
+
+    def filter_excepted(self, tool: str, files: list[str]) -> list[str]:
+        """Get the files in a list that are not excepted for a tool.
+
+        All of the files are returned if the package has no exceptions.
+        """
+        if self.exception_matcher is None:
+            return files
+        return [
+            path
+            for path in files
+            if not self.exception_matcher.is_path_excepted(tool, os.path.abspath(path))
+        ]
@@ -0,0 +1,229 @@
+"""Persist the results of scanning a package between runs.
+
+Each package gets a Merkle hash of its file tree. The hash of a file is the hash of its
+contents, and the hash of a directory is the hash of the names and hashes of everything
+in it. Files that are unchanged from the git index use their git hash. Other file hashes
+are stored with the size, modification time, and inode of the file, so only files that
+have changed are read again.
+
+The tree hash is combined with everything else the results depend on, such as the level,
+configuration, exceptions, and tool versions. When the combined hash matches the stored
+hash for a package, the stored issues, timings, and tool versions are used instead of
+running any discovery or tool plugins.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from typing import Any, Mapping, Optional, Sequence, Tuple
+
+from statick_tool.cache import Cache, get_file_hash
+from statick_tool.issue import Issue
+from statick_tool.package import Package
+from statick_tool.timing import Timing
+from statick_tool.tool_version import ToolVersion
+from statick_tool.walk import DirectoryFilter, walk
+
+# Arguments that don't change the issues found in a package.
+IGNORED_ARGS = {
+    "cache_dir",
+    "cache_max_size",
+    "check",
+    "list_packages",
+    "log_level",
+    "max_procs",
+    "no_cache",
+    "output_directory",
+    "packages_file",
+    "path",
+    "show_all_tool_versions",
+    "show_run_tool_versions",
+    "timings",
+    "workspace",
+}
+
+PackageResults = Tuple[dict[str, list[Issue]], list[Timing], list[ToolVersion]]
+FileStat = Tuple[int, int, int]
+
+
+def get_stored_file_hash(
+    path: str,
+    stored: Mapping[str, Tuple[FileStat, str]],
+    updated: list[Tuple[str, int, int, int, str]],
+) -> str:
+    """Get the hash of a file, using the stored hash if the file has not changed.
+
+    Files whose hash is read again are added to the updated list to be stored.
+    """
+    try:
+        stat = os.stat(path)
+        file_stat: Optional[FileStat] = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+    except OSError:
+        file_stat = None
+    entry = stored.get(path)
+    if file_stat is not None and entry is not None and entry[0] == file_stat:
+        return entry[1]
+    file_hash = get_file_hash(path)
+    if file_hash is None:
+        return ""
+    if file_stat is not None:
+        updated.append((path, *file_stat, file_hash))
+    return file_hash
+
+
+class PackageCache(Cache):
+    """Persist the results of scanning a package between runs."""
+
+    filename = "packages.sqlite"
+    schema = [
+        "CREATE TABLE IF NOT EXISTS file_hashes ("
+        " path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL,"
+        " inode INTEGER NOT NULL, hash TEXT NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS packages ("
+        " path TEXT PRIMARY KEY, hash TEXT NOT NULL, issues TEXT NOT NULL,"
+        " timings TEXT NOT NULL, tool_versions TEXT NOT NULL)",
+    ]
+
+    def get_tree_hash(  # pylint: disable=too-many-locals
+        self,
+        path: str,
+        skip: Optional[list[str]] = None,
+        dir_filter: Optional[DirectoryFilter] = None,
+        file_hashes: Optional[Mapping[str, str]] = None,
+    ) -> str:
+        """Get the Merkle hash of a directory tree.
+
+        Directories in the skip list and directories skipped by the filter are not
+        included. Files with a known hash, such as a git hash, are not read.
+        """
+        path = os.path.abspath(path)
+        skip = [os.path.abspath(skip_path) for skip_path in skip or []]
+        prefix = os.path.join(path, "")
+        try:
+            stored = {
+                row[0]: ((row[1], row[2], row[3]), row[4])
+                for row in self.execute(
+                    "SELECT path, size, mtime_ns, inode, hash FROM file_hashes"
+                    " WHERE substr(path, 1, ?) = ?",
+                    (len(prefix), prefix),
+                )
+            }
+        except sqlite3.Error as ex:
+            logging.warning("Unable to read package cache: %s", ex)
+            stored = {}
+
+        walked = []
+        for root, dirs, files in walk(path, dir_filter):
+            dirs[:] = [
+                sub_dir for sub_dir in dirs if os.path.join(root, sub_dir) not in skip
+            ]
+            walked.append((root, sorted(dirs), sorted(files)))
+
+        updated: list[Tuple[str, int, int, int, str]] = []
+        dir_hashes: dict[str, str] = {}
+        # Directories are walked before the directories inside them, so go backwards
+        # to hash the contents of each directory first.
+        for root, dirs, files in reversed(walked):
+            digest = hashlib.sha256()
+            for name in files:
+                full_path = os.path.join(root, name)
+                file_hash = file_hashes.get(full_path) if file_hashes else None
+                if file_hash is None:
+                    file_hash = get_stored_file_hash(full_path, stored, updated)
+                digest.update(f"f\0{name}\0{file_hash}\0".encode("utf-8", "replace"))
+            for name in dirs:
+                full_path = os.path.join(root, name)
+                if full_path in dir_hashes:
+                    dir_hash = dir_hashes[full_path]
+                else:
+                    # Symbolic links to directories are not walked.
+                    try:
+                        dir_hash = os.readlink(full_path)
+                    except OSError:
+                        dir_hash = ""
+                digest.update(f"d\0{name}\0{dir_hash}\0".encode("utf-8", "replace"))
+            dir_hashes[root] = digest.hexdigest()
+
+        try:
+            self.executemany(
+                "INSERT OR REPLACE INTO file_hashes (path, size, mtime_ns, inode, hash)"
+                " VALUES (?, ?, ?, ?, ?)",
+                updated,
+            )
+        except sqlite3.Error as ex:
+            logging.warning("Unable to update package cache: %s", ex)
+        return dir_hashes.get(path, "")
+
+    def get_package_hash(
+        self,
+        package: Package,
+        skip: Optional[list[str]],
+        dir_filter: Optional[DirectoryFilter] = None,
+        **inputs: Any,
+    ) -> str:
+        """Get the hash of a package tree and everything else its results depend on."""
+        digest = hashlib.sha256()
+        digest.update(
+            self.get_tree_hash(
+                package.path, skip, dir_filter, package.file_hashes
+            ).encode("utf-8")
+        )
+        digest.update(json.dumps(inputs, sort_keys=True, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get_package(
+        self, package: Package, package_hash: str
+    ) -> Optional[PackageResults]:
+        """Get the stored results of a package.
+
+        Returns None if there are no stored results for the hash.
+        """
+        try:
+            rows = self.execute(
+                "SELECT issues, timings, tool_versions FROM packages"
+                " WHERE path = ? AND hash = ?",
+                (package.path, package_hash),
+            )
+        except sqlite3.Error as ex:
+            logging.warning("Unable to read package cache: %s", ex)
+            return None
+        if not rows:
+            return None
+        issues = {
+            tool: [Issue(*issue) for issue in tool_issues]
+            for tool, tool_issues in json.loads(rows[0][0]).items()
+        }
+        timings = [Timing(*timing) for timing in json.loads(rows[0][1])]
+        tool_versions = [ToolVersion(*version) for version in json.loads(rows[0][2])]
+        return issues, timings, tool_versions
+
+    def set_package(
+        self,
+        package: Package,
+        package_hash: str,
+        issues: Mapping[str, Sequence[Issue]],
+        timings: list[Timing],
+        tool_versions: list[ToolVersion],
+    ) -> None:
+        """Store the results of a package, replacing results for an older hash."""
+        try:
+            self.execute(
+                "INSERT OR REPLACE INTO packages"
+                " (path, hash, issues, timings, tool_versions) VALUES (?, ?, ?, ?, ?)",
+                (
+                    package.path,
+                    package_hash,
+                    json.dumps(
+                        {
+                            tool: list(tool_issues)
+                            for tool, tool_issues in issues.items()
+                        }
+                    ),
+                    json.dumps(timings),
+                    json.dumps(tool_versions),
+                ),
+            )
+        except sqlite3.Error as ex:
+            logging.warning("Unable to update package cache: %s", ex)
@@ -0,0 +1,121 @@
+"""Read and parse the Python files of a package once for the tools that check them.
+
+Several tools check the Python files of a package, and each of them reads, decodes, and
+parses every file again. With `--in-process-tools`, tools that can check files inside
+Statick get the source, lines, and syntax tree of each file from a cache shared by the
+tools scanning the package instead. Each file is read and parsed the first time a tool
+asks for it, and the cache is cleared once the last tool using it has finished.
+"""
+
+import ast
+import io
+import os
+import threading
+import tokenize
+from typing import Any, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+class ParsedFile:
+    """Source, lines, and syntax tree of a Python file, made when first asked for.
+
+    Errors are kept too, so a file that can't be read or parsed raises the same error
+    for every tool that asks for it.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the parsed file."""
+        self.path = path
+        self._lock = threading.RLock()
+        self._values: dict[str, Any] = {}
+        self._errors: dict[str, Exception] = {}
+
+    def _get(self, key: str, make: Callable[[], T]) -> T:
+        """Get a value, making it the first time it is asked for."""
+        with self._lock:
+            if key in self._errors:
+                raise self._errors[key]
+            if key not in self._values:
+                try:
+                    self._values[key] = make()
+                except Exception as ex:
+                    self._errors[key] = ex
+                    raise
+            value: T = self._values[key]
+            return value
+
+    def get_source(self) -> bytes:
+        """Get the contents of the file."""
+
+        def read() -> bytes:
+            with open(self.path, "rb") as fid:
+                return fid.read()
+
+        return self._get("source", read)
+
+    def get_lines(self) -> list[str]:
+        """Get the decoded lines of the file, with their line endings.
+
+        The file is decoded with the encoding it declares, falling back to Latin-1 like
+        `pycodestyle` does. A new list is returned each time, since tools may change the
+        lines they are given.
+        """
+
+        def decode() -> list[str]:
+            source = self.get_source()
+            try:
+                encoding, _ = tokenize.detect_encoding(io.BytesIO(source).readline)
+                return io.TextIOWrapper(io.BytesIO(source), encoding).readlines()
+            except (LookupError, SyntaxError, UnicodeError):
+                return io.TextIOWrapper(io.BytesIO(source), "latin-1").readlines()
+
+        return list(self._get("lines", decode))
+
+    def get_tree(self) -> ast.Module:
+        """Get the syntax tree of the file.
+
+        The tree is shared by the tools that use it, so they must not change it.
+        """
+        return self._get(
+            "tree", lambda: ast.parse(self.get_source(), filename=self.path)
+        )
+
+
+class ParseCache:
+    """Parsed Python files of a package, shared by the tools that use them.
+
+    The cache is made with the names of the tools that will use it. Each tool releases
+    the cache when it has finished, and the files are dropped when every tool has.
+    """
+
+    def __init__(self, consumers: Iterable[str]) -> None:
+        """Initialize the cache for the named tools."""
+        self.consumers = set(consumers)
+        self._lock = threading.Lock()
+        self._files: dict[str, ParsedFile] = {}
+
+    def __len__(self) -> int:
+        """Get the number of files in the cache."""
+        return len(self._files)
+
+    def get(self, path: str) -> ParsedFile:
+        """Get a file from the cache, adding it if it is not there yet.
+
+        Files are not kept once every tool has released the cache.
+        """
+        key = os.path.abspath(path)
+        with self._lock:
+            parsed = self._files.get(key)
+            if parsed is None:
+                parsed = ParsedFile(path)
+                if self.consumers:
+                    self._files[key] = parsed
+            return parsed
+
+    def release(self, consumer: str) -> None:
+        """Release the cache for a tool that has finished with it."""
+        with self._lock:
+            self.consumers.discard(consumer)
+            if not self.consumers:
+                self._files.clear()
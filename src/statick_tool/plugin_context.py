@@ -1,12 +1,17 @@
 """Plugin context interface."""
 
 import argparse
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 
 from statick_tool.config import Config
+from statick_tool.jobserver import JobServer
 from statick_tool.resources import Resources
 
-PluginContext = NamedTuple(
-    "PluginContext",
-    [("args", argparse.Namespace), ("resources", Resources), ("config", Config)],
-)
+
+class PluginContext(NamedTuple):
+    """Plugin context interface."""
+
+    args: argparse.Namespace
+    resources: Resources
+    config: Config
+    jobserver: Optional[JobServer] = None
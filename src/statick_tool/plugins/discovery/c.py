@@ -1,13 +1,19 @@
 """Discover C files to analyze."""
 
 import logging
-from collections import OrderedDict
 from typing import Optional
 
 from statick_tool.discovery_plugin import DiscoveryPlugin
 from statick_tool.exceptions import Exceptions
+from statick_tool.file_index import FileRule
 from statick_tool.package import Package
 
+C_RULE = FileRule(
+    extensions=(".c", ".cc", ".cpp", ".cxx", ".h", ".hxx", ".hpp"),
+    types=("c source", "c program", "c++ source"),
+    exclude=(".cfg",),
+)
+
 
 class CDiscoveryPlugin(DiscoveryPlugin):
     """Discover C/C++ files to analyze."""
@@ -16,34 +22,24 @@ class CDiscoveryPlugin(DiscoveryPlugin):
         """Get name of discovery type."""
         return "C"
 
+    @classmethod
+    def get_package_keys(cls) -> list[str]:
+        """Get the package keys the plugin sets."""
+        return ["c_src"]
+
+    @classmethod
+    def is_cacheable(cls) -> bool:
+        """Return whether the results of the plugin only depend on the package files."""
+        return True
+
     def scan(
         self, package: Package, level: str, exceptions: Optional[Exceptions] = None
     ) -> None:
         """Scan package looking for C files."""
-        c_files: list[str] = []
-        c_extensions = (".c", ".cc", ".cpp", ".cxx", ".h", ".hxx", ".hpp")
-        c_output = ("c source", "c program", "c++ source")
-
-        self.find_files(package)
-
-        for file_dict in package.files.values():
-            if file_dict["name"].endswith(c_extensions):
-                c_files.append(file_dict["path"])
-
-            if any(
-                item in file_dict["file_cmd_out"] for item in c_output
-            ) and not file_dict["name"].endswith(".cfg"):
-                c_files.append(file_dict["path"])
+        self.find_files(package, exceptions=exceptions)
 
-        c_files = list(OrderedDict.fromkeys(c_files))
+        c_files = package.get_file_index().find(C_RULE, include_excepted=False)
 
         logging.info("  %d C/C++ files found.", len(c_files))
-        if exceptions:
-            original_file_count = len(c_files)
-            c_files = exceptions.filter_file_exceptions_early(package, c_files)
-            if original_file_count > len(c_files):
-                logging.info(
-                    "  After filtering, %d C/C++ files will be scanned.", len(c_files)
-                )
 
         package["c_src"] = c_files
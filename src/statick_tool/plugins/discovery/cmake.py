@@ -20,8 +20,12 @@ from typing import Match, Optional, Pattern, Union
 
 from statick_tool.discovery_plugin import DiscoveryPlugin
 from statick_tool.exceptions import Exceptions
+from statick_tool.file_index import FileRule
 from statick_tool.package import Package
 
+# Check for all lower-case file names since that is how they are stored.
+CMAKE_RULE = FileRule(extensions=(".cmake",), names=("cmakelists.txt",))
+
 
 class CMakeDiscoveryPlugin(DiscoveryPlugin):
     """Discovery plugin to find CMake-based projects."""
@@ -30,6 +34,19 @@ class CMakeDiscoveryPlugin(DiscoveryPlugin):
         """Get name of discovery type."""
         return "cmake"
 
+    @classmethod
+    def get_package_keys(cls) -> list[str]:
+        """Get the package keys the plugin sets."""
+        return [
+            "cmake_src",
+            "make_targets",
+            "headers",
+            "cmake",
+            "cpplint",
+            "src_dir",
+            "bin_dir",
+        ]
+
     @classmethod
     def get_discovery_dependencies(cls) -> list[str]:
         """Get a list of plugins that must run before this one."""
@@ -48,17 +65,9 @@ class CMakeDiscoveryPlugin(DiscoveryPlugin):
         if self.plugin_context is None:
             return
 
-        package["cmake_src"] = []
-
         self.find_files(package)
 
-        for file_dict in package.files.values():
-            # Check for all lower-case file name since that is how they are stored.
-            if (
-                file_dict["name"].endswith(".cmake")
-                or file_dict["name"] == "cmakelists.txt"
-            ):
-                package["cmake_src"].append(file_dict["path"])
+        package["cmake_src"] = package.get_file_index().find(CMAKE_RULE)
 
         package["make_targets"] = []
         package["headers"] = []
@@ -1,13 +1,15 @@
 """Discover Dockerfile files to analyze."""
 
 import logging
-from collections import OrderedDict
 from typing import Optional
 
 from statick_tool.discovery_plugin import DiscoveryPlugin
 from statick_tool.exceptions import Exceptions
+from statick_tool.file_index import FileRule
 from statick_tool.package import Package
 
+DOCKERFILE_RULE = FileRule(prefixes=("dockerfile",), exclude=(".yaml", ".yml"))
+
 
 class DockerfileDiscoveryPlugin(DiscoveryPlugin):
     """Discover Dockerfile files to analyze."""
@@ -16,31 +18,26 @@ class DockerfileDiscoveryPlugin(DiscoveryPlugin):
         """Get name of discovery type."""
         return "dockerfile"
 
+    @classmethod
+    def get_package_keys(cls) -> list[str]:
+        """Get the package keys the plugin sets."""
+        return ["dockerfile_src"]
+
+    @classmethod
+    def is_cacheable(cls) -> bool:
+        """Return whether the results of the plugin only depend on the package files."""
+        return True
+
     def scan(
         self, package: Package, level: str, exceptions: Optional[Exceptions] = None
     ) -> None:
         """Scan package looking for Dockerfile files."""
-        src_files: list[str] = []
-        yaml_extensions = (".yaml", ".yml")
-
-        self.find_files(package)
-
-        for file_dict in package.files.values():
-            if file_dict["name"].startswith("dockerfile") and not file_dict[
-                "name"
-            ].endswith(yaml_extensions):
-                src_files.append(file_dict["path"])
+        self.find_files(package, exceptions=exceptions)
 
-        src_files = list(OrderedDict.fromkeys(src_files))
+        src_files = package.get_file_index().find(
+            DOCKERFILE_RULE, include_excepted=False
+        )
 
         logging.info("  %d Dockerfile files found.", len(src_files))
-        if exceptions:
-            original_file_count = len(src_files)
-            src_files = exceptions.filter_file_exceptions_early(package, src_files)
-            if original_file_count > len(src_files):
-                logging.info(
-                    "  After filtering, %d Dockerfile files will be scanned.",
-                    len(src_files),
-                )
 
         package["dockerfile_src"] = src_files
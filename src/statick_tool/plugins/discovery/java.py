@@ -1,13 +1,16 @@
 """Discover Java files to analyze."""
 
 import logging
-from collections import OrderedDict
 from typing import Optional
 
 from statick_tool.discovery_plugin import DiscoveryPlugin
 from statick_tool.exceptions import Exceptions
+from statick_tool.file_index import FileRule
 from statick_tool.package import Package
 
+JAVA_SRC_RULE = FileRule(extensions=(".java",))
+JAVA_CLASS_RULE = FileRule(extensions=(".class",))
+
 
 class JavaDiscoveryPlugin(DiscoveryPlugin):
     """Discover Java files to analyze."""
@@ -16,47 +19,29 @@ class JavaDiscoveryPlugin(DiscoveryPlugin):
         """Get name of discovery type."""
         return "java"
 
+    @classmethod
+    def get_package_keys(cls) -> list[str]:
+        """Get the package keys the plugin sets."""
+        return ["java_src", "java_bin"]
+
+    @classmethod
+    def is_cacheable(cls) -> bool:
+        """Return whether the results of the plugin only depend on the package files."""
+        return True
+
     def scan(
         self, package: Package, level: str, exceptions: Optional[Exceptions] = None
     ) -> None:
         """Scan package looking for java files."""
-        java_src_files: list[str] = []
-        java_class_files: list[str] = []
-
-        self.find_files(package)
-
-        for file_dict in package.files.values():
-            if file_dict["name"].endswith(".java"):
-                java_src_files.append(file_dict["path"])
-            if file_dict["name"].endswith(".class"):
-                java_class_files.append(file_dict["path"])
+        self.find_files(package, exceptions=exceptions)
 
-        java_src_files = list(OrderedDict.fromkeys(java_src_files))
-        java_class_files = list(OrderedDict.fromkeys(java_class_files))
+        file_index = package.get_file_index()
+        java_src_files = file_index.find(JAVA_SRC_RULE, include_excepted=False)
+        java_class_files = file_index.find(JAVA_CLASS_RULE, include_excepted=False)
 
         logging.info("  %d java source files found.", len(java_src_files))
-        if exceptions:
-            original_src_file_count = len(java_src_files)
-            java_src_files = exceptions.filter_file_exceptions_early(
-                package, java_src_files
-            )
-            if original_src_file_count > len(java_src_files):
-                logging.info(
-                    "  After filtering, %d java source files will be scanned.",
-                    len(java_src_files),
-                )
 
         logging.info("  %d java class files found.", len(java_class_files))
-        if exceptions:
-            original_class_file_count = len(java_class_files)
-            java_class_files = exceptions.filter_file_exceptions_early(
-                package, java_class_files
-            )
-            if original_class_file_count > len(java_class_files):
-                logging.info(
-                    "  After filtering, %d java class files will be scanned.",
-                    len(java_class_files),
-                )
 
         package["java_src"] = java_src_files
         package["java_bin"] = java_class_files
@@ -1,13 +1,15 @@
 """Discover JavaScript files to analyze."""
 
 import logging
-from collections import OrderedDict
 from typing import Optional
 
 from statick_tool.discovery_plugin import DiscoveryPlugin
 from statick_tool.exceptions import Exceptions
+from statick_tool.file_index import FileRule
 from statick_tool.package import Package
 
+JAVASCRIPT_RULE = FileRule(extensions=(".js",), exclude=(".min.js",))
+
 
 class JavaScriptDiscoveryPlugin(DiscoveryPlugin):
     """Discover JavaScript files to analyze."""
@@ -16,30 +18,26 @@ class JavaScriptDiscoveryPlugin(DiscoveryPlugin):
         """Get name of discovery type."""
         return "javascript"
 
+    @classmethod
+    def get_package_keys(cls) -> list[str]:
+        """Get the package keys the plugin sets."""
+        return ["javascript_src"]
+
+    @classmethod
+    def is_cacheable(cls) -> bool:
+        """Return whether the results of the plugin only depend on the package files."""
+        return True
+
     def scan(
         self, package: Package, level: str, exceptions: Optional[Exceptions] = None
     ) -> None:
         """Scan package looking for JavaScript files."""
-        src_files: list[str] = []
-
-        self.find_files(package)
-
-        for file_dict in package.files.values():
-            if file_dict["name"].endswith(".js") and not file_dict["name"].endswith(
-                ".min.js"
-            ):
-                src_files.append(file_dict["path"])
+        self.find_files(package, exceptions=exceptions)
 
-        src_files = list(OrderedDict.fromkeys(src_files))
+        src_files = package.get_file_index().find(
+            JAVASCRIPT_RULE, include_excepted=False
+        )
 
         logging.info("  %d JavaScript source files found.", len(src_files))
-        if exceptions:
-            original_file_count = len(src_files)
-            src_files = exceptions.filter_file_exceptions_early(package, src_files)
-            if original_file_count > len(src_files):
-                logging.info(
-                    "  After filtering, %d Javascript files will be scanned.",
-                    len(src_files),
-                )
 
         package["javascript_src"] = src_files
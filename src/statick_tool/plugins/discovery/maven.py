@@ -1,6 +1,5 @@
 """Discover Maven POM files to analyze."""
 
-import fnmatch
 import logging
 import os
 from collections import OrderedDict
@@ -8,8 +7,11 @@ from typing import Optional
 
 from statick_tool.discovery_plugin import DiscoveryPlugin
 from statick_tool.exceptions import Exceptions
+from statick_tool.file_index import FileRule
 from statick_tool.package import Package
 
+MAVEN_RULE = FileRule(names=("pom.xml",))
+
 
 class MavenDiscoveryPlugin(DiscoveryPlugin):
     """Discover Maven files to analyze."""
@@ -18,6 +20,16 @@ class MavenDiscoveryPlugin(DiscoveryPlugin):
         """Get name of discovery type."""
         return "maven"
 
+    @classmethod
+    def get_package_keys(cls) -> list[str]:
+        """Get the package keys the plugin sets."""
+        return ["all_poms", "top_poms"]
+
+    @classmethod
+    def is_cacheable(cls) -> bool:
+        """Return whether the results of the plugin only depend on the package files."""
+        return True
+
     def scan(
         self, package: Package, level: str, exceptions: Optional[Exceptions] = None
     ) -> None:
@@ -26,22 +38,21 @@ class MavenDiscoveryPlugin(DiscoveryPlugin):
         all_poms: list[str] = []
         deepest_pom_level = 999999
 
-        for root, _, files in os.walk(package.path):
-            for f in fnmatch.filter(files, "pom.xml"):
-                full_path = os.path.join(root, f)
-                # Kind of an ugly hack, but it makes sure long paths don't
-                # mess up our depth tracking
-                if exceptions and not exceptions.filter_file_exceptions_early(
-                    package, [full_path]
-                ):
-                    continue
-                depth = full_path.count(os.sep)
-                if depth < deepest_pom_level:
-                    deepest_pom_level = depth
-                    top_poms = []
-                if depth == deepest_pom_level:
-                    top_poms.append(full_path)
-                all_poms.append(full_path)
+        self.find_files(package, exceptions=exceptions)
+
+        for full_path in package.get_file_index().find(
+            MAVEN_RULE, include_excepted=False
+        ):
+            # The index matches lowercase names, but Maven only reads pom.xml.
+            if os.path.basename(full_path) != "pom.xml":
+                continue
+            depth = full_path.count(os.sep)
+            if depth < deepest_pom_level:
+                deepest_pom_level = depth
+                top_poms = []
+            if depth == deepest_pom_level:
+                top_poms.append(full_path)
+            all_poms.append(full_path)
 
         top_poms = list(OrderedDict.fromkeys(top_poms))
         all_poms = list(OrderedDict.fromkeys(all_poms))
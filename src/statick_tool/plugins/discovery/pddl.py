@@ -5,8 +5,11 @@ from typing import Optional
 
 from statick_tool.discovery_plugin import DiscoveryPlugin
 from statick_tool.exceptions import Exceptions
+from statick_tool.file_index import FileRule
 from statick_tool.package import Package
 
+PDDL_RULE = FileRule(extensions=(".pddl",))
+
 
 class PDDLDiscoveryPlugin(DiscoveryPlugin):
     """Discover PDDL files to analyze."""
@@ -15,26 +18,25 @@ class PDDLDiscoveryPlugin(DiscoveryPlugin):
         """Get name of discovery type."""
         return "pddl"
 
+    @classmethod
+    def get_package_keys(cls) -> list[str]:
+        """Get the package keys the plugin sets."""
+        return ["pddl_domain_src", "pddl_problem_src"]
+
+    @classmethod
+    def is_cacheable(cls) -> bool:
+        """Return whether the results of the plugin only depend on the package files."""
+        return True
+
     def scan(
         self, package: Package, level: str, exceptions: Optional[Exceptions] = None
     ) -> None:
         """Scan package looking for PDDL files."""
-        pddl_files: list[str] = []
-
-        self.find_files(package)
+        self.find_files(package, exceptions=exceptions)
 
-        for file_dict in package.files.values():
-            if file_dict["name"].endswith(".pddl"):
-                pddl_files.append(file_dict["path"])
+        pddl_files = package.get_file_index().find(PDDL_RULE, include_excepted=False)
 
         logging.info("  %d PDDL files found.", len(pddl_files))
-        if exceptions:
-            original_file_count: int = len(pddl_files)
-            pddl_files = exceptions.filter_file_exceptions_early(package, pddl_files)
-            if original_file_count > len(pddl_files):
-                logging.info(
-                    "  After filtering, %d PDDL files will be scanned.", len(pddl_files)
-                )
 
         package["pddl_domain_src"] = []
         package["pddl_problem_src"] = []
@@ -1,13 +1,15 @@
 """Discover Perl files to analyze."""
 
 import logging
-from collections import OrderedDict
 from typing import Optional
 
 from statick_tool.discovery_plugin import DiscoveryPlugin
 from statick_tool.exceptions import Exceptions
+from statick_tool.file_index import FileRule
 from statick_tool.package import Package
 
+PERL_RULE = FileRule(extensions=(".pl",), types=("perl script",))
+
 
 class PerlDiscoveryPlugin(DiscoveryPlugin):
     """Discover Perl files to analyze."""
@@ -16,30 +18,24 @@ class PerlDiscoveryPlugin(DiscoveryPlugin):
         """Get name of discovery type."""
         return "perl"
 
+    @classmethod
+    def get_package_keys(cls) -> list[str]:
+        """Get the package keys the plugin sets."""
+        return ["perl_src"]
+
+    @classmethod
+    def is_cacheable(cls) -> bool:
+        """Return whether the results of the plugin only depend on the package files."""
+        return True
+
     def scan(
         self, package: Package, level: str, exceptions: Optional[Exceptions] = None
     ) -> None:
         """Scan package looking for Perl files."""
-        perl_files: list[str] = []
-
-        self.find_files(package)
-
-        for file_dict in package.files.values():
-            if (
-                file_dict["name"].endswith(".pl")
-                or "perl script" in file_dict["file_cmd_out"]
-            ):
-                perl_files.append(file_dict["path"])
+        self.find_files(package, exceptions=exceptions)
 
-        perl_files = list(OrderedDict.fromkeys(perl_files))
+        perl_files = package.get_file_index().find(PERL_RULE, include_excepted=False)
 
         logging.info("  %d Perl files found.", len(perl_files))
-        if exceptions:
-            original_file_count = len(perl_files)
-            perl_files = exceptions.filter_file_exceptions_early(package, perl_files)
-            if original_file_count > len(perl_files):
-                logging.info(
-                    "  After filtering, %d perl files will be scanned.", len(perl_files)
-                )
 
         package["perl_src"] = perl_files
@@ -1,13 +1,15 @@
 """Discover python files to analyze."""
 
 import logging
-from collections import OrderedDict
 from typing import Optional
 
 from statick_tool.discovery_plugin import DiscoveryPlugin
 from statick_tool.exceptions import Exceptions
+from statick_tool.file_index import FileRule
 from statick_tool.package import Package
 
+PYTHON_RULE = FileRule(extensions=(".py",), types=("python script",), exclude=(".cfg",))
+
 
 class PythonDiscoveryPlugin(DiscoveryPlugin):
     """Discover python files to analyze."""
@@ -16,34 +18,26 @@ class PythonDiscoveryPlugin(DiscoveryPlugin):
         """Get name of discovery type."""
         return "python"
 
+    @classmethod
+    def get_package_keys(cls) -> list[str]:
+        """Get the package keys the plugin sets."""
+        return ["python_src"]
+
+    @classmethod
+    def is_cacheable(cls) -> bool:
+        """Return whether the results of the plugin only depend on the package files."""
+        return True
+
     def scan(
         self, package: Package, level: str, exceptions: Optional[Exceptions] = None
     ) -> None:
         """Scan package looking for python files."""
-        python_files: list[str] = []
-
-        self.find_files(package)
-
-        for file_dict in package.files.values():
-            if file_dict["name"].endswith(".py"):
-                python_files.append(file_dict["path"])
-            elif "python script" in file_dict["file_cmd_out"] and not file_dict[
-                "name"
-            ].endswith(".cfg"):
-                python_files.append(file_dict["path"])
+        self.find_files(package, exceptions=exceptions)
 
-        python_files = list(OrderedDict.fromkeys(python_files))
+        python_files = package.get_file_index().find(
+            PYTHON_RULE, include_excepted=False
+        )
 
         logging.info("  %d python files found.", len(python_files))
-        if exceptions:
-            original_file_count = len(python_files)
-            python_files = exceptions.filter_file_exceptions_early(
-                package, python_files
-            )
-            if original_file_count > len(python_files):
-                logging.info(
-                    "  After filtering, %d python files will be scanned.",
-                    len(python_files),
-                )
 
         package["python_src"] = python_files
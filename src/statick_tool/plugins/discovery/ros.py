@@ -19,6 +19,11 @@ class RosDiscoveryPlugin(DiscoveryPlugin):
         """Get name of discovery type."""
         return "ros"
 
+    @classmethod
+    def get_package_keys(cls) -> list[str]:
+        """Get the package keys the plugin sets."""
+        return ["is_ros1", "is_ros2", "cmake_flags"]
+
     @classmethod
     def deep_get(
         cls,
@@ -1,13 +1,18 @@
 """Discover shell files to analyze."""
 
 import logging
-from collections import OrderedDict
 from typing import Optional
 
 from statick_tool.discovery_plugin import DiscoveryPlugin
 from statick_tool.exceptions import Exceptions
+from statick_tool.file_index import FileRule
 from statick_tool.package import Package
 
+SHELL_RULE = FileRule(
+    extensions=(".sh", ".bash", ".zsh", ".csh", ".ksh", ".dash"),
+    types=("shell script", "dash script", "zsh script"),
+)
+
 
 class ShellDiscoveryPlugin(DiscoveryPlugin):
     """Discover shell files to analyze."""
@@ -16,33 +21,24 @@ class ShellDiscoveryPlugin(DiscoveryPlugin):
         """Get name of discovery type."""
         return "shell"
 
+    @classmethod
+    def get_package_keys(cls) -> list[str]:
+        """Get the package keys the plugin sets."""
+        return ["shell_src"]
+
+    @classmethod
+    def is_cacheable(cls) -> bool:
+        """Return whether the results of the plugin only depend on the package files."""
+        return True
+
     def scan(
         self, package: Package, level: str, exceptions: Optional[Exceptions] = None
     ) -> None:
         """Scan package looking for shell files."""
-        shell_files: list[str] = []
-        shell_extensions = (".sh", ".bash", ".zsh", ".csh", ".ksh", ".dash")
-        shell_output = ("shell script", "dash script", "zsh script")
-
-        self.find_files(package)
-
-        for file_dict in package.files.values():
-            if file_dict["name"].endswith(shell_extensions):
-                shell_files.append(file_dict["path"])
-
-            if any(item in file_dict["file_cmd_out"] for item in shell_output):
-                shell_files.append(file_dict["path"])
+        self.find_files(package, exceptions=exceptions)
 
-        shell_files = list(OrderedDict.fromkeys(shell_files))
+        shell_files = package.get_file_index().find(SHELL_RULE, include_excepted=False)
 
         logging.info("  %d shell files found.", len(shell_files))
-        if exceptions:
-            original_file_count = len(shell_files)
-            shell_files = exceptions.filter_file_exceptions_early(package, shell_files)
-            if original_file_count > len(shell_files):
-                logging.info(
-                    "  After filtering, %d shell files will be scanned.",
-                    len(shell_files),
-                )
 
         package["shell_src"] = shell_files
@@ -1,13 +1,19 @@
 """Discover TeX files to analyze."""
 
 import logging
-from collections import OrderedDict
-from typing import Optional, Tuple
+from typing import Optional
 
 from statick_tool.discovery_plugin import DiscoveryPlugin
 from statick_tool.exceptions import Exceptions
+from statick_tool.file_index import FileRule
 from statick_tool.package import Package
 
+TEX_RULE = FileRule(
+    extensions=(".tex", ".bib"),
+    types=("latex document", "bibtex text file", "latex 2e document"),
+    exclude=(".sty", ".log", ".cls"),
+)
+
 
 class TexDiscoveryPlugin(DiscoveryPlugin):
     """Discover TeX files to analyze."""
@@ -16,35 +22,24 @@ class TexDiscoveryPlugin(DiscoveryPlugin):
         """Get name of discovery type."""
         return "tex"
 
+    @classmethod
+    def get_package_keys(cls) -> list[str]:
+        """Get the package keys the plugin sets."""
+        return ["tex"]
+
+    @classmethod
+    def is_cacheable(cls) -> bool:
+        """Return whether the results of the plugin only depend on the package files."""
+        return True
+
     def scan(
         self, package: Package, level: str, exceptions: Optional[Exceptions] = None
     ) -> None:
         """Scan package looking for TeX files."""
-        tex_files: list[str] = []
-        tex_extensions: Tuple[str, str] = (".tex", ".bib")
-        tex_ignore_extensions = (".sty", ".log", ".cls")
-        tex_output = ["latex document", "bibtex text file", "latex 2e document"]
-
-        self.find_files(package)
-
-        for file_dict in package.files.values():
-            if file_dict["name"].endswith(tex_extensions):
-                tex_files.append(file_dict["path"])
-
-            if any(
-                item in file_dict["file_cmd_out"] for item in tex_output
-            ) and not file_dict["name"].endswith(tex_ignore_extensions):
-                tex_files.append(file_dict["path"])
+        self.find_files(package, exceptions=exceptions)
 
-        tex_files = list(OrderedDict.fromkeys(tex_files))
+        tex_files = package.get_file_index().find(TEX_RULE, include_excepted=False)
 
         logging.info("  %d TeX files found.", len(tex_files))
-        if exceptions:
-            original_file_count: int = len(tex_files)
-            tex_files = exceptions.filter_file_exceptions_early(package, tex_files)
-            if original_file_count > len(tex_files):
-                logging.info(
-                    "  After filtering, %d TeX files will be scanned.", len(tex_files)
-                )
 
         package["tex"] = tex_files
@@ -1,13 +1,15 @@
 """Discover XML files to analyze."""
 
 import logging
-from collections import OrderedDict
-from typing import Optional, Tuple
+from typing import Optional
 
 from statick_tool.discovery_plugin import DiscoveryPlugin
 from statick_tool.exceptions import Exceptions
+from statick_tool.file_index import FileRule
 from statick_tool.package import Package
 
+XML_RULE = FileRule(extensions=(".xml", ".launch"))
+
 
 class XMLDiscoveryPlugin(DiscoveryPlugin):
     """Discover XML files to analyze."""
@@ -16,28 +18,24 @@ class XMLDiscoveryPlugin(DiscoveryPlugin):
         """Get name of discovery type."""
         return "xml"
 
+    @classmethod
+    def get_package_keys(cls) -> list[str]:
+        """Get the package keys the plugin sets."""
+        return ["xml"]
+
+    @classmethod
+    def is_cacheable(cls) -> bool:
+        """Return whether the results of the plugin only depend on the package files."""
+        return True
+
     def scan(
         self, package: Package, level: str, exceptions: Optional[Exceptions] = None
     ) -> None:
         """Scan package looking for XML files."""
-        xml_files: list[str] = []
-        xml_extensions: Tuple[str, str] = (".xml", ".launch")
-
-        self.find_files(package)
-
-        for file_dict in package.files.values():
-            if file_dict["name"].endswith(xml_extensions):
-                xml_files.append(file_dict["path"])
+        self.find_files(package, exceptions=exceptions)
 
-        xml_files = list(OrderedDict.fromkeys(xml_files))
+        xml_files = package.get_file_index().find(XML_RULE, include_excepted=False)
 
         logging.info("  %d XML files found.", len(xml_files))
-        if exceptions:
-            original_file_count = len(xml_files)
-            xml_files = exceptions.filter_file_exceptions_early(package, xml_files)
-            if original_file_count > len(xml_files):
-                logging.info(
-                    "  After filtering, %d XML files will be scanned.", len(xml_files)
-                )
 
         package["xml"] = xml_files
@@ -1,13 +1,15 @@
 """Discover YAML files to analyze."""
 
 import logging
-from collections import OrderedDict
 from typing import Optional
 
 from statick_tool.discovery_plugin import DiscoveryPlugin
 from statick_tool.exceptions import Exceptions
+from statick_tool.file_index import FileRule
 from statick_tool.package import Package
 
+YAML_RULE = FileRule(extensions=(".yaml", ".yml"))
+
 
 class YAMLDiscoveryPlugin(DiscoveryPlugin):
     """Discover YAML files to analyze."""
@@ -16,28 +18,24 @@ class YAMLDiscoveryPlugin(DiscoveryPlugin):
         """Get name of discovery type."""
         return "yaml"
 
+    @classmethod
+    def get_package_keys(cls) -> list[str]:
+        """Get the package keys the plugin sets."""
+        return ["yaml"]
+
+    @classmethod
+    def is_cacheable(cls) -> bool:
+        """Return whether the results of the plugin only depend on the package files."""
+        return True
+
     def scan(
         self, package: Package, level: str, exceptions: Optional[Exceptions] = None
     ) -> None:
         """Scan package looking for YAML files."""
-        yaml_files: list[str] = []
-        yaml_extensions = (".yaml", ".yml")
-
-        self.find_files(package)
-
-        for file_dict in package.files.values():
-            if file_dict["name"].endswith(yaml_extensions):
-                yaml_files.append(file_dict["path"])
+        self.find_files(package, exceptions=exceptions)
 
-        yaml_files = list(OrderedDict.fromkeys(yaml_files))
+        yaml_files = package.get_file_index().find(YAML_RULE, include_excepted=False)
 
         logging.info("  %d YAML files found.", len(yaml_files))
-        if exceptions:
-            original_file_count = len(yaml_files)
-            yaml_files = exceptions.filter_file_exceptions_early(package, yaml_files)
-            if original_file_count > len(yaml_files):
-                logging.info(
-                    "  After filtering, %d YAML files will be scanned.", len(yaml_files)
-                )
 
         package["yaml"] = yaml_files
@@ -5,7 +5,7 @@ import json
 import logging
 import os
 from collections import OrderedDict
-from typing import Any, Optional, Tuple
+from typing import Any, Mapping, Optional, Sequence, Tuple
 
 from statick_tool.issue import Issue
 from statick_tool.package import Package
@@ -20,7 +20,7 @@ class CodeClimateReportingPlugin(ReportingPlugin):
         return "code_climate"
 
     def report(
-        self, package: Package, issues: dict[str, list[Issue]], level: str
+        self, package: Package, issues: Mapping[str, Sequence[Issue]], level: str
     ) -> Tuple[Optional[None], bool]:
         """Go through the issues list and print them in JSON format.
 
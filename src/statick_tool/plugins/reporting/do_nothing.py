@@ -1,6 +1,6 @@
 """Do nothing to have a default reporting plugin with no side effects."""
 
-from typing import Optional, Tuple
+from typing import Mapping, Optional, Sequence, Tuple
 
 from statick_tool.issue import Issue
 from statick_tool.package import Package
@@ -15,7 +15,7 @@ class DoNothingReportingPlugin(ReportingPlugin):
         return "do_nothing"
 
     def report(
-        self, package: Package, issues: dict[str, list[Issue]], level: str
+        self, package: Package, issues: Mapping[str, Sequence[Issue]], level: str
     ) -> Tuple[Optional[None], bool]:
         """Do nothing."""
         return None, True
@@ -4,7 +4,7 @@ import json
 import logging
 import os
 from collections import OrderedDict
-from typing import Optional, Tuple, Union
+from typing import Mapping, Optional, Sequence, Tuple, Union
 
 from statick_tool.issue import Issue
 from statick_tool.package import Package
@@ -19,7 +19,7 @@ class JsonReportingPlugin(ReportingPlugin):
         return "json"
 
     def report(
-        self, package: Package, issues: dict[str, list[Issue]], level: str
+        self, package: Package, issues: Mapping[str, Sequence[Issue]], level: str
     ) -> Tuple[Optional[None], bool]:
         """Go through the issues list and print them in JSON format.
 
@@ -29,36 +29,15 @@ class JsonReportingPlugin(ReportingPlugin):
                     keyed by the tool that found them.
             level: Name of the level used in the scan.
         """
-        if not self.plugin_context or not self.plugin_context.config:
+        outputs = self.get_outputs(level)
+        if outputs is None:
             return None, False
-
-        file_output = False
-        terminal_output = False
-        file_output_str = self.plugin_context.config.get_reporting_config(
-            self.get_name(), level, "files"
-        )
-        if file_output_str and file_output_str.lower() == "true":
-            file_output = True
-        terminal_output_str = self.plugin_context.config.get_reporting_config(
-            self.get_name(), level, "terminal"
-        )
-        if terminal_output_str and terminal_output_str.lower() == "true":
-            terminal_output = True
+        file_output, terminal_output = outputs
 
         all_issues = []
         for _, value in issues.items():
             for issue in value:
-                issue_dict: OrderedDict[str, Union[str, int]] = OrderedDict()
-                issue_dict["fileName"] = issue.filename
-                issue_dict["lineNumber"] = issue.line_number
-                issue_dict["tool"] = issue.tool
-                issue_dict["type"] = issue.issue_type
-                issue_dict["severity"] = issue.severity
-                issue_dict["message"] = issue.message
-                issue_dict["certReference"] = ""
-                if issue.cert_reference:
-                    issue_dict["certReference"] = issue.cert_reference
-                all_issues.append(issue_dict)
+                all_issues.append(self.get_issue_dict(issue))
         report_json = {"issues": all_issues}
         line = json.dumps(report_json)
 
@@ -71,8 +50,98 @@ class JsonReportingPlugin(ReportingPlugin):
 
         return None, True
 
-    def write_output(self, package: Package, level: str, line: str) -> bool:
-        """Write JSON output to a file."""
+    def begin(self, package: Package, level: str) -> None:
+        """Start writing issues as tools find them.
+
+        The JSON written is the same as for `report`, but each issue is written when it
+        arrives instead of keeping all of them in memory.
+        """
+        self.streamed = None
+        outputs = self.get_outputs(level)
+        if outputs is None:
+            return
+        file_output, terminal_output = outputs
+        fid = None
+        if file_output:
+            output_file = self.get_output_file(package, level)
+            if output_file is None:
+                return
+            fid = open(  # pylint: disable=consider-using-with
+                output_file, "w", encoding="utf8"
+            )
+        self.streamed = {"file": fid, "terminal": terminal_output, "count": 0}
+        self.write_stream('{"issues": [')
+
+    def add_issues(self, tool: str, issues: Sequence[Issue]) -> None:
+        """Write issues found by a tool."""
+        if self.streamed is None:
+            return
+        for issue in issues:
+            separator = ", " if self.streamed["count"] else ""
+            self.write_stream(separator + json.dumps(self.get_issue_dict(issue)))
+            self.streamed["count"] += 1
+
+    def finish(self) -> Tuple[Optional[None], bool]:
+        """Finish writing the issues."""
+        if self.streamed is None:
+            return None, False
+        self.write_stream("]}")
+        if self.streamed["terminal"]:
+            print()
+        if self.streamed["file"] is not None:
+            self.streamed["file"].close()
+        self.streamed = None
+        return None, True
+
+    def write_stream(self, text: str) -> None:
+        """Write part of a report started with `begin`."""
+        if self.streamed["file"] is not None:
+            self.streamed["file"].write(text)
+        if self.streamed["terminal"]:
+            print(text, end="", flush=True)
+
+    def get_outputs(self, level: str) -> Optional[Tuple[bool, bool]]:
+        """Get whether to write the report to a file and to the terminal.
+
+        Returns None if there is no configuration to read that from.
+        """
+        if not self.plugin_context or not self.plugin_context.config:
+            return None
+
+        file_output = False
+        terminal_output = False
+        file_output_str = self.plugin_context.config.get_reporting_config(
+            self.get_name(), level, "files"
+        )
+        if file_output_str and file_output_str.lower() == "true":
+            file_output = True
+        terminal_output_str = self.plugin_context.config.get_reporting_config(
+            self.get_name(), level, "terminal"
+        )
+        if terminal_output_str and terminal_output_str.lower() == "true":
+            terminal_output = True
+        return file_output, terminal_output
+
+    @staticmethod
+    def get_issue_dict(issue: Issue) -> "OrderedDict[str, Union[str, int]]":
+        """Get the JSON fields of an issue."""
+        issue_dict: OrderedDict[str, Union[str, int]] = OrderedDict()
+        issue_dict["fileName"] = issue.filename
+        issue_dict["lineNumber"] = issue.line_number
+        issue_dict["tool"] = issue.tool
+        issue_dict["type"] = issue.issue_type
+        issue_dict["severity"] = issue.severity
+        issue_dict["message"] = issue.message
+        issue_dict["certReference"] = ""
+        if issue.cert_reference:
+            issue_dict["certReference"] = issue.cert_reference
+        return issue_dict
+
+    def get_output_file(self, package: Package, level: str) -> Optional[str]:
+        """Get the path of the file to write JSON output to.
+
+        Returns None if the output directory can't be made.
+        """
         # By default write report to the current directory.
         output_dir = os.getcwd()
         if (
@@ -89,12 +158,19 @@ class JsonReportingPlugin(ReportingPlugin):
             os.mkdir(output_dir)
         if not os.path.isdir(output_dir):
             logging.error("Unable to create output directory at %s!", output_dir)
-            return False
+            return None
 
         output_file = os.path.join(
             output_dir, package.name + "-" + level + ".statick.json"
         )
         logging.info("Writing output to %s", output_file)
+        return output_file
+
+    def write_output(self, package: Package, level: str, line: str) -> bool:
+        """Write JSON output to a file."""
+        output_file = self.get_output_file(package, level)
+        if output_file is None:
+            return False
         with open(output_file, "w", encoding="utf8") as out:
             out.write(line)
 
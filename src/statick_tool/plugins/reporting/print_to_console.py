@@ -1,7 +1,7 @@
 """Write issue reports to the console."""
 
 from collections import OrderedDict
-from typing import Optional, Tuple
+from typing import Mapping, Optional, Sequence, Tuple
 
 from statick_tool.issue import Issue
 from statick_tool.package import Package
@@ -16,7 +16,7 @@ class PrintToConsoleReportingPlugin(ReportingPlugin):
         return "print_to_console"
 
     def report(
-        self, package: Package, issues: dict[str, list[Issue]], level: str
+        self, package: Package, issues: Mapping[str, Sequence[Issue]], level: str
     ) -> Tuple[Optional[None], bool]:
         """Go through the issues list and print them to the console.
 
@@ -33,20 +33,52 @@ class PrintToConsoleReportingPlugin(ReportingPlugin):
             num_issues = len(unique_issues)
             print(f"Tool {key}: {num_issues} unique issues")
             for issue in unique_issues:
-                if issue.cert_reference:
-                    print(
-                        f"  {issue.filename}:{issue.line_number}: "
-                        f"{issue.tool}:{issue.issue_type}: {issue.message} "
-                        f"({issue.cert_reference}) [{issue.severity}]"
-                    )
-                else:
-                    print(
-                        f"  {issue.filename}:{issue.line_number}: "
-                        f"{issue.tool}:{issue.issue_type}: {issue.message} "
-                        f"[{issue.severity}]"
-                    )
+                self.print_issue(issue)
 
             total += len(unique_issues)
         print(f"{total} total unique issues")
 
         return None, True
+
+    def begin(self, package: Package, level: str) -> None:
+        """Start printing issues as tools find them.
+
+        Each unique issue is printed when it arrives, and the number of unique issues
+        from each tool is printed when the report is finished.
+        """
+        self.streamed = {}
+
+    def add_issues(self, tool: str, issues: Sequence[Issue]) -> None:
+        """Print the issues from a tool that have not been printed yet."""
+        seen = self.streamed.setdefault(tool, set())
+        for issue in issues:
+            if issue not in seen:
+                seen.add(issue)
+                self.print_issue(issue)
+
+    def finish(self) -> Tuple[Optional[None], bool]:
+        """Print the number of unique issues from each tool."""
+        total: int = 0
+        for key, seen in self.streamed.items():
+            print(f"Tool {key}: {len(seen)} unique issues")
+            total += len(seen)
+        print(f"{total} total unique issues")
+        self.streamed = None
+
+        return None, True
+
+    @staticmethod
+    def print_issue(issue: Issue) -> None:
+        """Print one issue."""
+        if issue.cert_reference:
+            print(
+                f"  {issue.filename}:{issue.line_number}: "
+                f"{issue.tool}:{issue.issue_type}: {issue.message} "
+                f"({issue.cert_reference}) [{issue.severity}]"
+            )
+        else:
+            print(
+                f"  {issue.filename}:{issue.line_number}: "
+                f"{issue.tool}:{issue.issue_type}: {issue.message} "
+                f"[{issue.severity}]"
+            )
@@ -18,6 +18,11 @@ class BanditToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "bandit"
 
+    @classmethod
+    def can_run_in_process(cls) -> bool:
+        """Return whether the tool is a Python package that can run in-process."""
+        return True
+
     def gather_args(self, args: argparse.Namespace) -> None:
         """Gather arguments."""
         args.add_argument(
@@ -47,10 +52,11 @@ class BanditToolPlugin(ToolPlugin):
         flags += user_flags
 
         try:
-            output = subprocess.check_output(
+            output = self.check_output(
                 [bandit_bin] + flags + files,
                 stderr=subprocess.STDOUT,
                 universal_newlines=True,
+                level=level,
             )
 
         except subprocess.CalledProcessError as ex:
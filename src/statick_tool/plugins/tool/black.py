@@ -17,10 +17,24 @@ class BlackToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "black"
 
+    @classmethod
+    def is_file_local(cls) -> bool:
+        """Return whether the issues found in a file only depend on that file."""
+        return True
+
+    @classmethod
+    def can_run_in_process(cls) -> bool:
+        """Return whether the tool is a Python package that can run in-process."""
+        return True
+
     def get_file_types(self) -> list[str]:
         """Return a list of file types the plugin can scan."""
         return ["python_src"]
 
+    def get_config_names(self, level: str) -> list[str]:
+        """Get the names of configuration files the tool finds next to the files."""
+        return ["pyproject.toml"]
+
     def process_files(
         self, package: Package, level: str, files: list[str], user_flags: list[str]
     ) -> Optional[list[str]]:
@@ -33,8 +47,11 @@ class BlackToolPlugin(ToolPlugin):
         tool_bin = self.get_binary()
         try:
             subproc_args = [tool_bin] + flags + files
-            output = subprocess.check_output(
-                subproc_args, stderr=subprocess.STDOUT, universal_newlines=True
+            output = self.check_output(
+                subproc_args,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                level=level,
             )
 
         except subprocess.CalledProcessError as ex:
@@ -18,6 +18,11 @@ class CatkinLintToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "catkin_lint"
 
+    @classmethod
+    def requires_whole_package(cls) -> bool:
+        """Return whether the tool has to scan the whole package."""
+        return True
+
     def get_file_types(self) -> list[str]:
         """Return a list of file types the plugin can scan."""
         return ["catkin"]
@@ -32,8 +37,11 @@ class CatkinLintToolPlugin(ToolPlugin):
 
         try:
             subproc_args = [tool_bin, package.path] + flags
-            output = subprocess.check_output(
-                subproc_args, stderr=subprocess.STDOUT, universal_newlines=True
+            output = self.check_output(
+                subproc_args,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                level=level,
             )
         except subprocess.CalledProcessError as ex:
             output = ex.output
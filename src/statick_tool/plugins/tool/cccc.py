@@ -11,8 +11,9 @@ browser.
 import argparse
 import csv
 import logging
+import os
 import subprocess
-from pathlib import Path
+import tempfile
 from typing import Any, Optional
 
 import xmltodict
@@ -20,7 +21,7 @@ import yaml
 
 from statick_tool.issue import Issue
 from statick_tool.package import Package
-from statick_tool.tool_plugin import ToolPlugin
+from statick_tool.tool_plugin import CommandResult, ToolPlugin
 
 
 class CCCCToolPlugin(ToolPlugin):
@@ -30,6 +31,10 @@ class CCCCToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "cccc"
 
+    def get_package_keys(self) -> list[str]:
+        """Get the package keys the tool reads."""
+        return ["c_src"]
+
     def gather_args(self, args: argparse.Namespace) -> None:
         """Gather arguments."""
         args.add_argument(
@@ -80,38 +85,56 @@ class CCCCToolPlugin(ToolPlugin):
             return []
         opts.append(" --lang=c++")
 
-        issues: list[Issue] = []
-
-        for src in package["c_src"]:
-            tool_output_dir: str = ".cccc-" + Path(src).name
-            opts.append("--outdir=" + tool_output_dir)
-
+        with tempfile.TemporaryDirectory(prefix="statick-cccc-") as output_dir:
+            # Each file gets its own output directory, so files can be checked at once.
+            tool_output_dirs = [
+                os.path.join(output_dir, str(index))
+                for index in range(len(package["c_src"]))
+            ]
+            commands: list[list[str]] = [
+                [cccc_bin] + opts + ["--outdir=" + tool_output_dir, src]
+                for src, tool_output_dir in zip(package["c_src"], tool_output_dirs)
+            ]
             try:
-                subproc_args: list[str] = [cccc_bin] + opts + [src]
-                logging.debug(" ".join(subproc_args))
-                log_output: bytes = subprocess.check_output(
-                    subproc_args, stderr=subprocess.STDOUT
+                for command in commands:
+                    logging.debug(" ".join(command))
+                # Return code 1 means cccc found problems in the code it checked.
+                results = self.run_many(
+                    commands, level=level, returncodes=(0, 1), stderr=subprocess.STDOUT
                 )
             except subprocess.CalledProcessError as ex:
-                if ex.returncode == 1:
-                    log_output = ex.output
-                else:
-                    logging.warning("Problem %d", ex.returncode)
-                    logging.warning("%s exception: %s", self.get_name(), ex.output)
-                    return None
+                logging.warning("Problem %d", ex.returncode)
+                logging.warning("%s exception: %s", self.get_name(), ex.output)
+                return None
 
             except OSError as ex:
                 logging.warning("Couldn't find cccc executable! (%s)", ex)
                 return None
 
-            logging.debug("%s", log_output)
+            return self.read_results(
+                package["c_src"], tool_output_dirs, results, config_file
+            )
+
+    def read_results(
+        self,
+        srcs: list[str],
+        tool_output_dirs: list[str],
+        results: list[CommandResult],
+        config_file: str,
+    ) -> list[Issue]:
+        """Read the output cccc wrote for each file and report issues."""
+        issues: list[Issue] = []
+        for src, tool_output_dir, result in zip(srcs, tool_output_dirs, results):
+            logging.debug("%s", result.output)
 
             if self.plugin_context and self.plugin_context.args.output_directory:
-                with open(self.get_name() + ".log", "ab") as flog:
-                    flog.write(log_output)
+                with open(self.get_name() + ".log", "a", encoding="utf8") as flog:
+                    flog.write(result.output)
 
             try:
-                with open(tool_output_dir + "/cccc.xml", encoding="utf8") as fresults:
+                with open(
+                    os.path.join(tool_output_dir, "cccc.xml"), encoding="utf8"
+                ) as fresults:
                     tool_output = xmltodict.parse(
                         fresults.read(), dict_constructor=dict
                     )
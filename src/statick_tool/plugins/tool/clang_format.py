@@ -21,6 +21,10 @@ class ClangFormatToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "clang-format"
 
+    def get_package_keys(self) -> list[str]:
+        """Get the package keys the tool reads."""
+        return ["make_targets", "headers"]
+
     def gather_args(self, args: argparse.Namespace) -> None:
         """Gather arguments."""
         args.add_argument(
@@ -89,6 +93,7 @@ class ClangFormatToolPlugin(ToolPlugin):
                 files += target["src"]
         if "headers" in package:
             files += package["headers"]
+        files = package.filter_changed(files)
 
         check: Optional[bool] = self.check_configuration(clang_format_bin)
         if check is None:
@@ -99,12 +104,13 @@ class ClangFormatToolPlugin(ToolPlugin):
         total_output: list[str] = []
 
         try:
-            for src in files:
-                output = subprocess.check_output(
-                    [clang_format_bin, src, "-output-replacements-xml"],
-                    stderr=subprocess.STDOUT,
-                    universal_newlines=True,
-                )
+            results = self.run_many(
+                [[clang_format_bin, src, "-output-replacements-xml"] for src in files],
+                level=level,
+                stderr=subprocess.STDOUT,
+            )
+            for src, result in zip(files, results):
+                output = result.output
                 if (
                     not self.plugin_context
                     or not self.plugin_context.args.clang_format_issue_per_line
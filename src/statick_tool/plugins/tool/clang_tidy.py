@@ -4,11 +4,11 @@ import argparse
 import logging
 import re
 import subprocess
-from typing import Match, Optional, Pattern
+from typing import Iterable, Iterator, Match, Optional, Pattern
 
 from statick_tool.issue import Issue
 from statick_tool.package import Package
-from statick_tool.tool_plugin import ToolPlugin
+from statick_tool.tool_plugin import ToolOutput, ToolPlugin
 
 
 class ClangTidyToolPlugin(ToolPlugin):
@@ -18,6 +18,15 @@ class ClangTidyToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "clang-tidy"
 
+    def get_package_keys(self) -> list[str]:
+        """Get the package keys the tool reads."""
+        return ["make_targets", "src_dir", "bin_dir"]
+
+    @classmethod
+    def requires_whole_package(cls) -> bool:
+        """Return whether the tool has to scan the whole package."""
+        return True
+
     @classmethod
     def get_tool_dependencies(cls) -> list[str]:
         """Get a list of tools that must run before this one."""
@@ -70,34 +79,37 @@ class ClangTidyToolPlugin(ToolPlugin):
             for target in package["make_targets"]:
                 files += target["src"]
 
+        diagnostic_errors = 0
+
+        def read_lines(output: ToolOutput) -> Iterator[str]:
+            nonlocal diagnostic_errors
+            for line in output:
+                if "clang-diagnostic-error" in line:
+                    diagnostic_errors += 1
+                yield line
+
         try:
-            output = subprocess.check_output(
-                [clang_tidy_bin] + flags + files,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-            )
-            if (
-                "clang-diagnostic-error" in output
-            ):  # pylint: disable=unsupported-membership-test
-                raise subprocess.CalledProcessError(-1, clang_tidy_bin, output)
+            with self.open_log() as log:
+                with self.run_lines(
+                    [clang_tidy_bin] + flags + files,
+                    level=level,
+                    log=log,
+                    stderr=subprocess.STDOUT,
+                ) as output:
+                    issues = self.parse_lines(read_lines(output))
+            # Return code 1 means clang-tidy found errors in the code it checked.
+            output.check((0, 1))
+            if output.returncode == 0 and diagnostic_errors:
+                raise subprocess.CalledProcessError(-1, clang_tidy_bin, output.text)
         except subprocess.CalledProcessError as ex:
-            output = ex.output
-            if ex.returncode != 1:
-                logging.warning("clang-tidy failed! Returncode = %d", ex.returncode)
-                logging.warning("%s exception: %s", self.get_name(), ex.output)
-                return None
+            logging.warning("clang-tidy failed! Returncode = %d", ex.returncode)
+            logging.warning("%s exception: %s", self.get_name(), ex.output)
+            return None
 
         except OSError as ex:
             logging.warning("Couldn't find %s! (%s)", clang_tidy_bin, ex)
             return None
 
-        logging.debug("%s", output)
-
-        if self.plugin_context and self.plugin_context.args.output_directory:
-            with open(self.get_name() + ".log", "w", encoding="utf8") as fid:
-                fid.write(output)
-
-        issues: list[Issue] = self.parse_tool_output(output)
         return issues
 
     @classmethod
@@ -112,12 +124,16 @@ class ClangTidyToolPlugin(ToolPlugin):
 
     def parse_tool_output(self, output: str) -> list[Issue]:
         """Parse tool output and report issues."""
+        return self.parse_lines(output.splitlines())
+
+    def parse_lines(self, lines: Iterable[str]) -> list[Issue]:
+        """Parse lines of tool output as they are read and report issues."""
         clang_tidy_re = r"(.+):(\d+):(\d+):\s(.+):\s(.+)\s\[(.+)\]"
         parse: Pattern[str] = re.compile(clang_tidy_re)
         issues: list[Issue] = []
         # Load the plugin mapping if possible
         warnings_mapping = self.load_mapping()
-        for line in output.splitlines():
+        for line in lines:
             match: Optional[Match[str]] = parse.match(line)
             if match and not self.check_for_exceptions(match):
                 if (
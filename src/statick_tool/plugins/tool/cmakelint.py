@@ -17,6 +17,11 @@ class CMakelintToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "cmakelint"
 
+    @classmethod
+    def can_run_in_process(cls) -> bool:
+        """Return whether the tool is a Python package that can run in-process."""
+        return True
+
     def get_file_types(self) -> list[str]:
         """Return a list of file types the plugin can scan."""
         return ["cmake_src"]
@@ -37,8 +42,11 @@ class CMakelintToolPlugin(ToolPlugin):
         tool_bin = self.get_binary()
         try:
             subproc_args = [tool_bin] + flags + cmake_files
-            output = subprocess.check_output(
-                subproc_args, stderr=subprocess.STDOUT, universal_newlines=True
+            output = self.check_output(
+                subproc_args,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                level=level,
             )
         except subprocess.CalledProcessError as ex:
             if ex.returncode == 1:
@@ -5,7 +5,7 @@ import logging
 import os
 import re
 import subprocess
-from typing import Match, Optional, Pattern
+from typing import Iterable, Match, Optional, Pattern
 
 from packaging.version import Version
 
@@ -28,6 +28,10 @@ class CppcheckToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "cppcheck"
 
+    def get_package_keys(self) -> list[str]:
+        """Get the package keys the tool reads."""
+        return ["make_targets", "headers"]
+
     def gather_args(self, args: argparse.Namespace) -> None:
         """Gather arguments."""
         args.add_argument(
@@ -110,6 +114,7 @@ class CppcheckToolPlugin(ToolPlugin):
                             include_dirs.append(include_dir)
         if "headers" in package:
             files += package["headers"]
+        files = package.filter_changed(files)
 
         if not files:
             return []
@@ -121,24 +126,22 @@ class CppcheckToolPlugin(ToolPlugin):
                 include_args.append(include_dir)
 
         try:
-            output = subprocess.check_output(
-                [cppcheck_bin] + flags + include_args + files,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-            )
+            with self.parallel_jobs() as jobs:
+                jobs_args = [f"-j{jobs}"] if jobs > 1 else []
+                with self.open_log() as log:
+                    with self.run_lines(
+                        [cppcheck_bin] + flags + jobs_args + include_args + files,
+                        level=level,
+                        log=log,
+                        stderr=subprocess.STDOUT,
+                    ) as output:
+                        issues = self.parse_lines(output)
+            output.check()
         except subprocess.CalledProcessError as ex:
-            output = ex.output
             logging.warning("cppcheck failed! Returncode = %d", ex.returncode)
             logging.warning("%s exception: %s", self.get_name(), ex.output)
             return None
 
-        logging.debug("%s", output)
-
-        if self.plugin_context and self.plugin_context.args.output_directory:
-            with open(self.get_name() + ".log", "w", encoding="utf8") as fid:
-                fid.write(output)
-
-        issues: list[Issue] = self.parse_tool_output(output)
         return issues
 
     # pylint: enable=too-many-locals, too-many-branches, too-many-return-statements
@@ -153,11 +156,15 @@ class CppcheckToolPlugin(ToolPlugin):
 
     def parse_tool_output(self, output: str) -> list[Issue]:
         """Parse tool output and report issues."""
+        return self.parse_lines(output.splitlines())
+
+    def parse_lines(self, lines: Iterable[str]) -> list[Issue]:
+        """Parse lines of tool output as they are read and report issues."""
         cppcheck_re = r"\[(.+):(\d+)\]:\s\((.+?)\s(.+?)\)\s(.+)"
         parse: Pattern[str] = re.compile(cppcheck_re)
         issues: list[Issue] = []
         warnings_mapping = self.load_mapping()
-        for line in output.splitlines():
+        for line in lines:
             match: Optional[Match[str]] = parse.match(line)
             if (
                 match
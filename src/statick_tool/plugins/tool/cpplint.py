@@ -18,6 +18,25 @@ class CpplintToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "cpplint"
 
+    def get_package_keys(self) -> list[str]:
+        """Get the package keys the tool reads."""
+        return ["make_targets", "headers", "cpplint"]
+
+    @classmethod
+    def is_file_local(cls) -> bool:
+        """Return whether the issues found in a file only depend on that file."""
+        return True
+
+    @classmethod
+    def is_shard_safe(cls) -> bool:
+        """Return whether the tool can be run on separate chunks of the files."""
+        return True
+
+    @classmethod
+    def can_run_in_process(cls) -> bool:
+        """Return whether the tool is a Python package that can run in-process."""
+        return True
+
     def get_binary(  # pylint: disable=unused-argument
         self, level: Optional[str] = None, package: Optional[Package] = None
     ) -> str:
@@ -28,6 +47,10 @@ class CpplintToolPlugin(ToolPlugin):
 
         return binary
 
+    def get_config_names(self, level: str) -> list[str]:
+        """Get the names of configuration files the tool finds next to the files."""
+        return ["CPPLINT.cfg"]
+
     def scan(self, package: Package, level: str) -> Optional[list[Issue]]:
         """Run tool and gather output."""
         if "make_targets" not in package and "headers" not in package:
@@ -40,20 +63,30 @@ class CpplintToolPlugin(ToolPlugin):
             logging.warning("  cpplint not found!")
             return None
 
-        flags: list[str] = []
-        flags += self.get_user_flags(level)
-        cpplint = self.get_binary(package=package)
+        return super().scan(package, level)
 
+    def get_files(self, package: Package) -> list[str]:
+        """Get the files in a package that the tool should scan."""
         files: list[str] = []
         if "make_targets" in package:
             for target in package["make_targets"]:
                 files += target["src"]
+        return files
+
+    def process_files(
+        self, package: Package, level: str, files: list[str], user_flags: list[str]
+    ) -> Optional[list[str]]:
+        """Run tool and gather output."""
+        flags: list[str] = []
+        flags += user_flags
+        cpplint = self.get_binary(package=package)
 
         try:
-            output = subprocess.check_output(
+            output = self.check_output(
                 [cpplint] + flags + files,
                 stderr=subprocess.STDOUT,
                 universal_newlines=True,
+                level=level,
             )
         except subprocess.CalledProcessError as ex:
             output = ex.output
@@ -68,11 +101,15 @@ class CpplintToolPlugin(ToolPlugin):
 
         logging.debug("%s", output)
 
-        if self.plugin_context and self.plugin_context.args.output_directory:
-            with open(self.get_name() + ".log", "w", encoding="utf8") as fid:
-                fid.write(output)
+        return [output]
 
-        issues: list[Issue] = self.parse_tool_output(output)
+    def parse_output(
+        self, total_output: list[str], package: Optional[Package] = None
+    ) -> list[Issue]:
+        """Parse tool output and report issues."""
+        issues: list[Issue] = []
+        for output in total_output:
+            issues += self.parse_tool_output(output)
         return issues
 
     @classmethod
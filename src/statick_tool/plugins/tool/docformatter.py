@@ -18,6 +18,11 @@ class DocformatterToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "docformatter"
 
+    @classmethod
+    def can_run_in_process(cls) -> bool:
+        """Return whether the tool is a Python package that can run in-process."""
+        return True
+
     def get_file_types(self) -> list[str]:
         """Return a list of file types the plugin can scan."""
         return ["python_src"]
@@ -34,8 +39,11 @@ class DocformatterToolPlugin(ToolPlugin):
 
         try:
             subproc_args = [tool_bin] + flags + files
-            output = subprocess.check_output(
-                subproc_args, stderr=subprocess.STDOUT, universal_newlines=True
+            output = self.check_output(
+                subproc_args,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                level=level,
             )
 
         except (IOError, OSError) as ex:
@@ -64,8 +64,8 @@ class DockerfileULintToolPlugin(ToolPlugin):
         for src in files:
             try:
                 exe = [tool_bin] + flags + ["-f", src]
-                output = subprocess.check_output(
-                    exe, stderr=subprocess.STDOUT, universal_newlines=True
+                output = self.check_output(
+                    exe, stderr=subprocess.STDOUT, universal_newlines=True, level=level
                 )
                 total_output.append(self.add_filename(output, src))
 
@@ -54,8 +54,8 @@ class DockerfileLintToolPlugin(ToolPlugin):
 
         try:
             exe = [tool_bin] + flags + files
-            output = subprocess.check_output(
-                exe, stderr=subprocess.STDOUT, universal_newlines=True
+            output = self.check_output(
+                exe, stderr=subprocess.STDOUT, universal_newlines=True, level=level
             )
             total_output.append(output)
 
@@ -74,7 +74,7 @@ class ESLintToolPlugin(ToolPlugin):
         """Run tool and gather output."""
         tool_bin = self.get_binary()
 
-        (format_file_name, copied_file) = self.get_format_file(level)
+        format_file_name, copied_file = self.get_format_file(level)
 
         flags: list[str] = ["-f", "json"]
         if format_file_name is not None:
@@ -82,49 +82,39 @@ class ESLintToolPlugin(ToolPlugin):
         flags += []
         flags += user_flags
 
-        total_output: list[str] = []
+        try:
+            results = self.run_many(
+                [[tool_bin] + flags + [src] for src in files],
+                level=level,
+                returncodes=(0, 1),  # eslint returns 1 upon linting errors
+                stderr=subprocess.STDOUT,
+            )
+        except subprocess.CalledProcessError as ex:
+            logging.warning("%s failed! Returncode = %d", tool_bin, ex.returncode)
+            logging.warning("%s exception: %s", self.get_name(), ex.output)
+            return None
+        except OSError as ex:
+            logging.warning("Couldn't find %s! (%s)", tool_bin, ex)
+            return None
+        finally:
+            if copied_file and format_file_name is not None:
+                self.remove_config_file(format_file_name)
 
-        for src in files:
-            try:
-                exe = [tool_bin] + flags + [src]
-                output = subprocess.check_output(
-                    exe, stderr=subprocess.STDOUT, universal_newlines=True
+        total_output: list[str] = []
+        for result in results:
+            if result.returncode == 1 and (
+                "Error: Cannot find module" in result.output
+                or "Require stack:" in result.output
+            ):
+                # nodejs cannot find a module and threw an error
+                # this results in the same returncode `1` that eslint
+                # uses to indicate the presence of linting issues.
+                logging.warning(
+                    "%s failed! Returncode = %d", tool_bin, result.returncode
                 )
-                total_output.append(output)
-
-            except subprocess.CalledProcessError as ex:
-                if (
-                    "Error: Cannot find module" in ex.output
-                    or "Require stack:" in ex.output
-                ):
-                    # nodejs cannot find a module and threw an error
-                    # this results in the same returncode `1` that eslint
-                    # uses to indicate the presence of linting issues.
-                    logging.warning(
-                        "%s failed! Returncode = %d", tool_bin, ex.returncode
-                    )
-                    logging.warning("%s exception: %s", self.get_name(), ex.output)
-                    return None
-
-                if ex.returncode == 1:  # eslint returns 1 upon linting errors
-                    total_output.append(ex.output)
-                else:
-                    logging.warning(
-                        "%s failed! Returncode = %d", tool_bin, ex.returncode
-                    )
-                    logging.warning("%s exception: %s", self.get_name(), ex.output)
-                    if copied_file and format_file_name is not None:
-                        self.remove_config_file(format_file_name)
-                    return None
-
-            except OSError as ex:
-                logging.warning("Couldn't find %s! (%s)", tool_bin, ex)
-                if copied_file and format_file_name is not None:
-                    self.remove_config_file(format_file_name)
+                logging.warning("%s exception: %s", self.get_name(), result.output)
                 return None
-
-        if copied_file and format_file_name is not None:
-            self.remove_config_file(format_file_name)
+            total_output.append(result.output)
 
         return total_output
 
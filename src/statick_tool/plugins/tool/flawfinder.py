@@ -17,6 +17,16 @@ class FlawfinderToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "flawfinder"
 
+    @classmethod
+    def is_shard_safe(cls) -> bool:
+        """Return whether the tool can be run on separate chunks of the files."""
+        return True
+
+    @classmethod
+    def can_run_in_process(cls) -> bool:
+        """Return whether the tool is a Python package that can run in-process."""
+        return True
+
     def get_file_types(self) -> list[str]:
         """Return a list of file types the plugin can scan."""
         return ["c_src"]
@@ -32,8 +42,11 @@ class FlawfinderToolPlugin(ToolPlugin):
 
         try:
             subproc_args = [tool_bin] + flags + files
-            output = subprocess.check_output(
-                subproc_args, stderr=subprocess.STDOUT, universal_newlines=True
+            output = self.check_output(
+                subproc_args,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                level=level,
             )
             total_output.append(output)
         except subprocess.CalledProcessError as ex:
@@ -64,11 +64,12 @@ class GroovyLintToolPlugin(ToolPlugin):
         total_output: list[str] = []
         try:
             exe = [tool_bin] + flags + files
-            output = subprocess.check_output(
+            output = self.check_output(
                 exe,
                 stderr=subprocess.STDOUT,
                 universal_newlines=True,
                 cwd=package.path,
+                level=level,
             )
             total_output.append(output)
         except subprocess.CalledProcessError as ex:
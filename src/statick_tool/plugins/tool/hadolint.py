@@ -64,6 +64,16 @@ class HadolintToolPlugin(ToolPlugin):
             version = self.get_version_from_docker()
         return version
 
+    def get_version_key(self) -> Optional[str]:
+        """Get a key that changes whenever the installed tool changes.
+
+        The docker image can change without any local binary changing, so versions from
+        docker are not stored.
+        """
+        if self.plugin_context and self.plugin_context.args.hadolint_docker:
+            return None
+        return super().get_version_key()
+
     # pylint: disable=too-many-locals
     def process_files(
         self, package: Package, level: str, files: list[str], user_flags: list[str]
@@ -102,11 +112,11 @@ class HadolintToolPlugin(ToolPlugin):
             and self.plugin_context.args.hadolint_docker
             and config_file_path is not None
         ):
-            output = self.scan_docker(tool_bin, flags, files, config_file_path)
+            output = self.scan_docker(tool_bin, flags, files, config_file_path, level)
         else:
             if config_file_path is not None and config_file_path:
                 flags += ["-c", config_file_path]
-            output = self.scan_local_binary(tool_bin, flags, files)
+            output = self.scan_local_binary(tool_bin, flags, files, level)
 
         if output:
             total_output.append(output)
@@ -121,14 +131,18 @@ class HadolintToolPlugin(ToolPlugin):
     # pylint: enable=too-many-locals
 
     def scan_local_binary(
-        self, tool_bin: str, flags: list[str], files: list[str]
+        self,
+        tool_bin: str,
+        flags: list[str],
+        files: list[str],
+        level: Optional[str] = None,
     ) -> Optional[str]:
         """Use locally installed hadolint binary to scan."""
         try:
             exe = [tool_bin] + flags
             exe.extend(files)
-            output = subprocess.check_output(
-                exe, stderr=subprocess.STDOUT, universal_newlines=True
+            output = self.check_output(
+                exe, stderr=subprocess.STDOUT, universal_newlines=True, level=level
             )
             return output
 
@@ -141,39 +155,47 @@ class HadolintToolPlugin(ToolPlugin):
             logging.warning("Couldn't find %s! (%s)", tool_bin, ex)
             return None
 
-    def scan_docker(
-        self, tool_bin: str, flags: list[str], files: list[str], config_file_path: str
+    def scan_docker(  # pylint: disable=too-many-locals
+        self,
+        tool_bin: str,
+        flags: list[str],
+        files: list[str],
+        config_file_path: str,
+        level: Optional[str] = None,
     ) -> Optional[str]:
         """Use hadolint docker image to scan."""
-        try:
-            json_dict = []
-            for src in files:
-                exe = [
-                    "docker",
-                    "run",
-                    "--rm",
-                    "-i",
-                ]
-                if config_file_path is not None and config_file_path:
-                    exe.extend(
-                        [
-                            "-v",
-                            config_file_path + ":/.config/hadolint.yaml",
-                        ]
-                    )
+        commands = []
+        for src in files:
+            exe = [
+                "docker",
+                "run",
+                "--rm",
+                "-i",
+            ]
+            if config_file_path is not None and config_file_path:
                 exe.extend(
                     [
                         "-v",
-                        src + ":/Dockerfile",
-                        "hadolint/hadolint",
-                        "hadolint",
+                        config_file_path + ":/.config/hadolint.yaml",
                     ]
                 )
-                exe.extend(flags)
-                exe.append("Dockerfile")
-                output = subprocess.check_output(
-                    exe, stderr=subprocess.STDOUT, universal_newlines=True
-                )
+            exe.extend(
+                [
+                    "-v",
+                    src + ":/Dockerfile",
+                    "hadolint/hadolint",
+                    "hadolint",
+                ]
+            )
+            exe.extend(flags)
+            exe.append("Dockerfile")
+            commands.append(exe)
+
+        try:
+            results = self.run_many(commands, level=level, stderr=subprocess.STDOUT)
+            json_dict = []
+            for src, result in zip(files, results):
+                output = result.output
                 if output:
                     output = output.replace(
                         '"file":"Dockerfile"', '"file":"' + src + '"'
@@ -20,10 +20,30 @@ class IsortToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "isort"
 
+    @classmethod
+    def is_file_local(cls) -> bool:
+        """Return whether the issues found in a file only depend on that file."""
+        return True
+
+    @classmethod
+    def can_run_in_process(cls) -> bool:
+        """Return whether the tool is a Python package that can run in-process."""
+        return True
+
     def get_file_types(self) -> list[str]:
         """Return a list of file types the plugin can scan."""
         return ["python_src"]
 
+    def get_config_names(self, level: str) -> list[str]:
+        """Get the names of configuration files the tool finds next to the files."""
+        return [
+            "pyproject.toml",
+            "setup.cfg",
+            "tox.ini",
+            ".isort.cfg",
+            ".editorconfig",
+        ]
+
     def process_files(
         self, package: Package, level: str, files: list[str], user_flags: list[str]
     ) -> Optional[list[str]]:
@@ -36,8 +56,11 @@ class IsortToolPlugin(ToolPlugin):
 
         try:
             subproc_args = [tool_bin] + flags + files
-            output = subprocess.check_output(
-                subproc_args, stderr=subprocess.STDOUT, universal_newlines=True
+            output = self.check_output(
+                subproc_args,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                level=level,
             )
             total_output.append(output)
 
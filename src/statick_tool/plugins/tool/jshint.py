@@ -51,8 +51,8 @@ class JSHintToolPlugin(ToolPlugin):
         for src in files:
             try:
                 exe = [tool_bin] + flags + [src]
-                output = subprocess.check_output(
-                    exe, stderr=subprocess.STDOUT, universal_newlines=True
+                output = self.check_output(
+                    exe, stderr=subprocess.STDOUT, universal_newlines=True, level=level
                 )
 
             except subprocess.CalledProcessError as ex:
@@ -34,8 +34,11 @@ class LacheckToolPlugin(ToolPlugin):
         tool_bin = self.get_binary()
         try:
             subproc_args: list[str] = [tool_bin] + flags + files
-            output = subprocess.check_output(
-                subproc_args, stderr=subprocess.STDOUT, universal_newlines=True
+            output = self.check_output(
+                subproc_args,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                level=level,
             )
 
         except subprocess.CalledProcessError as ex:
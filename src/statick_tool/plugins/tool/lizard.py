@@ -24,6 +24,15 @@ class LizardToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "lizard"
 
+    def get_package_keys(self) -> list[str]:
+        """Get the package keys the tool reads, none since it scans the package path."""
+        return []
+
+    @classmethod
+    def requires_whole_package(cls) -> bool:
+        """Return whether the tool has to scan the whole package."""
+        return True
+
     def scan(self, package: Package, level: str) -> Optional[list[Issue]]:
         """Run tool and gather output."""
         if not package.path:
@@ -46,16 +55,23 @@ class LizardToolPlugin(ToolPlugin):
         schema = lizard.OutputScheme(options.extensions)
         schema.patch_for_extensions()
 
-        result = lizard.analyze(
-            options.paths,
-            options.exclude,
-            options.working_threads,
-            options.extensions,
-            options.languages,
-        )
-        lizard_output = io.StringIO()
-        with redirect_stdout(lizard_output):
-            printer(result, options, schema, lizard.AllResult)
+        # Files are analyzed while the results are printed, so keep the jobs until then.
+        with self.parallel_jobs() as jobs:
+            working_threads = options.working_threads
+            if not any(
+                flag.startswith(("-t", "--working_threads")) for flag in user_flags
+            ):
+                working_threads = jobs
+            result = lizard.analyze(
+                options.paths,
+                options.exclude,
+                working_threads,
+                options.extensions,
+                options.languages,
+            )
+            lizard_output = io.StringIO()
+            with redirect_stdout(lizard_output):
+                printer(result, options, schema, lizard.AllResult)
         output = lizard_output.getvalue()
         lizard.print_extension_results(options.extensions)
 
@@ -3,7 +3,7 @@
 import logging
 import re
 import subprocess
-from typing import Any, Match, Optional, Pattern
+from typing import Any, Iterable, Match, Optional, Pattern
 
 from statick_tool.issue import Issue
 from statick_tool.package import Package
@@ -17,6 +17,15 @@ class MakeToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "make"
 
+    def get_package_keys(self) -> list[str]:
+        """Get the package keys the tool reads."""
+        return ["make_targets"]
+
+    @classmethod
+    def requires_whole_package(cls) -> bool:
+        """Return whether the tool has to scan the whole package."""
+        return True
+
     def scan(self, package: Package, level: str) -> Optional[list[Issue]]:
         """Run tool and gather output."""
         if "make_targets" not in package or not package["make_targets"]:
@@ -25,19 +34,22 @@ class MakeToolPlugin(ToolPlugin):
 
         tool_bin = self.get_binary()
 
-        output = None
         make_args: list[str] = [tool_bin, "statick_cmake_target"]
 
         try:
-            output = subprocess.check_output(
-                [tool_bin, "clean"], universal_newlines=True
-            )
-            output = subprocess.check_output(
-                make_args, stderr=subprocess.STDOUT, universal_newlines=True
-            )
+            self.check_output([tool_bin, "clean"], universal_newlines=True, level=level)
+            with self.parallel_jobs() as jobs:
+                with self.open_log() as log:
+                    with self.run_lines(
+                        make_args + [f"-j{jobs}"],
+                        level=level,
+                        log=log,
+                        stderr=subprocess.STDOUT,
+                    ) as output:
+                        issues = self.parse_package_lines(package, output)
+            output.check()
 
         except subprocess.CalledProcessError as ex:
-            output = ex.output
             logging.warning("Make failed! Returncode = %d", ex.returncode)
             logging.warning("%s exception: %s", self.get_name(), ex.output)
             return None
@@ -46,13 +58,6 @@ class MakeToolPlugin(ToolPlugin):
             logging.warning("Couldn't find make executable! (%s)", ex)
             return None
 
-        logging.debug("%s", output)
-
-        if self.plugin_context and self.plugin_context.args.output_directory:
-            with open(self.get_name() + ".log", "w", encoding="utf8") as fid:
-                fid.write(output)
-
-        issues: list[Issue] = self.parse_package_output(package, output)
         return issues
 
     @classmethod
@@ -85,10 +90,14 @@ class MakeToolPlugin(ToolPlugin):
             i += 1
         return result
 
-    def parse_package_output(  # pylint: disable=too-many-locals, too-many-branches
-        self, package: Package, output: str
-    ) -> list[Issue]:
+    def parse_package_output(self, package: Package, output: str) -> list[Issue]:
         """Parse tool output and report issues."""
+        return self.parse_package_lines(package, output.splitlines())
+
+    def parse_package_lines(  # pylint: disable=too-many-locals, too-many-branches
+        self, package: Package, lines: Iterable[str]
+    ) -> list[Issue]:
+        """Parse lines of tool output as they are read and report issues."""
         make_re = r"(.+):(\d+):(\d+):\s(.+):\s(.+)"
         make_warning_re = r".*\[(.+)\].*"
         parse: Pattern[str] = re.compile(make_re)
@@ -96,10 +105,13 @@ class MakeToolPlugin(ToolPlugin):
         matches: Any = []
         # Load the plugin mapping if possible
         warnings_mapping = self.load_mapping()
-        for line in output.splitlines():
+        link_failed = False
+        for line in lines:
             match: Optional[Match[str]] = parse.match(line)
             if match and not self.check_for_exceptions(match):
                 matches.append(match.groups())
+            elif line == "collect2: ld returned 1 exit status":
+                link_failed = True
 
         filtered_matches = self.filter_matches(matches, package)
         issues: list[Issue] = []
@@ -142,8 +154,7 @@ class MakeToolPlugin(ToolPlugin):
             if issue not in issues:
                 issues.append(issue)
 
-        lines = output.splitlines()
-        if "collect2: ld returned 1 exit status" in lines:
+        if link_failed:
             issues.append(
                 Issue(
                     "Linker",
@@ -17,17 +17,17 @@ class MarkdownlintToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "markdownlint"
 
+    @classmethod
+    def is_file_local(cls) -> bool:
+        """Return whether the issues found in a file only depend on that file."""
+        return True
+
     def get_file_types(self) -> list[str]:
         """Return a list of file types the plugin can scan."""
         return ["md_src"]
 
-    # pylint: disable=too-many-locals
-    def process_files(
-        self, package: Package, level: str, files: list[str], user_flags: list[str]
-    ) -> Optional[list[str]]:
-        """Run tool and gather output."""
-        tool_bin = self.get_binary()
-
+    def get_format_file(self, level: str) -> Optional[str]:
+        """Get the markdownlint configuration file to use."""
         tool_config = ".markdownlintrc"
         user_config = None
         if self.plugin_context is not None:
@@ -40,6 +40,22 @@ class MarkdownlintToolPlugin(ToolPlugin):
         format_file_name = None
         if self.plugin_context is not None:
             format_file_name = self.plugin_context.resources.get_file(tool_config)
+        return format_file_name
+
+    def get_config_files(self, level: str, package: Package) -> list[str]:
+        """Get the configuration files that change the output of the tool."""
+        format_file_name = self.get_format_file(level)
+        if format_file_name is None:
+            return []
+        return [format_file_name]
+
+    def process_files(
+        self, package: Package, level: str, files: list[str], user_flags: list[str]
+    ) -> Optional[list[str]]:
+        """Run tool and gather output."""
+        tool_bin = self.get_binary()
+
+        format_file_name = self.get_format_file(level)
         flags: list[str] = []
         if format_file_name is not None:
             flags += ["-c", format_file_name]
@@ -49,8 +65,8 @@ class MarkdownlintToolPlugin(ToolPlugin):
 
         try:
             exe = [tool_bin] + flags + files
-            output = subprocess.check_output(
-                exe, stderr=subprocess.STDOUT, universal_newlines=True
+            output = self.check_output(
+                exe, stderr=subprocess.STDOUT, universal_newlines=True, level=level
             )
             total_output.append(output)
 
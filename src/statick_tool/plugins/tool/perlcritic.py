@@ -49,10 +49,11 @@ class PerlCriticToolPlugin(ToolPlugin):
         perlcritic_bin = self.get_binary()
 
         try:
-            output = subprocess.check_output(
+            output = self.check_output(
                 [perlcritic_bin] + flags + files,
                 stderr=subprocess.STDOUT,
                 universal_newlines=True,
+                level=level,
             ).join(" ")
 
         except subprocess.CalledProcessError as ex:
@@ -3,12 +3,58 @@
 import logging
 import re
 import subprocess
-from typing import Match, Optional, Pattern
+from typing import Any, Match, Optional, Pattern
+
+import pycodestyle
 
 from statick_tool.issue import Issue
 from statick_tool.package import Package
+from statick_tool.parse_cache import ParseCache
 from statick_tool.tool_plugin import ToolPlugin
 
+# Options that make pycodestyle print more than the issues it finds.
+EXTRA_OUTPUT_OPTIONS = (
+    "benchmark",
+    "count",
+    "diff",
+    "quiet",
+    "show_pep8",
+    "show_source",
+    "statistics",
+    "verbose",
+)
+
+
+class OutputReport(pycodestyle.StandardReport):  # type: ignore[misc]
+    """Report that keeps the lines pycodestyle would print for each issue."""
+
+    def __init__(self, options: Any) -> None:
+        """Initialize the report."""
+        super().__init__(options)
+        self.output: list[str] = []
+
+    def get_file_results(self) -> int:
+        """Keep the lines for the issues in a file and return the number of issues."""
+        self._deferred_print.sort()
+        for line_number, offset, code, text, _ in self._deferred_print:
+            self.output.append(
+                self._fmt
+                % {
+                    "path": self.filename,
+                    "row": self.line_offset + line_number,
+                    "col": offset + 1,
+                    "code": code,
+                    "text": text,
+                }
+            )
+        errors: int = self.file_errors
+        return errors
+
+
+def raise_option_error(message: str) -> None:
+    """Raise an error for invalid options instead of printing usage and exiting."""
+    raise ValueError(message)
+
 
 class PycodestyleToolPlugin(ToolPlugin):
     """Apply pycodestyle tool and gather results."""
@@ -17,10 +63,34 @@ class PycodestyleToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "pycodestyle"
 
+    @classmethod
+    def is_file_local(cls) -> bool:
+        """Return whether the issues found in a file only depend on that file."""
+        return True
+
+    @classmethod
+    def is_shard_safe(cls) -> bool:
+        """Return whether the tool can be run on separate chunks of the files."""
+        return True
+
+    @classmethod
+    def can_run_in_process(cls) -> bool:
+        """Return whether the tool is a Python package that can run in-process."""
+        return True
+
+    @classmethod
+    def uses_parse_cache(cls) -> bool:
+        """Return whether the tool can check Python files with the parse cache."""
+        return True
+
     def get_file_types(self) -> list[str]:
         """Return a list of file types the plugin can scan."""
         return ["python_src"]
 
+    def get_config_names(self, level: str) -> list[str]:
+        """Get the names of configuration files the tool finds next to the files."""
+        return ["setup.cfg", "tox.ini", ".pycodestyle"]
+
     def process_files(
         self, package: Package, level: str, files: list[str], user_flags: list[str]
     ) -> Optional[list[str]]:
@@ -30,11 +100,22 @@ class PycodestyleToolPlugin(ToolPlugin):
 
         total_output: list[str] = []
 
+        parse_cache = self.get_parse_cache(package, level)
+        if parse_cache is not None:
+            output = self.check_parsed_files(parse_cache, flags, files)
+            if output is not None:
+                total_output.append(output)
+                logging.debug("%s", total_output)
+                return total_output
+
         tool_bin = self.get_binary()
         try:
             subproc_args = [tool_bin] + flags + files
-            output = subprocess.check_output(
-                subproc_args, stderr=subprocess.STDOUT, universal_newlines=True
+            output = self.check_output(
+                subproc_args,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                level=level,
             )
 
         except subprocess.CalledProcessError as ex:
@@ -56,6 +137,40 @@ class PycodestyleToolPlugin(ToolPlugin):
 
         return total_output
 
+    @staticmethod
+    def check_parsed_files(
+        parse_cache: ParseCache, flags: list[str], files: list[str]
+    ) -> Optional[str]:
+        """Check files with the lines from the parse cache.
+
+        The flags and configuration files are read like the pycodestyle command does,
+        and the output is the same as the output of the command. Returns None when the
+        flags are invalid or make pycodestyle print more than the issues, so the command
+        is run instead.
+        """
+        parser = pycodestyle.get_parser()
+        parser.error = raise_option_error
+        try:
+            style = pycodestyle.StyleGuide(paths=flags + files, parser=parser)
+        except (ValueError, SystemExit):
+            return None
+        if any(getattr(style.options, name, False) for name in EXTRA_OUTPUT_OPTIONS):
+            return None
+
+        report = style.init_report(OutputReport)
+        report.start()
+        for path in files:
+            if style.excluded(path):
+                continue
+            try:
+                lines: Optional[list[str]] = parse_cache.get(path).get_lines()
+            except OSError:
+                # pycodestyle reports files it can't read.
+                lines = None
+            style.input_file(path, lines=lines)
+        report.stop()
+        return "".join(line + "\n" for line in report.output)
+
     def parse_output(
         self, total_output: list[str], package: Optional[Package] = None
     ) -> list[Issue]:
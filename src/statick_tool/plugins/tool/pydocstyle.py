@@ -17,10 +17,37 @@ class PydocstyleToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "pydocstyle"
 
+    @classmethod
+    def is_file_local(cls) -> bool:
+        """Return whether the issues found in a file only depend on that file."""
+        return True
+
+    @classmethod
+    def is_shard_safe(cls) -> bool:
+        """Return whether the tool can be run on separate chunks of the files."""
+        return True
+
+    @classmethod
+    def can_run_in_process(cls) -> bool:
+        """Return whether the tool is a Python package that can run in-process."""
+        return True
+
     def get_file_types(self) -> list[str]:
         """Return a list of file types the plugin can scan."""
         return ["python_src"]
 
+    def get_config_names(self, level: str) -> list[str]:
+        """Get the names of configuration files the tool finds next to the files."""
+        return [
+            "setup.cfg",
+            "tox.ini",
+            "pyproject.toml",
+            ".pydocstyle",
+            ".pydocstyle.ini",
+            ".pydocstylerc",
+            ".pydocstylerc.ini",
+        ]
+
     def process_files(
         self, package: Package, level: str, files: list[str], user_flags: list[str]
     ) -> Optional[list[str]]:
@@ -33,8 +60,11 @@ class PydocstyleToolPlugin(ToolPlugin):
 
         try:
             subproc_args = [tool_bin] + flags + files
-            output = subprocess.check_output(
-                subproc_args, stderr=subprocess.STDOUT, universal_newlines=True
+            output = self.check_output(
+                subproc_args,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                level=level,
             )
 
         except subprocess.CalledProcessError as ex:
@@ -1,12 +1,18 @@
 """Apply pyflakes tool and gather results."""
 
+import io
 import logging
 import re
 import subprocess
 from typing import Match, Optional, Pattern
 
+import pyflakes.api
+import pyflakes.checker
+import pyflakes.reporter
+
 from statick_tool.issue import Issue
 from statick_tool.package import Package
+from statick_tool.parse_cache import ParseCache
 from statick_tool.tool_plugin import ToolPlugin
 
 
@@ -17,6 +23,21 @@ class PyflakesToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "pyflakes"
 
+    @classmethod
+    def is_shard_safe(cls) -> bool:
+        """Return whether the tool can be run on separate chunks of the files."""
+        return True
+
+    @classmethod
+    def can_run_in_process(cls) -> bool:
+        """Return whether the tool is a Python package that can run in-process."""
+        return True
+
+    @classmethod
+    def uses_parse_cache(cls) -> bool:
+        """Return whether the tool can check Python files with the parse cache."""
+        return True
+
     def get_file_types(self) -> list[str]:
         """Return a list of file types the plugin can scan."""
         return ["python_src"]
@@ -31,10 +52,19 @@ class PyflakesToolPlugin(ToolPlugin):
 
         total_output: list[str] = []
 
+        parse_cache = self.get_parse_cache(package, level)
+        if parse_cache is not None and not flags:
+            total_output.append(self.check_parsed_files(parse_cache, files))
+            logging.debug("%s", total_output)
+            return total_output
+
         try:
             subproc_args = [tool_bin] + flags + files
-            output = subprocess.check_output(
-                subproc_args, stderr=subprocess.STDOUT, universal_newlines=True
+            output = self.check_output(
+                subproc_args,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                level=level,
             )
 
         except subprocess.CalledProcessError as ex:
@@ -56,6 +86,27 @@ class PyflakesToolPlugin(ToolPlugin):
 
         return total_output
 
+    @staticmethod
+    def check_parsed_files(parse_cache: ParseCache, files: list[str]) -> str:
+        """Check files with the syntax trees from the parse cache.
+
+        The output is the same as the output of the pyflakes command. Files that can't
+        be read or parsed are checked by pyflakes itself to report the error.
+        """
+        output = io.StringIO()
+        reporter = pyflakes.reporter.Reporter(output, output)
+        for path in files:
+            try:
+                tree = parse_cache.get(path).get_tree()
+            except Exception:  # pylint: disable=broad-exception-caught
+                pyflakes.api.checkPath(path, reporter)
+                continue
+            checker = pyflakes.checker.Checker(tree, filename=path)
+            checker.messages.sort(key=lambda message: message.lineno)
+            for message in checker.messages:
+                reporter.flake(message)
+        return output.getvalue()
+
     def parse_output(  # pylint: disable=too-many-locals
         self, total_output: list[str], package: Optional[Package] = None
     ) -> list[Issue]:
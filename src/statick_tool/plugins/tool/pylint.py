@@ -30,31 +30,33 @@ class PylintToolPlugin(ToolPlugin):
             "--reports=no",
         ]
         flags += user_flags
-        if self.plugin_context and self.plugin_context.args.max_procs is not None:
-            flags += [f"-j {self.plugin_context.args.max_procs}"]
 
         tool_bin = self.get_binary()
 
         total_output: list[str] = []
 
-        try:
-            subproc_args = [tool_bin] + flags + files
-            output = subprocess.check_output(
-                subproc_args, stderr=subprocess.STDOUT, universal_newlines=True
-            )
-
-        except subprocess.CalledProcessError as ex:
-            if ex.returncode != 32:
-                output = ex.output
-            else:
-                logging.warning("Problem %d", ex.returncode)
-                logging.warning("%s exception: %s", self.get_name(), ex.output)
+        with self.parallel_jobs() as jobs:
+            try:
+                subproc_args = [tool_bin] + flags + [f"-j {jobs}"] + files
+                output = self.check_output(
+                    subproc_args,
+                    stderr=subprocess.STDOUT,
+                    universal_newlines=True,
+                    level=level,
+                )
+
+            except subprocess.CalledProcessError as ex:
+                if ex.returncode != 32:
+                    output = ex.output
+                else:
+                    logging.warning("Problem %d", ex.returncode)
+                    logging.warning("%s exception: %s", self.get_name(), ex.output)
+                    return None
+
+            except OSError as ex:
+                logging.warning("Couldn't find pylint executable! (%s)", ex)
                 return None
 
-        except OSError as ex:
-            logging.warning("Couldn't find pylint executable! (%s)", ex)
-            return None
-
         total_output.append(output)
 
         logging.debug("%s", total_output)
@@ -18,6 +18,10 @@ class RstlintToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "rstlint"
 
+    def get_package_keys(self) -> list[str]:
+        """Get the package keys the tool reads."""
+        return ["rst_src"]
+
     def get_binary(  # pylint: disable=unused-argument
         self, level: Optional[str] = None, package: Optional[Package] = None
     ) -> str:
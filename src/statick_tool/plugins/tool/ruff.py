@@ -31,8 +31,11 @@ class RuffToolPlugin(ToolPlugin):
 
         try:
             subproc_args = ["ruff"] + flags + files
-            output = subprocess.check_output(
-                subproc_args, stderr=subprocess.STDOUT, universal_newlines=True
+            output = self.check_output(
+                subproc_args,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                level=level,
             )
         except subprocess.CalledProcessError as ex:
             output = ex.output
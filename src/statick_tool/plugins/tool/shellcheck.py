@@ -21,6 +21,16 @@ class ShellcheckToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "shellcheck"
 
+    @classmethod
+    def is_file_local(cls) -> bool:
+        """Return whether the issues found in a file only depend on that file."""
+        return True
+
+    @classmethod
+    def is_shard_safe(cls) -> bool:
+        """Return whether the tool can be run on separate chunks of the files."""
+        return True
+
     def gather_args(self, args: argparse.Namespace) -> None:
         """Gather arguments."""
         args.add_argument(
@@ -39,25 +49,31 @@ class ShellcheckToolPlugin(ToolPlugin):
             binary = self.plugin_context.args.shellcheck_bin
         return binary
 
-    def scan(self, package: Package, level: str) -> Optional[list[Issue]]:
-        """Run tool and gather output."""
-        if "shell_src" not in package or not package["shell_src"]:
-            return []
+    def get_config_names(self, level: str) -> list[str]:
+        """Get the names of configuration files the tool finds next to the files."""
+        return [".shellcheckrc"]
+
+    def get_file_types(self) -> list[str]:
+        """Return a list of file types the plugin can scan."""
+        return ["shell_src"]
 
+    def process_files(
+        self, package: Package, level: str, files: list[str], user_flags: list[str]
+    ) -> Optional[list[str]]:
+        """Run tool and gather output."""
         shellcheck_bin = self.get_binary()
 
         # Get output in JSON format.
         flags: list[str] = ["-f", "json"]
-        flags += self.get_user_flags(level)
-
-        files: list[str] = []
-        if "shell_src" in package:
-            files += package["shell_src"]
+        flags += user_flags
 
         try:
             subproc_args = [shellcheck_bin] + flags + files
-            output = subprocess.check_output(
-                subproc_args, stderr=subprocess.STDOUT, universal_newlines=True
+            output = self.check_output(
+                subproc_args,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                level=level,
             )
 
         # We expect a CalledProcessError if issues are discovered by the tool.
@@ -74,11 +90,15 @@ class ShellcheckToolPlugin(ToolPlugin):
 
         logging.debug("%s", output)
 
-        if self.plugin_context and self.plugin_context.args.output_directory:
-            with open(self.get_name() + ".log", "w", encoding="utf8") as fid:
-                fid.write(output)
+        return [output]
 
-        issues: list[Issue] = self.parse_json_output(json.loads(output))
+    def parse_output(
+        self, total_output: list[str], package: Optional[Package] = None
+    ) -> list[Issue]:
+        """Parse tool output and report issues."""
+        issues: list[Issue] = []
+        for output in total_output:
+            issues += self.parse_json_output(json.loads(output))
         return issues
 
     def parse_json_output(self, output: Any) -> list[Issue]:
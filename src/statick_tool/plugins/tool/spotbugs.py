@@ -18,6 +18,15 @@ class SpotbugsToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "spotbugs"
 
+    def get_package_keys(self) -> list[str]:
+        """Get the package keys the tool reads."""
+        return ["all_poms", "top_poms"]
+
+    @classmethod
+    def requires_whole_package(cls) -> bool:
+        """Return whether the tool has to scan the whole package."""
+        return True
+
     @classmethod
     def get_tool_dependencies(cls) -> list[str]:
         """Get a list of tools that must run before this one."""
@@ -61,12 +70,13 @@ class SpotbugsToolPlugin(ToolPlugin):
         for pom in package["top_poms"]:
             try:
                 # The spotbugs:spotbugs-maven-plugin split is auto-concatenated
-                output = subprocess.check_output(
+                output = self.check_output(
                     ["mvn", "com.github.spotbugs:spotbugs-maven-plugin:spotbugs"]
                     + flags,
                     cwd=os.path.dirname(pom),
                     stderr=subprocess.STDOUT,
                     universal_newlines=True,
+                    level=level,
                 )
             except subprocess.CalledProcessError as ex:
                 output = ex.output
@@ -51,8 +51,8 @@ class StylelintToolPlugin(ToolPlugin):
         for src in files:
             try:
                 exe = [tool_bin] + flags + [src]
-                output = subprocess.check_output(
-                    exe, stderr=subprocess.STDOUT, universal_newlines=True
+                output = self.check_output(
+                    exe, stderr=subprocess.STDOUT, universal_newlines=True, level=level
                 )
                 total_output.append(output.strip())
 
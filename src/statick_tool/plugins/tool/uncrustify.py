@@ -18,6 +18,10 @@ class UncrustifyToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "uncrustify"
 
+    def get_package_keys(self) -> list[str]:
+        """Get the package keys the tool reads."""
+        return ["make_targets", "headers"]
+
     def gather_args(self, args: argparse.Namespace) -> None:
         """Gather arguments."""
         args.add_argument(
@@ -61,28 +65,26 @@ class UncrustifyToolPlugin(ToolPlugin):
                 files += target["src"]
         if "headers" in package:
             files += package["headers"]
+        files = package.filter_changed(files)
 
         total_output: list[str] = []
 
         try:
             format_file_name = self.plugin_context.resources.get_file("uncrustify.cfg")
 
-            for src in files:
-                cmd = [uncrustify_bin, "-c", format_file_name, "-f", src]
-                output = subprocess.check_output(
-                    cmd,  # type: ignore
-                    stderr=subprocess.STDOUT,
-                    universal_newlines=True,
-                )
-                src_cmd = ["cat", src]
-                src_output = subprocess.check_output(
-                    src_cmd, stderr=subprocess.STDOUT, universal_newlines=True
-                )
+            commands = [
+                [uncrustify_bin, "-c", format_file_name, "-f", src] for src in files
+            ]
+            results = self.run_many(
+                commands, level=level, stderr=subprocess.STDOUT  # type: ignore
+            )
+            for src, result in zip(files, results):
+                with open(src, encoding="utf8", errors="replace") as fid:
+                    src_output = fid.read()
                 diff = difflib.context_diff(
-                    output.splitlines(), src_output.splitlines()
+                    result.output.splitlines(), src_output.splitlines()
                 )
                 found_diff = False
-                output = output.split("\n", 1)[1]
                 for line in diff:
                     if (
                         line.startswith("---")
@@ -100,7 +102,6 @@ class UncrustifyToolPlugin(ToolPlugin):
                     total_output.append(src)
 
         except subprocess.CalledProcessError as ex:
-            output = ex.output
             logging.warning("uncrustify failed! Returncode = %d", ex.returncode)
             logging.warning("%s exception: %s", self.get_name(), ex.output)
             return None
@@ -27,6 +27,10 @@ class ValValidateToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "val_validate"
 
+    def get_package_keys(self) -> list[str]:
+        """Get the package keys the tool reads."""
+        return ["pddl_domain_src", "pddl_problem_src"]
+
     def gather_args(self, args: argparse.Namespace) -> None:
         """Gather arguments."""
         args.add_argument(
@@ -66,8 +70,11 @@ class ValValidateToolPlugin(ToolPlugin):
                 + package["pddl_domain_src"]
                 + package["pddl_problem_src"]
             )
-            output = subprocess.check_output(
-                subproc_args, stderr=subprocess.STDOUT, universal_newlines=True
+            output = self.check_output(
+                subproc_args,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                level=level,
             )
 
         except subprocess.CalledProcessError as ex:
@@ -44,8 +44,8 @@ class WriteGoodToolPlugin(ToolPlugin):
 
         try:
             exe = [tool_bin] + flags + files
-            output = subprocess.check_output(
-                exe, stderr=subprocess.STDOUT, universal_newlines=True
+            output = self.check_output(
+                exe, stderr=subprocess.STDOUT, universal_newlines=True, level=level
             )
             total_output.append(output)
 
@@ -1,6 +1,7 @@
 """Apply yamllint tool and gather results."""
 
 import logging
+import os
 import re
 import subprocess
 from typing import Match, Optional, Pattern
@@ -17,10 +18,37 @@ class YamllintToolPlugin(ToolPlugin):
         """Get name of tool."""
         return "yamllint"
 
+    @classmethod
+    def is_file_local(cls) -> bool:
+        """Return whether the issues found in a file only depend on that file."""
+        return True
+
+    @classmethod
+    def is_shard_safe(cls) -> bool:
+        """Return whether the tool can be run on separate chunks of the files."""
+        return True
+
     def get_file_types(self) -> list[str]:
         """Return a list of file types the plugin can scan."""
         return ["yaml"]
 
+    def get_config_files(self, level: str, package: Package) -> list[str]:
+        """Get the configuration files that change the output of the tool.
+
+        yamllint looks for its configuration in the working directory and its parents.
+        """
+        config_files: list[str] = []
+        directory = os.getcwd()
+        while True:
+            config_files += [
+                os.path.join(directory, name)
+                for name in (".yamllint", ".yamllint.yaml", ".yamllint.yml")
+            ]
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                return config_files
+            directory = parent
+
     def process_files(
         self, package: Package, level: str, files: list[str], user_flags: list[str]
     ) -> Optional[list[str]]:
@@ -34,8 +62,11 @@ class YamllintToolPlugin(ToolPlugin):
 
         try:
             subproc_args = [tool_bin] + flags + files
-            output = subprocess.check_output(
-                subproc_args, stderr=subprocess.STDOUT, universal_newlines=True
+            output = self.check_output(
+                subproc_args,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                level=level,
             )
 
         except subprocess.CalledProcessError as ex:
@@ -0,0 +1,211 @@
+"""Run Python tools in processes that have already imported them.
+
+Many tools are Python packages installed along with Statick. Starting a new interpreter
+and importing the tool again for every run can take longer than the scan itself,
+especially when the files of a package are split into chunks. Python tools can instead
+run in processes forked from a server that imported them once.
+
+Each run still gets its own process, so tools that keep global state start clean and the
+output is the same as running the command. With `--in-process-tools`, tools run this way
+when the command is a console script installed in the same environment as Statick. Other
+commands, and platforms that can't fork, run the command as usual.
+"""
+
+import contextlib
+import functools
+import importlib
+import multiprocessing
+import os
+import signal
+import sys
+import sysconfig
+import tempfile
+import threading
+import traceback
+from multiprocessing.context import BaseContext
+from typing import Any, Optional
+
+if sys.version_info < (3, 10):
+    from importlib_metadata import entry_points
+else:
+    from importlib.metadata import entry_points
+
+# Console scripts of the Python tools that Statick has plugins for. Their modules are
+# imported by the server when it starts.
+PYTHON_TOOLS = (
+    "bandit",
+    "black",
+    "cmakelint",
+    "cpplint",
+    "docformatter",
+    "flawfinder",
+    "isort",
+    "pycodestyle",
+    "pydocstyle",
+    "pyflakes",
+)
+
+_LOCK = threading.Lock()
+_CONTEXT: Optional[BaseContext] = None
+
+
+def is_supported() -> bool:
+    """Return whether tools can run in forked processes here.
+
+    Processes started by `multiprocessing.Pool`, like workspace workers, are daemons and
+    can't start processes of their own.
+    """
+    return (
+        sys.platform != "win32"
+        and "forkserver" in multiprocessing.get_all_start_methods()
+        and not multiprocessing.current_process().daemon
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_entry_point(binary: str) -> Optional[str]:
+    """Get the `module:function` entry point of a console script.
+
+    Returns None unless the script is installed in the same environment as Statick.
+    """
+    if os.path.basename(binary) != binary:
+        return None
+    if not os.path.isfile(os.path.join(sysconfig.get_path("scripts"), binary)):
+        return None
+    for entry_point in entry_points(group="console_scripts", name=binary):
+        return str(entry_point.value).split("[", 1)[0].strip()
+    return None
+
+
+def get_context() -> BaseContext:
+    """Get the context that starts processes from the server, importing the tools."""
+    global _CONTEXT  # pylint: disable=global-statement
+    with _LOCK:
+        if _CONTEXT is None:
+            # Each process runs the main module again, so the Statick modules it imports
+            # are imported once by the server.
+            modules = sorted(
+                name for name in sys.modules if name.split(".")[0] == "statick_tool"
+            )
+            for binary in PYTHON_TOOLS:
+                entry_point = get_entry_point(binary)
+                if entry_point is not None:
+                    modules.append(entry_point.split(":", 1)[0])
+            context = multiprocessing.get_context("forkserver")
+            context.set_forkserver_preload(modules)
+            _CONTEXT = context
+        return _CONTEXT
+
+
+def redirect_output(output_path: str, merge_stderr: bool) -> None:
+    """Write standard output, and standard error if it is merged, to a file."""
+    output = os.open(output_path, os.O_WRONLY)
+    os.dup2(output, 1)
+    if merge_stderr:
+        os.dup2(output, 2)
+    os.close(output)
+    # pylint: disable=consider-using-with
+    sys.stdout = open(1, "w", encoding="utf8", closefd=False)
+    sys.stderr = open(
+        2, "w", encoding="utf8", errors="backslashreplace", closefd=False, buffering=1
+    )
+
+
+def run_entry_point(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    entry_point: str,
+    args: list[str],
+    output_path: str,
+    merge_stderr: bool,
+    cwd: Optional[str],
+    env: Optional[dict[str, str]],
+    limits: dict[str, float],
+) -> None:
+    """Run an entry point like its console script would, then exit.
+
+    This runs in the forked process. Output is written to a file, and the process exits
+    with the return code of the tool.
+    """
+    # Start a process group, so anything the tool starts is killed with it.
+    os.setsid()
+    if limits.get("max_memory") or limits.get("cpu_time"):
+        # Imported here since the tool plugin module imports this one.
+        # pylint: disable=import-outside-toplevel, cyclic-import
+        from statick_tool.tool_plugin import set_resource_limits
+
+        set_resource_limits(limits.get("max_memory"), limits.get("cpu_time"))
+    if cwd is not None:
+        os.chdir(cwd)
+    if env is not None:
+        os.environ.clear()
+        os.environ.update(env)
+    redirect_output(output_path, merge_stderr)
+    sys.argv = list(args)
+
+    code: Any = 0
+    try:
+        module_name, _, attribute = entry_point.partition(":")
+        function: Any = importlib.import_module(module_name)
+        for name in attribute.split("."):
+            function = getattr(function, name)
+        code = function()
+    except SystemExit as ex:
+        code = ex.code
+    except BaseException:  # pylint: disable=broad-exception-caught
+        traceback.print_exc()
+        code = 1
+    if code is None:
+        code = 0
+    elif not isinstance(code, int):
+        print(code, file=sys.stderr)
+        code = 1
+    for stream in (sys.stdout, sys.stderr):
+        # Some tools close the stream they wrote their report to.
+        with contextlib.suppress(ValueError, OSError):
+            stream.flush()
+    os._exit(code & 0xFF)
+
+
+def run(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    args: list[str],
+    entry_point: str,
+    merge_stderr: bool = True,
+    cwd: Optional[str] = None,
+    env: Optional[dict[str, str]] = None,
+    limits: Optional[dict[str, float]] = None,
+) -> tuple[int, bytes, bool]:
+    """Run a Python tool in a process forked from the server.
+
+    Returns the return code, the output, and whether the tool was stopped at the
+    timeout. Return codes are negative when the process was killed by a signal, like
+    with `subprocess`.
+    """
+    limits = limits or {}
+    fd, output_path = tempfile.mkstemp(prefix="statick-", suffix=".out")
+    os.close(fd)
+    try:
+        process = get_context().Process(  # type: ignore[attr-defined]
+            target=run_entry_point,
+            args=(
+                entry_point,
+                args,
+                output_path,
+                merge_stderr,
+                cwd,
+                env,
+                limits,
+            ),
+        )
+        process.start()
+        process.join(limits.get("timeout"))
+        timed_out = process.exitcode is None
+        if timed_out:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                process.kill()
+            process.join()
+        with open(output_path, "rb") as fid:
+            output = fid.read()
+    finally:
+        os.remove(output_path)
+    return process.exitcode, output, timed_out
@@ -2,9 +2,9 @@
 
 import argparse
 import logging
-from typing import Any, Optional, Tuple, Union
+from typing import Any, Mapping, Optional, Sequence, Tuple, Union
 
-from statick_tool.issue import Issue
+from statick_tool.issue import Issue, IssueTable
 from statick_tool.package import Package
 from statick_tool.plugin_context import PluginContext
 
@@ -13,6 +13,8 @@ class ReportingPlugin:
     """Default implementation of reporting plugin."""
 
     plugin_context = None
+    # Package, level, and issues of a report started with `begin`.
+    streamed: Any = None
 
     def get_name(self) -> Optional[str]:
         """Get name of reporting plugin."""
@@ -21,10 +23,29 @@ class ReportingPlugin:
         """Gather arguments."""
 
     def report(  # type: ignore[empty-body]
-        self, package: Package, issues: dict[str, list[Issue]], level: str
+        self, package: Package, issues: Mapping[str, Sequence[Issue]], level: str
     ) -> Tuple[Optional[None], bool]:
         """Run the report generator."""
 
+    def begin(self, package: Package, level: str) -> None:
+        """Start a report that issues are added to as tools find them.
+
+        By default, the issues are collected and passed to `report` when the report is
+        finished. Plugins that can write issues as they arrive override `begin`,
+        `add_issues`, and `finish`.
+        """
+        self.streamed = (package, level, {})
+
+    def add_issues(self, tool: str, issues: Sequence[Issue]) -> None:
+        """Add issues found by a tool to the report."""
+        self.streamed[2].setdefault(tool, IssueTable()).extend(issues)
+
+    def finish(self) -> Tuple[Optional[None], bool]:
+        """Finish the report once all tools are done."""
+        package, level, issues = self.streamed
+        self.streamed = None
+        return self.report(package, issues, level)
+
     def set_plugin_context(self, plugin_context: Union[None, PluginContext]) -> None:
         """Setter for plugin_context."""
         self.plugin_context = plugin_context
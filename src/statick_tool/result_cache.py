@@ -0,0 +1,125 @@
+"""Persist the issues found in each file by file-local tools.
+
+Issues are stored under a key made from the tool name and version, the user flags, the
+contents of the tool configuration files, and the path and contents of the scanned file.
+A file whose key is found reuses the stored issues instead of running the tool on it.
+
+The cache is bounded in size. When it grows past the limit the entries that were used
+least recently are removed.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from typing import Iterable, Optional
+
+from statick_tool.cache import Cache
+from statick_tool.issue import Issue
+
+# Default maximum size of the stored issues, in megabytes.
+DEFAULT_MAX_SIZE = 512
+
+
+class ResultCache(Cache):
+    """Persist the issues found in each file by file-local tools."""
+
+    filename = "results.sqlite"
+    schema = [
+        "CREATE TABLE IF NOT EXISTS issues ("
+        " key TEXT PRIMARY KEY, issues TEXT NOT NULL, size INTEGER NOT NULL,"
+        " last_used INTEGER NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS issues_last_used ON issues (last_used)",
+    ]
+
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """Open the cache database, creating it if needed.
+
+        The maximum size is in megabytes.
+        """
+        super().__init__(cache_dir)
+        self.max_size = max_size * 1024 * 1024
+
+    @classmethod
+    def open(cls, args: argparse.Namespace) -> Optional["ResultCache"]:
+        """Open the cache for the given arguments.
+
+        Returns None if caching is not enabled or the cache can't be opened.
+        """
+        cache = super().open(args)
+        max_size = getattr(args, "cache_max_size", None)
+        if cache is not None and max_size is not None:
+            cache.max_size = max_size * 1024 * 1024
+        return cache
+
+    @staticmethod
+    def get_key(*parts: str) -> str:
+        """Get the key for a file from everything its issues depend on."""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8", "surrogateescape"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get_issues(self, keys: Iterable[str]) -> dict[str, list[Issue]]:
+        """Get the stored issues for each key that is in the cache.
+
+        Found entries are marked as used so they are the last to be removed.
+        """
+        found: dict[str, list[Issue]] = {}
+        keys = list(keys)
+        try:
+            # Stay under the SQLite limit on the number of query parameters.
+            for start in range(0, len(keys), 500):
+                batch = keys[start : start + 500]
+                rows = self.execute(
+                    "SELECT key, issues FROM issues WHERE key IN"
+                    f" ({', '.join('?' * len(batch))})",
+                    batch,
+                )
+                for key, issues in rows:
+                    found[key] = [Issue(*issue) for issue in json.loads(issues)]
+            now = time.time_ns()
+            self.executemany(
+                "UPDATE issues SET last_used = ? WHERE key = ?",
+                [(now, key) for key in found],
+            )
+        except sqlite3.Error as ex:
+            logging.warning("Unable to read result cache: %s", ex)
+            return {}
+        return found
+
+    def set_issues(self, entries: dict[str, list[Issue]]) -> None:
+        """Store the issues for each key, then remove old entries if needed."""
+        now = time.time_ns()
+        rows = []
+        for key, issues in entries.items():
+            serialized = json.dumps([list(issue) for issue in issues])
+            rows.append((key, serialized, len(key) + len(serialized), now))
+        try:
+            self.executemany(
+                "INSERT OR REPLACE INTO issues (key, issues, size, last_used)"
+                " VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self.evict()
+        except sqlite3.Error as ex:
+            logging.warning("Unable to update result cache: %s", ex)
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits its size."""
+        total = self.execute("SELECT COALESCE(SUM(size), 0) FROM issues")[0][0]
+        if total <= self.max_size:
+            return
+        stale = []
+        for key, size in self.execute(
+            "SELECT key, size FROM issues ORDER BY last_used"
+        ):
+            if total <= self.max_size:
+                break
+            stale.append((key,))
+            total -= size
+        logging.debug("Removing %d entries from result cache.", len(stale))
+        self.executemany("DELETE FROM issues WHERE key = ?", stale)
@@ -1,27 +1,46 @@
 """Code analysis front-end."""
 
+# pylint: disable=too-many-lines
+
 import argparse
 import copy
+import functools
 import io
 import logging
 import multiprocessing
 import os
 import sys
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from importlib.metadata import version
 from logging.handlers import MemoryHandler
-from typing import Any, Optional, Tuple
+from typing import Any, Iterator, Optional, Sequence, Tuple
 
+from statick_tool.changed_files import get_changed_files
 from statick_tool.config import Config
+from statick_tool.discovery_cache import DiscoveryCache
 from statick_tool.discovery_plugin import DiscoveryPlugin
 from statick_tool.exceptions import Exceptions
-from statick_tool.issue import Issue
+from statick_tool.git_files import get_package_git_files
+from statick_tool.issue import Issue, IssueTable
+from statick_tool.issue_stream import IssueStream
+from statick_tool.jobserver import JobServer
 from statick_tool.package import Package
+from statick_tool.package_cache import IGNORED_ARGS, PackageCache
+from statick_tool.parse_cache import ParseCache
 from statick_tool.plugin_context import PluginContext
 from statick_tool.profile import Profile
+from statick_tool.reporting_plugin import ReportingPlugin
 from statick_tool.resources import Resources
+from statick_tool.result_cache import DEFAULT_MAX_SIZE
 from statick_tool.timing import Timing
+from statick_tool.tool_plugin import ToolLimitError, ToolPlugin
 from statick_tool.tool_version import ToolVersion
+from statick_tool.walk import IGNORE_FILES, DirectoryFilter
+from statick_tool.workspace import find_packages
+
+# The issues, duration, version, and any limit that stopped a tool plugin.
+ToolResult = Tuple[Optional[list[Issue]], str, str, Optional[str]]
 
 if sys.version_info < (3, 10):
     from importlib_metadata import entry_points
@@ -29,7 +48,7 @@ else:
     from importlib.metadata import entry_points
 
 
-class Statick:  # pylint: disable=too-many-instance-attributes
+class Statick:  # pylint: disable=too-many-instance-attributes, too-many-public-methods
     """Code analysis front-end."""
 
     def __init__(self, user_paths: list[str]) -> None:
@@ -59,6 +78,8 @@ class Statick:  # pylint: disable=too-many-instance-attributes
         self.exceptions: Optional[Exceptions] = None
         self.timings: list[Timing] = []
         self.tool_versions: list[ToolVersion] = []
+        self.jobserver: Optional[JobServer] = None
+        self.known_versions: dict[Tuple[str, str], str] = {}
 
     @staticmethod
     def set_logging_level(args: argparse.Namespace) -> None:
@@ -207,6 +228,62 @@ class Statick:  # pylint: disable=too-many-instance-attributes
             type=str,
             help="Suffix to use when searching for CERT mapping files",
         )
+        args.add_argument(
+            "--cache-dir",
+            dest="cache_dir",
+            type=os.path.abspath,
+            default=os.environ.get("STATICK_CACHE_DIR"),
+            help="Directory to store results that can be reused by later runs. "
+            "Defaults to the STATICK_CACHE_DIR environment variable",
+        )
+        args.add_argument(
+            "--no-cache",
+            dest="no_cache",
+            action="store_true",
+            help="Do not read or write any cached results",
+        )
+        args.add_argument(
+            "--cache-max-size",
+            dest="cache_max_size",
+            type=int,
+            default=DEFAULT_MAX_SIZE,
+            help="Maximum size in megabytes of cached tool results. "
+            f"Defaults to {DEFAULT_MAX_SIZE}",
+        )
+        args.add_argument(
+            "--changed-since",
+            dest="changed_since",
+            type=str,
+            help="Only scan files that have changed since a git reference, "
+            "including untracked files",
+        )
+        args.add_argument(
+            "--changed-since-policy",
+            dest="changed_since_policy",
+            choices=["run", "skip"],
+            default="run",
+            help="Whether tools that need the whole package are run on all files or "
+            "skipped when using --changed-since. Defaults to run",
+        )
+        args.add_argument(
+            "--no-git-files",
+            dest="no_git_files",
+            action="store_true",
+            help="Find package files by walking the file system instead of asking git",
+        )
+        args.add_argument(
+            "--stream-issues",
+            dest="stream_issues",
+            action="store_true",
+            help="Report issues as tools find them instead of after all tools are done",
+        )
+        args.add_argument(
+            "--in-process-tools",
+            dest="in_process_tools",
+            action="store_true",
+            help="Run Python tools installed with Statick in processes forked from "
+            "Statick instead of starting new interpreters",
+        )
         args.add_argument(
             "--timings",
             dest="timings",
@@ -225,7 +302,7 @@ class Statick:  # pylint: disable=too-many-instance-attributes
             "--max-procs",
             dest="max_procs",
             type=self.set_cpu_count,
-            default=int(multiprocessing.cpu_count() / 2),
+            default=max(1, int(multiprocessing.cpu_count() / 2)),
             help="Maximum number of CPU cores to use. "
             "Defaults to half the available CPU cores. Setting to -1 will "
             "cause Statick to use all available CPU cores",
@@ -302,6 +379,22 @@ class Statick:  # pylint: disable=too-many-instance-attributes
         """Return list of version for each tool."""
         return self.tool_versions
 
+    def get_tool_version(self, plugin: ToolPlugin) -> str:
+        """Get the version of a tool, probing each installed binary only once.
+
+        Versions are remembered for the rest of the run and stored in the version cache
+        under the resolved path, modification time and size of the tool binary.
+        """
+        name = plugin.get_name()
+        binary = plugin.get_version_key()
+        known = self.known_versions.get((name, binary or ""))
+        if known is not None:
+            return known
+
+        tool_version = plugin.get_cached_version()
+        self.known_versions[(name, binary or "")] = tool_version
+        return tool_version
+
     def collect_tool_versions(self, args: argparse.Namespace) -> bool:
         """Print out all tool versions."""
         success = True
@@ -325,18 +418,303 @@ class Statick:  # pylint: disable=too-many-instance-attributes
 
         plugin_context = PluginContext(args, self.resources, self.config)
 
-        for plugin_name, plugin in list(self.tool_plugins.items()):
+        for plugin in self.tool_plugins.values():
             plugin.set_plugin_context(plugin_context)
-            self.add_tool_version(plugin_name, plugin.get_version())
+        # Probing versions is mostly waiting on subprocesses, so probe them all at once.
+        with ThreadPoolExecutor() as executor:
+            tool_versions = list(
+                executor.map(self.get_tool_version, self.tool_plugins.values())
+            )
+        for plugin_name, tool_version in zip(self.tool_plugins, tool_versions):
+            self.add_tool_version(plugin_name, tool_version)
 
         return success
 
+    def run_discovery_plugin(
+        self,
+        plugin: DiscoveryPlugin,
+        package: Package,
+        level: str,
+        discovery_cache: Optional[DiscoveryCache] = None,
+    ) -> None:
+        """Run a discovery plugin, reusing cached results if no files have changed."""
+        plugin_name = str(plugin.get_name())
+        logging.info("Running %s discovery plugin...", plugin_name)
+        plugin_start = time.time()
+
+        fingerprint = None
+        results = None
+        if discovery_cache is not None and plugin.is_cacheable():
+            exceptions = None
+            if self.exceptions is not None:
+                exceptions = self.exceptions.get_exceptions(package)
+            fingerprint = discovery_cache.get_fingerprint(
+                package, package.file_stats, plugin_name, level, exceptions
+            )
+            results = discovery_cache.get_results(package, plugin_name, fingerprint)
+
+        if results is not None:
+            logging.info("  Using cached results.")
+            package.update(results)
+        else:
+            previous = {key: copy.copy(value) for key, value in package.items()}
+            plugin.scan(package, level, self.exceptions)
+            if discovery_cache is not None and fingerprint is not None:
+                results = {
+                    key: value
+                    for key, value in package.items()
+                    if key not in previous or previous[key] != value
+                }
+                discovery_cache.set_results(package, plugin_name, fingerprint, results)
+
+        duration = format(time.time() - plugin_start, ".4f")
+        timing = Timing(package.name, plugin_name, "Discovery", duration)
+        self.timings.append(timing)
+        logging.info("%s discovery plugin done.", plugin_name)
+
+    def get_tool_plugin_graph(
+        self, enabled_plugins: list[str], force_tool_list: Optional[str] = None
+    ) -> Optional[dict[str, list[str]]]:
+        """Get the tool plugins to run mapped to the plugins each one depends on.
+
+        Plugins that are not in the force tool list are skipped unless a plugin that
+        does run depends on them. The returned dictionary is ordered so that every
+        plugin comes after all of its dependencies. None is returned if a plugin can't
+        be found, a dependency is not enabled, or the dependencies contain a cycle.
+        """
+        for plugin_name in enabled_plugins:
+            if plugin_name not in self.tool_plugins:
+                logging.error("Can't find specified tool plugin %s!", plugin_name)
+                return None
+
+        requested = enabled_plugins
+        if force_tool_list is not None:
+            forced = force_tool_list.split(",")
+            requested = []
+            for plugin_name in enabled_plugins:
+                if plugin_name in forced:
+                    requested.append(plugin_name)
+                else:
+                    logging.info("Skipping plugin not in force list %s!", plugin_name)
+
+        plugin_graph: dict[str, list[str]] = {}
+        visiting: list[str] = []
+
+        def visit(plugin_name: str) -> bool:
+            if plugin_name in plugin_graph:
+                return True
+            if plugin_name in visiting:
+                logging.error(
+                    "Tool plugin dependency cycle: %s",
+                    " -> ".join(visiting + [plugin_name]),
+                )
+                return False
+            visiting.append(plugin_name)
+            dependencies = self.tool_plugins[plugin_name].get_tool_dependencies()
+            for dependency_name in dependencies:
+                if dependency_name not in enabled_plugins:
+                    logging.error(
+                        "Plugin %s depends on plugin %s which isn't enabled!",
+                        plugin_name,
+                        dependency_name,
+                    )
+                    return False
+                if not visit(dependency_name):
+                    return False
+            visiting.remove(plugin_name)
+            plugin_graph[plugin_name] = list(dependencies)
+            return True
+
+        for plugin_name in requested:
+            if not visit(plugin_name):
+                return None
+
+        return plugin_graph
+
+    def get_package_keys(
+        self, plugin_graph: dict[str, list[str]]
+    ) -> Optional[set[str]]:
+        """Get the package keys read by the tools that will run.
+
+        Returns None if any of the tools does not declare the keys it reads.
+        """
+        package_keys: set[str] = set()
+        for plugin_name in plugin_graph:
+            plugin_keys = self.tool_plugins[plugin_name].get_package_keys()
+            if plugin_keys is None:
+                return None
+            package_keys.update(plugin_keys)
+        return package_keys
+
+    def run_tool_plugin(
+        self,
+        plugin_name: str,
+        package: Package,
+        level: str,
+        stream: Optional[IssueStream] = None,
+    ) -> ToolResult:
+        """Run a single tool plugin and return its issues, duration, and version.
+
+        If the tool is stopped for going over a timeout or resource limit, its issues
+        are replaced by one issue for the limit, and the limit is returned too. With a
+        stream, issues are added to the stream as the tool finds them and an empty list
+        is returned instead.
+        """
+        plugin = self.tool_plugins[plugin_name]
+        if (
+            package.changed_files is not None
+            and plugin.requires_whole_package()
+            and plugin.plugin_context is not None
+            and plugin.plugin_context.args.changed_since_policy == "skip"
+        ):
+            logging.info(
+                "Skipping %s tool plugin, it needs the whole package.",
+                plugin.get_name(),
+            )
+            if stream is not None:
+                stream.add_issues(plugin_name, [])
+            return [], format(0, ".4f"), self.get_tool_version(plugin), None
+        logging.info("Running %s tool plugin...", plugin.get_name())
+        plugin_start = time.time()
+        limit = None
+        tool_issues: Optional[list[Issue]] = None
+        try:
+            if stream is None:
+                tool_issues = plugin.scan(package, level)
+            elif plugin.scan_streaming(
+                package, level, functools.partial(stream.add_issues, plugin_name)
+            ):
+                tool_issues = []
+                # Reports list every tool that ran, even without issues.
+                if plugin_name not in stream.issues:
+                    stream.add_issues(plugin_name, [])
+        except ToolLimitError as ex:
+            limit = ex.limit
+            tool_issues = [
+                Issue(package.path, 0, plugin.get_name(), limit, 5, str(ex), None)
+            ]
+            if stream is not None:
+                stream.add_issues(plugin_name, tool_issues)
+        duration = format(time.time() - plugin_start, ".4f")
+        return tool_issues, duration, self.get_tool_version(plugin), limit
+
+    def run_tool_plugins(  # pylint: disable=too-many-locals
+        self,
+        package: Package,
+        level: str,
+        plugin_graph: dict[str, list[str]],
+        max_workers: int = 1,
+        stream: Optional[IssueStream] = None,
+    ) -> Tuple[dict[str, list[Issue]], bool]:
+        """Run tool plugins concurrently once the plugins they depend on are done.
+
+        Tools spend most of their time waiting on subprocesses, so they are run in a
+        thread pool with at most max_workers tools running at the same time. With a
+        jobserver, the first running tool uses the token held for the package and each
+        other running tool takes a token from the jobserver. With a stream, issues are
+        added to it as tools find them.
+        """
+        success = True
+        issues: dict[str, list[Issue]] = {}
+        pending = dict(plugin_graph)
+        done: set[str] = set()
+        running: dict[Future[ToolResult], str] = {}
+        with_token: set[Future[ToolResult]] = set()
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            while pending or running:
+                waiting = False
+                for plugin_name, dependencies in list(pending.items()):
+                    if not all(dependency in done for dependency in dependencies):
+                        continue
+                    has_token = False
+                    if running and self.jobserver is not None:
+                        if len(running) >= max_workers or not self.jobserver.acquire(
+                            block=False
+                        ):
+                            waiting = True
+                            break
+                        has_token = True
+                    future = executor.submit(
+                        self.run_tool_plugin, plugin_name, package, level, stream
+                    )
+                    running[future] = plugin_name
+                    if has_token:
+                        with_token.add(future)
+                    del pending[plugin_name]
+
+                # Check for tokens freed by other packages while waiting for tools.
+                finished, _ = wait(
+                    running,
+                    timeout=0.1 if waiting else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in finished:
+                    if future in with_token:
+                        with_token.remove(future)
+                        assert self.jobserver is not None
+                        self.jobserver.release()
+                    plugin_name = running.pop(future)
+                    if package.parse_cache is not None:
+                        package.parse_cache.release(plugin_name)
+                    tool_name = self.tool_plugins[plugin_name].get_name()
+                    tool_issues, duration, tool_version, limit = future.result()
+                    plugin_type = "Tool" if limit is None else f"Tool ({limit})"
+                    timing = Timing(package.name, tool_name, plugin_type, duration)
+                    self.timings.append(timing)
+                    self.add_tool_version(tool_name, tool_version)
+                    if limit is not None:
+                        assert tool_issues is not None
+                        issues[plugin_name] = tool_issues
+                        logging.error(
+                            "%s tool plugin stopped: %s",
+                            tool_name,
+                            tool_issues[0].message,
+                        )
+                        success = False
+                    elif tool_issues is not None:
+                        issues[plugin_name] = tool_issues
+                        logging.info("%s tool plugin done.", tool_name)
+                    else:
+                        logging.error("%s tool plugin failed", tool_name)
+                        success = False
+                    done.add(plugin_name)
+
+        return issues, success
+
+    def run(
+        self,
+        path: str,
+        args: argparse.Namespace,
+        start_time: Optional[float] = None,
+        package: Optional[Package] = None,
+    ) -> Tuple[Optional[dict[str, Sequence[Issue]]], bool]:
+        """Run scan tools against targets on path.
+
+        A package found by walking a workspace can be given instead of making a new one.
+        With `--stream-issues`, reporting plugins get issues as tools find them. Without
+        a jobserver from a workspace scan, one is made for the run and closed after it.
+        """
+        if self.jobserver is not None or args.max_procs <= 1:
+            return self.run_package(path, args, start_time, package)
+        # This process already holds one token while it scans the package.
+        self.jobserver = JobServer(args.max_procs - 1)
+        try:
+            return self.run_package(path, args, start_time, package)
+        finally:
+            self.jobserver.close()
+            self.jobserver = None
+
     # pylint: disable=too-many-locals, too-many-return-statements, too-many-branches
     # pylint: disable=too-many-statements
-    def run(
-        self, path: str, args: argparse.Namespace, start_time: Optional[float] = None
-    ) -> Tuple[Optional[dict[str, list[Issue]]], bool]:
-        """Run scan tools against targets on path."""
+    def run_package(
+        self,
+        path: str,
+        args: argparse.Namespace,
+        start_time: Optional[float] = None,
+        package: Optional[Package] = None,
+    ) -> Tuple[Optional[dict[str, Sequence[Issue]]], bool]:
+        """Run scan tools against targets on path with the jobserver of the run."""
         success = True
 
         path = os.path.abspath(path)
@@ -344,7 +722,8 @@ class Statick:  # pylint: disable=too-many-instance-attributes
             logging.error("No package found at %s!", path)
             return None, False
 
-        package = Package(os.path.basename(path), path)
+        if package is None:
+            package = Package(os.path.basename(path), path)
         level: Optional[str] = self.get_level(path, args)
         logging.info("level: %s", level)
         if level is None:
@@ -389,7 +768,7 @@ class Statick:  # pylint: disable=too-many-instance-attributes
             "Scanning package %s (%s) at level %s", package.name, package.path, level
         )
 
-        issues: dict[str, list[Issue]] = {}
+        issues: dict[str, Sequence[Issue]] = {}
 
         ignore_packages = self.get_ignore_packages()
         if package.name in ignore_packages:
@@ -398,135 +777,17 @@ class Statick:  # pylint: disable=too-many-instance-attributes
             )
             return issues, True
 
-        plugin_context = PluginContext(args, self.resources, self.config)
-
-        logging.info("---Discovery---")
-        if not DiscoveryPlugin.file_command_exists():
-            logging.info(
-                "file command isn't available, discovery plugins will be less effective"
-            )
-
-        discovery_plugins = self.config.get_enabled_discovery_plugins(level)
-        if not discovery_plugins:
-            discovery_plugins = list(self.discovery_plugins)
-        # Get timing information for finding files for discovery plugins.
-        dummy_plugin = DiscoveryPlugin()
-        plugin_start = time.time()
-        dummy_plugin.find_files(package)
-        duration = format(time.time() - plugin_start, ".4f")
-        timing = Timing(package.name, "find files", "Discovery", duration)
-        self.timings.append(timing)
-
-        plugins_ran: list[Any] = []
-        for plugin_name in discovery_plugins:
-            if plugin_name not in self.discovery_plugins:
-                logging.error("Can't find specified discovery plugin %s!", plugin_name)
-                return None, False
-
-            plugin = self.discovery_plugins[plugin_name]
-            dependencies = plugin.get_discovery_dependencies()
-            for dependency_name in dependencies:
-                dependency_plugin = self.discovery_plugins[dependency_name]
-                if dependency_plugin.get_name() in plugins_ran:
-                    continue
-                dependency_plugin.set_plugin_context(plugin_context)
-                logging.info(
-                    "Running %s discovery plugin...", dependency_plugin.get_name()
-                )
-                plugin_start = time.time()
-                dependency_plugin.scan(package, level, self.exceptions)
-                duration = format(time.time() - plugin_start, ".4f")
-                timing = Timing(
-                    package.name, dependency_plugin.get_name(), "Discovery", duration
-                )
-                self.timings.append(timing)
-                logging.info("%s discovery plugin done.", dependency_plugin.get_name())
-                plugins_ran.append(dependency_plugin.get_name())
-
-            if plugin.get_name() not in plugins_ran:
-                plugin.set_plugin_context(plugin_context)
-                logging.info("Running %s discovery plugin...", plugin.get_name())
-                plugin_start = time.time()
-                plugin.scan(package, level, self.exceptions)
-                duration = format(time.time() - plugin_start, ".4f")
-                timing = Timing(package.name, plugin.get_name(), "Discovery", duration)
-                self.timings.append(timing)
-                logging.info("%s discovery plugin done.", plugin.get_name())
-                plugins_ran.append(plugin.get_name())
-        logging.info("---Discovery---")
-
-        logging.info("---Tools---")
-        enabled_plugins = self.config.get_enabled_tool_plugins(level)
-        if not enabled_plugins:
-            enabled_plugins = list(self.tool_plugins)
-        plugins_to_run = copy.copy(enabled_plugins)
-        plugins_ran = []
-        plugin_dependencies: list[str] = []
-        while plugins_to_run:
-            plugin_name = plugins_to_run[0]
-
-            if plugin_name not in self.tool_plugins:
-                logging.error("Can't find specified tool plugin %s!", plugin_name)
-                return None, False
-
-            if args.force_tool_list is not None:
-                force_tool_list = args.force_tool_list.split(",")
-                if (
-                    plugin_name not in force_tool_list
-                    and plugin_name not in plugin_dependencies
-                ):
-                    logging.info("Skipping plugin not in force list %s!", plugin_name)
-                    plugins_to_run.remove(plugin_name)
-                    continue
-
-            plugin = self.tool_plugins[plugin_name]
-            plugin.set_plugin_context(plugin_context)
-
-            dependencies = plugin.get_tool_dependencies()
-            dependencies_met = True
-            for dependency_name in dependencies:
-                if dependency_name not in plugins_ran:
-                    if dependency_name not in enabled_plugins:
-                        logging.error(
-                            "Plugin %s depends on plugin %s which isn't enabled!",
-                            plugin_name,
-                            dependency_name,
-                        )
-                        return None, False
-                    plugin_dependencies.append(dependency_name)
-                    if dependency_name in plugins_to_run:
-                        plugins_to_run.remove(dependency_name)
-                    plugins_to_run.insert(0, dependency_name)
-                    dependencies_met = False
-
-            if not dependencies_met:
-                continue
-
-            logging.info("Running %s tool plugin...", plugin.get_name())
-            plugin_start = time.time()
-            tool_issues = plugin.scan(package, level)
-            duration = format(time.time() - plugin_start, ".4f")
-            timing = Timing(package.name, plugin.get_name(), "Tool", duration)
-            self.timings.append(timing)
-            self.add_tool_version(plugin.get_name(), plugin.get_version())
-            if tool_issues is not None:
-                issues[plugin_name] = tool_issues
-                logging.info("%s tool plugin done.", plugin.get_name())
+        if args.changed_since:
+            package.changed_files = get_changed_files(package.path, args.changed_since)
+            if package.changed_files is None:
+                logging.warning("Unable to find changed files, scanning all files.")
             else:
-                logging.error("%s tool plugin failed", plugin.get_name())
-                success = False
-
-            plugins_to_run.remove(plugin_name)
-            plugins_ran.append(plugin_name)
-
-        logging.info("---Tools---")
+                logging.info("%d files changed.", len(package.changed_files))
 
-        if self.exceptions is not None:
-            issues = self.exceptions.filter_issues(package, issues)
-
-        os.chdir(orig_path)
+        plugin_context = PluginContext(
+            args, self.resources, self.config, self.jobserver
+        )
 
-        logging.info("---Reporting---")
         reporting_plugins = self.config.get_enabled_reporting_plugins(level)
         if not reporting_plugins:
             if "print_to_console" in self.reporting_plugins:
@@ -536,17 +797,85 @@ class Statick:  # pylint: disable=too-many-instance-attributes
         for plugin_name in reporting_plugins:
             if plugin_name not in self.reporting_plugins:
                 logging.error("Can't find specified reporting plugin %s!", plugin_name)
+                os.chdir(orig_path)
                 return None, False
+            self.reporting_plugins[plugin_name].set_plugin_context(plugin_context)
+        stream = None
+        if getattr(args, "stream_issues", False):
+            stream = IssueStream(
+                package,
+                level,
+                [self.reporting_plugins[name] for name in reporting_plugins],
+                self.exceptions,
+            )
+            # Reports are written relative to where Statick was started.
+            scan_dir = os.getcwd()
+            os.chdir(orig_path)
+            stream.begin()
+            os.chdir(scan_dir)
+
+        package_cache = PackageCache.open(args)
+        package_hash = None
+        stored = None
+        if package_cache is not None:
+            skip = list(package.nested_packages)
+            if args.output_directory:
+                skip.append(os.path.join(orig_path, args.output_directory))
+            package_hash = self.get_package_hash(
+                package, level, args, plugin_context, package_cache, skip
+            )
+            stored = package_cache.get_package(package, package_hash)
+
+        if stored is not None:
+            logging.info("Package has not changed, using stored results.")
+            issues = dict(stored[0])
+            self.timings += stored[1]
+            self.tool_versions += stored[2]
+            if stream is not None:
+                for tool, tool_issues in issues.items():
+                    stream.add_issues(tool, tool_issues, filtered=True)
+        else:
+            timings_start = len(self.timings)
+            tool_versions_start = len(self.tool_versions)
+            scan_issues, success = self.run_plugins(
+                package, level, args, plugin_context, stream
+            )
+            if scan_issues is None:
+                if package_cache is not None:
+                    package_cache.close()
+                os.chdir(orig_path)
+                if stream is not None:
+                    stream.finish()
+                return None, False
+            issues = scan_issues
+            if package_cache is not None and package_hash is not None and success:
+                package_cache.set_package(
+                    package,
+                    package_hash,
+                    issues,
+                    self.timings[timings_start:],
+                    self.tool_versions[tool_versions_start:],
+                )
+        if package_cache is not None:
+            package_cache.close()
+
+        os.chdir(orig_path)
 
+        logging.info("---Reporting---")
+        if stream is not None:
+            stream.finish()
+        for position, plugin_name in enumerate(reporting_plugins):
             plugin = self.reporting_plugins[plugin_name]
-            plugin.set_plugin_context(plugin_context)
-            logging.info("Running %s reporting plugin...", plugin.get_name())
-            plugin_start = time.time()
-            plugin.report(package, issues, level)
-            duration = format(time.time() - plugin_start, ".4f")
+            if stream is not None:
+                duration = format(stream.durations[position], ".4f")
+            else:
+                logging.info("Running %s reporting plugin...", plugin.get_name())
+                plugin_start = time.time()
+                plugin.report(package, issues, level)
+                duration = format(time.time() - plugin_start, ".4f")
+                logging.info("%s reporting plugin done.", plugin.get_name())
             timing = Timing(package.name, plugin.get_name(), "Reporting", duration)
             self.timings.append(timing)
-            logging.info("%s reporting plugin done.", plugin.get_name())
         logging.info("---Reporting---")
 
         if start_time is not None:
@@ -557,12 +886,183 @@ class Statick:  # pylint: disable=too-many-instance-attributes
 
         return issues, success
 
+    def get_package_hash(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        package: Package,
+        level: str,
+        args: argparse.Namespace,
+        plugin_context: PluginContext,
+        package_cache: PackageCache,
+        skip: Optional[list[str]] = None,
+    ) -> str:
+        """Get a hash of a package and everything its scan results depend on."""
+        assert self.config is not None
+        enabled_plugins = self.config.get_enabled_tool_plugins(level)
+        if not enabled_plugins:
+            enabled_plugins = list(self.tool_plugins)
+        tool_versions = {}
+        for plugin_name in enabled_plugins:
+            if plugin_name in self.tool_plugins:
+                plugin = self.tool_plugins[plugin_name]
+                plugin.set_plugin_context(plugin_context)
+                tool_versions[plugin_name] = self.get_tool_version(plugin)
+
+        exceptions = None
+        ignore_directories = None
+        if self.exceptions is not None:
+            exceptions = self.exceptions.get_exceptions(package)
+            ignore_directories = self.exceptions.get_ignore_directories()
+        if not args.no_git_files:
+            # Files unchanged from the git index are hashed from git without reading.
+            get_package_git_files(package)
+
+        return package_cache.get_package_hash(
+            package,
+            skip,
+            DirectoryFilter.from_exceptions(self.exceptions, package),
+            level=level,
+            config=self.config.config,
+            exceptions=exceptions,
+            ignore_directories=ignore_directories,
+            tool_versions=tool_versions,
+            resources=[
+                package_cache.get_tree_hash(os.path.join(path, "rsc"))
+                for path in self.resources.paths
+            ],
+            args={
+                key: value
+                for key, value in vars(args).items()
+                if key not in IGNORED_ARGS
+            },
+            statick=version("statick"),
+            changed_files=(
+                None if package.changed_files is None else sorted(package.changed_files)
+            ),
+        )
+
+    def run_plugins(
+        self,
+        package: Package,
+        level: str,
+        args: argparse.Namespace,
+        plugin_context: PluginContext,
+        stream: Optional[IssueStream] = None,
+    ) -> Tuple[Optional[dict[str, Sequence[Issue]]], bool]:
+        """Run discovery and tool plugins on a package and filter the issues found.
+
+        With a stream, issues are filtered and reported as tools find them, and the
+        issues kept by the stream are returned.
+        """
+        assert self.config is not None
+        logging.info("---Discovery---")
+        if not DiscoveryPlugin.file_command_exists():
+            logging.info(
+                "file command isn't available, discovery plugins will be less effective"
+            )
+
+        enabled_plugins = self.config.get_enabled_tool_plugins(level)
+        if not enabled_plugins:
+            enabled_plugins = list(self.tool_plugins)
+        plugin_graph = self.get_tool_plugin_graph(enabled_plugins, args.force_tool_list)
+        if plugin_graph is None:
+            return None, False
+        package_keys = self.get_package_keys(plugin_graph)
+
+        discovery_plugins = self.config.get_enabled_discovery_plugins(level)
+        if not discovery_plugins:
+            discovery_plugins = list(self.discovery_plugins)
+        discovery_cache = DiscoveryCache.open(args)
+        try:
+            # Get timing information for finding files for discovery plugins.
+            dummy_plugin = DiscoveryPlugin()
+            dummy_plugin.set_plugin_context(plugin_context)
+            plugin_start = time.time()
+            dummy_plugin.find_files(package, discovery_cache, self.exceptions)
+            duration = format(time.time() - plugin_start, ".4f")
+            timing = Timing(package.name, "find files", "Discovery", duration)
+            self.timings.append(timing)
+
+            plugins_ran: list[Any] = []
+            for plugin_name in discovery_plugins:
+                if plugin_name not in self.discovery_plugins:
+                    logging.error(
+                        "Can't find specified discovery plugin %s!", plugin_name
+                    )
+                    return None, False
+
+                plugin = self.discovery_plugins[plugin_name]
+                produced = plugin.get_package_keys()
+                if (
+                    package_keys is not None
+                    and produced is not None
+                    and not package_keys.intersection(produced)
+                ):
+                    logging.info(
+                        "Skipping %s discovery plugin, no enabled tool uses it.",
+                        plugin.get_name(),
+                    )
+                    continue
+                dependencies = plugin.get_discovery_dependencies()
+                for dependency_name in dependencies:
+                    dependency_plugin = self.discovery_plugins[dependency_name]
+                    if dependency_plugin.get_name() in plugins_ran:
+                        continue
+                    dependency_plugin.set_plugin_context(plugin_context)
+                    self.run_discovery_plugin(
+                        dependency_plugin, package, level, discovery_cache
+                    )
+                    plugins_ran.append(dependency_plugin.get_name())
+
+                if plugin.get_name() not in plugins_ran:
+                    plugin.set_plugin_context(plugin_context)
+                    self.run_discovery_plugin(plugin, package, level, discovery_cache)
+                    plugins_ran.append(plugin.get_name())
+
+            # Only changed files were found, so the other files would look removed.
+            if discovery_cache is not None and package.changed_files is None:
+                discovery_cache.update_files(package, package.file_stats)
+        finally:
+            if discovery_cache is not None:
+                discovery_cache.close()
+        logging.info("---Discovery---")
+
+        logging.info("---Tools---")
+        for plugin_name in plugin_graph:
+            self.tool_plugins[plugin_name].set_plugin_context(plugin_context)
+        if getattr(args, "in_process_tools", False):
+            consumers = [
+                plugin_name
+                for plugin_name in plugin_graph
+                if self.tool_plugins[plugin_name].uses_parse_cache()
+            ]
+            # Files are only read and parsed once when tools share the cache.
+            if len(consumers) > 1:
+                package.parse_cache = ParseCache(consumers)
+        try:
+            issues, success = self.run_tool_plugins(
+                package, level, plugin_graph, args.max_procs, stream
+            )
+        finally:
+            package.parse_cache = None
+
+        logging.info("---Tools---")
+
+        if stream is not None:
+            return dict(stream.issues), success
+        if self.exceptions is not None:
+            issues = self.exceptions.filter_issues(package, issues)
+
+        return dict(issues), success
+
     def run_workspace(
         self, parsed_args: argparse.Namespace, start_time: Optional[float] = None
     ) -> Tuple[
-        Optional[dict[str, list[Issue]]], bool
+        Optional[dict[str, IssueTable]], bool
     ]:  # pylint: disable=too-many-locals, too-many-branches, too-many-statements
-        """Run statick on a workspace."""
+        """Run statick on a workspace.
+
+        The issues of each tool are collected from all packages into an issue table.
+        """
         if parsed_args.output_directory:
             out_dir = parsed_args.output_directory
             if not os.path.isdir(out_dir):
@@ -574,24 +1074,17 @@ class Statick:  # pylint: disable=too-many-instance-attributes
                     )
                     return None, False
 
-        ignore_packages = self.get_ignore_packages()
-        ignore_files = ["AMENT_IGNORE", "CATKIN_IGNORE", "COLCON_IGNORE"]
-        package_indicators = ["package.xml", "setup.py", "pyproject.toml"]
-
         packages = []
-        for root, dirs, files in os.walk(parsed_args.path):
-            if any(item in files for item in ignore_files):
-                dirs.clear()
-                continue
-            for sub_dir in dirs:
-                full_dir = os.path.join(root, sub_dir)
-                files = os.listdir(full_dir)
-                if any(item in package_indicators for item in files) and not any(
-                    item in files for item in ignore_files
-                ):
-                    if ignore_packages and sub_dir in ignore_packages:
-                        continue
-                    packages.append(Package(sub_dir, full_dir))
+        if not any(
+            os.path.isfile(os.path.join(parsed_args.path, item))
+            for item in IGNORE_FILES
+        ):
+            packages = find_packages(
+                parsed_args.path,
+                DirectoryFilter.from_exceptions(self.exceptions),
+                self.get_ignore_packages(),
+                parsed_args.max_procs,
+            )
 
         if parsed_args.packages_file is not None:
             packages_file_list = []
@@ -610,6 +1103,18 @@ class Statick:  # pylint: disable=too-many-instance-attributes
                 package for package in packages if package.name in packages_file_list
             ]
 
+        if parsed_args.changed_since:
+            changed_packages = []
+            for package in packages:
+                changed_files = get_changed_files(
+                    package.path, parsed_args.changed_since
+                )
+                if changed_files is not None and not changed_files:
+                    logging.info("Skipping package %s, no files changed.", package.name)
+                    continue
+                changed_packages.append(package)
+            packages = changed_packages
+
         if parsed_args.list_packages:
             for package in packages:
                 logging.info(
@@ -617,61 +1122,10 @@ class Statick:  # pylint: disable=too-many-instance-attributes
                 )
             return None, True
 
-        count = 0
-        total_issues: list[Any] = []
-        num_packages = len(packages)
-        mp_args = []
-        if multiprocessing.get_start_method() == "fork":
-            logging.info("-- Scanning %d packages --", num_packages)
-            for package in packages:
-                count += 1
-                mp_args.append((parsed_args, count, package, num_packages))
-
-            with multiprocessing.Pool(parsed_args.max_procs) as pool:
-                total_issues, all_timings = zip(  # type: ignore
-                    *pool.starmap(self.scan_package, mp_args)
-                )
-                for timings in all_timings:
-                    for timing in timings:
-                        self.timings.append(timing)
-        else:
-            logging.warning(
-                "Statick's plugin manager does not currently support multiprocessing"
-                " without UNIX's fork function. Falling back to a single process."
-            )
-            logging.info("-- Scanning %d packages --", num_packages)
-            for package in packages:
-                count += 1
-                pkg_issues, pkg_timings = self.scan_package(
-                    parsed_args, count, package, num_packages
-                )
-                total_issues.append(pkg_issues)
-                for timing in pkg_timings:
-                    self.timings.append(timing)
-                    break
-
-        logging.info("-- All packages run --")
-        logging.info("-- overall report --")
-
-        success = True
-        issues: dict[str, list[Issue]] = {}
-        for issue in total_issues:
-            if issue is not None:
-                for key, value in list(issue.items()):
-                    if key in issues:
-                        issues[key] += value
-                        if value:
-                            success = False
-                    else:
-                        issues[key] = value
-                        if value:
-                            success = False
-
-        enabled_reporting_plugins: list[str] = []
-
         # Make a fake 'all' package for reporting
         dummy_all_package = Package("all_packages", parsed_args.path)
         level = self.get_level(dummy_all_package.path, parsed_args)
+        enabled_reporting_plugins: list[str] = []
         if level is not None and self.config is not None:
             if not self.config or not self.config.has_level(level):
                 logging.error("Can't find specified level %s in config!", level)
@@ -689,15 +1143,44 @@ class Statick:  # pylint: disable=too-many-instance-attributes
         plugin_context = PluginContext(parsed_args, self.resources, self.config)  # type: ignore
         plugin_context.args.output_directory = parsed_args.output_directory
 
+        reporting_plugins: list[ReportingPlugin] = []
         for plugin_name in enabled_reporting_plugins:
             if plugin_name not in self.reporting_plugins:
                 logging.error("Can't find specified reporting plugin %s!", plugin_name)
                 continue
-            plugin = self.reporting_plugins[plugin_name]
+            # A copy keeps the workspace report apart from the report of each package.
+            plugin = copy.copy(self.reporting_plugins[plugin_name])
             plugin.set_plugin_context(plugin_context)
-            logging.info("Running %s reporting plugin...", plugin.get_name())
-            plugin.report(dummy_all_package, issues, level)
-            logging.info("%s reporting plugin done.", plugin.get_name())
+            reporting_plugins.append(plugin)
+
+        stream = None
+        if getattr(parsed_args, "stream_issues", False):
+            # Issues were filtered when each package was scanned.
+            stream = IssueStream(dummy_all_package, str(level), reporting_plugins)
+            stream.begin()
+
+        success = True
+        issues: dict[str, IssueTable] = {}
+        for pkg_issues in self.scan_packages(parsed_args, packages):
+            if pkg_issues is None:
+                continue
+            for key, value in pkg_issues.items():
+                issues.setdefault(key, IssueTable()).extend(value)
+                if stream is not None:
+                    stream.add_issues(key, value, filtered=True)
+                if value:
+                    success = False
+
+        logging.info("-- All packages run --")
+        logging.info("-- overall report --")
+
+        if stream is not None:
+            stream.finish()
+        else:
+            for plugin in reporting_plugins:
+                logging.info("Running %s reporting plugin...", plugin.get_name())
+                plugin.report(dummy_all_package, issues, level)  # type: ignore
+                logging.info("%s reporting plugin done.", plugin.get_name())
 
         if start_time is not None:
             duration = format(time.time() - start_time, ".4f")
@@ -706,14 +1189,64 @@ class Statick:  # pylint: disable=too-many-instance-attributes
 
         return issues, success
 
+    def scan_packages(
+        self, parsed_args: argparse.Namespace, packages: list[Package]
+    ) -> Iterator[Optional[dict[str, IssueTable]]]:
+        """Scan packages and get the issues of each package as it is done.
+
+        With fork, packages are scanned in a pool of worker processes. Results are in
+        the order of the packages.
+        """
+        num_packages = len(packages)
+        logging.info("-- Scanning %d packages --", num_packages)
+        mp_args = [
+            (parsed_args, count, package, num_packages)
+            for count, package in enumerate(packages, 1)
+        ]
+        if multiprocessing.get_start_method() != "fork":
+            logging.warning(
+                "Statick's plugin manager does not currently support multiprocessing"
+                " without UNIX's fork function. Falling back to a single process."
+            )
+            for args in mp_args:
+                # The timings of the package are already added in this process.
+                pkg_issues, _ = self.scan_package(*args)
+                yield pkg_issues
+            return
+
+        # Each package worker takes a token, so tools that run in parallel
+        # within a package share the same limit as the workers.
+        self.jobserver = JobServer(parsed_args.max_procs)
+        try:
+            with multiprocessing.Pool(parsed_args.max_procs) as pool:
+                for pkg_issues, pkg_timings in pool.imap(
+                    self.scan_package_args, mp_args
+                ):
+                    self.timings += pkg_timings
+                    yield pkg_issues
+        finally:
+            self.jobserver.close()
+            self.jobserver = None
+
+    def scan_package_args(
+        self, args: Tuple[argparse.Namespace, int, Package, int]
+    ) -> Tuple[Optional[dict[str, IssueTable]], list[Timing]]:
+        """Scan a package with the arguments of `scan_package` in a tuple."""
+        return self.scan_package(*args)
+
     def scan_package(
         self,
         parsed_args: argparse.Namespace,
         count: int,
         package: Package,
         num_packages: int,
-    ) -> Tuple[Optional[dict[str, list[Issue]]], list[Timing]]:
-        """Scan each package in a separate process while buffering output."""
+    ) -> Tuple[Optional[dict[str, IssueTable]], list[Timing]]:
+        """Scan each package in a separate process while buffering output.
+
+        Issues are returned in issue tables, which are smaller to send back from package
+        workers than lists of issues. Only the timings of this package are returned,
+        since a worker process can scan more than one package.
+        """
         logger = logging.getLogger()
         old_handler = None
         if logger.handlers[0]:
@@ -732,8 +1265,18 @@ class Statick:  # pylint: disable=too-many-instance-attributes
         sys.stdout = sio
         sys.stderr = sio
 
-        issues, dummy = self.run(package.path, parsed_args)
-        timings = self.get_timings()
+        timings_start = len(self.timings)
+        if self.jobserver is not None:
+            self.jobserver.acquire()
+        try:
+            issues, dummy = self.run(package.path, parsed_args, package=package)
+        finally:
+            if self.jobserver is not None:
+                self.jobserver.release()
+        timings = self.timings[timings_start:]
+        tables = None
+        if issues is not None:
+            tables = {key: IssueTable(value) for key, value in issues.items()}
 
         sys.stdout = old_stdout
         sys.stderr = old_stderr
@@ -754,7 +1297,7 @@ class Statick:  # pylint: disable=too-many-instance-attributes
             logger.removeHandler(handler)
             logger.addHandler(old_handler)
 
-        return issues, timings
+        return tables, timings
 
     @staticmethod
     def print_no_issues() -> None:
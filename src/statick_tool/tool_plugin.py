@@ -1,19 +1,355 @@
 """Tool plugin."""
 
+# pylint: disable=too-many-lines
+
 import argparse
+import asyncio
+import codecs
+import contextlib
 import logging
+import math
 import os
 import re
 import shlex
+import shutil
+import signal
 import subprocess
-from typing import Any, Match, Optional, Pattern, Union
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Iterator,
+    Literal,
+    Match,
+    NamedTuple,
+    Optional,
+    Pattern,
+    TextIO,
+    Union,
+    overload,
+)
 
+from statick_tool import python_tools
+from statick_tool.cache import get_file_hash
 from statick_tool.issue import Issue
 from statick_tool.package import Package
+from statick_tool.parse_cache import ParseCache
 from statick_tool.plugin_context import PluginContext
+from statick_tool.result_cache import ResultCache
+from statick_tool.version_cache import VersionCache
+
+# Configuration keys for the limits on each command a tool runs.
+LIMIT_KEYS = ("timeout", "max_memory", "cpu_time")
+
+# Seconds a command may keep running after its CPU time limit before it is killed.
+CPU_TIME_GRACE = 5
+
+# Output that shows a command ran out of memory.
+MEMORY_ERRORS = ("MemoryError", "bad_alloc", "Cannot allocate memory", "out of memory")
+
+# Arguments of `check_output` that commands run in-process support.
+IN_PROCESS_KWARGS = {"stderr", "universal_newlines", "text", "cwd", "env"}
+
+# Bytes of the command line kept for the tool, its flags and anything else it adds.
+COMMAND_LINE_RESERVE = 16384
+
+# Fewest files to pass to each run of a shard-safe tool, so short file lists are not
+# split into many short runs.
+MIN_SHARD_FILES = 50
+
+
+class ToolLimitError(subprocess.SubprocessError):
+    """A tool command was stopped for going over a configured limit."""
+
+    def __init__(self, cmd: Any, limit: str, message: str, output: Any = None) -> None:
+        """Store the command, the limit it went over, and the output so far."""
+        super().__init__(message)
+        self.cmd = cmd
+        self.limit = limit
+        self.output = output
+
+
+def get_max_command_length() -> int:
+    """Get the number of bytes of file names that can be passed on one command line.
+
+    On POSIX systems the arguments and environment of a command share `ARG_MAX` bytes,
+    and each argument also takes the size of a pointer.
+    """
+    if sys.platform == "win32":
+        return 32767 - COMMAND_LINE_RESERVE
+    try:
+        arg_max = os.sysconf("SC_ARG_MAX")
+    except (AttributeError, ValueError, OSError):
+        arg_max = 131072
+    environment = sum(
+        len(os.fsencode(key)) + len(os.fsencode(value)) + 2 + 8
+        for key, value in os.environ.items()
+    )
+    return max(4096, arg_max - environment - COMMAND_LINE_RESERVE)
+
+
+def split_files(
+    files: list[str], parts: int, max_length: Optional[int] = None
+) -> list[list[str]]:
+    """Split files into chunks to pass to separate runs of a tool.
+
+    Files are split into about `parts` chunks of at least `MIN_SHARD_FILES` files, and
+    chunks are split further so the file names in each fit on one command line. Files
+    stay in order.
+    """
+    if max_length is None:
+        max_length = get_max_command_length()
+    target = max(MIN_SHARD_FILES, math.ceil(len(files) / max(1, parts)))
+    chunks: list[list[str]] = []
+    chunk: list[str] = []
+    length = 0
+    for path in files:
+        path_length = len(os.fsencode(path)) + 1 + 8
+        if chunk and (len(chunk) >= target or length + path_length > max_length):
+            chunks.append(chunk)
+            chunk = []
+            length = 0
+        chunk.append(path)
+        length += path_length
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def get_directory_config_hashes(
+    directory: str, names: list[str], known: dict[str, list[str]]
+) -> list[str]:
+    """Get the hashes of the configuration files in a directory and its parents.
+
+    Hashes found for each directory are kept in `known`, so directories shared by many
+    files are only checked once.
+    """
+    if not names:
+        return []
+    chain: list[str] = []
+    current: Optional[str] = directory
+    while current is not None and current not in known:
+        chain.append(current)
+        parent = os.path.dirname(current)
+        current = parent if parent != current else None
+    hashes = known[current] if current is not None else []
+    for current in reversed(chain):
+        found = [os.path.join(current, name) for name in names]
+        hashes = [
+            f"{path}:{get_file_hash(path)}" for path in found if os.path.isfile(path)
+        ] + hashes
+        known[current] = hashes
+    return hashes
+
+
+def set_resource_limits(max_memory: Optional[float], cpu_time: Optional[float]) -> None:
+    """Limit the memory in megabytes and CPU time in seconds of the current process.
+
+    This runs in the child process before the tool command starts.
+    """
+    import resource  # pylint: disable=import-outside-toplevel
+
+    limits = []
+    if max_memory:
+        size = int(max_memory * 1024 * 1024)
+        limits.append((resource.RLIMIT_AS, size, size))
+    if cpu_time:
+        seconds = math.ceil(cpu_time)
+        limits.append((resource.RLIMIT_CPU, seconds, seconds + CPU_TIME_GRACE))
+    for kind, soft, hard in limits:
+        _, max_hard = resource.getrlimit(kind)
+        if max_hard != resource.RLIM_INFINITY:
+            soft = min(soft, max_hard)
+            hard = min(hard, max_hard)
+        resource.setrlimit(kind, (soft, hard))
 
 
-class ToolPlugin:
+def set_limit_kwargs(
+    limits: dict[str, float], kwargs: dict[str, Any]
+) -> dict[str, float]:
+    """Set the `subprocess.Popen` arguments that enforce limits on a command.
+
+    Returns the limits that can be enforced on this platform.
+    """
+    if not limits:
+        return limits
+    max_memory = limits.get("max_memory")
+    cpu_time = limits.get("cpu_time")
+    if sys.platform != "win32":
+        kwargs["start_new_session"] = True
+        if max_memory or cpu_time:
+            kwargs["preexec_fn"] = lambda: set_resource_limits(max_memory, cpu_time)
+    elif max_memory or cpu_time:
+        logging.warning("Memory and CPU time limits are not supported on Windows.")
+        limits = {key: value for key, value in limits.items() if key == "timeout"}
+    return limits
+
+
+def get_limit_error(
+    args: Any,
+    returncode: int,
+    text: str,
+    limits: dict[str, float],
+    output: Any = None,
+) -> Optional[ToolLimitError]:
+    """Get the error for a failed command if it failed by going over a limit."""
+    max_memory = limits.get("max_memory")
+    cpu_time = limits.get("cpu_time")
+    if cpu_time and returncode in (-signal.SIGXCPU, -signal.SIGKILL):
+        return ToolLimitError(
+            args,
+            "cpu_time",
+            f"Stopped after the {cpu_time:g} second CPU time limit.",
+            output,
+        )
+    if max_memory and (
+        returncode in (-signal.SIGKILL, -signal.SIGSEGV, -signal.SIGABRT)
+        or any(error in text for error in MEMORY_ERRORS)
+    ):
+        return ToolLimitError(
+            args,
+            "max_memory",
+            f"Stopped at the {max_memory:g} MB memory limit.",
+            output,
+        )
+    return None
+
+
+def kill_process(
+    process: Union["subprocess.Popen[Any]", "asyncio.subprocess.Process"],
+) -> None:
+    """Kill a command and, on POSIX systems, everything else in its process group.
+
+    Commands only have their own process group when they were started with limits.
+    Processes started by asyncio are signalled directly, since `kill` polls and can reap
+    the process before asyncio sees it exit.
+    """
+    if sys.platform != "win32":
+        with contextlib.suppress(ProcessLookupError, PermissionError):
+            os.killpg(process.pid, signal.SIGKILL)
+        if not isinstance(process, subprocess.Popen):
+            if process.returncode is None:
+                with contextlib.suppress(OSError):
+                    os.kill(process.pid, signal.SIGKILL)
+            return
+    with contextlib.suppress(OSError):
+        process.kill()
+
+
+async def read_lines(
+    process: "asyncio.subprocess.Process",
+    lines: list[str],
+    on_line: Optional[Callable[[str], None]] = None,
+) -> None:
+    """Read the output of a command into lines until it exits.
+
+    Output is read in chunks instead of with `readline`, so lines of any length can be
+    read.
+    """
+    assert process.stdout is not None
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    while True:
+        chunk = await process.stdout.read(65536)
+        text = decoder.decode(chunk, final=not chunk)
+        if text:
+            *complete, pending = (pending + text).split("\n")
+            for line in complete:
+                lines.append(line + "\n")
+                if on_line is not None:
+                    on_line(line)
+        if not chunk:
+            break
+    if pending:
+        lines.append(pending)
+        if on_line is not None:
+            on_line(pending)
+    await process.wait()
+
+
+class ToolOutput:
+    """The output of a running tool command, read one line at a time."""
+
+    # Lines kept from the end of the output for error messages.
+    TAIL_LINES = 100
+
+    def __init__(
+        self,
+        args: list[str],
+        process: "subprocess.Popen[str]",
+        limits: dict[str, float],
+        log: Optional[TextIO] = None,
+    ) -> None:
+        """Initialize the output of a command."""
+        self.args = args
+        self.process = process
+        self.limits = limits
+        self.log = log
+        self.tail: deque[str] = deque(maxlen=self.TAIL_LINES)
+        self.stopped = False
+
+    def __iter__(self) -> Iterator[str]:
+        """Read lines of output until the tool closes it."""
+        if self.process.stdout is None:
+            return
+        for line in self.process.stdout:
+            if self.log is not None:
+                self.log.write(line)
+            self.tail.append(line)
+            yield line.rstrip("\n")
+
+    @property
+    def text(self) -> str:
+        """Get the last lines of output."""
+        return "".join(self.tail)
+
+    @property
+    def returncode(self) -> Optional[int]:
+        """Get the return code of the command once it is done."""
+        return self.process.returncode
+
+    def stop(self) -> None:
+        """Stop the command for going over its timeout."""
+        self.stopped = True
+        kill_process(self.process)
+
+    def check(self, returncodes: Collection[int] = (0,)) -> None:
+        """Raise an error if the command did not finish with one of the return codes.
+
+        ToolLimitError is raised if the command went over a limit, otherwise
+        CalledProcessError is raised with the last lines of output.
+        """
+        if self.stopped:
+            raise ToolLimitError(
+                self.args,
+                "timeout",
+                f"Stopped after the {self.limits['timeout']:g} second timeout.",
+                self.text,
+            )
+        returncode = self.process.returncode
+        if returncode is None or returncode in returncodes:
+            return
+        limit_error = get_limit_error(
+            self.args, returncode, self.text, self.limits, self.text
+        )
+        if limit_error is not None:
+            raise limit_error
+        raise subprocess.CalledProcessError(returncode, self.args, output=self.text)
+
+
+class CommandResult(NamedTuple):
+    """The output of a tool command run with `run_command`."""
+
+    args: list[str]
+    returncode: int
+    output: str
+
+
+class ToolPlugin:  # pylint: disable=too-many-public-methods
     """Default implementation of tool plugin."""
 
     plugin_context = None
@@ -29,12 +365,90 @@ class ToolPlugin:
         """Get a list of tools that must run before this one."""
         return []
 
+    @classmethod
+    def is_file_local(cls) -> bool:
+        """Return whether the issues found in a file only depend on that file.
+
+        Issues from file-local tools are stored in the result cache, and only files that
+        have changed are passed to the tool.
+        """
+        return False
+
+    @classmethod
+    def is_shard_safe(cls) -> bool:
+        """Return whether the tool can be run on separate chunks of the files.
+
+        The files of shard-safe tools are split into chunks that fit on one command
+        line, the chunks are run at the same time, and their outputs are joined before
+        they are parsed.
+        """
+        return False
+
+    @classmethod
+    def can_run_in_process(cls) -> bool:
+        """Return whether the tool is a Python package that can run in-process.
+
+        With `--in-process-tools`, commands of these tools run in processes forked from
+        Statick, which has already imported the tool, instead of new interpreters.
+        """
+        return False
+
+    @classmethod
+    def uses_parse_cache(cls) -> bool:
+        """Return whether the tool can check Python files with the parse cache.
+
+        With `--in-process-tools`, these tools check files inside Statick using the
+        source and syntax trees from the parse cache of the package, which are read and
+        parsed once for all of the tools that use them.
+        """
+        return False
+
+    @classmethod
+    def requires_whole_package(cls) -> bool:
+        """Return whether the tool has to scan the whole package.
+
+        When only changed files are scanned, these tools are either run on the whole
+        package or skipped, depending on the `--changed-since-policy` argument.
+        """
+        return False
+
     def gather_args(self, args: argparse.Namespace) -> None:
         """Gather arguments."""
 
+    def get_config_files(  # pylint: disable=unused-argument
+        self, level: str, package: Package
+    ) -> list[str]:
+        """Get the configuration files that change the output of the tool.
+
+        Files in the list that don't exist are allowed.
+        """
+        return []
+
+    def get_config_names(  # pylint: disable=unused-argument
+        self, level: str
+    ) -> list[str]:
+        """Get the names of configuration files the tool finds next to the files.
+
+        Tools look for these in the directory of each file they scan and its parents, so
+        the result cache keys of a file include every one of them that exists there.
+        """
+        return []
+
     def get_file_types(self) -> list[str]:  # type: ignore[empty-body]
         """Return a list of file types the plugin can scan."""
 
+    def get_package_keys(self) -> Optional[list[str]]:
+        """Get the package keys the tool reads.
+
+        Only discovery plugins that set one of these keys are run. By default the keys
+        are the file types the tool scans. Returns None if the keys are not known, so
+        all discovery plugins run.
+        """
+        file_types = self.get_file_types()  # pylint: disable=assignment-from-no-return
+        if file_types is None:
+            return None
+        return list(file_types)
+
     def get_binary(  # pylint: disable=unused-argument
         self, level: Optional[str] = None, package: Optional[Package] = None
     ) -> str:
@@ -60,6 +474,49 @@ class ToolPlugin:
         except FileNotFoundError:  # NOLINT
             return self.TOOL_MISSING_STR
 
+    def get_version_key(self) -> Optional[str]:
+        """Get a key that changes whenever the installed tool changes.
+
+        The key is the resolved path of the tool binary with its modification time and
+        size. Returns None if the binary can't be found, so the version is not stored.
+        """
+        tool_bin = self.get_binary()
+        if not tool_bin:
+            return None
+        path = shutil.which(tool_bin)
+        if path is None:
+            return None
+        path = os.path.realpath(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+    def get_cached_version(self) -> str:
+        """Get the version of the tool, using the version cache when it is enabled.
+
+        Versions are stored under the key from `get_version_key`, so the tool is only
+        probed again after the binary changes.
+        """
+        binary = self.get_version_key()
+        cache = None
+        if binary is not None and self.plugin_context is not None:
+            cache = VersionCache.open(self.plugin_context.args)
+        if cache is None or binary is None:
+            return self.get_version()
+        try:
+            name = self.get_name()  # pylint: disable=assignment-from-no-return
+            version = cache.get_version(name, binary)
+            if version is None:
+                version = self.get_version()
+                # A failed probe is tried again on the next run.
+                if version != self.TOOL_UNKNOWN_STR:
+                    cache.set_version(name, binary, version)
+            return version
+        finally:
+            cache.close()
+
     def get_version_from_pkg(self, subproc_args: list[str], ver_re_str: str) -> str:
         """Figure out and return the version of the tool that's installed."""
         version = self.TOOL_MISSING_STR
@@ -119,28 +576,185 @@ class ToolPlugin:
             )
         return version
 
-    def scan(self, package: Package, level: str) -> Optional[list[Issue]]:
-        """Run tool and gather output."""
+    def get_files(self, package: Package) -> list[str]:
+        """Get the files in a package that the tool should scan."""
         files: list[str] = []
         for file_type in self.get_file_types():
             if file_type in package and package[file_type]:
                 files += package[file_type]
+        return files
+
+    def scan(self, package: Package, level: str) -> Optional[list[Issue]]:
+        """Run tool and gather output."""
+        files = self.get_files(package)
+        if not self.requires_whole_package():
+            files = package.filter_changed(files)
+        if self.is_file_local():
+            # Issues in excepted files would be filtered out, so don't scan them.
+            files = package.filter_excepted(self.get_name(), files)
+        if not files:
+            return []
+
+        cache = None
+        if self.is_file_local() and self.plugin_context is not None:
+            cache = ResultCache.open(self.plugin_context.args)
+        if cache is None:
+            return self.scan_files(package, level, files, self.get_user_flags(level))
+        try:
+            return self.scan_cached(package, level, files, cache)
+        finally:
+            cache.close()
+
+    def scan_streaming(
+        self,
+        package: Package,
+        level: str,
+        add_issues: Callable[[list[Issue]], None],
+    ) -> bool:
+        """Run tool and pass the issues it finds to a function as they are found.
+
+        Returns False if the tool failed. By default all issues from `scan` are passed
+        at once. Plugins that find issues while the tool is running can override this to
+        pass them in batches.
+        """
+        issues = self.scan(package, level)
+        if issues is None:
+            return False
+        add_issues(issues)
+        return True
 
-        if files:
+    def scan_files(
+        self, package: Package, level: str, files: list[str], user_flags: list[str]
+    ) -> Optional[list[Issue]]:
+        """Run tool on files and parse the output."""
+        if self.is_shard_safe():
+            total_output = self.process_shards(package, level, files, user_flags)
+        else:
             total_output = (  # pylint: disable=assignment-from-no-return
-                self.process_files(package, level, files, self.get_user_flags(level))
+                self.process_files(package, level, files, user_flags)
             )
-            if total_output is not None:
-                if self.plugin_context and self.plugin_context.args.output_directory:
-                    with open(self.get_name() + ".log", "w", encoding="utf8") as fid:
-                        for output in total_output:
-                            fid.write(output)
+        if total_output is None:
+            return None
 
-                return self.parse_output(total_output, package)
+        with self.open_log() as fid:
+            if fid is not None:
+                for output in total_output:
+                    fid.write(output)
 
+        return self.parse_output(total_output, package)
+
+    def scan_cached(  # pylint: disable=too-many-locals
+        self, package: Package, level: str, files: list[str], cache: ResultCache
+    ) -> Optional[list[Issue]]:
+        """Run tool on the files that are not in the result cache.
+
+        Issues for the other files are taken from the cache.
+        """
+        user_flags = self.get_user_flags(level)
+        version = self.get_cached_version()
+        if version in (self.TOOL_MISSING_STR, self.TOOL_UNKNOWN_STR):
+            return self.scan_files(package, level, files, user_flags)
+
+        config_hashes = [
+            f"{path}:{get_file_hash(path)}"
+            for path in sorted(self.get_config_files(level, package))
+        ]
+        # Flags can name configuration files too.
+        config_hashes += [
+            f"{flag}:{get_file_hash(flag)}"
+            for flag in user_flags
+            if os.path.isfile(flag)
+        ]
+        config_names = self.get_config_names(level)
+        directory_hashes: dict[str, list[str]] = {}
+        keys: dict[str, str] = {}
+        for path in files:
+            file_hash = package.file_hashes.get(os.path.abspath(path))
+            if file_hash is None:
+                file_hash = get_file_hash(path)
+            if file_hash is not None:
+                keys[path] = ResultCache.get_key(
+                    self.get_name(),
+                    version,
+                    shlex.join(user_flags),
+                    *config_hashes,
+                    *get_directory_config_hashes(
+                        os.path.dirname(os.path.abspath(path)),
+                        config_names,
+                        directory_hashes,
+                    ),
+                    path,
+                    file_hash,
+                )
+
+        cached = cache.get_issues(keys.values())
+        misses = [path for path in files if keys.get(path) not in cached]
+        missed = set(misses)
+        logging.info(
+            "  %d of %d files found in result cache.",
+            len(files) - len(misses),
+            len(files),
+        )
+        issues: list[Issue] = []
+        for path in files:
+            if path not in missed:
+                issues += cached[keys[path]]
+        if not misses:
+            return issues
+
+        new_issues = self.scan_files(package, level, misses, user_flags)
+        if new_issues is None:
             return None
+        issues += new_issues
 
-        return []
+        files_by_path = {os.path.abspath(path): path for path in misses}
+        file_issues: dict[str, list[Issue]] = {path: [] for path in misses}
+        for issue in new_issues:
+            issue_path = files_by_path.get(os.path.abspath(issue.filename))
+            if issue_path is None:
+                # Results that can't be tied to a file are never reused.
+                logging.debug("  Not caching results, no file for %s", issue)
+                return issues
+            file_issues[issue_path].append(issue)
+        cache.set_issues(
+            {keys[path]: file_issues[path] for path in misses if path in keys}
+        )
+        return issues
+
+    def process_shards(
+        self, package: Package, level: str, files: list[str], user_flags: list[str]
+    ) -> Optional[list[str]]:
+        """Run tool on chunks of the files at the same time and join the outputs.
+
+        At most as many chunks run at the same time as the tool has parallel jobs.
+        Returns None if the tool failed on any chunk.
+        """
+        with self.parallel_jobs() as jobs:
+            chunks = split_files(files, jobs)
+            if len(chunks) == 1:
+                return self.process_files(  # pylint: disable=assignment-from-no-return
+                    package, level, files, user_flags
+                )
+            logging.info(
+                "  Running %s on %d chunks of files.", self.get_name(), len(chunks)
+            )
+            total_output: list[str] = []
+            with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+                # Plugins may change the flags they are given, so each chunk gets a copy.
+                futures = [
+                    executor.submit(
+                        self.process_files, package, level, chunk, list(user_flags)
+                    )
+                    for chunk in chunks
+                ]
+                for future in futures:
+                    output = future.result()
+                    if output is None:
+                        for other in futures:
+                            other.cancel()
+                        return None
+                    total_output += output
+            return total_output
 
     def process_files(
         self, package: Package, level: str, files: list[str], user_flags: list[str]
@@ -152,6 +766,368 @@ class ToolPlugin:
     ) -> list[Issue]:
         """Parse tool output and report issues."""
 
+    @contextlib.contextmanager
+    def parallel_jobs(self) -> Iterator[int]:
+        """Get the number of parallel jobs a tool can run.
+
+        Extra CPU tokens are taken from the jobserver for as long as the context is
+        open, so tools that run their own jobs don't exceed `--max-procs` in total.
+        """
+        max_jobs = 1
+        jobserver = None
+        if self.plugin_context is not None:
+            max_jobs = getattr(self.plugin_context.args, "max_procs", None) or 1
+            jobserver = self.plugin_context.jobserver
+        if jobserver is None:
+            yield max_jobs
+            return
+        with jobserver.jobs(max_jobs) as jobs:
+            yield jobs
+
+    def get_limits(self, level: str) -> dict[str, float]:
+        """Get the timeout and resource limits for each command the tool runs.
+
+        The `timeout` and `cpu_time` limits are in seconds, and `max_memory` is in
+        megabytes. Limits that are not set or are not positive numbers are left out.
+        """
+        limits: dict[str, float] = {}
+        if self.plugin_context is None or self.plugin_context.config is None:
+            return limits
+        name = self.get_name()  # pylint: disable=assignment-from-no-return
+        for key in LIMIT_KEYS:
+            value = self.plugin_context.config.get_tool_config(name, level, key)
+            if not value:
+                continue
+            try:
+                limit = float(value)
+            except ValueError:
+                logging.warning("Invalid %s for %s tool plugin: %s", key, name, value)
+                continue
+            if limit > 0:
+                limits[key] = limit
+        return limits
+
+    @overload
+    def check_output(
+        self,
+        args: list[str],
+        level: Optional[str] = None,
+        *,
+        universal_newlines: Literal[True],
+        **kwargs: Any,
+    ) -> str: ...
+
+    @overload
+    def check_output(
+        self,
+        args: list[str],
+        level: Optional[str] = None,
+        *,
+        text: Literal[True],
+        **kwargs: Any,
+    ) -> str: ...
+
+    @overload
+    def check_output(
+        self, args: list[str], level: Optional[str] = None, **kwargs: Any
+    ) -> bytes: ...
+
+    def check_output(
+        self, args: list[str], level: Optional[str] = None, **kwargs: Any
+    ) -> Union[str, bytes]:
+        """Run a tool command and return its output, like `subprocess.check_output`.
+
+        The command is held to the limits configured for the tool at the level. It runs
+        in its own process group so anything it starts is killed with it when it runs
+        past the timeout. Memory and CPU time are limited with rlimits on POSIX systems.
+        ToolLimitError is raised when the command goes over a limit. The output is text
+        when `universal_newlines` or `text` is set, and bytes otherwise.
+        """
+        entry_point = self.get_entry_point(args, kwargs)
+        if entry_point is not None:
+            return self.check_output_in_process(args, entry_point, level, **kwargs)
+        limits = self.get_limits(level) if level is not None else {}
+        output: Union[str, bytes]
+        if not limits:
+            output = subprocess.check_output(args, **kwargs)
+            return output
+
+        input_data = kwargs.pop("input", None)
+        if input_data is not None:
+            kwargs["stdin"] = subprocess.PIPE
+        limits = set_limit_kwargs(limits, kwargs)
+
+        with subprocess.Popen(
+            args, stdout=subprocess.PIPE, **kwargs
+        ) as process:  # nosec
+            try:
+                output, _ = process.communicate(input_data, limits.get("timeout"))
+            except subprocess.TimeoutExpired:
+                kill_process(process)
+                output, _ = process.communicate()
+                raise ToolLimitError(
+                    args,
+                    "timeout",
+                    f"Stopped after the {limits['timeout']:g} second timeout.",
+                    output,
+                ) from None
+            returncode = process.poll()
+
+        if returncode:
+            text = (
+                output
+                if isinstance(output, str)
+                else (output or b"").decode(errors="replace")
+            )
+            limit_error = get_limit_error(args, returncode, text, limits, output)
+            if limit_error is not None:
+                raise limit_error
+            raise subprocess.CalledProcessError(returncode, args, output=output)
+        return output
+
+    def get_entry_point(self, args: list[str], kwargs: dict[str, Any]) -> Optional[str]:
+        """Get the entry point to run a command in-process, or None to run it as usual.
+
+        Only commands whose standard error is inherited or merged into the output run
+        in-process.
+        """
+        if (
+            not self.can_run_in_process()
+            or self.plugin_context is None
+            or not getattr(self.plugin_context.args, "in_process_tools", False)
+        ):
+            return None
+        if (
+            not args
+            or set(kwargs) - IN_PROCESS_KWARGS
+            or kwargs.get("stderr") not in (None, subprocess.STDOUT)
+            or not python_tools.is_supported()
+        ):
+            return None
+        return python_tools.get_entry_point(args[0])
+
+    def get_parse_cache(self, package: Package, level: str) -> Optional[ParseCache]:
+        """Get the parse cache to check files with, or None to run the tool command.
+
+        Tools checking files inside Statick can't be stopped, so the cache is only used
+        when no limits are set for the tool. The tool has to be installed in the same
+        environment as Statick.
+        """
+        if package.parse_cache is None or not self.uses_parse_cache():
+            return None
+        if self.get_limits(level):
+            return None
+        if python_tools.get_entry_point(self.get_binary(level, package)) is None:
+            return None
+        return package.parse_cache
+
+    def check_output_in_process(
+        self, args: list[str], entry_point: str, level: Optional[str], **kwargs: Any
+    ) -> Union[str, bytes]:
+        """Run a Python tool in-process and return its output, like `check_output`."""
+        limits = self.get_limits(level) if level is not None else {}
+        logging.debug("Running %s in-process.", args[0])
+        returncode, data, timed_out = python_tools.run(
+            args,
+            entry_point,
+            merge_stderr=kwargs.get("stderr") == subprocess.STDOUT,
+            cwd=kwargs.get("cwd"),
+            env=kwargs.get("env"),
+            limits=limits,
+        )
+        text = data.decode("utf8", errors="replace")
+        output: Union[str, bytes] = data
+        if kwargs.get("universal_newlines") or kwargs.get("text"):
+            output = text.replace("\r\n", "\n").replace("\r", "\n")
+        if timed_out:
+            raise ToolLimitError(
+                args,
+                "timeout",
+                f"Stopped after the {limits['timeout']:g} second timeout.",
+                output,
+            )
+        if returncode:
+            limit_error = get_limit_error(args, returncode, text, limits, output)
+            if limit_error is not None:
+                raise limit_error
+            raise subprocess.CalledProcessError(returncode, args, output=output)
+        return output
+
+    @contextlib.contextmanager
+    def run_lines(
+        self,
+        args: list[str],
+        level: Optional[str] = None,
+        log: Optional[TextIO] = None,
+        **kwargs: Any,
+    ) -> Iterator["ToolOutput"]:
+        """Run a tool command and read its output one line at a time.
+
+        Iterating over the output gives each line without its line ending as soon as the
+        tool prints it, so the whole output is never held in memory. Lines are written
+        to the log as they are read. The command is held to the same limits as
+        `check_output`. Once the context is closed, call `check` on the output to raise
+        an error if the command failed.
+        """
+        limits = self.get_limits(level) if level is not None else {}
+        limits = set_limit_kwargs(limits, kwargs)
+        kwargs.setdefault("universal_newlines", True)
+        process = subprocess.Popen(  # pylint: disable=consider-using-with
+            args, stdout=subprocess.PIPE, **kwargs
+        )  # nosec
+        output = ToolOutput(args, process, limits, log)
+        timer = None
+        if "timeout" in limits:
+            timer = threading.Timer(limits["timeout"], output.stop)
+            timer.start()
+        try:
+            yield output
+            # Read the rest of the output so the tool can finish and it is logged.
+            for _ in output:
+                pass
+        except BaseException:
+            kill_process(process)
+            raise
+        finally:
+            if timer is not None:
+                timer.cancel()
+            if process.stdout is not None:
+                process.stdout.close()
+            process.wait()
+
+    async def run_command(
+        self,
+        args: list[str],
+        level: Optional[str] = None,
+        returncodes: Collection[int] = (0,),
+        on_line: Optional[Callable[[str], None]] = None,
+        processes: Optional[set["asyncio.subprocess.Process"]] = None,
+        **kwargs: Any,
+    ) -> CommandResult:
+        """Run a tool command with asyncio and return its output.
+
+        The command is held to the limits configured for the tool at the level, like
+        `check_output`. Output is decoded as it is read, and each line is passed to
+        `on_line` as soon as the tool prints it. Many tools use return codes other than
+        0 to say they found issues, so CalledProcessError is only raised for return
+        codes that are not in `returncodes`. ToolLimitError is raised instead when the
+        command went over a limit. The process is kept in `processes` while it runs, so
+        it can be stopped by other commands.
+        """
+        limits = self.get_limits(level) if level is not None else {}
+        limits = set_limit_kwargs(limits, kwargs)
+        # Output is always decoded as text.
+        kwargs.pop("universal_newlines", None)
+        kwargs.pop("text", None)
+        process = await asyncio.create_subprocess_exec(
+            *args, stdout=asyncio.subprocess.PIPE, **kwargs
+        )  # nosec
+        if processes is not None:
+            processes.add(process)
+        lines: list[str] = []
+        try:
+            await asyncio.wait_for(
+                read_lines(process, lines, on_line), limits.get("timeout")
+            )
+        except asyncio.TimeoutError:
+            kill_process(process)
+            await process.wait()
+            raise ToolLimitError(
+                args,
+                "timeout",
+                f"Stopped after the {limits['timeout']:g} second timeout.",
+                "".join(lines),
+            ) from None
+        except BaseException:
+            # Stop the command if the caller is cancelled or reading failed.
+            kill_process(process)
+            await process.wait()
+            raise
+        finally:
+            if processes is not None:
+                processes.discard(process)
+
+        output = "".join(lines)
+        returncode = process.returncode
+        assert returncode is not None
+        if returncode not in returncodes:
+            limit_error = get_limit_error(args, returncode, output, limits, output)
+            if limit_error is not None:
+                raise limit_error
+            raise subprocess.CalledProcessError(returncode, args, output=output)
+        return CommandResult(args, returncode, output)
+
+    def run_many(
+        self,
+        commands: list[list[str]],
+        level: Optional[str] = None,
+        returncodes: Collection[int] = (0,),
+        **kwargs: Any,
+    ) -> list[CommandResult]:
+        """Run tool commands at the same time and return their results in order.
+
+        Tools that run once for each file use this to run on several files at once. At
+        most as many commands run at the same time as the tool has parallel jobs, so
+        commands share CPU tokens with the jobserver. If a command fails, the others are
+        stopped and its error is raised, like `run_command`.
+        """
+        if not commands:
+            return []
+        with self.parallel_jobs() as jobs:
+            return asyncio.run(
+                self.run_commands(commands, jobs, level, returncodes, **kwargs)
+            )
+
+    async def run_commands(
+        self,
+        commands: list[list[str]],
+        jobs: int,
+        level: Optional[str] = None,
+        returncodes: Collection[int] = (0,),
+        **kwargs: Any,
+    ) -> list[CommandResult]:
+        """Run tool commands with at most `jobs` running at the same time.
+
+        Commands are stopped by killing their processes instead of cancelling their
+        tasks, since a task cancelled while its process is starting may never finish.
+        """
+        semaphore = asyncio.Semaphore(max(1, jobs))
+        processes: set["asyncio.subprocess.Process"] = set()
+        errors: list[Exception] = []
+
+        async def run(args: list[str]) -> Optional[CommandResult]:
+            async with semaphore:
+                if errors:
+                    return None
+                try:
+                    return await self.run_command(
+                        args, level, returncodes, processes=processes, **dict(kwargs)
+                    )
+                except Exception as ex:  # pylint: disable=broad-except
+                    if not errors:
+                        errors.append(ex)
+                        for process in list(processes):
+                            kill_process(process)
+                    return None
+
+        results = await asyncio.gather(*(run(args) for args in commands))
+        if errors:
+            raise errors[0]
+        return [result for result in results if result is not None]
+
+    @contextlib.contextmanager
+    def open_log(self) -> Iterator[Optional[TextIO]]:
+        """Open the log file for the output of the tool.
+
+        The log is only written when an output directory is set, otherwise None is
+        given.
+        """
+        if self.plugin_context and self.plugin_context.args.output_directory:
+            with open(self.get_name() + ".log", "w", encoding="utf8") as fid:
+                yield fid
+        else:
+            yield None
+
     def set_plugin_context(self, plugin_context: Union[None, PluginContext]) -> None:
         """Set the plugin context."""
         self.plugin_context = plugin_context
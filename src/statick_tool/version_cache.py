@@ -0,0 +1,50 @@
+"""Persist the versions of installed tools between runs.
+
+Finding a tool version can mean running the tool or listing every package installed by
+apt, npm or docker. Versions are stored under a key made from the tool name and the
+resolved path, modification time and size of the tool binary, so a tool is only probed
+again after it is installed, upgraded or removed.
+"""
+
+import logging
+import sqlite3
+from typing import Optional
+
+from statick_tool.cache import Cache
+
+
+class VersionCache(Cache):
+    """Persist the versions of installed tools between runs."""
+
+    filename = "versions.sqlite"
+    schema = [
+        "CREATE TABLE IF NOT EXISTS versions ("
+        " tool TEXT NOT NULL, binary TEXT NOT NULL, version TEXT NOT NULL,"
+        " PRIMARY KEY (tool, binary))",
+    ]
+
+    def get_version(self, tool: str, binary: str) -> Optional[str]:
+        """Get the stored version of a tool, or None if it is not stored."""
+        try:
+            rows = self.execute(
+                "SELECT version FROM versions WHERE tool = ? AND binary = ?",
+                (tool, binary),
+            )
+        except sqlite3.Error as ex:
+            logging.warning("Unable to read version cache: %s", ex)
+            return None
+        if not rows:
+            return None
+        version: str = rows[0][0]
+        return version
+
+    def set_version(self, tool: str, binary: str, version: str) -> None:
+        """Store the version of a tool."""
+        try:
+            self.execute(
+                "INSERT OR REPLACE INTO versions (tool, binary, version)"
+                " VALUES (?, ?, ?)",
+                (tool, binary, version),
+            )
+        except sqlite3.Error as ex:
+            logging.warning("Unable to update version cache: %s", ex)
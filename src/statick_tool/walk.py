@@ -0,0 +1,148 @@
+"""Walk directory trees without visiting directories that will not be scanned.
+
+A directory is skipped if its name is in the list of directories to ignore, if it has a
+file marking it as ignored (like `COLCON_IGNORE`), or if a file exception for all tools
+matches every path inside it. Skipped directories are never listed, so large trees like
+`.git` or `node_modules` aren't read only to have every file in them thrown away.
+"""
+
+import fnmatch
+import os
+import re
+from typing import Iterable, Iterator, Optional
+
+from statick_tool.exceptions import ExceptionMatcher, Exceptions
+from statick_tool.package import Package
+
+# Files that mark a directory as ignored by ROS build tools.
+IGNORE_FILES = ["AMENT_IGNORE", "CATKIN_IGNORE", "COLCON_IGNORE"]
+
+
+class DirectoryFilter:
+    """Decide which directories to skip while walking a tree."""
+
+    def __init__(
+        self,
+        ignore_dirs: Iterable[str] = (),
+        matcher: Optional[ExceptionMatcher] = None,
+        ignore_files: Iterable[str] = tuple(IGNORE_FILES),
+    ) -> None:
+        """Compile the names of directories to ignore.
+
+        Names can be globs. If a matcher is given, directories whose contents are all
+        excepted for all tools are skipped too.
+        """
+        patterns = [fnmatch.translate(os.path.normcase(name)) for name in ignore_dirs]
+        self.ignore_dirs = re.compile("|".join(patterns)) if patterns else None
+        self.matcher = matcher
+        self.ignore_files = frozenset(ignore_files)
+
+    @classmethod
+    def from_exceptions(
+        cls, exceptions: Optional[Exceptions], package: Optional[Package] = None
+    ) -> "DirectoryFilter":
+        """Get the filter for the directories to ignore in an exceptions file.
+
+        If a package is given, its file exceptions for all tools are used too.
+        """
+        if exceptions is None:
+            return cls()
+        matcher = None
+        if package is not None:
+            matcher = exceptions.get_matcher(package)
+        return cls(exceptions.get_ignore_directories(), matcher)
+
+    def is_ignored(self, path: str, name: str) -> bool:
+        """Return whether a directory is skipped without listing it."""
+        if self.ignore_dirs is not None and self.ignore_dirs.match(
+            os.path.normcase(name)
+        ):
+            return True
+        return self.matcher is not None and self.matcher.is_dir_excepted(path)
+
+    def has_ignore_file(self, files: list[str]) -> bool:
+        """Return whether a directory has a file marking it as ignored."""
+        return not self.ignore_files.isdisjoint(files)
+
+
+def walk(
+    path: str, dir_filter: Optional[DirectoryFilter] = None
+) -> Iterator[tuple[str, list[str], list[str]]]:
+    """Walk a directory tree from the top down, like `os.walk`.
+
+    Directories skipped by the filter are left out of the lists of directories and are
+    not walked. Directories below the top with a file marking them as ignored are not
+    returned at all. As with `os.walk`, symbolic links to directories are listed but not
+    walked, and directories removed from the list by the caller are not walked.
+    """
+    stack = [path]
+    while stack:
+        root = stack.pop()
+        dirs: list[str] = []
+        files: list[str] = []
+        links: set[str] = set()
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        files.append(entry.name)
+                        continue
+                    if dir_filter is not None and dir_filter.is_ignored(
+                        entry.path, entry.name
+                    ):
+                        continue
+                    dirs.append(entry.name)
+                    try:
+                        if entry.is_symlink():
+                            links.add(entry.name)
+                    except OSError:
+                        links.add(entry.name)
+        except OSError:
+            continue
+        if (
+            root != path
+            and dir_filter is not None
+            and dir_filter.has_ignore_file(files)
+        ):
+            continue
+
+        yield root, dirs, files
+        stack.extend(
+            os.path.join(root, name) for name in reversed(dirs) if name not in links
+        )
+
+
+def filter_paths(
+    path: str, paths: Iterable[str], dir_filter: DirectoryFilter
+) -> list[str]:
+    """Get the paths of files under a path that walking it would find.
+
+    This applies a filter to files that were found without walking, such as files listed
+    by git.
+    """
+    paths = list(paths)
+    marked = {
+        os.path.dirname(full_path)
+        for full_path in paths
+        if os.path.basename(full_path) in dir_filter.ignore_files
+    }
+    marked.discard(path)
+    skipped: dict[str, bool] = {path: False}
+
+    def is_skipped(directory: str) -> bool:
+        if directory not in skipped:
+            parent = os.path.dirname(directory)
+            skipped[directory] = parent != directory and (
+                directory in marked
+                or dir_filter.is_ignored(directory, os.path.basename(directory))
+                or is_skipped(parent)
+            )
+        return skipped[directory]
+
+    return [
+        full_path for full_path in paths if not is_skipped(os.path.dirname(full_path))
+    ]
@@ -0,0 +1,86 @@
+"""Find the packages in a workspace and the files in each of them with one walk.
+
+Any directory below the top of the workspace with a package file (like `package.xml`) is
+a package. Each file belongs to the innermost package it is in, so a package nested in
+another package is only scanned once. The walk is split between threads by the
+directories at the top of the workspace.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from statick_tool.package import Package
+from statick_tool.walk import DirectoryFilter, walk
+
+# Files that mark a directory as a package.
+PACKAGE_INDICATORS = ["package.xml", "setup.py", "pyproject.toml"]
+
+
+def walk_subtree(
+    path: str, dir_filter: DirectoryFilter
+) -> list[tuple[str, list[str], list[str]]]:
+    """Walk a directory at the top of a workspace.
+
+    Nothing is returned if the directory has a file marking it as ignored.
+    """
+    walked = []
+    for root, dirs, files in walk(path, dir_filter):
+        if root == path and dir_filter.has_ignore_file(files):
+            return []
+        walked.append((root, dirs, files))
+    return walked
+
+
+def find_packages(  # pylint: disable=too-many-locals
+    path: str,
+    dir_filter: Optional[DirectoryFilter] = None,
+    ignore_packages: Optional[list[str]] = None,
+    max_workers: int = 1,
+) -> list[Package]:
+    """Find the packages in a workspace and the files that belong to each of them.
+
+    Packages named in the ignore list are not returned, and the files in them don't
+    belong to any other package. The top of the workspace is never a package.
+    """
+    path = os.path.abspath(path)
+    if dir_filter is None:
+        dir_filter = DirectoryFilter()
+    top = next(walk(path, dir_filter), None)
+    if top is None:
+        return []
+    subtrees = [
+        os.path.join(path, name)
+        for name in top[1]
+        if not os.path.islink(os.path.join(path, name))
+    ]
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        walked = list(executor.map(lambda sub: walk_subtree(sub, dir_filter), subtrees))
+
+    packages: list[Package] = []
+    files: dict[str, list[str]] = {}
+    nested: dict[str, list[str]] = {}
+    for subtree in walked:
+        # Directories are walked before the directories in them, so the package of a
+        # directory's parent is always known first.
+        owners: dict[str, Optional[str]] = {path: None}
+        for root, _, names in subtree:
+            parent = owners[os.path.dirname(root)]
+            owner = parent
+            if any(name in PACKAGE_INDICATORS for name in names):
+                owner = root
+                files[root] = []
+                nested[root] = []
+                if parent is not None:
+                    nested[parent].append(root)
+                package = Package(os.path.basename(root), root)
+                if not ignore_packages or package.name not in ignore_packages:
+                    packages.append(package)
+            owners[root] = owner
+            if owner is not None:
+                files[owner] += [os.path.join(root, name) for name in names]
+
+    for package in packages:
+        package.file_list = files[package.path]
+        package.nested_packages = nested[package.path]
+    return packages
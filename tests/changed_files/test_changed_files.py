@@ -0,0 +1,99 @@
+"""Tests for statick_tool.changed_files."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from statick_tool import changed_files
+from statick_tool.changed_files import get_changed_files
+
+
+def git(repo, *args):
+    """Run a git command in a repository."""
+    subprocess.check_output(
+        ["git", "-C", str(repo), "-c", "user.name=test", "-c", "user.email=test@test"]
+        + list(args)
+    )
+
+
+@pytest.fixture(name="repo")
+def fixture_repo(tmp_path):
+    """Make a git repository with a package and a branch with changes."""
+    if shutil.which("git") is None:
+        pytest.skip("Can't run git, unable to test changed files")
+    changed_files.get_repository_root.cache_clear()
+    changed_files.get_repository_changes.cache_clear()
+    repo = tmp_path / "repo"
+    package = repo / "package"
+    package.mkdir(parents=True)
+    (package / "same.py").write_text("x = 1\n")
+    (package / "changed.py").write_text("x = 1\n")
+    (package / "committed.py").write_text("x = 1\n")
+    (repo / "other.py").write_text("x = 1\n")
+    (repo / ".gitignore").write_text("*.log\n")
+    git(repo, "init", "-q", "-b", "main")
+    git(repo, "add", ".")
+    git(repo, "commit", "-q", "-m", "initial")
+    git(repo, "checkout", "-q", "-b", "feature")
+    (package / "committed.py").write_text("x = 2\n")
+    git(repo, "commit", "-q", "-am", "change")
+    (package / "changed.py").write_text("x = 2\n")
+    (package / "new.py").write_text("x = 1\n")
+    (package / "ignored.log").write_text("log\n")
+    yield repo
+    changed_files.get_repository_root.cache_clear()
+    changed_files.get_repository_changes.cache_clear()
+
+
+def test_get_changed_files(repo):
+    """Test finding files changed since a reference.
+
+    Expected result: committed, modified and untracked files in the package
+    """
+    package = repo / "package"
+    assert get_changed_files(str(package), "main") == {
+        str(package / "committed.py"),
+        str(package / "changed.py"),
+        str(package / "new.py"),
+    }
+
+
+def test_get_changed_files_ref_moved(repo):
+    """Test finding changed files when the reference has new commits.
+
+    Expected result: changes on the reference are not included
+    """
+    git(repo, "checkout", "-q", "main")
+    (repo / "package" / "same.py").write_text("x = 3\n")
+    git(repo, "commit", "-q", "-am", "main change")
+    git(repo, "checkout", "-q", "feature")
+
+    changed = get_changed_files(str(repo / "package"), "main")
+    assert str(repo / "package" / "same.py") not in changed
+    assert str(repo / "package" / "committed.py") in changed
+
+
+def test_get_changed_files_no_changes(repo):
+    """Test finding changed files in a directory without changes.
+
+    Expected result: empty set
+    """
+    (repo / "unchanged").mkdir()
+    assert get_changed_files(str(repo / "unchanged"), "main") == set()
+
+
+def test_get_changed_files_invalid_ref(repo):
+    """Test finding changed files since a reference that does not exist.
+
+    Expected result: None
+    """
+    assert get_changed_files(str(repo / "package"), "not-a-ref") is None
+
+
+def test_get_changed_files_not_repository(tmp_path):
+    """Test finding changed files outside of a git repository.
+
+    Expected result: None
+    """
+    assert get_changed_files(str(tmp_path), "main") is None
@@ -8,6 +8,7 @@ import mock
 import pytest
 
 from statick_tool.discovery_plugin import DiscoveryPlugin
+from statick_tool.exceptions import Exceptions
 from statick_tool.package import Package
 
 
@@ -44,8 +45,6 @@ def modified_environ(*remove, **update):
 def test_discovery_plugin_find_files():
     """Test calling find files."""
     dp = DiscoveryPlugin()
-    if not dp.file_command_exists():
-        pytest.skip("File command does not exist. Skipping test that requires it.")
     package = Package(
         "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
     )
@@ -67,22 +66,138 @@ def test_discovery_plugin_find_files():
 
     dp.find_files(package)
 
-    assert package._walked  # pylint: disable=protected-access
+    assert package.files_found
+    assert all("file_cmd_out" not in file_dict for file_dict in package.files.values())
+    for file_dict in package.files.values():
+        assert file_dict["file_cmd_out"]
     assert package.files == expected_dict
 
 
+@mock.patch("statick_tool.file_classifier.subprocess.check_output")
+def test_discovery_plugin_find_files_batched_file_cmd(mock_subprocess_check_output):
+    """Test that files which can't be classified in-process use one file command.
+
+    Expected result: file command run once for both unknown files, other files are
+    classified without it
+    """
+    mock_subprocess_check_output.return_value = (
+        "/tmp/pkg/a.unknown\0: C source, ASCII text\n"
+        "/tmp/pkg/b.unknown\0: ASCII text\n"
+    )
+    dp = DiscoveryPlugin()
+    package = Package("pkg", "/tmp/pkg")
+    with (
+        mock.patch("statick_tool.git_files.get_git_files", return_value=None),
+        mock.patch(
+            "statick_tool.discovery_plugin.walk",
+            return_value=[("/tmp/pkg", [], ["a.unknown", "b.unknown", "c.sh"])],
+        ),
+        mock.patch(
+            "statick_tool.file_classifier.classify_file",
+            side_effect=lambda path: (
+                "posix shell script" if path.endswith(".sh") else None
+            ),
+        ),
+        mock.patch(
+            "statick_tool.file_classifier.file_command_exists", return_value=True
+        ),
+    ):
+        dp.find_files(package)
+        assert not mock_subprocess_check_output.called
+        assert "c source" in package.files["/tmp/pkg/a.unknown"]["file_cmd_out"]
+
+    assert mock_subprocess_check_output.call_count == 1
+    assert (
+        package.files["/tmp/pkg/b.unknown"]["file_cmd_out"]
+        == "/tmp/pkg/b.unknown: ascii text\n"
+    )
+    assert (
+        package.files["/tmp/pkg/c.sh"].get("file_cmd_out")
+        == "/tmp/pkg/c.sh: posix shell script\n"
+    )
+
+
+def test_discovery_plugin_find_files_exceptions(tmp_path):
+    """Test that file exceptions for all tools are found once while finding files.
+
+    Expected result: excepted files are marked and the package keeps the matcher
+    """
+    exceptions_file = tmp_path / "exceptions.yaml"
+    exceptions_file.write_text(
+        "global:\n"
+        "  exceptions:\n"
+        "    file:\n"
+        "      - tools: all\n"
+        "        globs: ['*.sh']\n"
+        "      - tools: [cppcheck]\n"
+        "        globs: ['*.cpp']\n"
+    )
+    exceptions = Exceptions(str(exceptions_file))
+    dp = DiscoveryPlugin()
+    package = Package(
+        "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
+    )
+
+    dp.find_files(package, exceptions=exceptions)
+
+    excepted = [
+        os.path.basename(path)
+        for path, file_dict in package.files.items()
+        if file_dict.excepted
+    ]
+    assert excepted == ["test.sh"]
+    assert package.exception_matcher is exceptions.get_matcher(package)
+    assert exceptions.filter_file_exceptions_early(
+        package, sorted(package.files)
+    ) == sorted(path for path in package.files if not path.endswith(".sh"))
+    assert package.filter_excepted("cppcheck", sorted(package.files)) == sorted(
+        path for path in package.files if not path.endswith((".sh", ".cpp"))
+    )
+
+
+def test_discovery_plugin_find_files_exceptions_later(tmp_path):
+    """Test that excepted files are marked when exceptions come after the files.
+
+    Expected result: files found without exceptions are marked once exceptions are given
+    """
+    exceptions_file = tmp_path / "exceptions.yaml"
+    exceptions_file.write_text(
+        "global:\n"
+        "  exceptions:\n"
+        "    file:\n"
+        "      - tools: all\n"
+        "        globs: ['*.sh']\n"
+    )
+    exceptions = Exceptions(str(exceptions_file))
+    dp = DiscoveryPlugin()
+    package = Package(
+        "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
+    )
+
+    dp.find_files(package)
+    assert not any(file_dict.excepted for file_dict in package.files.values())
+    dp.find_files(package, exceptions=exceptions)
+
+    assert [
+        os.path.basename(path)
+        for path, file_dict in package.files.items()
+        if file_dict.excepted
+    ] == ["test.sh"]
+    assert package.exception_matcher is exceptions.get_matcher(package)
+
+
 def test_discovery_plugin_find_files_multiple():
     """Test that find_files will only walk the path once."""
     dp = DiscoveryPlugin()
     package = Package(
         "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
     )
-    package._walked = True  # pylint: disable=protected-access
+    package.files_found = True
     expected_dict = {}
 
     dp.find_files(package)
 
-    assert package._walked  # pylint: disable=protected-access
+    assert package.files_found
     assert package.files == expected_dict
 
 
@@ -0,0 +1,138 @@
+"""Tests for statick_tool.discovery_cache."""
+
+import argparse
+import os
+
+import mock
+
+from statick_tool.discovery_cache import DiscoveryCache
+from statick_tool.discovery_plugin import DiscoveryPlugin
+from statick_tool.package import Package
+
+
+def make_package(tmp_path):
+    """Make a package with two files in it."""
+    package_dir = tmp_path / "package"
+    package_dir.mkdir()
+    (package_dir / "test.py").write_text("x = 1\n")
+    (package_dir / "test.sh").write_text("#!/bin/sh\necho\n")
+    return Package("package", str(package_dir))
+
+
+def test_discovery_cache_open_disabled():
+    """Test opening the cache without a cache directory.
+
+    Expected result: no cache is returned
+    """
+    assert DiscoveryCache.open(argparse.Namespace(cache_dir=None)) is None
+    assert DiscoveryCache.open(argparse.Namespace()) is None
+
+
+def test_discovery_cache_open_error(tmp_path):
+    """Test opening the cache when the cache directory can't be created.
+
+    Expected result: no cache is returned
+    """
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("")
+    args = argparse.Namespace(cache_dir=str(not_a_dir / "cache"))
+    assert DiscoveryCache.open(args) is None
+
+
+def test_discovery_cache_reuses_file_types(tmp_path):
+    """Test that file types are reused when files have not changed.
+
+    Expected result: second walk does not classify any files
+    """
+    cache = DiscoveryCache(str(tmp_path / "cache"))
+    package = make_package(tmp_path)
+    DiscoveryPlugin().find_files(package, cache)
+    file_types = {path: fd["file_cmd_out"] for path, fd in package.files.items()}
+    cache.update_files(package, package.file_stats)
+
+    package = Package(package.name, package.path)
+    with mock.patch("statick_tool.file_classifier.classify_file") as mock_classify_file:
+        DiscoveryPlugin().find_files(package, cache)
+        assert {
+            path: fd["file_cmd_out"] for path, fd in package.files.items()
+        } == file_types
+        assert not mock_classify_file.called
+    cache.close()
+
+
+def test_discovery_cache_changed_file(tmp_path):
+    """Test that a changed file is classified again.
+
+    Expected result: only the changed file is classified
+    """
+    cache = DiscoveryCache(str(tmp_path / "cache"))
+    package = make_package(tmp_path)
+    DiscoveryPlugin().find_files(package, cache)
+    for file_dict in package.files.values():
+        file_dict.get("file_cmd_out")
+    cache.update_files(package, package.file_stats)
+
+    changed = os.path.join(package.path, "test.sh")
+    with open(changed, "a", encoding="utf8") as fid:
+        fid.write("echo again\n")
+    package = Package(package.name, package.path)
+    with mock.patch(
+        "statick_tool.file_classifier.classify_file", return_value="changed"
+    ) as mock_classify_file:
+        DiscoveryPlugin().find_files(package, cache)
+        assert package.files[changed]["file_cmd_out"] == changed.lower() + ": changed\n"
+        mock_classify_file.assert_called_once_with(changed)
+    cache.close()
+
+
+def test_discovery_cache_evicts_stale_files(tmp_path):
+    """Test that removed files are removed from the cache.
+
+    Expected result: removed file has no cache entry
+    """
+    cache = DiscoveryCache(str(tmp_path / "cache"))
+    package = make_package(tmp_path)
+    DiscoveryPlugin().find_files(package, cache)
+    cache.update_files(package, package.file_stats)
+    removed = os.path.join(package.path, "test.py")
+    assert removed in cache.get_files(package)
+
+    os.remove(removed)
+    package = Package(package.name, package.path)
+    DiscoveryPlugin().find_files(package, cache)
+    cache.update_files(package, package.file_stats)
+
+    assert removed not in cache.get_files(package)
+    assert len(cache.get_files(package)) == 1
+    cache.close()
+
+
+def test_discovery_cache_results(tmp_path):
+    """Test storing and getting results of a discovery plugin.
+
+    Expected result: results only returned for a matching fingerprint
+    """
+    cache = DiscoveryCache(str(tmp_path / "cache"))
+    package = make_package(tmp_path)
+    DiscoveryPlugin().find_files(package, cache)
+    fingerprint = cache.get_fingerprint(package, package.file_stats, "python", "lvl")
+    results = {"python_src": [os.path.join(package.path, "test.py")]}
+    cache.set_results(package, "python", fingerprint, results)
+
+    assert cache.get_results(package, "python", fingerprint) == results
+    other = cache.get_fingerprint(package, package.file_stats, "python", "other")
+    assert other != fingerprint
+    assert cache.get_results(package, "python", other) is None
+    cache.close()
+
+
+def test_discovery_cache_results_not_serializable(tmp_path):
+    """Test storing results that can't be stored.
+
+    Expected result: no results are stored
+    """
+    cache = DiscoveryCache(str(tmp_path / "cache"))
+    package = make_package(tmp_path)
+    cache.set_results(package, "plugin", "abc", {"key": object()})
+    assert cache.get_results(package, "plugin", "abc") is None
+    cache.close()
@@ -1,13 +1,21 @@
 """Unit tests for the Exceptions module."""
 
+import fnmatch
 import os
 import tempfile
 from tempfile import TemporaryDirectory
 
+import mock
 import pytest
 
-from statick_tool.exceptions import Exceptions
-from statick_tool.issue import Issue
+from statick_tool import exceptions as exceptions_module
+from statick_tool.exceptions import (
+    ExceptionMatcher,
+    Exceptions,
+    NolintIndex,
+    compile_globs,
+)
+from statick_tool.issue import Issue, IssueTable
 from statick_tool.package import Package
 
 
@@ -441,6 +449,98 @@ def test_filter_issues_nolint_file_not_found_error():
     assert len(issues) == len(filtered_issues)
 
 
+def test_filter_issues_nolint_markers(tmp_path):
+    """Test that issues are filtered based on configured suppression markers.
+
+    Expected result: only the issues on lines with a configured marker are removed
+    """
+    exceptions = Exceptions(
+        os.path.join(os.path.dirname(__file__), "nolint_markers_exceptions.yaml")
+    )
+    assert exceptions.get_nolint_markers() == ["noqa", "statick: ignore"]
+
+    filename = str(tmp_path / "x.py")
+    with open(filename, "wb") as fid:
+        fid.write(b"x = 0  # noqa\r\ny = 0  # NOLINT\rz = 0  # statick: ignore\n")
+    issues = {
+        "pylint": [
+            Issue(filename, line, "pylint", "type", 3, "message", None)
+            for line in (1, 2, 3)
+        ],
+        "flake8": [Issue(filename, 3, "flake8", "type", 3, "message", None)],
+    }
+
+    issues = exceptions.filter_nolint(issues)
+    assert [issue.line_number for issue in issues["pylint"]] == [2]
+    assert not issues["flake8"]
+
+
+def test_filter_issues_table(tmp_path):
+    """Test that issues in an issue table are filtered without making lists.
+
+    Expected result: excepted and suppressed issues are removed from the table
+    """
+    package = Package(
+        "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
+    )
+    exceptions = Exceptions(
+        os.path.join(os.path.dirname(__file__), "valid_exceptions.yaml")
+    )
+    filename = str(tmp_path / "x.py")
+    with open(filename, "w", encoding="utf8") as fid:
+        fid.write("x = 0\ny = 0  # NOLINT\n")
+    message = (
+        "R0205: Class 'Example' inherits from object, can be safely removed from "
+        "bases in python3"
+    )
+    issues = {
+        "pylint": IssueTable(
+            [
+                Issue(filename, 1, "pylint", "R0205", 5, message, None),
+                Issue(filename, 1, "pylint", "C0103", 3, "invalid name", None),
+                Issue(filename, 2, "pylint", "C0103", 3, "invalid name", None),
+            ]
+        )
+    }
+
+    issues = exceptions.filter_issues(package, issues)
+    assert isinstance(issues["pylint"], IssueTable)
+    assert issues["pylint"] == [
+        Issue(filename, 1, "pylint", "C0103", 3, "invalid name", None)
+    ]
+
+
+def test_nolint_index_reads_once(tmp_path):
+    """Test that each file is read once no matter how many issues it has.
+
+    Expected result: the file is read once and the marked lines are found
+    """
+    filename = str(tmp_path / "x.cpp")
+    with open(filename, "w", encoding="utf-8") as fid:
+        fid.write("int x;  // NOLINT\nint y;\n\nint z;  // NOLINT\n")
+    index = NolintIndex()
+
+    with mock.patch.object(index, "read_lines", wraps=index.read_lines) as read_lines:
+        suppressed = [
+            index.is_suppressed(filename, line) for line in (0, 1, 2, 3, 4, 5)
+        ]
+    assert suppressed == [False, True, False, False, True, False]
+    read_lines.assert_called_once_with(filename)
+
+
+@mock.patch.object(exceptions_module, "MMAP_SIZE", 16)
+def test_nolint_index_mmap(tmp_path):
+    """Test that large files are memory mapped to find markers.
+
+    Expected result: the marked lines are found in the mapped file
+    """
+    filename = str(tmp_path / "x.cpp")
+    with open(filename, "w", encoding="utf-8") as fid:
+        fid.write("int x;\n" * 100 + "int y;  // NOLINT\n")
+
+    assert NolintIndex().read_lines(filename) == frozenset([101])
+
+
 def test_filter_issues_nolint_not_abs_path():
     """Test that issues are not filtered based on NOLINT comment when not absolute path.
 
@@ -492,3 +592,90 @@ def test_filter_issues_wildcard_exceptions():
 
     issues = exceptions.filter_issues(package, issues)
     assert len(issues["pylint"]) == 1
+
+
+def test_exception_matcher_tools():
+    """Test that file exceptions only apply to the tools they list.
+
+    Expected result: issues are removed by absolute and relative globs for the
+    listed tool, and by regexes limited to globs
+    """
+    package_path = os.path.join(os.path.dirname(__file__), "valid_package")
+    matcher = ExceptionMatcher(
+        package_path,
+        [
+            {"tools": ["pylint"], "globs": ["*/x.py"]},
+            {"tools": "all", "globs": ["src/*"]},
+        ],
+        [
+            {"tools": ["mypy"], "regex": "error: .*", "globs": ["*/y.py"]},
+            {"tools": "all", "regex": "[invalid"},
+        ],
+    )
+    x_path = os.path.join(package_path, "x.py")
+    y_path = os.path.join(package_path, "y.py")
+    src_path = os.path.join(package_path, "src", "z.py")
+    assert matcher.is_excepted("pylint", Issue(x_path, 1, "pylint", "a", 1, "m", None))
+    assert not matcher.is_excepted("mypy", Issue(x_path, 1, "mypy", "a", 1, "m", None))
+    assert matcher.is_excepted("mypy", Issue(src_path, 1, "mypy", "a", 1, "m", None))
+    assert matcher.is_excepted(
+        "mypy", Issue(y_path, 1, "mypy", "a", 1, "error: bad", None)
+    )
+    assert not matcher.is_excepted(
+        "mypy", Issue(x_path, 1, "mypy", "a", 1, "error: bad", None)
+    )
+    assert not matcher.is_file_excepted(src_path)
+    assert not matcher.is_file_excepted(x_path)
+
+
+def test_exception_matcher_duplicate_issues():
+    """Test that every copy of an excepted issue is removed.
+
+    Expected result: only the issue in the other file is left
+    """
+    package_path = os.path.join(os.path.dirname(__file__), "valid_package")
+    matcher = ExceptionMatcher(
+        package_path, [{"tools": "all", "globs": ["*/x.py"]}], []
+    )
+    x_issue = Issue(os.path.join(package_path, "x.py"), 1, "pylint", "a", 1, "m", None)
+    y_issue = Issue(os.path.join(package_path, "y.py"), 1, "pylint", "a", 1, "m", None)
+    issues = matcher.filter_issues({"pylint": [x_issue, y_issue, x_issue]})
+    assert issues == {"pylint": [y_issue]}
+
+
+def test_compile_globs_matches_fnmatch():
+    """Test that combined globs match the same paths as fnmatch.
+
+    Expected result: each path matches the combined globs if it matches any glob
+    """
+    globs = [
+        "*/build/*",
+        "*/src/*.py",
+        "*/src/[ab]?.cpp",
+        "*[!x].h",
+        "docs/*",
+        "setup.py",
+        "[unclosed",
+        "*",
+    ]
+    paths = [
+        "/ws/build/a.cpp",
+        "/ws/src/x.py",
+        "/ws/src/ab.cpp",
+        "/ws/src/ac.cpp",
+        "/ws/src/cd.cpp",
+        "/ws/include/y.h",
+        "/ws/include/x.h",
+        "docs/index.md",
+        "setup.py",
+        "[unclosed",
+        "",
+    ]
+    for count in range(len(globs)):
+        compiled = compile_globs(globs[:count])
+        for path in paths:
+            expected = any(fnmatch.fnmatch(path, glob) for glob in globs[:count])
+            assert bool(compiled and compiled.match(path)) == expected, (
+                globs[:count],
+                path,
+            )
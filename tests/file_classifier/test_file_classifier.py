@@ -0,0 +1,107 @@
+"""Tests for statick_tool.file_classifier."""
+
+import os
+import subprocess
+
+import mock
+import pytest
+
+from statick_tool import file_classifier
+
+
+@pytest.mark.parametrize(
+    "filename, contents, expected",
+    [
+        ("empty", b"", "empty"),
+        ("run", b"#!/usr/bin/env python3\nprint(1)\n", "python script"),
+        ("run", b"#!/usr/bin/python3.11\n", "python script"),
+        ("run", b"#!/bin/bash\necho\n", "bourne-again shell script"),
+        ("run", b"#!/bin/sh\necho\n", "posix shell script"),
+        ("run", b"#!/usr/bin/env zsh\n", "zsh script"),
+        ("run", b"#!/usr/bin/env dash\n", "dash script"),
+        ("run", b"#!/usr/bin/perl -w\n", "perl script"),
+        ("test.c", b"int main() {}\n", "c source"),
+        ("test.hpp", b"class A {};\n", "c++ source"),
+        ("test.py", b"x = 1\n", "python script"),
+        ("index.html", b"<html></html>\n", "html document"),
+        ("paper.tex", b"\\documentclass{article}\n", "latex document"),
+        ("refs.bib", b"@article{a}\n", "bibtex text file"),
+        ("notes.txt", "caf\u00e9\n".encode("utf-8"), "utf-8 text"),
+        ("image.png", b"\x89PNG\r\n\x1a\n\x00\x00", "png image data"),
+        ("Test.class", b"\xca\xfe\xba\xbe\x00\x00", "compiled java class data"),
+    ],
+)
+def test_classify_file(tmp_path, filename, contents, expected):
+    """Test classifying files from their contents and extension.
+
+    Expected result: description contains the same text as the file command output
+    """
+    path = tmp_path / filename
+    path.write_bytes(contents)
+    assert expected in file_classifier.classify_file(str(path))
+
+
+@pytest.mark.parametrize(
+    "filename, contents",
+    [
+        ("README", b"some text\n"),
+        ("data.bin", b"\x00\x01\x02\x03"),
+    ],
+)
+def test_classify_file_undecided(tmp_path, filename, contents):
+    """Test files that can't be classified in-process.
+
+    Expected result: None is returned
+    """
+    path = tmp_path / filename
+    path.write_bytes(contents)
+    assert file_classifier.classify_file(str(path)) is None
+
+
+def test_classify_file_missing():
+    """Test classifying a file that doesn't exist.
+
+    Expected result: None is returned
+    """
+    assert file_classifier.classify_file("/not/a/real/file") is None
+
+
+def test_get_file_cmd_outputs(tmp_path):
+    """Test running the file command on a batch of files.
+
+    Expected result: output for each file matches running file on a single file
+    """
+    if not file_classifier.file_command_exists():
+        pytest.skip("File command does not exist. Skipping test that requires it.")
+    empty = tmp_path / "Empty"
+    empty.write_bytes(b"")
+    script = tmp_path / "script"
+    script.write_bytes(b"#!/bin/sh\necho\n")
+
+    outputs = file_classifier.get_file_cmd_outputs([str(empty), str(script)])
+
+    assert outputs[str(empty)] == (str(empty) + ": empty\n").lower()
+    assert "shell script" in outputs[str(script)]
+
+
+@mock.patch("statick_tool.file_classifier.subprocess.check_output")
+def test_get_file_cmd_outputs_calledprocess_error(mock_subprocess_check_output):
+    """Test what happens when a CalledProcessError is raised.
+
+    Expected result: no outputs are returned
+    """
+    mock_subprocess_check_output.side_effect = subprocess.CalledProcessError(
+        1, "", output="mocked error"
+    )
+    with mock.patch(
+        "statick_tool.file_classifier.file_command_exists", return_value=True
+    ):
+        assert not file_classifier.get_file_cmd_outputs(["/tmp/x"])
+
+
+def test_file_command_exists_no_path():
+    """Test when file command is not on the search path.
+
+    Expected result: False is returned
+    """
+    assert not file_classifier.find_file_command(os.path.join("not", "a", "path"))
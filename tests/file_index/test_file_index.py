@@ -0,0 +1,166 @@
+"""Tests for statick_tool.file_index."""
+
+from statick_tool.file_index import FileIndex, FileRule
+from statick_tool.file_record import FileRecord
+from statick_tool.package import Package
+
+
+def make_package(files):
+    """Make a package with files that have known file types."""
+    package = Package("pkg", "/tmp/pkg")
+    for name, file_type in files:
+        path = f"/tmp/pkg/{name}"
+        package.files[path] = {
+            "name": name.lower(),
+            "path": path,
+            "file_cmd_out": f"{path}: {file_type}\n".lower(),
+        }
+    return package
+
+
+def test_file_index_find_extensions():
+    """Test finding files by extension.
+
+    Expected result: files are found in package order, and excluded files are not found
+    """
+    package = make_package(
+        [
+            ("b.js", "ascii text"),
+            ("a.min.js", "ascii text"),
+            ("c.JS", "ascii text"),
+            ("d.json", "ascii text"),
+            ("e..js", "ascii text"),
+        ]
+    )
+    found = package.get_file_index().find(
+        FileRule(extensions=(".js",), exclude=(".min.js",))
+    )
+    assert found == ["/tmp/pkg/b.js", "/tmp/pkg/c.JS", "/tmp/pkg/e..js"]
+
+
+def test_file_index_find_extension_without_dot():
+    """Test finding files by the end of their names.
+
+    Expected result: files ending with the extension are found
+    """
+    index = FileIndex(make_package([("a.yaml", "text"), ("yaml", "text")]).files)
+    assert index.find(FileRule(extensions=("yaml",))) == [
+        "/tmp/pkg/a.yaml",
+        "/tmp/pkg/yaml",
+    ]
+
+
+def test_file_index_find_excepted():
+    """Test leaving out files that are excepted for all tools.
+
+    Expected result: excepted files only found when asked for
+    """
+    package = Package("pkg", "/tmp/pkg")
+    for name in ("a.py", "b.py", "c.py"):
+        path = f"/tmp/pkg/{name}"
+        package.files[path] = FileRecord(path, file_cmd_out="python script\n")
+    package.files["/tmp/pkg/b.py"].excepted = True
+    index = package.get_file_index()
+    rule = FileRule(extensions=(".py",))
+    assert index.find(rule) == ["/tmp/pkg/a.py", "/tmp/pkg/b.py", "/tmp/pkg/c.py"]
+    assert index.find(rule, include_excepted=False) == [
+        "/tmp/pkg/a.py",
+        "/tmp/pkg/c.py",
+    ]
+
+
+def test_file_index_find_names_and_prefixes():
+    """Test finding files by name and by the start of their names.
+
+    Expected result: each file is found once
+    """
+    package = make_package(
+        [
+            ("Dockerfile", "ascii text"),
+            ("dockerfile.dev", "ascii text"),
+            ("docker-compose.yml", "ascii text"),
+            ("dockerfile.yaml", "ascii text"),
+            ("sub/dockerfile", "ascii text"),
+        ]
+    )
+    for file_dict in package.files.values():
+        file_dict["name"] = file_dict["name"].rsplit("/", 1)[-1]
+    found = package.get_file_index().find(
+        FileRule(
+            names=("dockerfile",),
+            prefixes=("dockerfile",),
+            exclude=(".yaml", ".yml"),
+        )
+    )
+    assert found == [
+        "/tmp/pkg/Dockerfile",
+        "/tmp/pkg/dockerfile.dev",
+        "/tmp/pkg/sub/dockerfile",
+    ]
+
+
+def test_file_index_find_types():
+    """Test finding files by file type.
+
+    Expected result: the file type is matched but not the path of the file
+    """
+    package = make_package(
+        [
+            ("run", "python script, ascii text executable"),
+            ("setup.cfg", "python script, ascii text"),
+            ("python script", "ascii text"),
+            ("a.py", "ascii text"),
+        ]
+    )
+    found = package.get_file_index().find(
+        FileRule(extensions=(".py",), types=("python script",), exclude=(".cfg",))
+    )
+    assert found == ["/tmp/pkg/run", "/tmp/pkg/a.py"]
+
+
+def test_file_index_types_resolved_lazily():
+    """Test that file types are only used for rules that need them.
+
+    Expected result: file types are not read for a rule without types
+    """
+
+    class FileDict(dict):
+        """File dictionary that records reads of the file type."""
+
+        reads = 0
+
+        def __getitem__(self, key):
+            if key == "file_cmd_out":
+                FileDict.reads += 1
+            return super().__getitem__(key)
+
+    package = make_package([("a.py", "python script"), ("b", "python script")])
+    package.files = {path: FileDict(value) for path, value in package.files.items()}
+    index = package.get_file_index()
+    assert index.find(FileRule(extensions=(".py",))) == ["/tmp/pkg/a.py"]
+    assert FileDict.reads == 0
+    assert index.find(FileRule(types=("python script",))) == [
+        "/tmp/pkg/a.py",
+        "/tmp/pkg/b",
+    ]
+    assert FileDict.reads == 2
+
+
+def test_package_file_index_rebuilt():
+    """Test that the index of a package is made again when files are found.
+
+    Expected result: the same index is returned until files are added
+    """
+    package = make_package([("a.md", "ascii text")])
+    index = package.get_file_index()
+    assert package.get_file_index() is index
+    package.files["/tmp/pkg/b.md"] = {
+        "name": "b.md",
+        "path": "/tmp/pkg/b.md",
+        "file_cmd_out": "/tmp/pkg/b.md: ascii text\n",
+    }
+    assert package.get_file_index() is not index
+    assert package.get_file_index().find(FileRule(extensions=(".md",))) == [
+        "/tmp/pkg/a.md",
+        "/tmp/pkg/b.md",
+    ]
@@ -0,0 +1,73 @@
+"""Tests for statick_tool.file_record."""
+
+import pickle
+
+import mock
+
+from statick_tool.file_record import FILE_TYPES, FileRecord, FileTypeResolver
+
+
+def test_file_record_mapping():
+    """Test that a record can be used like a dictionary.
+
+    Expected result: the record has name, path, and file_cmd_out keys
+    """
+    record = FileRecord("/tmp/pkg/Test.CPP", None, "/tmp/pkg/test.cpp: c++ source\n")
+    expected = {
+        "name": "test.cpp",
+        "path": "/tmp/pkg/Test.CPP",
+        "file_cmd_out": "/tmp/pkg/test.cpp: c++ source\n",
+    }
+    assert record == expected
+    assert dict(record) == expected
+    assert record["name"] == "test.cpp"
+    assert record.get("file_cmd_out") == "/tmp/pkg/test.cpp: c++ source\n"
+    assert record.get("missing", "default") == "default"
+    assert record.description == ": c++ source\n"
+    assert not hasattr(record, "__dict__")
+
+
+def test_file_record_shared_type_codes():
+    """Test that files with the same file type share a code.
+
+    Expected result: the code is the same, and the output without the path is kept
+    """
+    first = FileRecord("/tmp/a.sh", None, "/tmp/a.sh: posix shell script\n")
+    second = FileRecord("/tmp/b.sh", None, "/tmp/b.sh: posix shell script\n")
+    failed = FileRecord("/tmp/c.sh", None, "")
+    assert first.type_code == second.type_code
+    assert FILE_TYPES.get_description(first.type_code) == ": posix shell script\n"
+    assert second["file_cmd_out"] == "/tmp/b.sh: posix shell script\n"
+    assert failed["file_cmd_out"] == ""
+
+
+def test_file_record_resolved_on_first_use():
+    """Test that file types are found for all pending files when one is needed.
+
+    Expected result: the file type is not known until it is asked for
+    """
+    resolver = FileTypeResolver()
+    records = [FileRecord(f"/tmp/pkg/{name}", resolver) for name in ("a.py", "b")]
+    assert "file_cmd_out" not in records[0]
+    assert list(records[0]) == ["name", "path"]
+    assert records[0].get_file_cmd_out(resolve=False) is None
+    with mock.patch(
+        "statick_tool.file_classifier.classify_file", return_value="python script"
+    ) as mock_classify_file:
+        assert records[1]["file_cmd_out"] == "/tmp/pkg/b: python script\n"
+        assert mock_classify_file.call_count == 2
+    assert "file_cmd_out" in records[0]
+    assert records[0]["file_cmd_out"] == "/tmp/pkg/a.py: python script\n"
+    assert not resolver.pending
+
+
+def test_file_record_pickle():
+    """Test that a record can be pickled.
+
+    Expected result: the file type and whether the file is excepted are kept
+    """
+    record = FileRecord("/tmp/a.md", None, "/tmp/a.md: ascii text\n")
+    record.excepted = True
+    copy = pickle.loads(pickle.dumps(record))
+    assert copy == record
+    assert copy.excepted
@@ -0,0 +1,133 @@
+"""Tests for statick_tool.git_files."""
+
+import argparse
+import shutil
+import subprocess
+
+import mock
+import pytest
+
+from statick_tool.discovery_plugin import DiscoveryPlugin
+from statick_tool.git_files import get_git_files, get_package_git_files
+from statick_tool.package import Package
+from statick_tool.plugin_context import PluginContext
+
+
+def git(repo, *args):
+    """Run a git command in a repository."""
+    return subprocess.check_output(
+        ["git", "-C", str(repo), "-c", "user.name=test", "-c", "user.email=test@test"]
+        + list(args),
+        universal_newlines=True,
+    ).strip()
+
+
+@pytest.fixture(name="repo")
+def fixture_repo(tmp_path):
+    """Make a git repository with a package with tracked and untracked files."""
+    if shutil.which("git") is None:
+        pytest.skip("Can't run git, unable to test finding files with git")
+    repo = tmp_path / "repo"
+    package = repo / "package"
+    (package / "src").mkdir(parents=True)
+    (package / "same.py").write_text("x = 1\n")
+    (package / "changed.py").write_text("x = 1\n")
+    (package / "deleted.py").write_text("x = 1\n")
+    (package / "src" / "nested.py").write_text("x = 1\n")
+    (repo / "other.py").write_text("x = 1\n")
+    (repo / ".gitignore").write_text("*.log\nbuild/\n")
+    git(repo, "init", "-q")
+    git(repo, "add", ".")
+    git(repo, "commit", "-q", "-m", "initial")
+    (package / "changed.py").write_text("x = 2\n")
+    (package / "deleted.py").unlink()
+    (package / "new.py").write_text("x = 1\n")
+    (package / "ignored.log").write_text("log\n")
+    (package / "build").mkdir()
+    (package / "build" / "generated.py").write_text("x = 1\n")
+    return repo
+
+
+def test_get_git_files(repo):
+    """Test finding the files in a package from git.
+
+    Expected result: tracked and untracked files, with hashes of unmodified files
+    """
+    package = repo / "package"
+    files = get_git_files(str(package))
+    assert files == {
+        str(package / "same.py"): git(repo, "hash-object", str(package / "same.py")),
+        str(package / "changed.py"): None,
+        str(package / "new.py"): None,
+        str(package / "src" / "nested.py"): git(
+            repo, "hash-object", str(package / "src" / "nested.py")
+        ),
+    }
+
+
+def test_get_git_files_not_repository(tmp_path):
+    """Test finding files outside of a git repository.
+
+    Expected result: None
+    """
+    if shutil.which("git") is None:
+        pytest.skip("Can't run git, unable to test finding files with git")
+    (tmp_path / "test.py").write_text("x = 1\n")
+    assert get_git_files(str(tmp_path)) is None
+
+
+def test_get_git_files_nested_repository(repo):
+    """Test finding files when a package has another repository in it.
+
+    Expected result: None, so the package is walked instead
+    """
+    nested = repo / "package" / "nested"
+    nested.mkdir()
+    (nested / "test.py").write_text("x = 1\n")
+    git(nested, "init", "-q")
+    assert get_git_files(str(repo / "package")) is None
+
+
+def test_get_package_git_files(repo, tmp_path):
+    """Test that git is only asked for the files of a package once.
+
+    Expected result: files and hashes kept with the package, None outside a repository
+    """
+    package = Package("package", str(repo / "package"))
+    git_files = get_package_git_files(package)
+    assert git_files == get_git_files(package.path)
+    assert str(repo / "package" / "same.py") in package.file_hashes
+    with mock.patch("statick_tool.git_files.get_git_files") as mock_get_git_files:
+        assert get_package_git_files(package) is git_files
+        mock_get_git_files.assert_not_called()
+
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    package = Package("outside", str(outside))
+    assert get_package_git_files(package) is None
+    assert get_package_git_files(package) is None
+    assert not package.file_hashes
+
+
+def test_find_files_git(repo):
+    """Test that discovery finds files with git when the package is in a repository.
+
+    Expected result: ignored files are not found unless git is not used
+    """
+    package = Package("package", str(repo / "package"))
+    DiscoveryPlugin().find_files(package)
+    assert sorted(package.files) == sorted(get_git_files(package.path))
+    assert package.file_hashes == {
+        path: file_hash
+        for path, file_hash in get_git_files(package.path).items()
+        if file_hash is not None
+    }
+
+    args = argparse.Namespace(no_git_files=True)
+    plugin = DiscoveryPlugin()
+    plugin.set_plugin_context(PluginContext(args, None, None))
+    package = Package("package", str(repo / "package"))
+    plugin.find_files(package)
+    assert str(repo / "package" / "ignored.log") in package.files
+    assert str(repo / "package" / "build" / "generated.py") in package.files
+    assert not package.file_hashes
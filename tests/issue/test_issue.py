@@ -0,0 +1,81 @@
+"""Tests for statick_tool.issue."""
+
+import pickle
+
+from statick_tool.issue import Issue, IssueTable
+
+
+def make_issues():
+    """Make issues that share file names, tools and issue types."""
+    return [
+        Issue("/tmp/a.py", 1, "pylint", "C0111", 1, "missing docstring", None),
+        Issue("/tmp/a.py", 7, "pylint", "W0611", 3, "unused import", None),
+        Issue("/tmp/b.py", 2, "pylint", "C0111", 1, "missing docstring", "CERT-1"),
+    ]
+
+
+def test_issue_table_iterate():
+    """Test that a table gives back the issues added to it.
+
+    Expected result: issues are the same and strings are stored once
+    """
+    issues = make_issues()
+    table = IssueTable(issues)
+    assert len(table) == 3
+    assert list(table) == issues
+    assert table == issues
+    assert table[1] == issues[1]
+    assert table[-1] == issues[-1]
+    assert table[1:] == issues[1:]
+    assert isinstance(table[1:], IssueTable)
+    assert table.strings.count("/tmp/a.py") == 1
+    assert table.strings.count("pylint") == 1
+
+
+def test_issue_table_extend():
+    """Test adding a table to another table.
+
+    Expected result: issues from both tables are kept, in order
+    """
+    issues = make_issues()
+    table = IssueTable(issues[:1])
+    other = IssueTable(reversed(issues))
+    table += other
+    table.append(issues[0])
+    assert table == issues[:1] + list(reversed(issues)) + issues[:1]
+    assert len(table.strings) == len(set(table.strings))
+
+
+def test_issue_table_filter():
+    """Test filtering a table.
+
+    Expected result: a table with only the kept issues
+    """
+    issues = make_issues()
+    table = IssueTable(issues)
+    filtered = table.filter(lambda issue: issue.filename == "/tmp/a.py")
+    assert isinstance(filtered, IssueTable)
+    assert filtered == issues[:2]
+    assert table == issues
+
+
+def test_issue_table_non_integer_numbers():
+    """Test that line numbers that are not integers are kept as they are.
+
+    Expected result: the issue is the same as the one added
+    """
+    issues = make_issues()
+    odd = Issue("/tmp/c.rst", None, "rstlint", "warning", 3, "title", None)
+    table = IssueTable(issues)
+    table.append(odd)
+    table.extend(IssueTable(issues))
+    assert table == issues + [odd] + issues
+
+
+def test_issue_table_pickle():
+    """Test that a table can be pickled.
+
+    Expected result: the issues are the same after unpickling
+    """
+    table = IssueTable(make_issues())
+    assert pickle.loads(pickle.dumps(table)) == make_issues()
@@ -0,0 +1,136 @@
+"""Tests for statick_tool.issue_stream."""
+
+import os
+
+from statick_tool.exceptions import Exceptions
+from statick_tool.issue import Issue
+from statick_tool.issue_stream import IssueStream
+from statick_tool.package import Package
+from statick_tool.reporting_plugin import ReportingPlugin
+
+
+class RecordingReportingPlugin(ReportingPlugin):
+    """Reporting plugin that records the calls made to it."""
+
+    def __init__(self):
+        """Initialize the plugin."""
+        self.calls = []
+
+    def get_name(self):
+        """Get the name of the plugin."""
+        return "recording"
+
+    def begin(self, package, level):
+        """Record the start of the report."""
+        self.calls.append(("begin", package.name, level))
+
+    def add_issues(self, tool, issues):
+        """Record issues added to the report."""
+        self.calls.append(("add_issues", tool, list(issues)))
+
+    def finish(self):
+        """Record the end of the report."""
+        self.calls.append(("finish",))
+        return None, True
+
+
+class BufferedReportingPlugin(ReportingPlugin):
+    """Reporting plugin that only implements `report`."""
+
+    def __init__(self):
+        """Initialize the plugin."""
+        self.reports = []
+
+    def get_name(self):
+        """Get the name of the plugin."""
+        return "buffered"
+
+    def report(self, package, issues, level):
+        """Record the report."""
+        self.reports.append((package.name, {k: list(v) for k, v in issues.items()}))
+        return None, True
+
+
+def make_issue(filename, line_number=1, tool="tool_a"):
+    """Make an issue for a tool."""
+    return Issue(filename, line_number, tool, "type", 1, "message", None)
+
+
+def test_issue_stream_reports_batches():
+    """Test that each batch is added to reporting plugins as it arrives.
+
+    Expected result: begin, one call for each batch, then finish
+    """
+    package = Package("package", "/tmp/package")
+    plugin = RecordingReportingPlugin()
+    stream = IssueStream(package, "level", [plugin])
+    first = [make_issue("/tmp/package/a.py")]
+    second = [make_issue("/tmp/package/b.py")]
+
+    stream.begin()
+    stream.add_issues("tool_a", first)
+    stream.add_issues("tool_a", second)
+    stream.add_issues("tool_b", [])
+    stream.finish()
+
+    assert plugin.calls == [
+        ("begin", "package", "level"),
+        ("add_issues", "tool_a", first),
+        ("add_issues", "tool_a", second),
+        ("add_issues", "tool_b", []),
+        ("finish",),
+    ]
+    assert stream.issues == {"tool_a": first + second, "tool_b": []}
+    assert len(stream.durations) == 1
+
+
+def test_issue_stream_filters_batches(tmp_path):
+    """Test that exceptions are applied to each batch before it is reported.
+
+    Expected result: excepted and suppressed issues are not reported
+    """
+    exceptions = Exceptions(
+        os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            "exceptions",
+            "valid_exceptions.yaml",
+        )
+    )
+    package = Package("package", str(tmp_path))
+    source = tmp_path / "a.py"
+    source.write_text("x = 0\ny = 0  # NOLINT\n")
+    plugin = RecordingReportingPlugin()
+    stream = IssueStream(package, "level", [plugin], exceptions)
+    kept = make_issue(str(source), 1)
+
+    stream.begin()
+    stream.add_issues(
+        "tool_a",
+        [kept, make_issue(str(source), 2), make_issue(str(tmp_path / "example.py"))],
+    )
+    stream.add_issues("tool_a", [make_issue(str(source), 2)], filtered=True)
+    stream.finish()
+
+    assert plugin.calls[1] == ("add_issues", "tool_a", [kept])
+    assert plugin.calls[2] == ("add_issues", "tool_a", [make_issue(str(source), 2)])
+
+
+def test_issue_stream_buffered_reporting_plugin():
+    """Test that plugins without streaming support get all issues at the end.
+
+    Expected result: report is called once with the issues of every tool
+    """
+    package = Package("package", "/tmp/package")
+    plugin = BufferedReportingPlugin()
+    stream = IssueStream(package, "level", [plugin])
+    issues = [make_issue("/tmp/package/a.py", line) for line in (1, 2)]
+
+    stream.begin()
+    stream.add_issues("tool_a", issues[:1])
+    assert not plugin.reports
+    stream.add_issues("tool_a", issues[1:])
+    stream.add_issues("tool_b", [])
+    stream.finish()
+
+    assert plugin.reports == [("package", {"tool_a": issues, "tool_b": []})]
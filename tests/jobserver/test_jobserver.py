@@ -0,0 +1,72 @@
+"""Tests for statick_tool.jobserver."""
+
+import multiprocessing
+import sys
+
+import pytest
+
+from statick_tool.jobserver import JobServer
+
+
+def test_jobserver_acquire_release():
+    """Test taking and returning tokens.
+
+    Expected result: tokens can't be taken once the pool is empty
+    """
+    jobserver = JobServer(2)
+    assert jobserver.acquire(block=False)
+    assert jobserver.acquire()
+    assert not jobserver.acquire(block=False)
+    jobserver.release()
+    assert jobserver.acquire(block=False)
+    jobserver.close()
+
+
+def test_jobserver_acquire_extra():
+    """Test taking more tokens than are available.
+
+    Expected result: only the available tokens are taken
+    """
+    jobserver = JobServer(3)
+    assert jobserver.acquire_extra(5) == 3
+    assert jobserver.acquire_extra(1) == 0
+    jobserver.release(3)
+    assert jobserver.acquire_extra(2) == 2
+    jobserver.close()
+
+
+def test_jobserver_jobs():
+    """Test getting the number of parallel jobs to run.
+
+    Expected result: jobs include the held token, tokens are returned afterwards
+    """
+    jobserver = JobServer(2)
+    with jobserver.jobs(4) as jobs:
+        assert jobs == 3
+        with jobserver.jobs(4) as nested_jobs:
+            assert nested_jobs == 1
+    assert jobserver.acquire_extra(2) == 2
+    jobserver.close()
+
+
+def take_token(jobserver):
+    """Take a token in another process."""
+    assert jobserver.acquire(block=False)
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32" or multiprocessing.get_start_method() != "fork",
+    reason="Tokens are only shared with forked processes",
+)
+def test_jobserver_shared_between_processes():
+    """Test taking a token in a forked process.
+
+    Expected result: token taken by the other process is not available
+    """
+    jobserver = JobServer(1)
+    process = multiprocessing.Process(target=take_token, args=(jobserver,))
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+    assert not jobserver.acquire(block=False)
+    jobserver.close()
@@ -0,0 +1,110 @@
+"""Tests for statick_tool.package_cache."""
+
+import os
+
+import mock
+
+from statick_tool.issue import Issue
+from statick_tool.package import Package
+from statick_tool.package_cache import PackageCache
+from statick_tool.timing import Timing
+from statick_tool.tool_version import ToolVersion
+
+
+def make_tree(tmp_path):
+    """Make a package directory with a nested directory."""
+    package_dir = tmp_path / "package"
+    (package_dir / "src").mkdir(parents=True)
+    (package_dir / "setup.py").write_text("setup()\n")
+    (package_dir / "src" / "test.py").write_text("x = 1\n")
+    return package_dir
+
+
+def test_package_cache_tree_hash(tmp_path):
+    """Test the hash of a directory tree.
+
+    Expected result: hash only changes when the contents of the tree change
+    """
+    package_dir = make_tree(tmp_path)
+    cache = PackageCache(str(tmp_path / "cache"))
+    first = cache.get_tree_hash(str(package_dir))
+    assert cache.get_tree_hash(str(package_dir)) == first
+
+    (package_dir / "src" / "test.py").write_text("x = 2\n")
+    second = cache.get_tree_hash(str(package_dir))
+    assert second != first
+
+    os.rename(package_dir / "src" / "test.py", package_dir / "src" / "other.py")
+    assert cache.get_tree_hash(str(package_dir)) != second
+    cache.close()
+
+
+def test_package_cache_tree_hash_skip(tmp_path):
+    """Test skipping a directory in the tree.
+
+    Expected result: changes in the skipped directory don't change the hash
+    """
+    package_dir = make_tree(tmp_path)
+    cache = PackageCache(str(tmp_path / "cache"))
+    first = cache.get_tree_hash(str(package_dir), [str(package_dir / "src")])
+    (package_dir / "src" / "test.py").write_text("x = 2\n")
+    assert cache.get_tree_hash(str(package_dir), [str(package_dir / "src")]) == first
+    cache.close()
+
+
+def test_package_cache_tree_hash_reuses_file_hashes(tmp_path):
+    """Test that unchanged files are not read again.
+
+    Expected result: only the changed file is hashed
+    """
+    package_dir = make_tree(tmp_path)
+    cache = PackageCache(str(tmp_path / "cache"))
+    cache.get_tree_hash(str(package_dir))
+    changed = package_dir / "src" / "test.py"
+    changed.write_text("x = 22\n")
+    with mock.patch(
+        "statick_tool.package_cache.get_file_hash", return_value="abc"
+    ) as mock_get_file_hash:
+        cache.get_tree_hash(str(package_dir))
+        mock_get_file_hash.assert_called_once_with(str(changed))
+    cache.close()
+
+
+def test_package_cache_tree_hash_known_file_hashes(tmp_path):
+    """Test that files with a known hash, such as a git hash, are not read.
+
+    Expected result: only the file without a known hash is hashed
+    """
+    package_dir = make_tree(tmp_path)
+    cache = PackageCache(str(tmp_path / "cache"))
+    setup = str(package_dir / "setup.py")
+    with mock.patch(
+        "statick_tool.package_cache.get_file_hash", return_value="abc"
+    ) as mock_get_file_hash:
+        first = cache.get_tree_hash(str(package_dir), file_hashes={setup: "1" * 40})
+        mock_get_file_hash.assert_called_once_with(str(package_dir / "src" / "test.py"))
+    assert cache.get_tree_hash(str(package_dir), file_hashes={setup: "2" * 40}) != first
+    cache.close()
+
+
+def test_package_cache_results(tmp_path):
+    """Test storing and getting the results of a package.
+
+    Expected result: results only returned for a matching hash
+    """
+    package_dir = make_tree(tmp_path)
+    package = Package("package", str(package_dir))
+    cache = PackageCache(str(tmp_path / "cache"))
+    package_hash = cache.get_package_hash(package, None, level="default")
+    assert cache.get_package(package, package_hash) is None
+
+    issues = {"tool": [Issue("test.py", 1, "tool", "type", 3, "message", None)]}
+    timings = [Timing("package", "tool", "Tool", "1.0000")]
+    tool_versions = [ToolVersion("tool", "1.0")]
+    cache.set_package(package, package_hash, issues, timings, tool_versions)
+
+    assert cache.get_package(package, package_hash) == (issues, timings, tool_versions)
+    other = cache.get_package_hash(package, None, level="threshold")
+    assert other != package_hash
+    assert cache.get_package(package, other) is None
+    cache.close()
@@ -0,0 +1,85 @@
+"""Tests for statick_tool.parse_cache."""
+
+import ast
+
+import mock
+import pytest
+
+from statick_tool.parse_cache import ParseCache
+
+
+def test_parse_cache_get(tmp_path):
+    """Test that files are read and parsed once for every tool using the cache.
+
+    Expected result: source, lines, and tree of the file, read from disk once
+    """
+    path = tmp_path / "a.py"
+    path.write_bytes(b"import os\r\nx = 1\n")
+    parse_cache = ParseCache(["pyflakes", "pycodestyle"])
+
+    parsed = parse_cache.get(str(path))
+    assert parse_cache.get(str(path)) is parsed
+    assert len(parse_cache) == 1
+    assert parsed.get_source() == b"import os\r\nx = 1\n"
+    with mock.patch("builtins.open") as mock_open:
+        assert parse_cache.get(str(path)).get_source() == b"import os\r\nx = 1\n"
+        assert isinstance(parsed.get_tree(), ast.Module)
+        assert parsed.get_tree() is parsed.get_tree()
+        assert parsed.get_lines() == ["import os\n", "x = 1\n"]
+        mock_open.assert_not_called()
+
+
+def test_parse_cache_get_lines_encoding(tmp_path):
+    """Test that lines are decoded with the encoding the file declares.
+
+    Expected result: byte order mark removed, Latin-1 used for unknown encodings
+    """
+    bom = tmp_path / "bom.py"
+    bom.write_bytes(b"\xef\xbb\xbfx = 1\n")
+    unknown = tmp_path / "unknown.py"
+    unknown.write_bytes(b"# -*- coding: unknown -*-\ns = '\xe9'\n")
+    parse_cache = ParseCache(["pycodestyle"])
+
+    assert parse_cache.get(str(bom)).get_lines() == ["x = 1\n"]
+    lines = parse_cache.get(str(unknown)).get_lines()
+    assert lines[1] == "s = '\xe9'\n"
+    # Tools may change the lines they are given.
+    lines.clear()
+    assert len(parse_cache.get(str(unknown)).get_lines()) == 2
+
+
+def test_parse_cache_get_errors(tmp_path):
+    """Test that errors reading or parsing a file are kept.
+
+    Expected result: the same error is raised each time the file is asked for
+    """
+    path = tmp_path / "bad.py"
+    path.write_text("def f(:\n")
+    parse_cache = ParseCache(["pyflakes"])
+
+    with pytest.raises(SyntaxError):
+        parse_cache.get(str(path)).get_tree()
+    path.write_text("x = 1\n")
+    with pytest.raises(SyntaxError):
+        parse_cache.get(str(path)).get_tree()
+    with pytest.raises(OSError):
+        parse_cache.get(str(tmp_path / "missing.py")).get_source()
+
+
+def test_parse_cache_release(tmp_path):
+    """Test that files are dropped once every tool has released the cache.
+
+    Expected result: files kept until the last release, and not added after it
+    """
+    path = tmp_path / "a.py"
+    path.write_text("x = 1\n")
+    parse_cache = ParseCache(["pyflakes", "pycodestyle"])
+    parse_cache.get(str(path))
+
+    parse_cache.release("pyflakes")
+    assert len(parse_cache) == 1
+    parse_cache.release("pycodestyle")
+    assert not parse_cache
+
+    assert parse_cache.get(str(path)).get_source() == b"x = 1\n"
+    assert not parse_cache
@@ -3,6 +3,8 @@
 import os
 import sys
 
+import mock
+
 from statick_tool.exceptions import Exceptions
 from statick_tool.package import Package
 from statick_tool.plugins.discovery.maven import MavenDiscoveryPlugin
@@ -91,3 +93,25 @@ def test_maven_discovery_plugin_scan_with_exceptions():
 
     assert not package["top_poms"]
     assert not package["all_poms"]
+
+
+def test_maven_discovery_plugin_scan_file_index():
+    """Test that the Maven discovery plugin takes pom.xml files from the file index.
+
+    Expected result: package is not walked again, and excepted files are left out
+    """
+    mdp = MavenDiscoveryPlugin()
+    package = Package(
+        "multi_package", os.path.join(os.path.dirname(__file__), "multi_package")
+    )
+    mdp.find_files(package)
+    package.files[os.path.join(package.path, "b", "pom.xml")].excepted = True
+    with mock.patch("statick_tool.discovery_plugin.walk") as mock_walk:
+        mdp.scan(package, "level")
+        assert not mock_walk.called
+
+    assert package["top_poms"] == [os.path.join(package.path, "a", "pom.xml")]
+    assert set(package["all_poms"]) == {
+        os.path.join(package.path, "a", "pom.xml"),
+        os.path.join(package.path, "a", "c", "pom.xml"),
+    }
@@ -96,8 +96,8 @@ def test_perl_discovery_plugin_scan_exceptions():
 def test_perl_discovery_plugin_no_file_cmd():
     """Test when file command does not exist.
 
-    Test that files are not discovered with file command output if file command does not
-    exist.
+    Test that scripts without a known extension are still discovered from their shebang
+    line when the file command does not exist.
     """
     with modified_environ(PATH=""):
         pldp = PerlDiscoveryPlugin()
@@ -106,6 +106,7 @@ def test_perl_discovery_plugin_no_file_cmd():
         )
         pldp.scan(package, "level")
         expected = ["test.pl", os.path.join("ignore_this", "ignoreme.pl")]
+        expected += ["oddextensionpl.source"]
         # We have to add the path to each of the above...yuck
         expected_fullpath = [
             os.path.join(package.path, filename) for filename in expected
@@ -106,8 +106,8 @@ def test_python_discovery_plugin_scan_exceptions():
 def test_python_discovery_plugin_no_file_cmd():
     """Test when file command does not exist.
 
-    Test that files are not discovered with file command output if file command does not
-    exist.
+    Test that scripts without a known extension are still discovered from their shebang
+    line when the file command does not exist.
     """
     with modified_environ(PATH=""):
         pydp = PythonDiscoveryPlugin()
@@ -116,6 +116,7 @@ def test_python_discovery_plugin_no_file_cmd():
         )
         pydp.scan(package, "level")
         expected = ["test.py", os.path.join("ignore_this", "ignoreme.py")]
+        expected += ["oddextensionpy.source"]
         # We have to add the path to each of the above...yuck
         expected_fullpath = [
             os.path.join(package.path, filename) for filename in expected
@@ -123,8 +123,8 @@ def test_shell_discovery_plugin_scan_exceptions():
 def test_shell_discovery_plugin_no_file_cmd():
     """Test when file command does not exist.
 
-    Test that files are not discovered with file command output if file command does not
-    exist.
+    Test that scripts without a known extension are still discovered from their shebang
+    line when the file command does not exist.
     """
     with modified_environ(PATH=""):
         shdp = ShellDiscoveryPlugin()
@@ -133,6 +133,14 @@ def test_shell_discovery_plugin_no_file_cmd():
         )
         shdp.scan(package, "level")
         expected = ["test.sh", os.path.join("ignore_this", "ignoreme.bash")]
+        expected += [
+            "oddextensionsh.source",
+            "oddextensionbash.source",
+            "oddextensionzsh.source",
+            "oddextensioncsh.source",
+            "oddextensionksh.source",
+            "oddextensiondash.source",
+        ]
         # We have to add the path to each of the above...yuck
         expected_fullpath = [
             os.path.join(package.path, filename) for filename in expected
@@ -42,9 +42,7 @@ def test_json_reporting_plugin_found():
     for plugin_type in reporting_plugins:
         plugin = plugin_type.load()
         plugins[plugin_type.name] = plugin()
-    assert any(
-        plugin.get_name() == "json" for _, plugin in list(plugins.items())
-    )
+    assert any(plugin.get_name() == "json" for _, plugin in list(plugins.items()))
 
 
 def test_json_reporting_plugin_report_cert_reference():
@@ -114,3 +112,37 @@ def test_json_reporting_plugin_write_output_no_plugin_context():
         output_file = os.path.join(os.getcwd(), package.name + "-" + "level" + ".json")
         if os.path.exists(output_file):
             os.remove(output_file)
+
+
+def test_json_reporting_plugin_stream(capsys):
+    """Test that issues written as they arrive give the same JSON as a report."""
+    with TemporaryDirectory() as tmp_dir:
+        jrp = setup_json_reporting_plugin(tmp_dir)
+        package = Package(
+            "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
+        )
+        issues = {
+            "tool_a": [
+                Issue("test.txt", 1, "tool_a", "type", 1, "This is a test", "CERT"),
+                Issue("test.txt", 2, "tool_a", "type", 1, "This is a test", None),
+            ],
+            "tool_b": [],
+        }
+        output_file = os.path.join(
+            tmp_dir, "valid_package-level", "valid_package-level.statick.json"
+        )
+        _, success = jrp.report(package, issues, "level")
+        assert success
+        with open(output_file, encoding="utf8") as fid:
+            expected = fid.read()
+        capsys.readouterr()
+
+        jrp.begin(package, "level")
+        jrp.add_issues("tool_a", issues["tool_a"][:1])
+        jrp.add_issues("tool_b", [])
+        jrp.add_issues("tool_a", issues["tool_a"][1:])
+        _, success = jrp.finish()
+        assert success
+        with open(output_file, encoding="utf8") as fid:
+            assert fid.read() == expected
+        assert capsys.readouterr().out == expected + "\n"
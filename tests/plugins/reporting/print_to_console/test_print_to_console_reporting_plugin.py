@@ -67,3 +67,27 @@ def test_console_reporting_plugin_report_nocert(capsys):
         "  test.txt:1: tool_a:type: This is a test [1]",
         "1 total unique issues",
     ]
+
+
+def test_console_reporting_plugin_stream(capsys):
+    """Test that issues are printed as they arrive, and counted at the end."""
+    ptcrp = PrintToConsoleReportingPlugin()
+    package = Package(
+        "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
+    )
+    issue = Issue("test.txt", 1, "tool_a", "type", 1, "This is a test", None)
+
+    ptcrp.begin(package, "level")
+    ptcrp.add_issues("tool_a", [issue])
+    assert capsys.readouterr().out.splitlines() == [
+        "  test.txt:1: tool_a:type: This is a test [1]"
+    ]
+    ptcrp.add_issues("tool_a", [issue])
+    ptcrp.add_issues("tool_b", [])
+    ptcrp.finish()
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [
+        "Tool tool_a: 1 unique issues",
+        "Tool tool_b: 0 unique issues",
+        "1 total unique issues",
+    ]
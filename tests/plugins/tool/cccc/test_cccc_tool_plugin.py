@@ -1,10 +1,10 @@
 """Unit tests for the CCCC tool module."""
+
 from __future__ import print_function
 
 import argparse
 import os
 import shutil
-import subprocess
 import sys
 
 import mock
@@ -53,9 +53,7 @@ def test_cccc_tool_plugin_found():
     for plugin_type in tool_plugins:
         plugin = plugin_type.load()
         plugins[plugin_type.name] = plugin()
-    assert any(
-        plugin.get_name() == "cccc" for _, plugin in list(plugins.items())
-    )
+    assert any(plugin.get_name() == "cccc" for _, plugin in list(plugins.items()))
 
 
 # Has issues with not finding the cccc.opts config correctly.
@@ -234,14 +232,12 @@ def test_cccc_tool_plugin_parse_config_none():
     assert not config
 
 
-@mock.patch("statick_tool.plugins.tool.cccc.subprocess.check_output")
-def test_cccc_tool_plugin_scan_empty_oserror(mock_subprocess_check_output):
+def test_cccc_tool_plugin_scan_empty_oserror(tmp_path):
     """Test what happens an OSError is hit (such as if cccc doesn't exist)
 
     Expected result: issues is an empty list
     """
-    mock_subprocess_check_output.side_effect = OSError("mocked error")
-    ctp = setup_cccc_tool_plugin()
+    ctp = setup_cccc_tool_plugin(binary=str(tmp_path / "cccc"))
     package = Package(
         "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
     )
@@ -252,19 +248,17 @@ def test_cccc_tool_plugin_scan_empty_oserror(mock_subprocess_check_output):
     assert issues is None
 
 
-@mock.patch("statick_tool.plugins.tool.cccc.subprocess.check_output")
-def test_cccc_tool_plugin_scan_empty_calledprocesserror(mock_subprocess_check_output):
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a stub executable.")
+def test_cccc_tool_plugin_scan_empty_calledprocesserror(tmp_path):
     """Test what happens when a CalledProcessError is hit (such as if cccc encounters an
     error).
 
-    Expected result: issues is an empty list
+    Expected result: issues is None for an error, and an empty list for return code 1
     """
-    mock_subprocess_check_output.side_effect = subprocess.CalledProcessError(
-        0, "", output=b"mocked error"
-    )
-    ctp = setup_cccc_tool_plugin()
-    if not ctp.command_exists("cccc"):
-        pytest.skip("Missing cccc executable.")
+    binary = tmp_path / "cccc"
+    binary.write_text("#!/bin/sh\necho mocked error\nexit 2\n")
+    binary.chmod(0o755)
+    ctp = setup_cccc_tool_plugin(binary=str(binary))
     package = Package(
         "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
     )
@@ -274,11 +268,9 @@ def test_cccc_tool_plugin_scan_empty_calledprocesserror(mock_subprocess_check_ou
     issues = ctp.scan(package, "level")
     assert issues is None
 
-    mock_subprocess_check_output.side_effect = subprocess.CalledProcessError(
-        1, "", output=b"mocked error"
-    )
+    binary.write_text("#!/bin/sh\necho mocked error\nexit 1\n")
     issues = ctp.scan(package, "level")
-    assert not issues
+    assert issues == []
 
 
 @mock.patch("statick_tool.plugins.tool.cccc.xmltodict.parse")
@@ -300,3 +292,43 @@ def test_cccc_tool_plugin_scan_filenotfound(mock_xmltodict_parse):
     ]
     issues = ctp.scan(package, "level")
     assert not issues
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a stub executable.")
+def test_cccc_tool_plugin_scan_same_file_names(tmp_path):
+    """Test checking files with the same name in different directories.
+
+    Expected result: the output of each file is read for that file, and the output
+    directories are removed afterwards
+    """
+    binary = tmp_path / "cccc"
+    binary.write_text(
+        "#!/bin/sh\n"
+        'for arg; do case "$arg" in --outdir=*) outdir="${arg#--outdir=}";; esac; done\n'
+        'mkdir -p "$outdir"\n'
+        'echo "$outdir" >> "$0.outdirs"\n'
+        'echo "<CCCC_Project><src>$arg</src></CCCC_Project>" > "$outdir/cccc.xml"\n'
+    )
+    binary.chmod(0o755)
+    ctp = setup_cccc_tool_plugin(binary=str(binary))
+    srcs = []
+    for directory in ("a", "b"):
+        (tmp_path / directory).mkdir()
+        src = tmp_path / directory / "example.cpp"
+        src.write_text("int main() { return 0; }\n")
+        srcs.append(str(src))
+    package = Package("valid_package", str(tmp_path))
+    package["c_src"] = srcs
+
+    with mock.patch.object(
+        ctp, "parse_tool_output", return_value=[]
+    ) as mock_parse_tool_output:
+        assert ctp.scan(package, "level") == []
+
+    assert [
+        (call.args[0]["CCCC_Project"]["src"], call.args[1])
+        for call in mock_parse_tool_output.call_args_list
+    ] == [(src, src) for src in srcs]
+    outdirs = (tmp_path / "cccc.outdirs").read_text().split()
+    assert len(set(outdirs)) == 2
+    assert not any(os.path.exists(outdir) for outdir in outdirs)
@@ -3,7 +3,6 @@
 import argparse
 import os
 import shutil
-import subprocess
 import sys
 from xml.etree import ElementTree
 
@@ -338,19 +337,17 @@ def test_clang_format_tool_plugin_custom_config_diff():
     assert not issues
 
 
-@mock.patch(
-    "statick_tool.plugins.tool.clang_format.subprocess.check_output"
-)
-def test_clang_format_tool_plugin_scan_calledprocesserror(mock_subprocess_check_output):
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a stub executable.")
+def test_clang_format_tool_plugin_scan_calledprocesserror(tmp_path):
     """Test what happens when a CalledProcessError is raised (usually means clang-format
     hit an error).
 
     Expected result: issues is empty (no raise) or None (raise)
     """
-    mock_subprocess_check_output.side_effect = subprocess.CalledProcessError(
-        1, "", output="mocked error"
-    )
-    cftp = setup_clang_format_tool_plugin()
+    binary = tmp_path / "clang-format"
+    binary.write_text("#!/bin/sh\necho mocked error\nexit 1\n")
+    binary.chmod(0o755)
+    cftp = setup_clang_format_tool_plugin(binary=str(binary))
     shutil.copyfile(
         cftp.plugin_context.resources.get_file("_clang-format"),
         os.path.join(os.path.expanduser("~"), "_clang-format"),
@@ -367,7 +364,7 @@ def test_clang_format_tool_plugin_scan_calledprocesserror(mock_subprocess_check_
     issues = cftp.scan(package, "level")
     assert not issues
 
-    cftp = setup_clang_format_tool_plugin(do_raise=True)
+    cftp = setup_clang_format_tool_plugin(binary=str(binary), do_raise=True)
     issues = cftp.scan(package, "level")
     assert issues is None
 
@@ -401,17 +398,14 @@ def test_clang_format_tool_plugin_scan_oserror_open(mock_open):
     assert issues is None
 
 
-@mock.patch(
-    "statick_tool.plugins.tool.clang_format.subprocess.check_output"
-)
-def test_clang_format_tool_plugin_scan_oserror(mock_subprocess_check_output):
+def test_clang_format_tool_plugin_scan_oserror(tmp_path):
     """Test what happens when an OSError is raised (usually means clang-format doesn't
     exist).
 
     Expected result: issues is empty (no raise) or None (raise)
     """
-    mock_subprocess_check_output.side_effect = OSError("mocked error")
-    cftp = setup_clang_format_tool_plugin()
+    binary = str(tmp_path / "clang-format")
+    cftp = setup_clang_format_tool_plugin(binary=binary)
     shutil.copyfile(
         cftp.plugin_context.resources.get_file("_clang-format"),
         os.path.join(os.path.expanduser("~"), "_clang-format"),
@@ -430,7 +424,7 @@ def test_clang_format_tool_plugin_scan_oserror(mock_subprocess_check_output):
     issues = cftp.scan(package, "level")
     assert not issues
 
-    cftp = setup_clang_format_tool_plugin(do_raise=True)
+    cftp = setup_clang_format_tool_plugin(binary=binary, do_raise=True)
     issues = cftp.scan(package, "level")
     assert issues is None
 
@@ -1,6 +1,7 @@
 """Unit tests for the clang-tidy plugin."""
 
 import argparse
+import io
 import os
 import subprocess
 import sys
@@ -52,9 +53,7 @@ def test_clang_tidy_tool_plugin_found():
     for plugin_type in tool_plugins:
         plugin = plugin_type.load()
         plugins[plugin_type.name] = plugin()
-    assert any(
-        plugin.get_name() == "clang-tidy" for _, plugin in list(plugins.items())
-    )
+    assert any(plugin.get_name() == "clang-tidy" for _, plugin in list(plugins.items()))
 
 
 def test_clang_tidy_tool_plugin_scan_valid():
@@ -273,14 +272,22 @@ def test_clang_tidy_tool_plugin_scan_missing_fields():
     assert not issues
 
 
-@mock.patch("statick_tool.plugins.tool.clang_tidy.subprocess.check_output")
-def test_clang_tidy_tool_plugin_scan_oserror(mock_subprocess_check_output):
+def make_process(output, returncode):
+    """Make a mock process that prints output and exits with a return code."""
+    process = mock.MagicMock()
+    process.stdout = io.StringIO(output)
+    process.returncode = returncode
+    return process
+
+
+@mock.patch("statick_tool.plugins.tool.clang_tidy.subprocess.Popen")
+def test_clang_tidy_tool_plugin_scan_oserror(mock_subprocess_popen):
     """Test what happens when an OSError is raised (usually means clang-tidy doesn't
     exist).
 
     Expected result: issues is None
     """
-    mock_subprocess_check_output.side_effect = OSError("mocked error")
+    mock_subprocess_popen.side_effect = OSError("mocked error")
     cttp = setup_clang_tidy_tool_plugin()
     with TemporaryDirectory() as bin_dir:
         package = Package(
@@ -297,16 +304,14 @@ def test_clang_tidy_tool_plugin_scan_oserror(mock_subprocess_check_output):
     assert issues is None
 
 
-@mock.patch("statick_tool.plugins.tool.clang_tidy.subprocess.check_output")
-def test_clang_tidy_tool_plugin_scan_calledprocesserror(mock_subprocess_check_output):
+@mock.patch("statick_tool.plugins.tool.clang_tidy.subprocess.Popen")
+def test_clang_tidy_tool_plugin_scan_calledprocesserror(mock_subprocess_popen):
     """Test what happens when a CalledProcessError is raised (usually means clang-tidy
     hit an error).
 
     Expected result: issues is None
     """
-    mock_subprocess_check_output.side_effect = subprocess.CalledProcessError(
-        2, "", output="mocked error"
-    )
+    mock_subprocess_popen.return_value = make_process("mocked error\n", 2)
     cttp = setup_clang_tidy_tool_plugin()
     with TemporaryDirectory() as bin_dir:
         package = Package(
@@ -323,14 +328,14 @@ def test_clang_tidy_tool_plugin_scan_calledprocesserror(mock_subprocess_check_ou
     assert issues is None
 
 
-@mock.patch("statick_tool.plugins.tool.clang_tidy.subprocess.check_output")
-def test_clang_tidy_tool_plugin_scan_diagnosticerror(mock_subprocess_check_output):
+@mock.patch("statick_tool.plugins.tool.clang_tidy.subprocess.Popen")
+def test_clang_tidy_tool_plugin_scan_diagnosticerror(mock_subprocess_popen):
     """Test that a CalledProcessError is raised when subprocess's output contains
     'clang-diagnostic-error'.
 
     Expected result: issues is None
     """
-    mock_subprocess_check_output.return_value = "clang-diagnostic-error"
+    mock_subprocess_popen.return_value = make_process("clang-diagnostic-error\n", 0)
     cttp = setup_clang_tidy_tool_plugin()
     with TemporaryDirectory() as bin_dir:
         package = Package(
@@ -347,6 +352,40 @@ def test_clang_tidy_tool_plugin_scan_diagnosticerror(mock_subprocess_check_outpu
     assert issues is None
 
 
+@mock.patch("statick_tool.plugins.tool.clang_tidy.subprocess.Popen")
+def test_clang_tidy_tool_plugin_scan_issues_found(mock_subprocess_popen):
+    """Test that issues are parsed from output read line by line.
+
+    Expected result: clang-tidy returning 1 for the issues it found is not a failure,
+    and the output is written to the log
+    """
+    output = (
+        "test.c:6:5: warning: unused variable 'x' [clang-diagnostic-unused-variable]\n"
+        "    int x;\n"
+    )
+    mock_subprocess_popen.return_value = make_process(output, 1)
+    cttp = setup_clang_tidy_tool_plugin()
+    with TemporaryDirectory() as bin_dir:
+        cttp.plugin_context.args.output_directory = bin_dir
+        package = Package(
+            "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
+        )
+        package["make_targets"] = [{"src": ["test.c"]}]
+        package["bin_dir"] = bin_dir
+        package["src_dir"] = os.path.join(os.path.dirname(__file__), "valid_package")
+        cwd = os.getcwd()
+        os.chdir(bin_dir)
+        try:
+            issues = cttp.scan(package, "level")
+            with open("clang-tidy.log", encoding="utf8") as fid:
+                assert fid.read() == output
+        finally:
+            os.chdir(cwd)
+    assert len(issues) == 1
+    assert issues[0].line_number == 6
+    assert issues[0].issue_type == "warning/clang-diagnostic-unused-variable"
+
+
 def test_checkforexceptions_true():
     """Test check_for_exceptions behavior where it should return True."""
     mm = mock.MagicMock()
@@ -1,6 +1,7 @@
 """Unit tests for the cppcheck plugin."""
 
 import argparse
+import io
 import os
 import subprocess
 import sys
@@ -227,14 +228,21 @@ def calledprocesserror_helper(*popenargs, **kwargs):
         raise subprocess.CalledProcessError(2, "", output="mocked error")
 
 
+@mock.patch("statick_tool.plugins.tool.cppcheck.subprocess.Popen")
 @mock.patch("statick_tool.plugins.tool.cppcheck.subprocess.check_output")
-def test_cppcheck_tool_plugin_scan_calledprocesserror(mock_subprocess_check_output):
+def test_cppcheck_tool_plugin_scan_calledprocesserror(
+    mock_subprocess_check_output, mock_subprocess_popen
+):
     """Test what happens when a CalledProcessError is raised (usually means cppcheck hit
     an error).
 
     Expected result: issues is None
     """
     mock_subprocess_check_output.side_effect = calledprocesserror_helper
+    process = mock.MagicMock()
+    process.stdout = io.StringIO("mocked error\n")
+    process.returncode = 2
+    mock_subprocess_popen.return_value = process
     cctp = setup_cppcheck_tool_plugin()
     package = Package(
         "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
@@ -2,18 +2,17 @@
 
 import argparse
 import os
-import subprocess
 import sys
 
 import mock
 import pytest
+
+import statick_tool
 from statick_tool.config import Config
 from statick_tool.package import Package
 from statick_tool.plugin_context import PluginContext
-from statick_tool.resources import Resources
-
-import statick_tool
 from statick_tool.plugins.tool.eslint import ESLintToolPlugin
+from statick_tool.resources import Resources
 
 if sys.version_info < (3, 10):
     from importlib_metadata import entry_points
@@ -129,17 +128,8 @@ def test_eslint_tool_plugin_parse_invalid():
     assert not issues
 
 
-@mock.patch("statick_tool.plugins.tool.eslint.subprocess.check_output")
-def test_eslint_tool_plugin_scan_calledprocesserror(mock_subprocess_check_output):
-    """
-    Test what happens when a CalledProcessError is raised (usually means eslint hit an error).
-
-    Expected result: issues is None
-    """
-    mock_subprocess_check_output.side_effect = subprocess.CalledProcessError(
-        0, "", output="mocked error"
-    )
-    plugin = setup_eslint_tool_plugin()
+def make_eslint_package():
+    """Make a package with files for eslint to scan."""
     package = Package(
         "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
     )
@@ -149,77 +139,72 @@ def test_eslint_tool_plugin_scan_calledprocesserror(mock_subprocess_check_output
     package["javascript_src"] = [
         os.path.join(os.path.dirname(__file__), "valid_package", "test.js")
     ]
+    return package
+
+
+def make_eslint_stub(directory, output, returncode):
+    """Make a stub eslint executable that prints output and exits."""
+    binary = directory / "eslint"
+    binary.write_text(f"#!/bin/sh\necho '{output}'\nexit {returncode}\n")
+    binary.chmod(0o755)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a stub executable.")
+def test_eslint_tool_plugin_scan_calledprocesserror(tmp_path, monkeypatch):
+    """
+    Test what happens when a CalledProcessError is raised (usually means eslint hit an error).
+
+    Expected result: issues is None
+    """
+    monkeypatch.setenv("PATH", str(tmp_path))
+    make_eslint_stub(tmp_path, "mocked error", 2)
+    plugin = setup_eslint_tool_plugin()
+    package = make_eslint_package()
     issues = plugin.scan(package, "level")
     assert issues is None
 
-    mock_subprocess_check_output.side_effect = subprocess.CalledProcessError(
-        2, "", output="mocked error"
-    )
+    make_eslint_stub(tmp_path, "mocked error", 0)
     issues = plugin.scan(package, "level")
     assert not issues
 
 
-@mock.patch("statick_tool.plugins.tool.eslint.subprocess.check_output")
-def test_eslint_tool_plugin_scan_nodejs_error(mock_subprocess_check_output):
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a stub executable.")
+def test_eslint_tool_plugin_scan_nodejs_error(tmp_path, monkeypatch):
     """
     Test what happens when a CalledProcessError is raised when nodejs throws an error.
 
     Expected result: issues is None
     """
-    mock_subprocess_check_output.side_effect = subprocess.CalledProcessError(
+    monkeypatch.setenv("PATH", str(tmp_path))
+    make_eslint_stub(
+        tmp_path,
+        "internal/modules/cjs/loader.js:883 throw err; ^ "
+        "Error: Cannot find module node:fs Require stack:",
         1,
-        "",
-        output="internal/modules/cjs/loader.js:883 \
-  throw err; \
-  ^ \
-\
-Error: Cannot find module 'node:fs' \
-Require stack:",
     )
     plugin = setup_eslint_tool_plugin()
-    package = Package(
-        "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
-    )
-    package["html_src"] = [
-        os.path.join(os.path.dirname(__file__), "valid_package", "test.html")
-    ]
-    package["javascript_src"] = [
-        os.path.join(os.path.dirname(__file__), "valid_package", "test.js")
-    ]
+    package = make_eslint_package()
     issues = plugin.scan(package, "level")
     assert issues is None
 
-    mock_subprocess_check_output.side_effect = subprocess.CalledProcessError(
-        1, "", output="Require stack:"
-    )
+    make_eslint_stub(tmp_path, "Require stack:", 1)
     issues = plugin.scan(package, "level")
     assert issues is None
 
-    mock_subprocess_check_output.side_effect = subprocess.CalledProcessError(
-        1, "", output="Generic error message"
-    )
+    make_eslint_stub(tmp_path, "Generic error message", 1)
     issues = plugin.scan(package, "level")
     assert not issues
 
 
-@mock.patch("statick_tool.plugins.tool.eslint.subprocess.check_output")
-def test_eslint_tool_plugin_scan_oserror(mock_subprocess_check_output):
+def test_eslint_tool_plugin_scan_oserror(tmp_path, monkeypatch):
     """
     Test what happens when an OSError is raised (usually means eslint doesn't exist).
 
     Expected result: issues is None
     """
-    mock_subprocess_check_output.side_effect = OSError("mocked error")
+    monkeypatch.setenv("PATH", str(tmp_path))
     plugin = setup_eslint_tool_plugin()
-    package = Package(
-        "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
-    )
-    package["html_src"] = [
-        os.path.join(os.path.dirname(__file__), "valid_package", "test.html")
-    ]
-    package["javascript_src"] = [
-        os.path.join(os.path.dirname(__file__), "valid_package", "test.js")
-    ]
+    package = make_eslint_package()
     issues = plugin.scan(package, "level")
     assert issues is None
 
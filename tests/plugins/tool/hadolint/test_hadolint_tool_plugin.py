@@ -8,13 +8,13 @@ import sys
 
 import mock
 import pytest
+
+import statick_tool
 from statick_tool.config import Config
 from statick_tool.package import Package
 from statick_tool.plugin_context import PluginContext
-from statick_tool.resources import Resources
-
-import statick_tool
 from statick_tool.plugins.tool.hadolint import HadolintToolPlugin
+from statick_tool.resources import Resources
 
 if sys.version_info < (3, 10):
     from importlib_metadata import entry_points
@@ -325,19 +325,49 @@ def test_hadolint_tool_plugin_scan_oserror(mock_subprocess_check_output):
     assert issues is None
 
 
-@mock.patch("statick_tool.plugins.tool.hadolint.subprocess.check_output")
+def make_docker_stub(directory, script):
+    """Make a docker executable that runs a shell script."""
+    binary = directory / "docker"
+    binary.write_text("#!/bin/sh\n" + script)
+    binary.chmod(0o755)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a stub executable.")
+def test_hadolint_tool_plugin_scan_docker_stub(tmp_path, monkeypatch):
+    """
+    Test that scan_docker runs hadolint for each file and merges the output.
+
+    Expected result: one issue for each file, with the path of the file
+    """
+    issue = (
+        '[{"code":"DL3008","column":1,"file":"Dockerfile","level":"warning",'
+        '"line":3,"message":"Pin versions in apt get install."}]'
+    )
+    make_docker_stub(tmp_path, f"echo '{issue}'\n")
+    monkeypatch.setenv("PATH", str(tmp_path))
+    plugin = setup_hadolint_tool_plugin(use_docker=True)
+    package = Package(
+        "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
+    )
+    files = [str(tmp_path / "first" / "Dockerfile"), str(tmp_path / "Dockerfile")]
+    package["dockerfile_src"] = files
+    issues = plugin.scan(package, "level")
+    assert [issue.filename for issue in issues] == files
+    assert issues[0].issue_type == "DL3008"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a stub executable.")
 def test_hadolint_tool_plugin_scan_calledprocesserror_with_docker(
-    mock_subprocess_check_output,
+    tmp_path, monkeypatch
 ):
     """
-    Test what happens when a CalledProcessError is raised by scan_docker.
+    Test what happens when docker fails in scan_docker.
     This usually means hadolint hit an error.
 
     Expected result: issues is None
     """
-    mock_subprocess_check_output.side_effect = subprocess.CalledProcessError(
-        0, "", output="mocked error"
-    )
+    make_docker_stub(tmp_path, "echo 'mocked error'\nexit 2\n")
+    monkeypatch.setenv("PATH", str(tmp_path))
     plugin = setup_hadolint_tool_plugin(use_docker=True)
     package = Package(
         "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
@@ -348,22 +378,14 @@ def test_hadolint_tool_plugin_scan_calledprocesserror_with_docker(
     issues = plugin.scan(package, "level")
     assert issues is None
 
-    mock_subprocess_check_output.side_effect = subprocess.CalledProcessError(
-        2, "", output="mocked error"
-    )
-    issues = plugin.scan(package, "level")
-    assert not issues
-
 
-@mock.patch("statick_tool.plugins.tool.hadolint.subprocess.check_output")
-def test_hadolint_tool_plugin_scan_oserror_with_docker(mock_subprocess_check_output):
+def test_hadolint_tool_plugin_scan_oserror_with_docker(tmp_path, monkeypatch):
     """
-    Test what happens when an OSError is raised by scan_docker.
-    This usually means hadolint doesn't exist.
+    Test what happens when docker can't be found by scan_docker.
 
     Expected result: issues is None
     """
-    mock_subprocess_check_output.side_effect = OSError("mocked error")
+    monkeypatch.setenv("PATH", str(tmp_path))
     plugin = setup_hadolint_tool_plugin(use_docker=True)
     package = Package(
         "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
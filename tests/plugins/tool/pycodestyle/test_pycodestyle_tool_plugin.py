@@ -6,10 +6,13 @@ import subprocess
 import sys
 
 import mock
+import pytest
 
 import statick_tool
+from statick_tool import python_tools
 from statick_tool.config import Config
 from statick_tool.package import Package
+from statick_tool.parse_cache import ParseCache
 from statick_tool.plugin_context import PluginContext
 from statick_tool.plugins.tool.pycodestyle import PycodestyleToolPlugin
 from statick_tool.resources import Resources
@@ -47,6 +50,70 @@ def test_pycodestyle_tool_plugin_found():
     )
 
 
+@pytest.mark.skipif(
+    not python_tools.is_supported(), reason="Forked processes are not supported."
+)
+def test_pycodestyle_tool_plugin_scan_in_process():
+    """Test that pycodestyle finds the same issues when it runs in-process.
+
+    Expected result: issues are the same, and no new interpreter is started
+    """
+    pcstp = setup_pycodestyle_tool_plugin()
+    package = Package(
+        "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
+    )
+    package["python_src"] = [
+        os.path.join(os.path.dirname(__file__), "valid_package", "e501.py")
+    ]
+    issues = pcstp.scan(package, "level")
+    pcstp.plugin_context.args.in_process_tools = True
+    with mock.patch(
+        "statick_tool.tool_plugin.subprocess.check_output"
+    ) as mock_subprocess_check_output:
+        assert pcstp.scan(package, "level") == issues
+        mock_subprocess_check_output.assert_not_called()
+
+
+@pytest.mark.skipif(
+    python_tools.get_entry_point("pycodestyle") is None,
+    reason="pycodestyle is not installed with Statick.",
+)
+def test_pycodestyle_tool_plugin_scan_parse_cache():
+    """Test that pycodestyle finds the same issues with the lines from the cache.
+
+    Expected result: issues are the same and the command is not run, unless the flags
+    make pycodestyle print more than the issues
+    """
+    pcstp = setup_pycodestyle_tool_plugin()
+    package = Package(
+        "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
+    )
+    package["python_src"] = [
+        os.path.join(os.path.dirname(__file__), "valid_package", "e501.py")
+    ]
+    issues = pcstp.scan(package, "level")
+    package.parse_cache = ParseCache(["pycodestyle"])
+    with mock.patch(
+        "statick_tool.tool_plugin.subprocess.check_output"
+    ) as mock_subprocess_check_output:
+        assert pcstp.scan(package, "level") == issues
+        mock_subprocess_check_output.assert_not_called()
+    assert len(package.parse_cache) == 1
+
+    assert (
+        pcstp.check_parsed_files(
+            package.parse_cache, ["--statistics"], package["python_src"]
+        )
+        is None
+    )
+    assert (
+        pcstp.check_parsed_files(
+            package.parse_cache, ["--not-an-option"], package["python_src"]
+        )
+        is None
+    )
+
+
 def test_pycodestyle_tool_plugin_scan_valid():
     """Integration test: Make sure the pycodestyle output hasn't changed."""
     pcstp = setup_pycodestyle_tool_plugin()
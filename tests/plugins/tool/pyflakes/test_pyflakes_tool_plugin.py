@@ -6,10 +6,13 @@ import subprocess
 import sys
 
 import mock
+import pytest
 
 import statick_tool
+from statick_tool import python_tools
 from statick_tool.config import Config
 from statick_tool.package import Package
+from statick_tool.parse_cache import ParseCache
 from statick_tool.plugin_context import PluginContext
 from statick_tool.plugins.tool.pyflakes import PyflakesToolPlugin
 from statick_tool.resources import Resources
@@ -42,9 +45,7 @@ def test_pyflakes_tool_plugin_found():
     for plugin_type in tool_plugins:
         plugin = plugin_type.load()
         plugins[plugin_type.name] = plugin()
-    assert any(
-        plugin.get_name() == "pyflakes" for _, plugin in list(plugins.items())
-    )
+    assert any(plugin.get_name() == "pyflakes" for _, plugin in list(plugins.items()))
 
 
 def test_pyflakes_tool_plugin_scan_valid():
@@ -60,6 +61,47 @@ def test_pyflakes_tool_plugin_scan_valid():
     assert len(issues) == 1
 
 
+@pytest.mark.skipif(
+    python_tools.get_entry_point("pyflakes") is None,
+    reason="pyflakes is not installed with Statick.",
+)
+def test_pyflakes_tool_plugin_scan_parse_cache(tmp_path):
+    """Test that pyflakes finds the same issues with the syntax trees from the cache.
+
+    Expected result: issues are the same, syntax errors are still reported, and the
+    command is not run
+    """
+    pftp = setup_pyflakes_tool_plugin()
+    package = Package(
+        "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
+    )
+    invalid = tmp_path / "invalid.py"
+    invalid.write_text("def f(:\n")
+    package["python_src"] = [
+        os.path.join(os.path.dirname(__file__), "valid_package", "pyflakes_test.py"),
+        str(invalid),
+    ]
+    issues = pftp.scan(package, "level")
+    package.parse_cache = ParseCache(["pyflakes"])
+    with mock.patch(
+        "statick_tool.tool_plugin.subprocess.check_output"
+    ) as mock_subprocess_check_output:
+        assert pftp.scan(package, "level") == issues
+        mock_subprocess_check_output.assert_not_called()
+    assert len(package.parse_cache) == 2
+
+    output = subprocess.run(
+        ["pyflakes"] + package["python_src"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+        check=False,
+    ).stdout
+    assert sorted(
+        pftp.check_parsed_files(package.parse_cache, package["python_src"]).splitlines()
+    ) == sorted(output.splitlines())
+
+
 def test_pyflakes_tool_plugin_parse_valid():
     """Verify that we can parse the normal output of pyflakes."""
     pftp = setup_pyflakes_tool_plugin()
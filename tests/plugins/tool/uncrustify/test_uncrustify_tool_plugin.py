@@ -5,7 +5,6 @@ import os
 import subprocess
 import sys
 
-import mock
 import pytest
 
 import statick_tool
@@ -51,9 +50,7 @@ def test_uncrustify_tool_plugin_found():
     for plugin_type in tool_plugins:
         plugin = plugin_type.load()
         plugins[plugin_type.name] = plugin()
-    assert any(
-        plugin.get_name() == "uncrustify" for _, plugin in list(plugins.items())
-    )
+    assert any(plugin.get_name() == "uncrustify" for _, plugin in list(plugins.items()))
 
 
 def test_uncrustify_tool_plugin_scan_valid():
@@ -175,15 +172,41 @@ def test_uncrustify_tool_plugin_scan_missing_fields():
     assert not issues
 
 
-@mock.patch("statick_tool.plugins.tool.uncrustify.subprocess.check_output")
-def test_uncrustify_tool_plugin_scan_oserror(mock_subprocess_check_output):
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a stub executable.")
+def test_uncrustify_tool_plugin_scan_stub(tmp_path):
+    """Test that each file is checked and only files that change are reported.
+
+    Expected result: one issue for the file that uncrustify would change
+    """
+    binary = tmp_path / "uncrustify"
+    binary.write_text(
+        '#!/bin/sh\ncase "$4" in *bad.c) echo "int  x;" ;; *) cat "$4" ;; esac\n'
+    )
+    binary.chmod(0o755)
+    good = tmp_path / "good.c"
+    good.write_text("int x;\n")
+    bad = tmp_path / "bad.c"
+    bad.write_text("int x;\n")
+    utp = setup_uncrustify_tool_plugin(binary=str(binary))
+    package = Package("valid_package", str(tmp_path))
+    package["make_targets"] = [{"src": [str(good), str(bad)]}]
+    package["headers"] = []
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        issues = utp.scan(package, "level")
+    finally:
+        os.chdir(cwd)
+    assert [issue.filename for issue in issues] == [str(bad)]
+
+
+def test_uncrustify_tool_plugin_scan_oserror(tmp_path):
     """Test what happens when an OSError is raised (usually means uncrustify doesn't
     exist).
 
     Expected result: issues is None
     """
-    mock_subprocess_check_output.side_effect = OSError("mocked error")
-    utp = setup_uncrustify_tool_plugin()
+    utp = setup_uncrustify_tool_plugin(binary=str(tmp_path / "uncrustify"))
     package = Package(
         "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
     )
@@ -198,17 +221,17 @@ def test_uncrustify_tool_plugin_scan_oserror(mock_subprocess_check_output):
     assert issues is None
 
 
-@mock.patch("statick_tool.plugins.tool.uncrustify.subprocess.check_output")
-def test_uncrustify_tool_plugin_scan_calledprocesserror(mock_subprocess_check_output):
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a stub executable.")
+def test_uncrustify_tool_plugin_scan_calledprocesserror(tmp_path):
     """Test what happens when a CalledProcessError is raised (usually means uncrustify
     hit an error).
 
     Expected result: issues is None
     """
-    mock_subprocess_check_output.side_effect = subprocess.CalledProcessError(
-        2, "", output="mocked error"
-    )
-    utp = setup_uncrustify_tool_plugin()
+    binary = tmp_path / "uncrustify"
+    binary.write_text("#!/bin/sh\necho mocked error\nexit 2\n")
+    binary.chmod(0o755)
+    utp = setup_uncrustify_tool_plugin(binary=str(binary))
     package = Package(
         "valid_package", os.path.join(os.path.dirname(__file__), "valid_package")
     )
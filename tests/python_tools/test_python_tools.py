@@ -0,0 +1,71 @@
+"""Tests for statick_tool.python_tools."""
+
+import time
+
+import pytest
+
+from statick_tool import python_tools
+
+pytestmark = pytest.mark.skipif(
+    not python_tools.is_supported(), reason="Forked processes are not supported."
+)
+
+
+def test_python_tools_get_entry_point():
+    """Test finding the entry points of console scripts installed with Statick.
+
+    Expected result: entry points of installed tools, and None for other commands
+    """
+    assert python_tools.get_entry_point("pycodestyle") == "pycodestyle:_main"
+    assert python_tools.get_entry_point("flawfinder") == "flawfinder:main"
+    assert python_tools.get_entry_point("/usr/bin/pycodestyle") is None
+    assert python_tools.get_entry_point("not-a-python-tool") is None
+
+
+def test_python_tools_run(tmp_path):
+    """Test running an entry point in a forked process.
+
+    Expected result: the output and return code are the same as running the command
+    """
+    valid = tmp_path / "valid.json"
+    valid.write_text('{"a": 1}')
+    invalid = tmp_path / "invalid.json"
+    invalid.write_text("{")
+    args = ["json.tool"]
+
+    returncode, output, timed_out = python_tools.run(
+        args + [str(valid)], "json.tool:main"
+    )
+    assert (returncode, output, timed_out) == (0, b'{\n    "a": 1\n}\n', False)
+
+    returncode, output, timed_out = python_tools.run(
+        args + [str(invalid)], "json.tool:main"
+    )
+    assert returncode == 1
+    assert b"Expecting property name" in output
+    assert not timed_out
+
+    returncode, output, _ = python_tools.run(
+        args + [str(invalid)], "json.tool:main", merge_stderr=False
+    )
+    assert (returncode, output) == (1, b"")
+
+    returncode, output, _ = python_tools.run(
+        args + ["valid.json"], "json.tool:main", cwd=str(tmp_path)
+    )
+    assert (returncode, output) == (0, b'{\n    "a": 1\n}\n')
+
+
+def test_python_tools_run_timeout():
+    """Test that a tool that runs too long is killed.
+
+    Expected result: the tool is stopped at the timeout
+    """
+    args = ["timeit", "-n", "1", "-r", "1", "import time; time.sleep(30)"]
+    start = time.time()
+    returncode, _, timed_out = python_tools.run(
+        args, "timeit:main", limits={"timeout": 1}
+    )
+    assert timed_out
+    assert returncode < 0
+    assert time.time() - start < 10
@@ -0,0 +1,82 @@
+"""Tests for statick_tool.result_cache."""
+
+import argparse
+
+from statick_tool.cache import get_file_hash
+from statick_tool.issue import Issue
+from statick_tool.result_cache import ResultCache
+
+
+def make_issue(filename):
+    """Make an issue for a file."""
+    return Issue(filename, 1, "tool", "type", 3, "message", None)
+
+
+def test_result_cache_open_no_cache(tmp_path):
+    """Test opening the cache with --no-cache.
+
+    Expected result: no cache is returned
+    """
+    args = argparse.Namespace(cache_dir=str(tmp_path), no_cache=True)
+    assert ResultCache.open(args) is None
+
+
+def test_result_cache_open_max_size(tmp_path):
+    """Test opening the cache with a maximum size.
+
+    Expected result: maximum size is converted to bytes
+    """
+    args = argparse.Namespace(cache_dir=str(tmp_path), cache_max_size=2)
+    cache = ResultCache.open(args)
+    assert cache.max_size == 2 * 1024 * 1024
+    cache.close()
+
+
+def test_result_cache_issues(tmp_path):
+    """Test storing and getting issues.
+
+    Expected result: stored issues are returned, missing keys are not
+    """
+    cache = ResultCache(str(tmp_path))
+    cache.set_issues({"a": [make_issue("a.py")], "b": []})
+    assert cache.get_issues(["a", "b", "c"]) == {"a": [make_issue("a.py")], "b": []}
+    cache.close()
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path):
+    """Test that the least recently used entries are removed when the cache is full.
+
+    Expected result: entry that was not read is removed
+    """
+    cache = ResultCache(str(tmp_path))
+    cache.set_issues({"a": [make_issue("a.py")], "b": [make_issue("b.py")]})
+    cache.get_issues(["a"])
+    size = cache.execute("SELECT SUM(size) FROM issues")[0][0]
+    cache.max_size = size
+    cache.set_issues({"c": [make_issue("c.py")]})
+    assert set(cache.get_issues(["a", "b", "c"])) == {"a", "c"}
+    cache.close()
+
+
+def test_result_cache_key():
+    """Test the key for a file.
+
+    Expected result: key changes when any part changes
+    """
+    key = ResultCache.get_key("tool", "1.0", "--flag", "file.py", "abc")
+    assert key == ResultCache.get_key("tool", "1.0", "--flag", "file.py", "abc")
+    assert key != ResultCache.get_key("tool", "1.1", "--flag", "file.py", "abc")
+    assert key != ResultCache.get_key("tool", "1.0", "--flag", "file.py", "abd")
+
+
+def test_result_cache_file_hash(tmp_path):
+    """Test hashing the contents of a file.
+
+    Expected result: hash changes with the contents, None for missing files
+    """
+    path = tmp_path / "file.py"
+    path.write_text("x = 1\n")
+    first = get_file_hash(str(path))
+    path.write_text("x = 2\n")
+    assert get_file_hash(str(path)) != first
+    assert get_file_hash(str(tmp_path / "missing")) is None
@@ -1,4 +1,6 @@
 """Unit tests of statick_tool.py."""
+
+import argparse
 import contextlib
 import logging
 import multiprocessing
@@ -12,10 +14,18 @@ import mock
 import pytest
 
 from statick_tool.args import Args
+from statick_tool.discovery_cache import DiscoveryCache
 from statick_tool.discovery_plugin import DiscoveryPlugin
+from statick_tool.issue import Issue
+from statick_tool.issue_stream import IssueStream
+from statick_tool.jobserver import JobServer
 from statick_tool.package import Package
+from statick_tool.parse_cache import ParseCache
+from statick_tool.plugin_context import PluginContext
 from statick_tool.plugins.tool.clang_tidy import ClangTidyToolPlugin
+from statick_tool.reporting_plugin import ReportingPlugin
 from statick_tool.statick_tool import Statick
+from statick_tool.tool_plugin import ToolLimitError, ToolPlugin
 
 LOGGER = logging.getLogger(__name__)
 
@@ -300,6 +310,144 @@ def test_run():
         print(f"Error: {ex}")
 
 
+def test_run_discovery_plugins_needed(tmp_path):
+    """Test that only discovery plugins that set keys read by the tools are run.
+
+    Expected result: no discovery plugins for a tool that reads no keys, only the
+    python plugin for a tool that reads python files
+    """
+    args = Args("Statick tool")
+    args.parser.add_argument("--path", help="Path of package to scan")
+    statick = Statick(args.get_user_paths())
+    statick.gather_args(args.parser)
+    parsed_args = args.get_args(
+        [
+            "--output-directory",
+            str(tmp_path),
+            "--path",
+            os.path.join(os.path.dirname(__file__), "test_package"),
+            "--force-tool-list",
+            "do_nothing",
+        ]
+    )
+    statick.get_config(parsed_args)
+    statick.get_exceptions(parsed_args)
+    _, success = statick.run(parsed_args.path, parsed_args)
+    assert success
+    assert [
+        timing.name
+        for timing in statick.get_timings()
+        if timing.plugin_type == "Discovery"
+    ] == ["find files"]
+
+    statick.timings = []
+    plugin = statick.tool_plugins["do_nothing"]
+    with mock.patch.object(plugin, "get_package_keys", return_value=["python_src"]):
+        _, success = statick.run(parsed_args.path, parsed_args)
+    assert success
+    assert [
+        timing.name
+        for timing in statick.get_timings()
+        if timing.plugin_type == "Discovery"
+    ] == ["find files", "python"]
+
+
+def test_get_package_keys(init_statick):
+    """Test finding the package keys read by tools.
+
+    Expected result: keys of all tools, or None if a tool doesn't declare its keys
+    """
+    init_statick.tool_plugins = {
+        "a": SleepToolPlugin("a"),
+        "b": SleepToolPlugin("b"),
+    }
+    init_statick.tool_plugins["a"].get_package_keys = lambda: ["python_src"]
+    init_statick.tool_plugins["b"].get_package_keys = lambda: ["make_targets"]
+    assert init_statick.get_package_keys({"a": [], "b": []}) == {
+        "python_src",
+        "make_targets",
+    }
+    init_statick.tool_plugins["b"].get_package_keys = lambda: None
+    assert init_statick.get_package_keys({"a": [], "b": []}) is None
+
+
+def test_run_package_cache(tmp_path):
+    """Test running Statick on a package that has not changed.
+
+    Expected result: second run reports stored issues without running any plugins
+    """
+    package_dir = tmp_path / "test_package"
+    shutil.copytree(
+        os.path.join(os.path.dirname(__file__), "test_package"), package_dir
+    )
+    args = Args("Statick tool")
+    args.parser.add_argument("--path", help="Path of package to scan")
+    statick = Statick(args.get_user_paths())
+    statick.gather_args(args.parser)
+    parsed_args = args.get_args(
+        [
+            "--output-directory",
+            str(tmp_path),
+            "--path",
+            str(package_dir),
+            "--cache-dir",
+            str(tmp_path / "cache"),
+            "--force-tool-list",
+            "do_nothing",
+        ]
+    )
+    statick.get_config(parsed_args)
+    statick.get_exceptions(parsed_args)
+    issues, success = statick.run(parsed_args.path, parsed_args)
+    assert success
+    timings = list(statick.get_timings())
+
+    with mock.patch.object(statick, "run_plugins") as mock_run_plugins:
+        cached_issues, success = statick.run(parsed_args.path, parsed_args)
+        assert not mock_run_plugins.called
+    assert success
+    assert cached_issues == issues
+    cached_timings = statick.get_timings()[len(timings) :]
+    assert [(timing.name, timing.plugin_type) for timing in cached_timings] == [
+        (timing.name, timing.plugin_type) for timing in timings
+    ]
+
+    (package_dir / "new.py").write_text("x = 1\n")
+    with mock.patch.object(
+        statick, "run_plugins", return_value=({}, True)
+    ) as mock_run_plugins:
+        statick.run(parsed_args.path, parsed_args)
+        assert mock_run_plugins.called
+
+
+def test_run_jobserver_closed(tmp_path):
+    """Test that a jobserver made for a single package run is closed after it.
+
+    Expected result: jobserver closed and cleared once the run has finished
+    """
+    args = Args("Statick tool")
+    statick = Statick(args.get_user_paths())
+    statick.gather_args(args.parser)
+    parsed_args = args.get_args(
+        [
+            "--output-directory",
+            str(tmp_path),
+            "--force-tool-list",
+            "do_nothing",
+        ]
+    )
+    # Set directly, since the option is limited to the number of CPU cores.
+    parsed_args.max_procs = 2
+    statick.get_config(parsed_args)
+    statick.get_exceptions(parsed_args)
+    path = os.path.join(os.path.dirname(__file__), "test_package")
+    with mock.patch.object(JobServer, "close", autospec=True) as mock_close:
+        _, success = statick.run(path, parsed_args)
+    assert success
+    assert mock_close.call_count == 1
+    assert statick.jobserver is None
+
+
 def test_run_missing_path(init_statick):
     """Test running Statick against a package that does not exist."""
     args = Args("Statick tool")
@@ -568,6 +716,333 @@ def test_run_tool_dependency(init_statick):
         print(f"Error: {ex}")
 
 
+class SleepToolPlugin(ToolPlugin):
+    """Tool plugin that sleeps instead of running a tool."""
+
+    def __init__(self, name, dependencies=None, events=None):
+        """Initialize the plugin."""
+        self.name = name
+        self.dependencies = dependencies or []
+        self.events = events if events is not None else []
+
+    def get_name(self):
+        """Get name of tool."""
+        return self.name
+
+    def get_tool_dependencies(self):
+        """Get a list of tools that must run before this one."""
+        return self.dependencies
+
+    def get_version(self):
+        """Get version of tool."""
+        return "1.0"
+
+    def scan(self, package, level):
+        """Record when the tool starts and ends."""
+        self.events.append(("start", self.name))
+        time.sleep(0.2)
+        self.events.append(("end", self.name))
+        return []
+
+
+def test_get_tool_plugin_graph_force_tool_list(init_statick):
+    """Test that dependencies of forced tools are run even if not in the force list.
+
+    Expected result: forced tool and its dependency are in the graph, dependency first
+    """
+    init_statick.tool_plugins = {
+        "a": SleepToolPlugin("a"),
+        "b": SleepToolPlugin("b", ["a"]),
+        "c": SleepToolPlugin("c"),
+    }
+    graph = init_statick.get_tool_plugin_graph(["c", "b", "a"], "b")
+    assert list(graph) == ["a", "b"]
+    assert graph["b"] == ["a"]
+
+
+def test_get_tool_plugin_graph_cycle(init_statick):
+    """Test that a dependency cycle is reported as an error.
+
+    Expected result: None is returned
+    """
+    init_statick.tool_plugins = {
+        "a": SleepToolPlugin("a", ["b"]),
+        "b": SleepToolPlugin("b", ["a"]),
+    }
+    assert init_statick.get_tool_plugin_graph(["a", "b"]) is None
+
+
+def test_get_tool_plugin_graph_missing_plugin(init_statick):
+    """Test that an enabled tool that doesn't exist is reported as an error.
+
+    Expected result: None is returned
+    """
+    init_statick.tool_plugins = {"a": SleepToolPlugin("a")}
+    assert init_statick.get_tool_plugin_graph(["a", "missing"]) is None
+
+
+def test_run_tool_plugins_concurrently(init_statick):
+    """Test that independent tools run at the same time and dependencies wait.
+
+    Expected result: a and c overlap, b only starts after a ends, timings for each tool
+    """
+    events = []
+    init_statick.tool_plugins = {
+        "a": SleepToolPlugin("a", events=events),
+        "b": SleepToolPlugin("b", ["a"], events=events),
+        "c": SleepToolPlugin("c", events=events),
+    }
+    graph = init_statick.get_tool_plugin_graph(["a", "b", "c"])
+    package = Package("test_package", os.path.dirname(__file__))
+    issues, success = init_statick.run_tool_plugins(package, "default", graph, 3)
+
+    assert success
+    assert issues == {"a": [], "b": [], "c": []}
+    assert events.index(("start", "c")) < events.index(("end", "a"))
+    assert events.index(("end", "a")) < events.index(("start", "b"))
+    assert sorted(timing.name for timing in init_statick.get_timings()) == [
+        "a",
+        "b",
+        "c",
+    ]
+
+
+class ParseCacheToolPlugin(SleepToolPlugin):
+    """Tool plugin that records the files in the parse cache when it runs."""
+
+    def scan(self, package, level):
+        """Parse this file with the cache and record how many files it holds."""
+        package.parse_cache.get(__file__).get_tree()
+        self.events.append((self.name, len(package.parse_cache)))
+        return []
+
+
+def test_run_tool_plugins_parse_cache(init_statick):
+    """Test that the parse cache is released once the last tool using it is done.
+
+    Expected result: files are kept until the last consumer has finished
+    """
+    events = []
+    init_statick.tool_plugins = {
+        "a": ParseCacheToolPlugin("a", events=events),
+        "b": ParseCacheToolPlugin("b", ["a"], events=events),
+        "c": SleepToolPlugin("c", ["b"]),
+    }
+    package = Package("package", os.path.dirname(__file__))
+    package.parse_cache = ParseCache(["a", "b"])
+    parse_cache = package.parse_cache
+    issues, success = init_statick.run_tool_plugins(
+        package, "level", {"a": [], "b": ["a"], "c": ["b"]}, 1
+    )
+
+    assert success
+    assert issues == {"a": [], "b": [], "c": []}
+    assert events == [("a", 1), ("b", 1)]
+    assert not parse_cache.consumers
+    assert not parse_cache
+
+
+class TimeoutToolPlugin(SleepToolPlugin):
+    """Tool plugin that goes over its timeout."""
+
+    def scan(self, package, level):
+        """Stop the tool for going over its timeout."""
+        raise ToolLimitError(["sleep"], "timeout", "Stopped after 1 second.", "")
+
+
+def test_run_tool_plugins_limit(init_statick):
+    """Test that a tool stopped by a limit is reported without stopping other tools.
+
+    Expected result: issue and timing for the limit, other tool still runs
+    """
+    init_statick.tool_plugins = {
+        "a": TimeoutToolPlugin("a"),
+        "b": SleepToolPlugin("b", ["a"]),
+    }
+    package = Package("package", os.path.dirname(__file__))
+    issues, success = init_statick.run_tool_plugins(
+        package, "level", {"a": [], "b": ["a"]}, 2
+    )
+
+    assert not success
+    assert issues["b"] == []
+    assert len(issues["a"]) == 1
+    assert issues["a"][0].issue_type == "timeout"
+    assert issues["a"][0].message == "Stopped after 1 second."
+    assert {
+        (timing.name, timing.plugin_type) for timing in init_statick.get_timings()
+    } == {("a", "Tool (timeout)"), ("b", "Tool")}
+
+
+class BatchToolPlugin(SleepToolPlugin):
+    """Tool plugin that finds issues in two batches."""
+
+    def scan_streaming(self, package, level, add_issues):
+        """Pass each issue as soon as it is found."""
+        for line in (1, 2):
+            add_issues([Issue("a.py", line, self.name, "type", 1, "message", None)])
+        return True
+
+
+class RecordingReportingPlugin(ReportingPlugin):
+    """Reporting plugin that records the batches added to it."""
+
+    def __init__(self):
+        """Initialize the plugin."""
+        self.batches = []
+
+    def get_name(self):
+        """Get the name of the plugin."""
+        return "recording"
+
+    def begin(self, package, level):
+        """Start the report."""
+
+    def add_issues(self, tool, issues):
+        """Record issues added to the report."""
+        self.batches.append((tool, len(issues)))
+
+    def finish(self):
+        """Finish the report."""
+        return None, True
+
+
+def test_run_tool_plugins_stream(init_statick):
+    """Test that issues are added to a stream as tools find them.
+
+    Expected result: each batch reaches the reporting plugin, limits are streamed too
+    """
+    init_statick.tool_plugins = {
+        "a": BatchToolPlugin("a"),
+        "b": TimeoutToolPlugin("b"),
+        "c": SleepToolPlugin("c"),
+    }
+    package = Package("package", os.path.dirname(__file__))
+    plugin = RecordingReportingPlugin()
+    stream = IssueStream(package, "level", [plugin])
+    stream.begin()
+    issues, success = init_statick.run_tool_plugins(
+        package, "level", {"a": [], "b": ["a"], "c": ["b"]}, 1, stream
+    )
+    stream.finish()
+
+    assert not success
+    assert issues == {"a": [], "b": stream.issues["b"], "c": []}
+    assert plugin.batches == [("a", 1), ("a", 1), ("b", 1), ("c", 0)]
+    assert [issue.line_number for issue in stream.issues["a"]] == [1, 2]
+    assert stream.issues["b"][0].issue_type == "timeout"
+    assert not stream.issues["c"]
+
+
+class VersionToolPlugin(SleepToolPlugin):
+    """Tool plugin that counts how many times its version is probed."""
+
+    def __init__(self, name, binary):
+        """Initialize the plugin."""
+        super().__init__(name)
+        self.binary = binary
+        self.probes = 0
+
+    def get_binary(self, level=None, package=None):
+        """Get tool binary name."""
+        return self.binary
+
+    def get_version(self):
+        """Get version of tool."""
+        self.probes += 1
+        return f"{self.name} {self.probes}"
+
+
+def test_get_tool_version(init_statick, tmp_path):
+    """Test that tool versions are probed once per binary and kept between runs.
+
+    Expected result: version is reused until the binary changes
+    """
+    binary = tmp_path / "tool"
+    binary.write_text("#!/bin/sh\n")
+    binary.chmod(0o755)
+    args = argparse.Namespace(cache_dir=str(tmp_path / "cache"), no_cache=False)
+    plugin = VersionToolPlugin("tool", str(binary))
+    plugin.set_plugin_context(PluginContext(args, None, None))
+    assert init_statick.get_tool_version(plugin) == "tool 1"
+    assert init_statick.get_tool_version(plugin) == "tool 1"
+    assert plugin.probes == 1
+
+    init_statick.known_versions.clear()
+    assert init_statick.get_tool_version(plugin) == "tool 1"
+    assert plugin.probes == 1
+
+    binary.write_text("#!/bin/sh\necho 2\n")
+    assert init_statick.get_tool_version(plugin) == "tool 2"
+    assert plugin.probes == 2
+
+
+def test_get_tool_version_no_binary(init_statick):
+    """Test that versions of tools without a binary are only kept for the run.
+
+    Expected result: version is probed once
+    """
+    plugin = VersionToolPlugin("tool", "statick-missing-binary")
+    plugin.set_plugin_context(
+        PluginContext(argparse.Namespace(cache_dir=None), None, None)
+    )
+    assert init_statick.get_tool_version(plugin) == "tool 1"
+    assert init_statick.get_tool_version(plugin) == "tool 1"
+    assert plugin.probes == 1
+
+
+class CountingDiscoveryPlugin(DiscoveryPlugin):
+    """Discovery plugin that counts how many times it scans."""
+
+    def __init__(self):
+        """Initialize the plugin."""
+        self.scans = 0
+
+    def get_name(self):
+        """Get name of plugin."""
+        return "counting"
+
+    @classmethod
+    def is_cacheable(cls):
+        """Return whether the results of the plugin only depend on the package files."""
+        return True
+
+    def scan(self, package, level, exceptions=None):
+        """Count the scan and set a package entry."""
+        self.scans += 1
+        package["counting_src"] = sorted(package.files)
+
+
+def test_run_discovery_plugin_cached(init_statick, tmp_path):
+    """Test that discovery plugin results are reused from the cache.
+
+    Expected result: plugin only scans the first time, results are the same both times
+    """
+    package_dir = tmp_path / "package"
+    package_dir.mkdir()
+    (package_dir / "test.py").write_text("x = 1\n")
+    args = argparse.Namespace(cache_dir=str(tmp_path / "cache"))
+    plugin = CountingDiscoveryPlugin()
+
+    for _ in range(2):
+        package = Package("package", str(package_dir))
+        cache = DiscoveryCache.open(args)
+        plugin.find_files(package, cache)
+        init_statick.run_discovery_plugin(plugin, package, "level", cache)
+        cache.close()
+        assert package["counting_src"] == [str(package_dir / "test.py")]
+    assert plugin.scans == 1
+
+    (package_dir / "new.py").write_text("y = 2\n")
+    package = Package("package", str(package_dir))
+    cache = DiscoveryCache.open(args)
+    plugin.find_files(package, cache)
+    init_statick.run_discovery_plugin(plugin, package, "level", cache)
+    cache.close()
+    assert plugin.scans == 2
+    assert len(package["counting_src"]) == 2
+
+
 def test_run_discovery_dependency(init_statick):
     """Test that a discovery plugin can run its dependencies.
 
@@ -935,6 +1410,58 @@ def test_run_workspace_one_proc(init_statick_ws):
     assert success
 
 
+def test_scan_packages_without_fork_timings(init_statick_ws):
+    """Test the timings of packages scanned without forking worker processes.
+
+    Expected result: each timing of each package is kept once
+    """
+    statick = init_statick_ws[0]
+    args = init_statick_ws[1]
+    parsed_args = args.get_args(init_statick_ws[2] + ["--force-tool-list", "pylint"])
+    statick.get_config(parsed_args)
+    statick.get_exceptions(parsed_args)
+    workspace = os.path.join(os.path.dirname(__file__), "test_workspace")
+    packages = [
+        Package(name, os.path.join(workspace, name))
+        for name in ("test_package", "test_package2", "test_package")
+    ]
+
+    with mock.patch("multiprocessing.get_start_method", return_value="spawn"):
+        results = list(statick.scan_packages(parsed_args, packages))
+
+    assert len(results) == 3
+    timings = statick.get_timings()
+    first = [timing for timing in timings if timing.package == "test_package"]
+    second = [timing for timing in timings if timing.package == "test_package2"]
+    assert second
+    assert len(first) == 2 * len(second)
+    assert len(timings) == len(first) + len(second)
+
+
+def test_run_workspace_stream_issues(init_statick_ws):
+    """Test running Statick on a workspace with issues reported as they are found."""
+    statick = init_statick_ws[0]
+    args = init_statick_ws[1]
+    sys.argv = init_statick_ws[2]
+    sys.argv.extend(
+        [
+            "--max-procs",
+            "0",
+            "--stream-issues",
+        ]
+    )
+
+    parsed_args = args.get_args(sys.argv)
+    statick.get_config(parsed_args)
+    statick.get_exceptions(parsed_args)
+
+    issues, success = statick.run_workspace(parsed_args)
+
+    for tool in issues:
+        assert not issues[tool]
+    assert success
+
+
 def test_run_workspace_two_procs(init_statick_ws):
     """Test running Statick on a workspace."""
     max_cpus = multiprocessing.cpu_count()
@@ -1456,3 +1983,50 @@ def test_print_logging_level_invalid():
 
     logger = logging.getLogger()
     assert logger.getEffectiveLevel() == logging.WARNING
+
+
+def test_run_tool_plugin_changed_since_policy(init_statick):
+    """Test running a tool that needs the whole package when only scanning changes.
+
+    Expected result: tool is skipped with the skip policy and run with the run policy
+    """
+    plugin = SleepToolPlugin("whole")
+    plugin.requires_whole_package = lambda: True
+    init_statick.tool_plugins = {"whole": plugin}
+    package = Package("package", os.path.dirname(__file__))
+    package.changed_files = set()
+
+    plugin.set_plugin_context(
+        PluginContext(argparse.Namespace(changed_since_policy="skip"), None, None)
+    )
+    assert init_statick.run_tool_plugin("whole", package, "level")[0] == []
+    assert not plugin.events
+
+    plugin.set_plugin_context(
+        PluginContext(argparse.Namespace(changed_since_policy="run"), None, None)
+    )
+    init_statick.run_tool_plugin("whole", package, "level")
+    assert plugin.events == [("start", "whole"), ("end", "whole")]
+
+
+def test_run_tool_plugins_jobserver(init_statick):
+    """Test that tools only run at the same time when jobserver tokens are available.
+
+    Expected result: tools run one at a time with no free tokens, then concurrently
+    """
+    events = []
+    init_statick.tool_plugins = {
+        "a": SleepToolPlugin("a", events=events),
+        "b": SleepToolPlugin("b", events=events),
+    }
+    package = Package("package", os.path.dirname(__file__))
+    init_statick.jobserver = JobServer(0)
+    init_statick.run_tool_plugins(package, "level", {"a": [], "b": []}, 2)
+    assert events == [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")]
+
+    events.clear()
+    init_statick.jobserver.release()
+    init_statick.run_tool_plugins(package, "level", {"a": [], "b": []}, 2)
+    assert events[:2] == [("start", "a"), ("start", "b")]
+    assert init_statick.jobserver.acquire(block=False)
+    init_statick.jobserver.close()
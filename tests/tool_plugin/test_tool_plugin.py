@@ -1,18 +1,27 @@
 """Tests for statick_tool.tool_plugin."""
 
 import argparse
+import asyncio
+import io
 import os
 import stat
+import subprocess
 import sys
 import tempfile
+import time
 from tempfile import TemporaryDirectory
 
+import mock
 import pytest
 
 from statick_tool.config import Config
+from statick_tool.exceptions import ExceptionMatcher
+from statick_tool.issue import Issue
+from statick_tool.jobserver import JobServer
+from statick_tool.package import Package
 from statick_tool.plugin_context import PluginContext
 from statick_tool.resources import Resources
-from statick_tool.tool_plugin import ToolPlugin
+from statick_tool.tool_plugin import ToolLimitError, ToolPlugin, split_files
 
 
 def test_tool_plugin_get_version_no_binary():
@@ -191,6 +200,35 @@ def test_tool_plugin_is_valid_executable_nonexistent():
     assert not ToolPlugin.is_valid_executable("nonexistent")
 
 
+def test_tool_plugin_get_version_key(tmp_path, monkeypatch):
+    """Test that the version key follows the resolved tool binary.
+
+    Expected result: key changes with the binary, None if the binary is missing
+    """
+    binary = tmp_path / "test"
+    binary.write_text("#!/bin/sh\n")
+    binary.chmod(0o755)
+    monkeypatch.setenv("PATH", str(tmp_path))
+    plugin = LimitsToolPlugin()
+    key = plugin.get_version_key()
+    assert key.startswith(os.path.realpath(binary))
+
+    binary.write_text("#!/bin/sh\necho 2.0\n")
+    assert plugin.get_version_key() != key
+
+    binary.unlink()
+    assert plugin.get_version_key() is None
+
+
+def test_tool_plugin_get_package_keys():
+    """Test the package keys read by a tool.
+
+    Expected result: file types by default, None if the file types are unknown
+    """
+    assert FileLocalToolPlugin().get_package_keys() == ["python_src"]
+    assert ToolPlugin().get_package_keys() is None
+
+
 def test_tool_dependencies():
     """Verify that dependencies are reported correctly."""
     arg_parser = argparse.ArgumentParser()
@@ -337,3 +375,608 @@ def test_tool_plugin_command_exists_shortpath_invalid(monkeypatch):
             os.chmod(tmp_file.name, st.st_mode | stat.S_IXUSR)
             _, tmp_file_name = os.path.split(tmp_file.name)
             assert not ToolPlugin.command_exists(tmp_file_name)
+
+
+class FileLocalToolPlugin(ToolPlugin):
+    """Tool plugin that records which files it scans."""
+
+    def __init__(self):
+        """Initialize the plugin."""
+        self.scanned = []
+
+    def get_name(self):
+        """Get name of tool."""
+        return "test"
+
+    @classmethod
+    def is_file_local(cls):
+        """Return whether the issues found in a file only depend on that file."""
+        return True
+
+    def get_version(self):
+        """Get the tool version."""
+        return "1.0"
+
+    def get_file_types(self):
+        """Return a list of file types the plugin can scan."""
+        return ["python_src"]
+
+    def get_config_files(self, level, package):
+        """Get the configuration files that change the output of the tool."""
+        return [os.path.join(package.path, "setup.cfg")]
+
+    def process_files(self, package, level, files, user_flags):
+        """Report one issue for each file."""
+        self.scanned.append(files)
+        return [f"{path}:1:{' '.join(user_flags)}\n" for path in files]
+
+    def parse_output(self, total_output, package=None):
+        """Parse tool output and report issues."""
+        issues = []
+        for output in total_output:
+            filename, line, message = output.strip().split(":")
+            issues.append(
+                Issue(filename, int(line), self.get_name(), "type", 1, message, None)
+            )
+        return issues
+
+
+def setup_file_local_tool_plugin(tmp_path, *cli_args):
+    """Create a file-local plugin and a package with two files."""
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--cache-dir", dest="cache_dir")
+    arg_parser.add_argument("--no-cache", dest="no_cache", action="store_true")
+    arg_parser.add_argument("--output-directory", dest="output_directory")
+    resources = Resources(
+        [os.path.join(os.path.dirname(__file__), "user_flags_config")]
+    )
+    config = Config(resources.get_file("config.yaml"))
+    args = arg_parser.parse_args(["--cache-dir", str(tmp_path / "cache"), *cli_args])
+    plugin = FileLocalToolPlugin()
+    plugin.set_plugin_context(PluginContext(args, resources, config))
+
+    package_dir = tmp_path / "package"
+    package_dir.mkdir()
+    package = Package("package", str(package_dir))
+    package["python_src"] = []
+    for name in ("a.py", "b.py"):
+        (package_dir / name).write_text("x = 1\n")
+        package["python_src"].append(str(package_dir / name))
+    return plugin, package
+
+
+def test_tool_plugin_scan_result_cache(tmp_path):
+    """Test that unchanged files are not scanned again by file-local tools.
+
+    Expected result: only the changed file is scanned, issues are the same
+    """
+    plugin, package = setup_file_local_tool_plugin(tmp_path)
+    issues = plugin.scan(package, "level")
+    assert plugin.scanned == [package["python_src"]]
+    assert len(issues) == 2
+    assert issues[0].message == "look a flag"
+
+    assert sorted(plugin.scan(package, "level")) == sorted(issues)
+    assert len(plugin.scanned) == 1
+
+    changed = package["python_src"][1]
+    with open(changed, "a", encoding="utf8") as fid:
+        fid.write("y = 2\n")
+    assert sorted(plugin.scan(package, "level")) == sorted(issues)
+    assert plugin.scanned[1] == [changed]
+
+
+def test_tool_plugin_scan_result_cache_config_changed(tmp_path):
+    """Test that all files are scanned again when a configuration file changes.
+
+    Expected result: all files are scanned twice
+    """
+    plugin, package = setup_file_local_tool_plugin(tmp_path)
+    plugin.scan(package, "level")
+    with open(os.path.join(package.path, "setup.cfg"), "w", encoding="utf8") as fid:
+        fid.write("[test]\n")
+    plugin.scan(package, "level")
+    assert plugin.scanned == [package["python_src"], package["python_src"]]
+
+
+class DirectoryConfigToolPlugin(FileLocalToolPlugin):
+    """File-local tool plugin that finds its configuration next to the files."""
+
+    def get_config_names(self, level):
+        """Get the names of configuration files the tool finds next to the files."""
+        return ["tox.ini"]
+
+
+def test_tool_plugin_scan_result_cache_directory_config(tmp_path):
+    """Test that configuration files next to files or in parents are in cache keys.
+
+    Expected result: only files below a changed configuration file are scanned again
+    """
+    base, package = setup_file_local_tool_plugin(tmp_path)
+    plugin = DirectoryConfigToolPlugin()
+    plugin.set_plugin_context(base.plugin_context)
+    nested = tmp_path / "package" / "nested"
+    nested.mkdir()
+    (nested / "c.py").write_text("x = 1\n")
+    package["python_src"].append(str(nested / "c.py"))
+    plugin.scan(package, "level")
+
+    (nested / "tox.ini").write_text("[test]\n")
+    plugin.scan(package, "level")
+    assert plugin.scanned[1] == [str(nested / "c.py")]
+
+    (tmp_path / "tox.ini").write_text("[test]\n")
+    plugin.scan(package, "level")
+    assert plugin.scanned[2] == package["python_src"]
+    plugin.scan(package, "level")
+    assert len(plugin.scanned) == 3
+
+
+class VersionCountingToolPlugin(FileLocalToolPlugin):
+    """File-local tool plugin that counts how many times its version is probed."""
+
+    probes = 0
+
+    def get_version(self):
+        """Get the tool version."""
+        self.probes += 1
+        return "1.0"
+
+    def get_version_key(self):
+        """Get a key that changes whenever the installed tool changes."""
+        return "binary"
+
+
+def test_tool_plugin_scan_result_cache_version_cache(tmp_path):
+    """Test that the result cache gets the tool version from the version cache.
+
+    Expected result: the version is probed once for every package scanned
+    """
+    plugin, package = setup_file_local_tool_plugin(tmp_path)
+    counting = VersionCountingToolPlugin()
+    counting.set_plugin_context(plugin.plugin_context)
+    counting.scan(package, "level")
+    other = Package("other", package.path)
+    other["python_src"] = package["python_src"]
+    counting.scan(other, "level")
+    assert counting.probes == 1
+
+
+def test_tool_plugin_scan_result_cache_git_hashes(tmp_path):
+    """Test that the result cache uses the git hashes of files when they are known.
+
+    Expected result: files with git hashes are not hashed again
+    """
+    plugin, package = setup_file_local_tool_plugin(tmp_path)
+    package.file_hashes = {package["python_src"][0]: "0" * 40}
+    with mock.patch(
+        "statick_tool.tool_plugin.get_file_hash", return_value="1" * 64
+    ) as get_file_hash:
+        issues = plugin.scan(package, "level")
+    assert len(issues) == 2
+    hashed = [call.args[0] for call in get_file_hash.call_args_list]
+    assert package["python_src"][1] in hashed
+    assert package["python_src"][0] not in hashed
+
+
+def test_tool_plugin_scan_no_cache(tmp_path):
+    """Test that the result cache is not used with --no-cache.
+
+    Expected result: all files are scanned every time
+    """
+    plugin, package = setup_file_local_tool_plugin(tmp_path, "--no-cache")
+    plugin.scan(package, "level")
+    plugin.scan(package, "level")
+    assert plugin.scanned == [package["python_src"], package["python_src"]]
+    assert not os.path.exists(tmp_path / "cache")
+
+
+def test_tool_plugin_scan_result_cache_unknown_file(tmp_path):
+    """Test that results are not cached if an issue is not for a scanned file.
+
+    Expected result: all files are scanned every time
+    """
+    plugin, package = setup_file_local_tool_plugin(tmp_path)
+    process_files = plugin.process_files
+    plugin.process_files = lambda *args: process_files(*args) + ["other.py:1:x\n"]
+    plugin.scan(package, "level")
+    plugin.scan(package, "level")
+    assert plugin.scanned == [package["python_src"], package["python_src"]]
+
+
+def test_tool_plugin_scan_changed_files(tmp_path):
+    """Test that only changed files are scanned.
+
+    Expected result: tools that need the whole package scan all files
+    """
+    plugin, package = setup_file_local_tool_plugin(tmp_path, "--no-cache")
+    package.changed_files = {package["python_src"][0]}
+    plugin.scan(package, "level")
+    assert plugin.scanned == [[package["python_src"][0]]]
+
+    package.changed_files = set()
+    assert plugin.scan(package, "level") == []
+    assert len(plugin.scanned) == 1
+
+    plugin.requires_whole_package = lambda: True
+    plugin.scan(package, "level")
+    assert plugin.scanned[1] == package["python_src"]
+
+
+def test_tool_plugin_scan_excepted_files(tmp_path):
+    """Test that file-local tools don't scan files excepted for them.
+
+    Expected result: only the file that is not excepted is scanned
+    """
+    plugin, package = setup_file_local_tool_plugin(tmp_path, "--no-cache")
+    package.exception_matcher = ExceptionMatcher(
+        package.path, [{"tools": ["test"], "globs": ["b.py"]}], []
+    )
+    plugin.scan(package, "level")
+    assert plugin.scanned == [[package["python_src"][0]]]
+
+    plugin.is_file_local = lambda: False
+    plugin.scan(package, "level")
+    assert plugin.scanned[1] == package["python_src"]
+
+
+def test_split_files():
+    """Test splitting files into chunks for separate runs of a tool.
+
+    Expected result: chunks in order, balanced between parts and within the length
+    """
+    files = [f"/tmp/{index:03}.py" for index in range(200)]
+    chunks = split_files(files, 4)
+    assert [len(chunk) for chunk in chunks] == [50, 50, 50, 50]
+    assert sum(chunks, []) == files
+    assert split_files(files[:60], 4) == [files[:50], files[50:60]]
+    # Each file takes its name, a separator and a pointer.
+    chunks = split_files(files, 1, max_length=(11 + 1 + 8) * 30)
+    assert [len(chunk) for chunk in chunks] == [30] * 6 + [20]
+    assert sum(chunks, []) == files
+    assert split_files(["/tmp/long.py"], 1, max_length=1) == [["/tmp/long.py"]]
+    assert not split_files([], 4)
+
+
+class ShardToolPlugin(FileLocalToolPlugin):
+    """Tool plugin that can be run on chunks of the files."""
+
+    @classmethod
+    def is_shard_safe(cls):
+        """Return whether the tool can be run on separate chunks of the files."""
+        return True
+
+    def process_files(self, package, level, files, user_flags):
+        """Report one issue for each file, or fail on files named fail.py."""
+        if any(path.endswith("fail.py") for path in files):
+            return None
+        user_flags.append("changed")
+        return super().process_files(package, level, files, user_flags)
+
+
+def test_tool_plugin_scan_shards():
+    """Test that shard-safe tools run on chunks of the files.
+
+    Expected result: one run for each chunk, and the outputs joined in order
+    """
+    plugin = ShardToolPlugin()
+    plugin.set_plugin_context(
+        PluginContext(
+            argparse.Namespace(max_procs=3, output_directory=None), None, None
+        )
+    )
+    package = Package("package", "/tmp/package")
+    files = [f"/tmp/package/{index:03}.py" for index in range(150)]
+    issues = plugin.scan_files(package, "level", files, ["flag"])
+    assert sorted(plugin.scanned) == [files[:50], files[50:100], files[100:]]
+    assert [issue.filename for issue in issues] == files
+    assert {issue.message for issue in issues} == {"flag changed"}
+
+    plugin.scanned = []
+    issues = plugin.scan_files(package, "level", files[:10], ["flag"])
+    assert plugin.scanned == [files[:10]]
+    assert len(issues) == 10
+
+    assert plugin.scan_files(package, "level", files + ["fail.py"], []) is None
+
+
+def test_tool_plugin_parallel_jobs():
+    """Test getting the number of parallel jobs a tool can run.
+
+    Expected result: jobs limited by max_procs and the free jobserver tokens
+    """
+    tp = ToolPlugin()
+    with tp.parallel_jobs() as jobs:
+        assert jobs == 1
+
+    args = argparse.Namespace(max_procs=4)
+    tp.set_plugin_context(PluginContext(args, None, None))
+    with tp.parallel_jobs() as jobs:
+        assert jobs == 4
+
+    jobserver = JobServer(1)
+    tp.set_plugin_context(PluginContext(args, None, None, jobserver))
+    with tp.parallel_jobs() as jobs:
+        assert jobs == 2
+        assert not jobserver.acquire(block=False)
+    assert jobserver.acquire(block=False)
+    jobserver.close()
+
+
+class LimitsToolPlugin(ToolPlugin):
+    """Tool plugin with limits in its configuration."""
+
+    def get_name(self):
+        """Get name of tool."""
+        return "test"
+
+
+def setup_limits_tool_plugin():
+    """Create a plugin with the limits configuration."""
+    arg_parser = argparse.ArgumentParser()
+    resources = Resources([os.path.join(os.path.dirname(__file__), "limits_config")])
+    config = Config(resources.get_file("config.yaml"))
+    plugin = LimitsToolPlugin()
+    plugin.set_plugin_context(
+        PluginContext(arg_parser.parse_args([]), resources, config)
+    )
+    return plugin
+
+
+def test_tool_plugin_get_limits():
+    """Test that limits are read from the configuration for each level.
+
+    Expected result: valid limits are found, invalid limits are left out
+    """
+    plugin = setup_limits_tool_plugin()
+    assert plugin.get_limits("timeout") == {"timeout": 1.0}
+    assert plugin.get_limits("max_memory") == {"max_memory": 200.0}
+    assert plugin.get_limits("invalid") == {}
+    assert plugin.get_limits("missing") == {}
+
+
+def test_tool_plugin_check_output():
+    """Test that commands within their limits return their output.
+
+    Expected result: output is returned, failures raise CalledProcessError
+    """
+    plugin = setup_limits_tool_plugin()
+    for level in ("missing", "timeout"):
+        output = plugin.check_output(
+            [sys.executable, "-c", "print('done')"],
+            level=level,
+            universal_newlines=True,
+        )
+        assert output.strip() == "done"
+        with pytest.raises(subprocess.CalledProcessError):
+            plugin.check_output(
+                [sys.executable, "-c", "raise SystemExit(1)"], level=level
+            )
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a POSIX shell.")
+def test_tool_plugin_check_output_timeout():
+    """Test that a command that runs too long is killed along with its children.
+
+    Expected result: ToolLimitError with the output so far, raised at the timeout
+    """
+    plugin = setup_limits_tool_plugin()
+    start = time.time()
+    with pytest.raises(ToolLimitError) as ex:
+        plugin.check_output(
+            ["sh", "-c", "echo started; sleep 30 & sleep 30"],
+            level="timeout",
+            universal_newlines=True,
+        )
+    assert time.time() - start < 10
+    assert ex.value.limit == "timeout"
+    assert ex.value.output.strip() == "started"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses rlimits.")
+def test_tool_plugin_check_output_cpu_time():
+    """Test that a command that uses too much CPU time is stopped.
+
+    Expected result: ToolLimitError for the CPU time limit
+    """
+    plugin = setup_limits_tool_plugin()
+    with pytest.raises(ToolLimitError) as ex:
+        plugin.check_output(
+            [sys.executable, "-c", "while True: pass"], level="cpu_time"
+        )
+    assert ex.value.limit == "cpu_time"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses rlimits.")
+def test_tool_plugin_check_output_max_memory():
+    """Test that a command that uses too much memory is stopped.
+
+    Expected result: ToolLimitError for the memory limit
+    """
+    plugin = setup_limits_tool_plugin()
+    with pytest.raises(ToolLimitError) as ex:
+        plugin.check_output(
+            [sys.executable, "-c", "data = bytearray(1024 * 1024 * 1024)"],
+            level="max_memory",
+            stderr=subprocess.STDOUT,
+        )
+    assert ex.value.limit == "max_memory"
+
+
+def test_tool_plugin_run_lines():
+    """Test reading the output of a command one line at a time.
+
+    Expected result: lines arrive without line endings and are written to the log
+    """
+    plugin = setup_limits_tool_plugin()
+    log = io.StringIO()
+    script = "import sys\nfor i in range(3): print(f'line {i}', flush=True)"
+    with plugin.run_lines([sys.executable, "-c", script], log=log) as output:
+        lines = list(output)
+    output.check()
+    assert lines == ["line 0", "line 1", "line 2"]
+    assert log.getvalue() == "line 0\nline 1\nline 2\n"
+    assert output.returncode == 0
+
+
+def test_tool_plugin_run_lines_failed():
+    """Test that a failed command raises an error with the end of its output.
+
+    Expected result: CalledProcessError unless the return code is allowed
+    """
+    plugin = setup_limits_tool_plugin()
+    script = "for i in range(200): print(i)\nraise SystemExit(3)"
+    with plugin.run_lines([sys.executable, "-c", script], level="missing") as output:
+        # Output the caller doesn't read is still read so the command can finish.
+        pass
+    with pytest.raises(subprocess.CalledProcessError) as ex:
+        output.check()
+    assert ex.value.returncode == 3
+    assert ex.value.output.splitlines() == [str(i) for i in range(100, 200)]
+    output.check((0, 3))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a POSIX shell.")
+def test_tool_plugin_run_lines_timeout():
+    """Test that a command that runs too long is killed while its output is read.
+
+    Expected result: ToolLimitError with the output so far, raised at the timeout
+    """
+    plugin = setup_limits_tool_plugin()
+    start = time.time()
+    with plugin.run_lines(
+        ["sh", "-c", "echo started; sleep 30 & sleep 30"], level="timeout"
+    ) as output:
+        lines = list(output)
+    with pytest.raises(ToolLimitError) as ex:
+        output.check()
+    assert time.time() - start < 10
+    assert lines == ["started"]
+    assert ex.value.limit == "timeout"
+    assert ex.value.output.strip() == "started"
+
+
+def make_stub(directory, name, script):
+    """Make a stub executable that runs a Python script."""
+    path = os.path.join(directory, name)
+    with open(path, "w", encoding="utf8") as fid:
+        fid.write(f"#!{sys.executable}\n{script}\n")
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+    return path
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses stub executables.")
+def test_tool_plugin_run_many(tmp_path):
+    """Test running commands at the same time with a return code policy.
+
+    Expected result: results are in command order, and commands overlap
+    """
+    stub = make_stub(
+        str(tmp_path),
+        "lint",
+        "import sys, time\n"
+        "time.sleep(0.5)\n"
+        "print('checked', sys.argv[1])\n"
+        "raise SystemExit(32 if sys.argv[1] == 'bad.py' else 0)",
+    )
+    plugin = setup_limits_tool_plugin()
+    plugin.plugin_context.args.max_procs = 4
+    files = ["a.py", "bad.py", "c.py", "d.py"]
+    start = time.time()
+    results = plugin.run_many([[stub, src] for src in files], returncodes=(0, 32))
+    assert time.time() - start < 1.5
+    assert [result.output for result in results] == [
+        f"checked {src}\n" for src in files
+    ]
+    assert [result.returncode for result in results] == [0, 32, 0, 0]
+    assert plugin.run_many([]) == []
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses stub executables.")
+def test_tool_plugin_run_many_failed(tmp_path):
+    """Test that a failed command stops the others.
+
+    Expected result: CalledProcessError for the failed command, raised right away
+    """
+    slow = make_stub(str(tmp_path), "slow", "import time\ntime.sleep(30)")
+    failed = make_stub(str(tmp_path), "failed", "print('error')\nraise SystemExit(2)")
+    plugin = setup_limits_tool_plugin()
+    plugin.plugin_context.args.max_procs = 2
+    start = time.time()
+    with pytest.raises(subprocess.CalledProcessError) as ex:
+        plugin.run_many([[slow], [failed]], returncodes=(0, 1))
+    assert time.time() - start < 10
+    assert ex.value.returncode == 2
+    assert ex.value.output == "error\n"
+    with pytest.raises(OSError):
+        plugin.run_many([[os.path.join(str(tmp_path), "missing")]])
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses stub executables.")
+def test_tool_plugin_run_many_failed_one_job(tmp_path):
+    """Test that commands waiting for a job are not started after a failure.
+
+    Expected result: the first CalledProcessError, and the other commands never run
+    """
+    ran = os.path.join(str(tmp_path), "ran")
+    failed = make_stub(
+        str(tmp_path),
+        "failed",
+        f"open({ran!r}, 'a').write('x')\nraise SystemExit(2)",
+    )
+    plugin = setup_limits_tool_plugin()
+    plugin.plugin_context.args.max_procs = 1
+    for _ in range(20):
+        with pytest.raises(subprocess.CalledProcessError):
+            plugin.run_many([[failed]] * 4)
+    with open(ran, encoding="utf8") as fid:
+        assert fid.read() == "x" * 20
+
+
+def test_tool_plugin_run_command_lines():
+    """Test that lines are passed on as a command prints them.
+
+    Expected result: each line once, including lines longer than the read size
+    """
+    plugin = setup_limits_tool_plugin()
+    lines = []
+    script = "print('x' * 100000)\nprint('done', end='')"
+    result = asyncio.run(
+        plugin.run_command([sys.executable, "-c", script], on_line=lines.append)
+    )
+    assert lines == ["x" * 100000, "done"]
+    assert result.output == "x" * 100000 + "\ndone"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a POSIX shell.")
+def test_tool_plugin_run_command_timeout():
+    """Test that a command that runs too long is killed along with its children.
+
+    Expected result: ToolLimitError with the output so far, raised at the timeout
+    """
+    plugin = setup_limits_tool_plugin()
+    start = time.time()
+    with pytest.raises(ToolLimitError) as ex:
+        plugin.run_many(
+            [["sh", "-c", "echo started; sleep 30 & sleep 30"]], level="timeout"
+        )
+    assert time.time() - start < 10
+    assert ex.value.limit == "timeout"
+    assert ex.value.output == "started\n"
+
+
+def test_tool_plugin_scan_streaming():
+    """Test that streaming a scan passes all issues from the scan at once.
+
+    Expected result: one batch with the issues, and False if the scan failed
+    """
+    plugin = ToolPlugin()
+    package = Package("valid_package", "/tmp/valid_package")
+    issue = Issue("a.py", 1, "tool", "type", 1, "message", None)
+    batches = []
+    with mock.patch.object(ToolPlugin, "scan", return_value=[issue]):
+        assert plugin.scan_streaming(package, "level", batches.append)
+    assert batches == [[issue]]
+    with mock.patch.object(ToolPlugin, "scan", return_value=None):
+        assert not plugin.scan_streaming(package, "level", batches.append)
+    assert batches == [[issue]]
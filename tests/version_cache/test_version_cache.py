@@ -0,0 +1,33 @@
+"""Tests for statick_tool.version_cache."""
+
+import argparse
+
+from statick_tool.version_cache import VersionCache
+
+
+def test_version_cache_open_no_cache(tmp_path):
+    """Test opening the cache with --no-cache.
+
+    Expected result: no cache is returned
+    """
+    args = argparse.Namespace(cache_dir=str(tmp_path), no_cache=True)
+    assert VersionCache.open(args) is None
+
+
+def test_version_cache_versions(tmp_path):
+    """Test storing and getting versions.
+
+    Expected result: stored versions are returned for the same tool and binary only
+    """
+    cache = VersionCache(str(tmp_path))
+    assert cache.get_version("tool", "/bin/tool:1:2") is None
+    cache.set_version("tool", "/bin/tool:1:2", "1.0")
+    cache.close()
+
+    cache = VersionCache(str(tmp_path))
+    assert cache.get_version("tool", "/bin/tool:1:2") == "1.0"
+    assert cache.get_version("tool", "/bin/tool:3:2") is None
+    assert cache.get_version("other", "/bin/tool:1:2") is None
+    cache.set_version("tool", "/bin/tool:1:2", "2.0")
+    assert cache.get_version("tool", "/bin/tool:1:2") == "2.0"
+    cache.close()
@@ -0,0 +1,133 @@
+"""Tests for statick_tool.walk."""
+
+import os
+
+from statick_tool.exceptions import ExceptionMatcher, Exceptions
+from statick_tool.package import Package
+from statick_tool.walk import DirectoryFilter, walk
+
+
+def make_tree(tmp_path):
+    """Make a directory tree with directories that should be skipped."""
+    tree = tmp_path / "tree"
+    for path in (
+        "src/a.py",
+        "src/nested/b.py",
+        ".git/objects/c",
+        "node_modules/left-pad/index.js",
+        "build/generated.cpp",
+        "vendor/COLCON_IGNORE",
+        "vendor/d.py",
+    ):
+        (tree / path).parent.mkdir(parents=True, exist_ok=True)
+        (tree / path).write_text("x\n")
+    return str(tree)
+
+
+def get_files(path, dir_filter=None):
+    """Get the relative paths of all files found by walking a tree."""
+    return sorted(
+        os.path.relpath(os.path.join(root, name), path)
+        for root, _, files in walk(path, dir_filter)
+        for name in files
+    )
+
+
+def test_walk_matches_os_walk(tmp_path):
+    """Test walking a tree without a filter.
+
+    Expected result: same directories and files as os.walk, in the same order
+    """
+    path = make_tree(tmp_path)
+    os.symlink(os.path.join(path, "src"), os.path.join(path, "link"))
+
+    expected = [
+        (root, sorted(dirs), sorted(files)) for root, dirs, files in os.walk(path)
+    ]
+    walked = [(root, sorted(dirs), sorted(files)) for root, dirs, files in walk(path)]
+    assert sorted(walked) == sorted(expected)
+    assert "link" in walked[0][1]
+    assert not any(root.endswith("link") for root, _, _ in walked)
+
+
+def test_walk_prune_by_caller(tmp_path):
+    """Test that directories removed from the list by the caller are not walked.
+
+    Expected result: no files from the removed directory
+    """
+    path = make_tree(tmp_path)
+    files = []
+    for root, dirs, names in walk(path):
+        dirs[:] = [name for name in dirs if name != "src"]
+        files += [os.path.relpath(os.path.join(root, name), path) for name in names]
+    assert not any(name.startswith("src") for name in files)
+
+
+def test_walk_directory_filter(tmp_path):
+    """Test skipping ignored directories and directories with ignore files.
+
+    Expected result: ignored directories are not listed or walked
+    """
+    path = make_tree(tmp_path)
+    dir_filter = DirectoryFilter([".git", "node_*"])
+    assert get_files(path, dir_filter) == [
+        os.path.join("build", "generated.cpp"),
+        os.path.join("src", "a.py"),
+        os.path.join("src", "nested", "b.py"),
+    ]
+    top_dirs = next(walk(path, dir_filter))[1]
+    assert ".git" not in top_dirs
+    assert "node_modules" not in top_dirs
+
+
+def test_walk_excepted_directories(tmp_path):
+    """Test skipping directories whose files are all excepted for all tools.
+
+    Expected result: only globs ending with a wildcard skip directories
+    """
+    path = make_tree(tmp_path)
+    matcher = ExceptionMatcher(
+        path,
+        [
+            {"tools": "all", "globs": ["*/build/*", "*/src/nested"]},
+            {"tools": ["pylint"], "globs": ["*/src/*"]},
+        ],
+        [],
+    )
+    assert matcher.is_dir_excepted(os.path.join(path, "build"))
+    assert not matcher.is_dir_excepted(os.path.join(path, "src", "nested"))
+    assert not matcher.is_dir_excepted(os.path.join(path, "src"))
+    assert get_files(path, DirectoryFilter([".git", "node_modules"], matcher)) == [
+        os.path.join("src", "a.py"),
+        os.path.join("src", "nested", "b.py"),
+    ]
+
+
+def test_directory_filter_from_exceptions(tmp_path):
+    """Test getting the directories to ignore from an exceptions file.
+
+    Expected result: directories are ignored by name and by package file exceptions
+    """
+    path = make_tree(tmp_path)
+    exceptions_file = tmp_path / "exceptions.yaml"
+    exceptions_file.write_text(
+        "global:\n"
+        "  exceptions:\n"
+        "    file:\n"
+        "      - tools: all\n"
+        "        globs: ['*/build/*']\n"
+        "ignore_directories: [.git, node_modules]\n"
+    )
+    exceptions = Exceptions(str(exceptions_file))
+    assert exceptions.get_ignore_directories() == [".git", "node_modules"]
+
+    dir_filter = DirectoryFilter.from_exceptions(exceptions)
+    assert os.path.join("build", "generated.cpp") in get_files(path, dir_filter)
+
+    package = Package("package", path)
+    dir_filter = DirectoryFilter.from_exceptions(exceptions, package)
+    assert get_files(path, dir_filter) == [
+        os.path.join("src", "a.py"),
+        os.path.join("src", "nested", "b.py"),
+    ]
+    assert DirectoryFilter.from_exceptions(None).ignore_dirs is None
@@ -0,0 +1,81 @@
+"""Tests for statick_tool.workspace."""
+
+import os
+
+from statick_tool.discovery_plugin import DiscoveryPlugin
+from statick_tool.walk import DirectoryFilter
+from statick_tool.workspace import find_packages
+
+
+def make_workspace(tmp_path):
+    """Make a workspace with nested and ignored packages."""
+    workspace = tmp_path / "ws"
+    for path in (
+        "README.md",
+        "outer/package.xml",
+        "outer/src/outer.cpp",
+        "outer/inner/setup.py",
+        "outer/inner/inner.py",
+        "other/deep/pyproject.toml",
+        "other/deep/deep.py",
+        "other/loose.py",
+        "skipped/COLCON_IGNORE",
+        "skipped/hidden/package.xml",
+        "unwanted/package.xml",
+        "unwanted/unwanted.py",
+        "outer/.git/config",
+    ):
+        (workspace / path).parent.mkdir(parents=True, exist_ok=True)
+        (workspace / path).write_text("x\n")
+    return str(workspace)
+
+
+def test_find_packages(tmp_path):
+    """Test finding the packages in a workspace and the files in each of them.
+
+    Expected result: each file belongs to its innermost package only
+    """
+    workspace = make_workspace(tmp_path)
+    packages = find_packages(
+        workspace, DirectoryFilter([".git"]), ["unwanted"], max_workers=2
+    )
+    assert sorted(package.name for package in packages) == ["deep", "inner", "outer"]
+    by_name = {package.name: package for package in packages}
+
+    outer = by_name["outer"]
+    assert outer.path == os.path.join(workspace, "outer")
+    assert sorted(outer.file_list) == [
+        os.path.join(workspace, "outer", "package.xml"),
+        os.path.join(workspace, "outer", "src", "outer.cpp"),
+    ]
+    assert outer.nested_packages == [os.path.join(workspace, "outer", "inner")]
+    assert sorted(by_name["inner"].file_list) == [
+        os.path.join(workspace, "outer", "inner", "inner.py"),
+        os.path.join(workspace, "outer", "inner", "setup.py"),
+    ]
+    assert not by_name["inner"].nested_packages
+    assert sorted(by_name["deep"].file_list) == [
+        os.path.join(workspace, "other", "deep", "deep.py"),
+        os.path.join(workspace, "other", "deep", "pyproject.toml"),
+    ]
+
+
+def test_find_packages_find_files(tmp_path):
+    """Test that discovery uses the files found by walking the workspace.
+
+    Expected result: the files of the nested package are not in the outer package
+    """
+    workspace = make_workspace(tmp_path)
+    packages = find_packages(workspace)
+    outer = next(package for package in packages if package.name == "outer")
+    DiscoveryPlugin().find_files(outer)
+    assert sorted(outer.files) == sorted(outer.file_list)
+    assert os.path.join(workspace, "outer", "inner", "inner.py") not in outer.files
+
+
+def test_find_packages_empty(tmp_path):
+    """Test finding packages in a workspace that doesn't exist.
+
+    Expected result: no packages
+    """
+    assert not find_packages(str(tmp_path / "missing"))